@@ -0,0 +1,691 @@
+# DataToolsBenchmark: a benchmark suite for the DataTools functions
+#
+# Measure the speed (throughput) and peak memory use of the DataTools functions, for the C++ (PYtoCPP = True) and the Python (PYtoCPP = False) paths,
+# for a range of input sizes, window widths and data types. The results are stored in a JSON file, and can be compared to those of an earlier run
+# (the baseline): if a function has become slower (or uses more memory) than allowed, the script ends with exit code 1.
+#
+# Examples:
+#
+#   python DataToolsBenchmark.py --output baseline.json
+#   python DataToolsBenchmark.py --baseline baseline.json --threshold 0.2
+#   python DataToolsBenchmark.py --functions passAverageFilter getNearestValue --maximum-size-class 8 --dtypes float32
+#
+# With --import-time, only the time to import DataTools and HandyTools is measured (with python -X importtime), instead of the speed of the functions:
+# the script ends with exit code 1 if the import takes longer than allowed, or if it imports the libraries that should only be imported when they are used
+# (matplotlib.pyplot, scipy.signal, Numba and the Python to C++ libraries).
+#
+#   python DataToolsBenchmark.py --import-time --maximum-import-seconds 0.5
+#
+# With --threads, the C++ functions (which release the GIL) are run on independent arrays, once one after the other and once in a ThreadPoolExecutor:
+# the script reports the speed-up of the threads, and ends with exit code 1 if a function does not run faster in the threads than allowed.
+#
+#   python DataToolsBenchmark.py --threads --number-of-threads 4 --minimum-thread-speed-up 1.5
+
+# Standard imports.
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+import datetime
+import tracemalloc
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+# The DataTools module and the Python to C++ libraries are found relative to this script.
+benchmarkPath = os.path.dirname ( os.path.abspath (__file__) )
+sys.path.append ( os.path.join (benchmarkPath, '..', 'DataTools') )
+sys.path.append ( os.path.join (benchmarkPath, '..', 'PYtoCPP', 'DataTools') )
+
+import DataTools as DataToolsModule
+from DataTools import DataTools
+
+
+
+class DataToolsBenchmark:
+    '''
+    DataToolsBenchmark is a pseudo-class (no instantiation, no 'self'), bundling the functions to benchmark DataTools.
+    '''
+
+
+    # The functions that are benchmarked: for each, the name of its operation in the backend registry (if any), whether it has a C++ path,
+    #  whether it uses a window width, and how it is called.
+    benchmarkFunctions = {
+
+        'getSegmentSpecsFromDataValues': { 'operationName': 'getSegmentSpecsFromDataValues', 'hasPYtoCPP': True, 'usesWindowWidth': False,
+                                           'function': lambda dataValues, PYtoCPP, windowWidth: DataTools.getSegmentSpecsFromDataValues (dataValues, PYtoCPP = PYtoCPP) },
+
+        'passAverageFilter': { 'operationName': 'passAverageFilter', 'hasPYtoCPP': True, 'usesWindowWidth': True,
+                               'function': lambda dataValues, PYtoCPP, windowWidth: DataTools.passAverageFilter (dataValues, windowWidth, PYtoCPP = PYtoCPP) },
+
+        'getAverageVarAndSDPYtoCPP': { 'operationName': 'getAverageVarAndSD', 'hasPYtoCPP': True, 'usesWindowWidth': False,
+                                       'function': lambda dataValues, PYtoCPP, windowWidth: DataTools.getAverageVarAndSDPYtoCPP (dataValues, PYtoCPP = PYtoCPP) },
+
+        'getMedianAndQuantilesPYtoCPP': { 'operationName': 'getMedianAndQuantiles', 'hasPYtoCPP': True, 'usesWindowWidth': False,
+                                          'function': lambda dataValues, PYtoCPP, windowWidth: DataTools.getMedianAndQuantilesPYtoCPP (dataValues) },
+
+        'getNearestValue': { 'operationName': 'getNearestValue', 'hasPYtoCPP': True, 'usesWindowWidth': False,
+                             'function': lambda dataValues, PYtoCPP, windowWidth: DataTools.getNearestValue (dataValues, 0., monotonicList = 0, PYtoCPP = PYtoCPP) },
+
+        'linearLeastSquare': { 'operationName': None, 'hasPYtoCPP': False, 'usesWindowWidth': False,
+                               'function': lambda dataValues, PYtoCPP, windowWidth: DataTools.linearLeastSquare ( np.arange ( len (dataValues) ), dataValues ) },
+
+        'QQPlot': { 'operationName': None, 'hasPYtoCPP': False, 'usesWindowWidth': False,
+                    'function': lambda dataValues, PYtoCPP, windowWidth: DataTools.QQPlot (dataValues, headless = True) },
+
+    }
+
+
+
+    # Create the random data values of a given size and data type.
+    @staticmethod
+    def getBenchmarkDataValues (numberOfValues, dtype, randomGenerator):
+        '''
+        :param numberOfValues: number of data values.
+        :type numberOfValues: int
+
+        :param dtype: the data type, for example :code:`'float32'`, :code:`'float64'` or :code:`'int16'`.
+        :type dtype: str
+
+        :param randomGenerator: the random generator.
+        :type randomGenerator: np.random.Generator
+
+        :return: normally distributed data values (multiplied by 1000 for integer data types).
+        :rtype: NumPy array
+        '''
+
+        dataValues = randomGenerator.standard_normal (numberOfValues)
+        if np.issubdtype ( np.dtype (dtype), np.integer ):
+
+            dataValues *= 1000
+
+        return dataValues.astype (dtype)
+
+
+
+    # Run a single benchmark case.
+    @staticmethod
+    def runBenchmarkCase (functionName, dataValues, PYtoCPP, windowWidth, numberOfRepeats):
+        '''
+        :param functionName: the name of the DataTools function.
+        :type functionName: str
+
+        :param dataValues: the data values.
+        :type dataValues: NumPy array
+
+        :param PYtoCPP: use the C++ path (:code:`True`) or the Python path (:code:`False`).
+        :type PYtoCPP: bool
+
+        :param windowWidth: the window width, for the functions that use one.
+        :type windowWidth: int
+
+        :param numberOfRepeats: number of timed runs, the fastest counts.
+        :type numberOfRepeats: int
+
+        :return: the fastest time (s), the throughput (values / s), the peak memory allocated by the function (bytes) and the backend used.
+        :rtype: float, float, int, str
+
+
+        **Description:**
+        The function is called once before the timed runs, so that one-time costs (like the compilation of the Numba versions) are not counted.
+        This first call is profiled (see :py:meth:`DataTools.enableProfile`), to record the backend that actually ran. With PYtoCPP = False,
+        only the NumPy backends may be selected, and the backend is :code:`'python'` when the Python version ran.
+        The peak memory is measured with :code:`tracemalloc` in a separate run, since tracing slows down the function. It includes the NumPy arrays,
+        but not the memory allocated inside the C++ code.
+        '''
+
+        benchmarkFunction = DataToolsBenchmark.benchmarkFunctions [functionName]
+        numberOfValues = len (dataValues)
+
+        # The Python path uses the NumPy backends (the function getMedianAndQuantilesPYtoCPP has no PYtoCPP argument), not the compiled Numba backends.
+        backendPreference = DataToolsModule.dataToolsBackendSettings ['backendPreference'] if PYtoCPP else 'numpy'
+        with DataTools.useBackend (backendPreference):
+
+            # The first call is profiled, to find the backend that is actually used ('python' if no backend is selected, as in the Python versions).
+            profileEnabled = DataToolsModule.dataToolsProfileSettings ['enabled']
+            DataTools.enableProfile ()
+            DataTools.resetProfile ()
+            benchmarkFunction ['function'] (dataValues, PYtoCPP, windowWidth)
+            backendNames = DataTools.getProfile ().get (functionName, {}).get ('backends', {})
+            DataTools.resetProfile ()
+            DataTools.enableProfile (profileEnabled)
+
+            backendName = '+'.join ( sorted (backendNames) ) or 'python'
+
+            timeFastest = np.inf
+            for iRepeat in range (numberOfRepeats):
+
+                timeStart = time.perf_counter ()
+                benchmarkFunction ['function'] (dataValues, PYtoCPP, windowWidth)
+                timeFastest = min ( timeFastest, time.perf_counter () - timeStart )
+
+            tracemalloc.start ()
+            benchmarkFunction ['function'] (dataValues, PYtoCPP, windowWidth)
+            peakMemory = tracemalloc.get_traced_memory () [1]
+            tracemalloc.stop ()
+
+
+        return timeFastest, numberOfValues / timeFastest, peakMemory, backendName
+
+
+
+    # Run all benchmark cases.
+    @staticmethod
+    def runBenchmarks ( functionNames = None,
+                        sizeClasses = range (2, 7),
+                        windowWidths = [3, 11, 101],
+                        dtypes = ['float32', 'float64', 'int16'],
+                        numberOfRepeats = 3,
+                        maximumSecondsPerCase = 10.,
+                        printResults = True ):
+        '''
+        :param functionNames: the names of the functions to benchmark, default all.
+        :type functionNames: list [str]
+
+        :param sizeClasses: the sizes to benchmark, as powers of ten, default 2 to 6.
+        :type sizeClasses: list [int]
+
+        :param windowWidths: the window widths for the functions that use one, default [3, 11, 101].
+        :type windowWidths: list [int]
+
+        :param dtypes: the data types, default ['float32', 'float64', 'int16'].
+        :type dtypes: list [str]
+
+        :param numberOfRepeats: number of timed runs per case, default 3.
+        :type numberOfRepeats: int
+
+        :param maximumSecondsPerCase: once a case takes longer than this, the larger sizes of the same case are skipped, default 10 s.
+        :type maximumSecondsPerCase: float
+
+        :param printResults: print the result of each case, default :code:`True`.
+        :type printResults: bool
+
+        :return: the results of the benchmark cases.
+        :rtype: list [dict]
+        '''
+
+        if functionNames is None:
+
+            functionNames = list (DataToolsBenchmark.benchmarkFunctions)
+
+
+        randomGenerator = np.random.default_rng (0)
+        benchmarkResults = []
+        for dtype in dtypes:
+
+            # The sizes are the outer loop, so that the data values only need to be created once per size.
+            casesTooSlow = set ()
+            for sizeClass in sorted (sizeClasses):
+
+                dataValues = DataToolsBenchmark.getBenchmarkDataValues (10 ** sizeClass, dtype, randomGenerator)
+                for functionName in functionNames:
+
+                    benchmarkFunction = DataToolsBenchmark.benchmarkFunctions [functionName]
+                    for PYtoCPP in ( [True, False] if benchmarkFunction ['hasPYtoCPP'] else [True] ):
+
+                        for windowWidth in ( windowWidths if benchmarkFunction ['usesWindowWidth'] else [0] ):
+
+                            case = (functionName, PYtoCPP, windowWidth)
+                            if case in casesTooSlow:
+
+                                continue
+
+
+                            seconds, throughput, peakMemory, backendName = DataToolsBenchmark.runBenchmarkCase (functionName, dataValues, PYtoCPP, windowWidth, numberOfRepeats)
+                            if seconds > maximumSecondsPerCase:
+
+                                casesTooSlow.add (case)
+
+
+                            benchmarkResults.append ( { 'functionName': functionName,
+                                                        'numberOfValues': 10 ** sizeClass,
+                                                        'dtype': dtype,
+                                                        'PYtoCPP': PYtoCPP if benchmarkFunction ['hasPYtoCPP'] else None,
+                                                        'windowWidth': windowWidth if benchmarkFunction ['usesWindowWidth'] else None,
+                                                        'backend': backendName,
+                                                        'seconds': seconds,
+                                                        'throughput': throughput,
+                                                        'peakMemory': peakMemory } )
+
+                            if printResults:
+
+                                print ( '{:30s} {:>10d} {:8s} PYtoCPP = {:5s} window = {:>4s} {:7s} {:12.6f} s {:12.4g} values/s {:12d} bytes'.format (
+                                         functionName, 10 ** sizeClass, dtype, str (PYtoCPP), str (windowWidth) if benchmarkFunction ['usesWindowWidth'] else '-',
+                                         backendName, seconds, throughput, peakMemory ) )
+
+
+        return benchmarkResults
+
+
+
+    # The key that identifies a benchmark case.
+    @staticmethod
+    def getBenchmarkCaseKey (benchmarkResult):
+        '''
+        :param benchmarkResult: the result of a benchmark case.
+        :type benchmarkResult: dict
+
+        :return: the function name, number of values, data type, PYtoCPP and window width of the case.
+        :rtype: tuple
+        '''
+
+        return benchmarkResult ['functionName'], \
+               benchmarkResult ['numberOfValues'], \
+               benchmarkResult ['dtype'], \
+               benchmarkResult ['PYtoCPP'], \
+               benchmarkResult ['windowWidth']
+
+
+
+    # Compare benchmark results to a baseline.
+    @staticmethod
+    def getRegressions (benchmarkResults, baselineResults, threshold = 0.2, memoryThreshold = 0.2, minimumSeconds = 1e-4):
+        '''
+        :param benchmarkResults: the results of the current run.
+        :type benchmarkResults: list [dict]
+
+        :param baselineResults: the results of the baseline run.
+        :type baselineResults: list [dict]
+
+        :param threshold: the allowed fractional increase of the time, default 0.2 (20 %).
+        :type threshold: float
+
+        :param memoryThreshold: the allowed fractional increase of the peak memory, default 0.2 (20 %).
+        :type memoryThreshold: float
+
+        :param minimumSeconds: cases that take less time than this in the baseline are too noisy to compare in time, default 0.1 ms.
+        :type minimumSeconds: float
+
+        :return: a description of each regression.
+        :rtype: list [str]
+        '''
+
+        baselineResultsByCase = { DataToolsBenchmark.getBenchmarkCaseKey (baselineResult): baselineResult for baselineResult in baselineResults }
+
+        regressions = []
+        for benchmarkResult in benchmarkResults:
+
+            baselineResult = baselineResultsByCase.get ( DataToolsBenchmark.getBenchmarkCaseKey (benchmarkResult) )
+            if baselineResult is None:
+
+                continue
+
+
+            if baselineResult ['seconds'] >= minimumSeconds and benchmarkResult ['seconds'] > baselineResult ['seconds'] * (1 + threshold):
+
+                regressions.append ( '{} : {:.6f} s, baseline {:.6f} s (+{:.0f} %)'.format ( DataToolsBenchmark.getBenchmarkCaseKey (benchmarkResult),
+                                     benchmarkResult ['seconds'], baselineResult ['seconds'], 100 * (benchmarkResult ['seconds'] / baselineResult ['seconds'] - 1) ) )
+
+            if baselineResult ['peakMemory'] > 0 and benchmarkResult ['peakMemory'] > baselineResult ['peakMemory'] * (1 + memoryThreshold):
+
+                regressions.append ( '{} : {} bytes, baseline {} bytes (+{:.0f} %)'.format ( DataToolsBenchmark.getBenchmarkCaseKey (benchmarkResult),
+                                     benchmarkResult ['peakMemory'], baselineResult ['peakMemory'], 100 * (benchmarkResult ['peakMemory'] / baselineResult ['peakMemory'] - 1) ) )
+
+
+        return regressions
+
+
+
+    # The libraries that importing DataTools or HandyTools should not import: they are only imported by the functions that use them.
+    lazilyImportedModuleNames = [ 'matplotlib.pyplot', 'scipy.signal', 'numba', 'DataWranglingToolsPYtoCPP', 'FilterToolsPYtoCPP', 'DataToolsNumba' ]
+
+
+
+    # Measure the time it takes to import modules, in a new Python process.
+    @staticmethod
+    def getImportTimes (moduleNames = ['DataTools', 'HandyTools'], numberOfRepeats = 3):
+        '''
+        :param moduleNames: the modules to import, default DataTools and HandyTools.
+        :type moduleNames: list [str]
+
+        :param numberOfRepeats: number of times the import is measured, the fastest time counts, default 3.
+        :type numberOfRepeats: int
+
+        :return: the import time (s) of each module, and the names of all modules that were imported.
+        :rtype: dict, set
+
+
+        **Description:**
+        Each module is imported in a new Python process with :code:`python -X importtime`, so that the time includes the import of
+        all the modules it needs. The modules are imported in the given order, so that the time of a module does not include the modules
+        that were imported before it.
+        '''
+
+        pythonPaths = [ os.environ.get ('PYTHONPATH', ''),
+                        os.path.join (benchmarkPath, '..', 'DataTools'),
+                        os.path.join (benchmarkPath, '..', 'HandyTools'),
+                        os.path.join (benchmarkPath, '..', 'PYtoCPP', 'DataTools') ]
+        environment = dict ( os.environ, PYTHONPATH = os.pathsep.join ( [ pythonPath for pythonPath in pythonPaths if pythonPath ] ) )
+
+        importTimes = { moduleName: np.inf for moduleName in moduleNames }
+        importedModuleNames = set ()
+        for iRepeat in range (numberOfRepeats):
+
+            completedProcess = subprocess.run ( [ sys.executable, '-X', 'importtime', '-c', 'import ' + ', '.join (moduleNames) ],
+                                                env = environment, capture_output = True, text = True )
+            if completedProcess.returncode:
+
+                print ()
+                print ('---WARNING---')
+                print (' The import of {} failed:'.format ( ', '.join (moduleNames) ) )
+                print (completedProcess.stderr)
+
+                return {}, set ()
+
+
+            # Each line is:  import time: self [us] | cumulative [us] | module name (indented by its import depth).
+            for line in completedProcess.stderr.splitlines ():
+
+                if not line.startswith ('import time:') or line.endswith ('imported package'):
+
+                    continue
+
+
+                selfTime, cumulativeTime, moduleName = line [ len ('import time:') : ].split ('|')
+                if not cumulativeTime.strip ().isdigit ():
+
+                    continue
+
+
+                importedModuleNames.add ( moduleName.strip () )
+                if moduleName.strip () in importTimes and moduleName == ' ' + moduleName.strip ():
+
+                    importTimes [ moduleName.strip () ] = min ( importTimes [ moduleName.strip () ], int (cumulativeTime) * 1e-6 )
+
+
+        return importTimes, importedModuleNames
+
+
+
+    # Check that importing DataTools and HandyTools is fast, and does not import the libraries that are only needed by some functions.
+    @staticmethod
+    def getImportTimeRegressions (maximumSeconds = 0.5, numberOfRepeats = 3):
+        '''
+        :param maximumSeconds: the maximum time (s) that the import of each module may take, default 0.5.
+        :type maximumSeconds: float
+
+        :param numberOfRepeats: number of times the import is measured, the fastest time counts, default 3.
+        :type numberOfRepeats: int
+
+        :return: a description of each regression.
+        :rtype: list [str]
+        '''
+
+        importTimes, importedModuleNames = DataToolsBenchmark.getImportTimes (numberOfRepeats = numberOfRepeats)
+        if not importTimes:
+
+            return ['the modules could not be imported']
+
+
+        regressions = []
+        for moduleName, seconds in importTimes.items ():
+
+            print ( '{:<12s} {:10.4f} s'.format (moduleName, seconds) )
+            if seconds > maximumSeconds:
+
+                regressions.append ( 'import {} : {:.4f} s, maximum {:.4f} s'.format (moduleName, seconds, maximumSeconds) )
+
+
+        for moduleName in DataToolsBenchmark.lazilyImportedModuleNames:
+
+            if moduleName in importedModuleNames:
+
+                regressions.append ( 'import {} : should only be imported when it is used'.format (moduleName) )
+
+
+        return regressions
+
+
+
+    # Measure the speed-up of the functions that release the GIL when they run in several threads.
+    @staticmethod
+    def getThreadSpeedUps (functionNames = None, numberOfThreads = 4, numberOfValues = 1000000, windowWidth = 11, backendName = 'native', numberOfRepeats = 3):
+        '''
+        :param functionNames: the functions to run, default all the functions with a C++ path.
+        :type functionNames: list [str]
+
+        :param numberOfThreads: number of threads, and of independent arrays, default 4.
+        :type numberOfThreads: int
+
+        :param numberOfValues: number of data values of each array, default 1000000.
+        :type numberOfValues: int
+
+        :param windowWidth: the window width, for the functions that use one, default 11.
+        :type windowWidth: int
+
+        :param backendName: the backend to use, default :code:`'native'` (C++).
+        :type backendName: str
+
+        :param numberOfRepeats: number of timed runs, the fastest counts, default 3.
+        :type numberOfRepeats: int
+
+        :return: for each function, the time (s) to run it on all the arrays one after the other, the time in the threads, the speed-up and the backend used.
+        :rtype: list [dict]
+
+
+        **Description:**
+        Each function is run on :code:`numberOfThreads` independent float64 arrays, first one array after the other in the main thread, 
+        then each array in its own thread of a :code:`ThreadPoolExecutor`. If the function releases the GIL, then the threads run in parallel, 
+        and the speed-up approaches the number of threads (as long as there are enough processor cores). If it does not, the speed-up stays around 1.
+        The backend preference only applies to the current thread (see :py:meth:`DataTools.useBackend`), so it is set in each thread.
+        '''
+
+        if functionNames is None:
+
+            functionNames = [ functionName for functionName, benchmarkFunction in DataToolsBenchmark.benchmarkFunctions.items () if benchmarkFunction ['hasPYtoCPP'] ]
+
+
+        randomGenerator = np.random.default_rng (12345)
+        dataValuesList = [ DataToolsBenchmark.getBenchmarkDataValues (numberOfValues, 'float64', randomGenerator) for iThread in range (numberOfThreads) ]
+
+        threadResults = []
+        for functionName in functionNames:
+
+            benchmarkFunction = DataToolsBenchmark.benchmarkFunctions [functionName]
+
+            def runFunction (dataValues):
+
+                with DataTools.useBackend (backendName):
+
+                    benchmarkFunction ['function'] (dataValues, True, windowWidth)
+
+
+            with DataTools.useBackend (backendName):
+
+                usedBackendName = DataTools.selectBackend (benchmarkFunction ['operationName'], numberOfValues) [0] or 'python'
+
+
+            with ThreadPoolExecutor (max_workers = numberOfThreads) as executor:
+
+                # The first runs are not timed, so that one-time costs (loading the library, starting the threads) are not counted.
+                list ( map (runFunction, dataValuesList) )
+                list ( executor.map (runFunction, dataValuesList) )
+
+                timeSerial = np.inf
+                timeThreads = np.inf
+                for iRepeat in range (numberOfRepeats):
+
+                    timeStart = time.perf_counter ()
+                    list ( map (runFunction, dataValuesList) )
+                    timeSerial = min ( timeSerial, time.perf_counter () - timeStart )
+
+                    timeStart = time.perf_counter ()
+                    list ( executor.map (runFunction, dataValuesList) )
+                    timeThreads = min ( timeThreads, time.perf_counter () - timeStart )
+
+
+            threadResults.append ( { 'function': functionName, 'backend': usedBackendName, 'threads': numberOfThreads, 'numberOfValues': numberOfValues,
+                                     'secondsSerial': timeSerial, 'secondsThreads': timeThreads, 'speedUp': timeSerial / timeThreads } )
+
+            print ( '{:<30s} {:>7s}  {:2d} threads  serial {:10.6f} s  threads {:10.6f} s  speed-up {:5.2f}'.format (functionName, usedBackendName, numberOfThreads, 
+                                                                                                                    timeSerial, timeThreads, timeSerial / timeThreads) )
+
+
+        return threadResults
+
+
+
+    # Run the benchmark from the command line.
+    @staticmethod
+    def main (arguments = None):
+        '''
+        :param arguments: the command line arguments, default :code:`sys.argv [1:]`.
+        :type arguments: list [str]
+
+        :return: the exit code: 0 if there are no regressions, 1 otherwise.
+        :rtype: int
+        '''
+
+        argumentParser = argparse.ArgumentParser ( description = 'Benchmark the C++ and Python paths of the DataTools functions.' )
+        argumentParser.add_argument ( '--functions', nargs = '+', default = None, choices = list (DataToolsBenchmark.benchmarkFunctions),
+                                      help = 'the functions to benchmark (default all)' )
+        argumentParser.add_argument ( '--minimum-size-class', type = int, default = 2, help = 'the smallest size, as a power of ten (default 2)' )
+        argumentParser.add_argument ( '--maximum-size-class', type = int, default = 6, help = 'the largest size, as a power of ten (default 6, up to 8)' )
+        argumentParser.add_argument ( '--window-widths', nargs = '+', type = int, default = [3, 11, 101], help = 'the window widths (default 3 11 101)' )
+        argumentParser.add_argument ( '--dtypes', nargs = '+', default = ['float32', 'float64', 'int16'], help = 'the data types (default float32 float64 int16)' )
+        argumentParser.add_argument ( '--repeats', type = int, default = 3, help = 'number of timed runs per case (default 3)' )
+        argumentParser.add_argument ( '--maximum-seconds-per-case', type = float, default = 10., help = 'skip the larger sizes of a case that takes longer (default 10)' )
+        argumentParser.add_argument ( '--output', default = None, help = 'the JSON file for the results (default DataToolsBenchmark_<date and time>.json)' )
+        argumentParser.add_argument ( '--baseline', default = None, help = 'a JSON file with earlier results to compare to' )
+        argumentParser.add_argument ( '--threshold', type = float, default = 0.2, help = 'the allowed fractional increase of the time (default 0.2)' )
+        argumentParser.add_argument ( '--memory-threshold', type = float, default = 0.2, help = 'the allowed fractional increase of the peak memory (default 0.2)' )
+        argumentParser.add_argument ( '--minimum-seconds', type = float, default = 1e-4, help = 'do not compare the time of cases faster than this in the baseline (default 1e-4)' )
+        argumentParser.add_argument ( '--import-time', action = 'store_true', help = 'only measure the time to import DataTools and HandyTools' )
+        argumentParser.add_argument ( '--maximum-import-seconds', type = float, default = 0.5, help = 'the maximum time to import each module (default 0.5)' )
+        argumentParser.add_argument ( '--threads', action = 'store_true', help = 'only measure the speed-up of the C++ functions in a ThreadPoolExecutor, on arrays of 10^maximum-size-class values' )
+        argumentParser.add_argument ( '--number-of-threads', type = int, default = min ( 4, os.cpu_count () or 1 ), 
+                                      help = 'the number of threads and independent arrays (default the number of cores, up to 4)' )
+        argumentParser.add_argument ( '--minimum-thread-speed-up', type = float, default = 1.5, 
+                                      help = 'the minimum speed-up of the threads, only checked with at least 2 threads and cores (default 1.5)' )
+        parsedArguments = argumentParser.parse_args (arguments)
+
+
+        if parsedArguments.import_time:
+
+            regressions = DataToolsBenchmark.getImportTimeRegressions ( maximumSeconds = parsedArguments.maximum_import_seconds,
+                                                                        numberOfRepeats = parsedArguments.repeats )
+            print ()
+            if regressions:
+
+                print ('---WARNING---')
+                print (' {} import time regression(s):'.format ( len (regressions) ) )
+                for regression in regressions:
+
+                    print ('  ' + regression)
+
+                return 1
+
+
+            print ('No import time regressions.')
+
+            return 0
+
+
+        if parsedArguments.threads:
+
+            functionNames = parsedArguments.functions
+            if functionNames is not None:
+
+                functionNames = [ functionName for functionName in functionNames if DataToolsBenchmark.benchmarkFunctions [functionName] ['hasPYtoCPP'] ]
+
+
+            threadResults = DataToolsBenchmark.getThreadSpeedUps ( functionNames = functionNames,
+                                                                   numberOfThreads = parsedArguments.number_of_threads,
+                                                                   numberOfValues = 10 ** parsedArguments.maximum_size_class,
+                                                                   windowWidth = parsedArguments.window_widths [0],
+                                                                   numberOfRepeats = parsedArguments.repeats )
+            print ()
+            if parsedArguments.number_of_threads < 2 or ( os.cpu_count () or 1 ) < 2:
+
+                print ('The speed-up is not checked: it needs at least 2 threads and 2 processor cores.')
+
+                return 0
+
+
+            regressions = [ '{} ({}) : speed-up {:.2f} with {} threads, minimum {:.2f}'.format ( threadResult ['function'], threadResult ['backend'], threadResult ['speedUp'],
+                                                                                               threadResult ['threads'], parsedArguments.minimum_thread_speed_up )
+                            for threadResult in threadResults if threadResult ['speedUp'] < parsedArguments.minimum_thread_speed_up ]
+            if regressions:
+
+                print ('---WARNING---')
+                print (' {} function(s) do not run faster in threads:'.format ( len (regressions) ) )
+                for regression in regressions:
+
+                    print ('  ' + regression)
+
+                return 1
+
+
+            print ('All the functions run faster in threads.')
+
+            return 0
+
+
+        benchmarkResults = DataToolsBenchmark.runBenchmarks ( functionNames = parsedArguments.functions,
+                                                              sizeClasses = range (parsedArguments.minimum_size_class, parsedArguments.maximum_size_class + 1),
+                                                              windowWidths = parsedArguments.window_widths,
+                                                              dtypes = parsedArguments.dtypes,
+                                                              numberOfRepeats = parsedArguments.repeats,
+                                                              maximumSecondsPerCase = parsedArguments.maximum_seconds_per_case )
+
+        outputFileName = parsedArguments.output
+        if outputFileName is None:
+
+            outputFileName = 'DataToolsBenchmark_{}.json'.format ( datetime.datetime.now ().strftime ('%Y%m%d_%H%M%S') )
+
+        with open (outputFileName, 'w') as outputFile:
+
+            json.dump ( { 'DataToolsVersion': DataToolsModule.DataToolsVersion,
+                          'machine': platform.node (),
+                          'processor': platform.machine (),
+                          'python': platform.python_version (),
+                          'numpy': np.__version__,
+                          'DataWranglingToolsPYtoCPPExists': DataToolsModule.DataWranglingToolsPYtoCPPExists,
+                          'FilterToolsPYtoCPPExists': DataToolsModule.FilterToolsPYtoCPPExists,
+                          'results': benchmarkResults },
+                        outputFile, indent = 4 )
+
+        print ()
+        print ('The results are stored in {}'.format (outputFileName) )
+
+
+        if parsedArguments.baseline is not None:
+
+            with open (parsedArguments.baseline, 'r') as baselineFile:
+
+                baselineResults = json.load (baselineFile) ['results']
+
+            regressions = DataToolsBenchmark.getRegressions ( benchmarkResults,
+                                                              baselineResults,
+                                                              threshold = parsedArguments.threshold,
+                                                              memoryThreshold = parsedArguments.memory_threshold,
+                                                              minimumSeconds = parsedArguments.minimum_seconds )
+            print ()
+            if regressions:
+
+                print ('---WARNING---')
+                print (' {} regression(s) compared to the baseline {}:'.format ( len (regressions), parsedArguments.baseline ) )
+                for regression in regressions:
+
+                    print ('  ' + regression)
+
+                return 1
+
+            else:
+
+                print ('No regressions compared to the baseline {}.'.format (parsedArguments.baseline) )
+
+
+        return 0
+
+
+
+
+if __name__ == '__main__':
+
+    sys.exit ( DataToolsBenchmark.main () )
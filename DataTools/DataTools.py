@@ -15,36 +15,86 @@ from pathlib import Path
 
 import datetime
 import time
+import math
+import json
+import platform
+import contextlib
+import contextvars
+import functools
+import threading
+import random
+import importlib
+import importlib.util
+
+from concurrent.futures import ProcessPoolExecutor
 
-import matplotlib.pyplot as plt
 import numpy as np
 
-from scipy import signal
 
+# matplotlib, scipy.signal and scipy.special are only imported by the methods that use them (QQPlot, passMedianFilter, the Butterworth filters
+#  and getStandardNormalDistributionGrid),
+#  so that importing DataTools stays fast.
 
-# Custom imports of the Python to C++ libraries.
-# If the libraries cannot be loaded, then set to the corresponding boolean to False, so that the methods that call these libraries revert to standard Python.
-DataWranglingToolsPYtoCPPExists = True
-try:
+# The Python to C++ libraries and the Numba versions of the C++ functions (used when the Python to C++ libraries cannot be loaded, if Numba is installed)
+#  are also only imported when they are used for the first time, see DataTools.registerLazyBackend. If a library cannot be loaded,
+#  then its backends are removed, so that the methods that call these libraries revert to the other versions.
+# The booleans DataWranglingToolsPYtoCPPExists, FilterToolsPYtoCPPExists and DataToolsNumbaExists can still be read from the module,
+#  which loads the library if that has not been done yet (see __getattr__ at the end of this file).
+dataToolsBackendModuleNames = { 'DataWranglingToolsPYtoCPPExists': 'DataWranglingToolsPYtoCPP',
+                                'FilterToolsPYtoCPPExists': 'FilterToolsPYtoCPP',
+                                'DataToolsNumbaExists': 'DataToolsNumba' }
 
-    import DataWranglingToolsPYtoCPP
+# The libraries that have been imported, or None for those that could not be loaded.
+dataToolsBackendModules = {}
 
+# The backends that are registered but whose library has not been imported yet: for each (operation name, backend name) a tuple (module name, function name).
+dataToolsLazyBackends = {}
+dataToolsLazyBackendsLock = threading.Lock ()
 
-except:
 
-    DataWranglingToolsPYtoCPPExists = False
+# The standard normal distribution curves calculated by DataTools.getStandardNormalDistributionGrid, for each (rangeInSigma, stepInSigma).
+standardNormalDistributionGrids = {}
 
 
-FilterToolsPYtoCPPExists = True
-try:
+# The implementations (backends) of the operations that exist in more than one version: for each operation name a dictionary { backend name: function }.
+#  The backends are registered with DataTools.registerBackend at the end of this module.
+dataToolsBackends = {}
 
-    import FilterToolsPYtoCPP
+# The global backend preference (see DataTools.setBackendPreference), and the fastest backend per operation and size class found by DataTools.autotuneBackends.
+dataToolsBackendSettings = { 'backendPreference': ['native', 'numba', 'numpy'],
+                             'autotuneResults': {} }
 
-except:
+# The backend preference set by DataTools.useBackend, which only applies to the current thread and overrides the global one.
+dataToolsBackendPreferenceContext = contextvars.ContextVar ('dataToolsBackendPreferenceContext', default = None)
 
-    FilterToolsPYtoCPPExists = False
+# The data type each backend converts its input data values to, for each (operation name, backend name), used to predict the copies in the profile.
+dataToolsBackendInputDTypes = {}
 
 
+# The profile of the DataTools calls (see DataTools.enableProfile): for each function name the number of calls, latencies, input bytes, copies and backends.
+dataToolsProfile = {}
+dataToolsProfileLock = threading.Lock ()
+dataToolsProfileSettings = { 'enabled': False,
+                             'maximumNumberOfLatencies': 10000,
+                             'originalFunctions': {} }
+
+# The functions that are profiled.
+dataToolsProfiledFunctionNames = [ 'getSegmentSpecsFromDataValues', 'passAverageFilter', 'passMedianFilter', 'passButterworthNotchFilter',
+                                   'passButterworthBandPassOrStopFilter', 'linearLeastSquare', 'QQPlot', 'getQQData', 'getAverageVarAndSDPYtoCPP',
+                                   'getMedianAndQuantilesPYtoCPP', 'getNanFreeNumpyArray', 'getDataValuesWithGaussianNoise', 'getNearestValue' ]
+
+# The record of the call that is being profiled in the current thread, to which DataTools.selectBackend adds the selected backend.
+dataToolsProfileCurrentCall = contextvars.ContextVar ('dataToolsProfileCurrentCall', default = None)
+
+
+# The arrays of the workspace of DataTools.getSegmentSpecsFromDataValues (see DataTools.getSegmentSpecsWorkspace), with their data types.
+segmentSpecsWorkspaceDataTypes = { 'segmentStartIndices': np.uintc,
+                                   'segmentAmplitudes': np.single,
+                                   'segmentSlopes': np.single,
+                                   'segmentDurations': np.uintc,
+                                   'segmentStartIndicesNegative': np.uintc,
+                                   'segmentStartIndicesPositive': np.uintc }
+
 
 class DataTools:
     """
@@ -57,7 +107,7 @@ class DataTools:
     # Used in the  getUncertaintyLevelInElectrode  method and by  AnnotationTool  in te NoiseViewer method.
     # Determine the list of amplitude segments for the electrogram.
     @staticmethod
-    def getSegmentSpecsFromDataValues (dataValues, PYtoCPP = True, convertToSingle = False):
+    def getSegmentSpecsFromDataValues (dataValues, PYtoCPP = True, convertToSingle = False, workspace = None):
         '''
         :param dataValues: list (one dimension) of data values. The values in the :code:`dataValues` list are converted to 32-float if code:`PYtoCPP == True`.
         :type dataValues: list or NumPy array <np.single or float32>
@@ -68,6 +118,10 @@ class DataTools:
         :param convertToSingle: if :code:`True` convert the values in :code:`dataValues` to 32-float, default :code:`True`. 
         :type convertToSingle: bool
 
+        :param workspace: the arrays in which the results are stored, made with :py:meth:`~.getSegmentSpecsWorkspace`, default :code:`None` (new arrays).
+            It is not used by the Python version.
+        :type workspace: dict
+
         :return: characteristics of the *segments* defined by :code:`dataValues` (see **Description**) when :code:`PYtoCPP = True`, or list of amplitudes and start indices when :code:`PYtoCPP = False`.
         :rtype: tuple (:code:`PYtoCPP = True`);  list, list (:code:`PYtoCPP = False`)
 
@@ -92,24 +146,36 @@ class DataTools:
             | [11] iSteepestPositiveSlopeSegment;
             | [12] iSegmentStartIndicesSteepestPositiveSlope;
  
-        If :code:`PYtoCPP = True`, only lists of segment amplitudes and segment start indices are being returned.
+        If the C++ version cannot be loaded, then the Numba version (if Numba is installed) returns the same tuple.
+        If :code:`PYtoCPP = False`, the Python version is used, and only lists of segment amplitudes and segment start indices are being returned.
         
         .. note::
         
             Note that :code:`dataValues` are converted to 32-float (np.single) when :code:`PYtoCPP = True`. 
             If :code:`PYtoCPP = False`, then the user can choose whether to convert :code:`dataValues` or not by setting the :code:`convertToSingle` boolean. 
 
+        To analyse many (short) lists of data values in a loop without making new arrays for the results every time, make a workspace once with
+        :py:meth:`~.getSegmentSpecsWorkspace` for the longest list, and pass it to every call. The arrays that are returned are then parts of the arrays
+        of the workspace, which are overwritten by the next call: copy them if they need to be kept.
+
                  
         '''
 
-        # Run the C++ version.
-        if PYtoCPP and DataWranglingToolsPYtoCPPExists:
+        # Run the C++ version, or another registered backend that returns the same results (the Numba version). 
+        #  With PYtoCPP = False the Python version is used, which returns only the amplitudes and start indices.
+        backendName, backendFunction = DataTools.selectBackend ('getSegmentSpecsFromDataValues', len (dataValues))  if PYtoCPP  else (None, None)
+        if backendFunction is not None:
+
+            if workspace is not None:
 
-            return DataWranglingToolsPYtoCPP.getSegmentSpecsFromDataValuesPYtoCPP (dataValues)
+                return backendFunction ( dataValues, workspace = DataTools.checkSegmentSpecsWorkspace ( workspace, len (dataValues) ) )
+
+
+            return backendFunction (dataValues)
 
 
         # Run the Python version.
-        elif not PYtoCPP or not DataWranglingToolsPYtoCPPExists:
+        else:
                 
             if convertToSingle:
             
@@ -146,7 +212,7 @@ class DataTools:
 
     #
     @staticmethod
-    def passAverageFilter (dataValues, windowWidth, PYtoCPP = True):
+    def passAverageFilter (dataValues, windowWidth, PYtoCPP = True, out = None):
         '''
         :param dataValues: list of data values that represent the signal to be filtered.
         :type dataValues: list or NumPy array  
@@ -154,7 +220,13 @@ class DataTools:
         :param windowWidth: width of the window which will include the central value. This is always an uneven number. If an even number is given, then :code:`windowWidth` will be increased by one.
         :type windowWidth: int
 
-        :return: filtered data values.
+        :param PYtoCPP: if :code:`False`, do not use the C++ version, default :code:`True`.
+        :type PYtoCPP: bool
+
+        :param out: array in which the filtered data values are stored, with the same number of values as :code:`dataValues`, default :code:`None` (a new array).
+        :type out: NumPy array <np.single>
+
+        :return: filtered data values (:code:`out`, if given).
         :rtype: list 
 
 
@@ -166,6 +238,9 @@ class DataTools:
         
         The noise level of the filtered set can be easily calculated from the noise level of the original data values, by dividing by the square root of the total
         number of data values in the averaging window. 
+
+        To filter many (short) lists of data values in a loop without making a new array every time, pass the same (np.single) array as :code:`out` to every call,
+        see :py:meth:`~.checkOutputArray`.
         '''
 
         if windowWidth <= 0:
@@ -193,42 +268,29 @@ class DataTools:
                 print (' Window width needs to be uneven number: reset to {} samples.'.format (windowWidth) )
     
                 
-            if PYtoCPP and FilterToolsPYtoCPPExists:
-                        
-                return FilterToolsPYtoCPP.passAverageFilterPYtoCPP (dataValues, windowWidth // 2)
-        
-        
-            # If the compiled C++ module cannot be found ot if the user chooses to use Python over C++.
-            elif not PYtoCPP or not FilterToolsPYtoCPPExists:
-            
-                numberOfElements = len (dataValues)
-                dataValuesFiltered = np.zeros (numberOfElements)
-                halfWindowWidth = windowWidth // 2
-                        
-                # The first  halfWindowWidth  filtered data values are calculated with the available points, which is not the full window.
-                for iElement in range (0, halfWindowWidth):
-                
-                    dataValuesFiltered [iElement] = np.mean ( dataValues [ 0 : iElement + halfWindowWidth + 1 ] )
-                
+            # Run the C++ version (returns 32-float values), or the Numba or NumPy version if the compiled C++ module cannot be found or if the user chooses not to use C++
+            #  (see also DataTools.setBackendPreference).
+            backendName, backendFunction = DataTools.selectBackend ('passAverageFilter', len (dataValues), PYtoCPP)
 
-                # Calculate the filtered data values within the window centered on the current data value at index  iElement .
-                for iElement in range ( halfWindowWidth, numberOfElements - halfWindowWidth ):
+            # The C++ version needs at least one full window: for fewer data values, use the NumPy version, which limits each window to the data values.
+            if windowWidth > len (dataValues):
 
-                    dataValuesFiltered [iElement] = np.mean ( dataValues [ iElement - halfWindowWidth : iElement + halfWindowWidth + 1 ] )   
-                    
-                
-                # The last  halfWindowWidth  filtered data values are calculated with the available points, which is not the full window.
-                for iElement in range ( numberOfElements - halfWindowWidth, numberOfElements ):
-                
-                    dataValuesFiltered [iElement] = np.mean ( dataValues [ iElement : ] )     
+                backendName, backendFunction = 'numpy', dataToolsBackends ['passAverageFilter'] ['numpy']
+
+
+            out = DataTools.checkOutputArray ( out, len (dataValues), [np.single], 'passAverageFilter', contiguous = True )
+            if out is not None:
+
+                return backendFunction (dataValues, windowWidth // 2, out = out)
 
-                return dataValuesFiltered
+                        
+            return backendFunction (dataValues, windowWidth // 2)
         
 
 
     # Pass a given input signal through a median filter.
     @staticmethod
-    def passMedianFilter (dataValues, windowWidth = 3):
+    def passMedianFilter (dataValues, windowWidth = 3, out = None):
         '''
         :param dataValues: list (one dimension) of data values that represent the signal to be filtered.
         :type dataValues: list 
@@ -236,8 +298,16 @@ class DataTools:
         :param windowWidth: width of the window: number of values in the averaging window including the central value. This is always an uneven number.
         :type windowWidth: int
 
+        :param out: array in which the filtered data values are stored, with the same number of values as :code:`dataValues`, default :code:`None` (a new array).
+        :type out: NumPy array
+
+        :return: filtered data values (:code:`out`, if given).
+        :rtype: NumPy array
+
         **Description:**
-        Pass a given input signal through a median filter, using signal.medfilt method.
+        Pass a given input signal through a median filter, using signal.medfilt method. If an :code:`out` array is given, then the 
+        `scipy.ndimage.median_filter <https://docs.scipy.org/doc/scipy/reference/generated/scipy.ndimage.median_filter.html>`_ method is used,
+        with zeros beyond the ends of the signal as in signal.medfilt, which stores the filtered values directly in :code:`out`.
         '''
 
         if windowWidth <= 0:
@@ -259,6 +329,18 @@ class DataTools:
                 print (' Window width needs to be uneven number: reset to {} samples.'.format (windowWidth) )
 
     
+            out = DataTools.checkOutputArray ( out, len (dataValues), [np.single, np.double, np.short, np.intc], 'passMedianFilter' )
+            if out is not None:
+
+                from scipy import ndimage
+
+                ndimage.median_filter (dataValues, size = windowWidth, mode = 'constant', cval = 0., output = out)
+
+                return out
+
+
+            from scipy import signal
+
             return signal.medfilt (dataValues, windowWidth)         
 
            
@@ -272,7 +354,8 @@ class DataTools:
                                      samplingFrequency = 1000, 
                                      notchFrequency = 50, 
                                      qualityFactor = 2, 
-                                     getFilterSettings = True ):
+                                     getFilterSettings = True,
+                                     out = None ):
         '''
         :param inputSignal: list (one dimension) of data values that represent the signal to be filtered.
         :type inputSignal: list 
@@ -298,6 +381,9 @@ class DataTools:
         :param getFilterSettings: True (default) if the filter settings are to be calculated.
         :type getFilterSettings: bool
 
+        :param out: array in which the outputSignal is stored, with the same number of values as the inputSignal, default :code:`None` (a new array).
+        :type out: NumPy array <np.double>
+
         :return: If getFilterSettings = True and applyFilter = True, then return outputSignal, bNotch, aNotch, filterFrequency, amplitudedB. If getFilterSettings = True and applyFilter = False, then return bNotch, aNotch, filterFrequency, amplitudedB. If getFilterSettings = False and applyFilter = True, then return outputSignal.
         :rtype: list, NumPy array, NumPy array, NumPy array, NumPy array
         
@@ -338,6 +424,8 @@ class DataTools:
         '''
 
         
+        from scipy import signal
+
         # Calculate the bNotch and aNotch parameters of the filter.
         if getFilterSettings:
              
@@ -351,7 +439,7 @@ class DataTools:
         # Apply the filter to the input signal.
         if applyFilter and len (bNotch) and len (aNotch):
         
-            outputSignal = signal.filtfilt (bNotch, aNotch, inputSignal)
+            outputSignal = DataTools.copyToOutputArray ( signal.filtfilt (bNotch, aNotch, inputSignal), out, 'passButterworthNotchFilter' )
 
 
         # If no valid filter parameters were given, then issue a warning.
@@ -388,7 +476,8 @@ class DataTools:
                                               filterType = 'lowpass', 
                                               filterOrder = 10,
                                               cutoffFrequency = 10,
-                                              getFilterSettings = True ):
+                                              getFilterSettings = True,
+                                              out = None ):
        
         '''
         :param inputSignal: list (one dimension) of data values that represent the signal to be filtered.
@@ -412,6 +501,9 @@ class DataTools:
         :param cutoffFrequency: filter cutoff frequency, one number for low and high pass filters, a list of two numbers for band stop filter.
         :type cutoffFrequency: float or list [float, float]
 
+        :param out: array in which the outputSignal is stored, with the same number of values as the inputSignal, default :code:`None` (a new array).
+        :type out: NumPy array <np.double>
+
         :return: If getFilterSettings = True and applyFilter = True, then return outputSignal, secondfilterOrderSections. If getFilterSettings = True and applyFilter = False, then return secondfilterOrderSections. If getFilterSettings = False and applyFilter = True, then return outputSignal.
         :rtype: list, NumPy array, NumPy array
         
@@ -463,6 +555,8 @@ class DataTools:
 
         '''
          
+        from scipy import signal
+
         # Calculate the filter parameters.
         if getFilterSettings:
 
@@ -480,7 +574,7 @@ class DataTools:
         # Apply the filter to the input signal.
         if applyFilter and len (secondfilterOrderSections):
         
-            outputSignal = signal.sosfiltfilt (secondfilterOrderSections, inputSignal)
+            outputSignal = DataTools.copyToOutputArray ( signal.sosfiltfilt (secondfilterOrderSections, inputSignal), out, 'passButterworthBandPassOrStopFilter' )
 
 
         # If no valid filter parameters were given, then issue a warning.
@@ -599,7 +693,9 @@ class DataTools:
                 HistTitleToPrint = 'DataTools version ' + DataToolsVersion + ': Histogram of input data', 
                 plotTextAverageMedian = True,
                 savePlots = False,
-                plotBaseFileName = 'QQPlot.png'):
+                plotBaseFileName = 'QQPlot.png',
+                headless = False,
+                maximumNumberOfPointsToPlot = 20000):
         '''
         :param xInput: the list of data points.
         :type xInput: list [float]
@@ -625,241 +721,501 @@ class DataTools:
         :param plotBaseFileName: file name of the plots. It can be given with or without file  type extension (.png, .jpg, .jpeg or .gif). Spaces in the file name are replaced with :file:`_`.  
         :type plotBaseFileName: str
 
+        :param headless: if True then do not use the pyplot figures 1 and 2, but draw in two separate Figure objects on the Agg backend, which are not shown on screen, default :code:`False`.
+        :type headless: bool
+
+        :param maximumNumberOfPointsToPlot: the maximum number of points to scatter in the QQ-plot, default 20000. Use :code:`None` to plot all points.
+        :type maximumNumberOfPointsToPlot: int
+
+        :return: nothing, or if :code:`headless = True`, the Figure objects of the QQ-plot and of the histogram.
+        :rtype: None, or matplotlib Figure, matplotlib Figure
                 
         **Description:**
         Calculate and plot the QQ-plot (or Quantile-Quantile plot), as well as the histogram, of a given list of data values.
         If the user has opted to save the plots, then the plotBaseFileName is used to determine the file names of the plots.
         The strings :file:`_QQPlot` and :file:`_Histogram` are automatically added at the end of the file name.
         The default plot image file type is .png, if the user does not indicate any (.jpg, .jpeg or .gif).
+        The values of the QQ-plot are calculated with the :py:meth:`~.getQQData` function, which can also be called directly when no plots are needed.
+        
+        For large numbers of data points, only :code:`maximumNumberOfPointsToPlot` points are drawn in the QQ-plot, selected with the :py:meth:`~.getDecimatedIndices` function,
+        which keeps all the points in the tails of the distribution. 
+        
+        With :code:`headless = True` the global pyplot state is not touched, so that this function can be called safely from worker processes 
+        (see :py:meth:`~.saveQQPlotsWithProcessPool`) and from scripts that run without a display.
         '''
 
 
         # Make sure the plotBaseFileName has no space in the name and determine the extension.
         if savePlots:
 
-            plotBaseFileName = plotBaseFileName.replace (' ', '_')
-       
-            extension = ' '
-            if '.png' in plotBaseFileName:
-            
-                extension = '.png'
-            
-            if '.jpg' in plotBaseFileName:
-
-                extension = '.jpg'
-                
-            if '.jpeg' in plotBaseFileName:
-            
-                extension = '.jpeg'
-
-            if '.gif' in plotBaseFileName:
+            plotFileNameQQ, plotFileNameHistogram = DataTools.getQQPlotFileNames (plotBaseFileName)
             
-                extention = '.gif'
-                
-            plotFileNameQQ = plotBaseFileName.split (extension)[0] + '_QQPlot'
-            plotFileNameQQ += '.png'  if extension == ' ' else  extension
-
-            plotFileNameHistogram = plotBaseFileName.split (extension)[0] + '_Histogram'
-            plotFileNameHistogram += '.png'  if extension == ' ' else  extension
-            
-
-
-        xInput = np.array (xInput)
-        xInputMean = np.mean (xInput)
-        xInputMedian = np.median (xInput)
-        xInputStd = np.std (xInput)
-
-        x, cumulativeNormalDistribution = DataTools.getCumulativeNormalDistribution (xInputMean, xInputStd)
-
-        xInputfilterOrdered = xInput.copy ()
-        xInputfilterOrdered.sort ()
-
-        xInputCumulativeNormalDistribution = [ (i-1) / len (xInputfilterOrdered) for i in range (1,len (xInputfilterOrdered)+1) ]
 
-        xValues = []
-
-        # Search for the indices in the true normally distributed cumulativeNormalDistribution between which
-        #  the estimated cumulative distrbution value of the input (xInputCumulativeNormalDistribution) values lie
-        #  and calculate the true normally distributed cumulative value that would correspond to the this iDataPoint
-        #  by interpolation.
-        for i, xInputCumulativeNormalDistributionValue in enumerate (xInputCumulativeNormalDistribution):
-
-            cumulativeNormalDistributionAdded = cumulativeNormalDistribution.copy ()
-            cumulativeNormalDistributionAdded.append (xInputCumulativeNormalDistributionValue)
-            cumulativeNormalDistributionAdded.sort ()
-            valueIndex = np.where ( np.array (cumulativeNormalDistributionAdded) == xInputCumulativeNormalDistributionValue )[0][-1]
-
-            if valueIndex == 0:
-
-                xValue = x [0]
+        xInput = np.asarray (xInput)
 
-            if valueIndex == len (x):
+        zValuesxInputfilterOrdered, zValues, xInputMean, xInputMedian, xInputStd = DataTools.getQQData (xInput)
 
-                xValue = x [-1]
+        # Only scatter a representative selection of the points when there are many.
+        if maximumNumberOfPointsToPlot:
 
-            else:
+            iPointsToPlot = DataTools.getDecimatedIndices ( len (zValues), maximumNumberOfPointsToPlot )
+            zValuesxInputfilterOrdered = zValuesxInputfilterOrdered [iPointsToPlot]
+            zValues = zValues [iPointsToPlot]
 
-                xValue = x [valueIndex-1] + (xInputCumulativeNormalDistributionValue - cumulativeNormalDistribution [valueIndex-1]) * \
-                         (x [valueIndex] - x [valueIndex-1]) / \
-                         (cumulativeNormalDistribution [valueIndex] - cumulativeNormalDistribution [valueIndex-1])
 
+        # Only import the parts of matplotlib that are needed: pyplot is not imported when headless.
+        if headless:
 
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
 
-            xValues.append (xValue)
+        else:
 
+            import matplotlib.pyplot as plt
 
-        zValues = (np.array (xValues) - xInputMean) / xInputStd
-        phiValues = np.array (zValues) * xInputStd + xInputMean
-        phiValuesStandard = (phiValues - xInputMean) / xInputStd
 
-        zValuesxInputfilterOrdered = (np.array (xInputfilterOrdered) - xInputMean) / xInputStd
+        # Plot the QQ-plot in figure 1 and the histogram in figure 2, or in two separate Figure objects if headless.
+        if headless:
+        
+            figureQQ = Figure ()
+            FigureCanvasAgg (figureQQ)
+            
+        else:
+        
+            figureQQ = plt.figure (1)
+            figureQQ.clf ()
 
-        # Plot the QQ-plot in figure 1 and the histogram in figure 2
-        plt.figure (1)
-        plt.clf ()
+        axisQQ = figureQQ.add_subplot ()
 
         labelMeanToPrint = 'mean, median = {:g}, {:g}'.format (xInputMean, xInputMedian)
         labelSTDToPrint = 'sd = {:g}'.format (xInputStd)
 
-        plt.scatter (zValuesxInputfilterOrdered, zValues, s=1, color = 'green')
-        plt.xlim (-3,3)
+        axisQQ.scatter (zValuesxInputfilterOrdered, zValues, s=1, color = 'green')
+        axisQQ.set_xlim (-3,3)
         # Plot the vertical 1-sigma reference lines
-        plt.plot ([-1,-1], [-3,3], color = 'green', linewidth = 0.5)
-        plt.plot ([1,1], [-3,3], color = 'green', linewidth = 0.5)
+        axisQQ.plot ([-1,-1], [-3,3], color = 'green', linewidth = 0.5)
+        axisQQ.plot ([1,1], [-3,3], color = 'green', linewidth = 0.5)
 
-        plt.plot (phiValuesStandard, zValues, color = 'orange')
-        plt.ylim (-3,3)
+        axisQQ.plot (zValues, zValues, color = 'orange')
+        axisQQ.set_ylim (-3,3)
         # Plot the horizontal 1-sigma reference lines
-        plt.plot ([-3,3], [-1,-1], color = 'orange', linewidth = 0.5)
-        plt.plot ([-3,3], [1,1], color = 'orange', linewidth = 0.5)
+        axisQQ.plot ([-3,3], [-1,-1], color = 'orange', linewidth = 0.5)
+        axisQQ.plot ([-3,3], [1,1], color = 'orange', linewidth = 0.5)
 
-        plt.xlabel (xlabelToPrint + ' - normalised to N(mu,sigma)', fontsize = 12)
-        plt.ylabel (ylabelToPrint, fontsize = 12)
-        plt.title (QQTitleToPrint)
+        axisQQ.set_xlabel (xlabelToPrint + ' - normalised to N(mu,sigma)', fontsize = 12)
+        axisQQ.set_ylabel (ylabelToPrint, fontsize = 12)
+        axisQQ.set_title (QQTitleToPrint)
 
         if plotTextAverageMedian:
 
-            plt.text (-2.8,2.6, labelMeanToPrint, color = 'green')
-            plt.text (-2.8,2.3, labelSTDToPrint, color = 'green')
+            axisQQ.text (-2.8,2.6, labelMeanToPrint, color = 'green')
+            axisQQ.text (-2.8,2.3, labelSTDToPrint, color = 'green')
 
 
         # Save the QQPlot if the user has selected this option.
         if savePlots:
         
-            plt.savefig (plotFileNameQQ)
-            plt.close ()
+            figureQQ.savefig (plotFileNameQQ)
+            
+            if not headless:
+            
+                plt.close (figureQQ)
 
         
         
-        plt.figure (2)
-        plt.clf ()
+        if headless:
+        
+            figureHistogram = Figure ()
+            FigureCanvasAgg (figureHistogram)
+            
+        else:
+        
+            figureHistogram = plt.figure (2)
+            figureHistogram.clf ()
+
+        axisHistogram = figureHistogram.add_subplot ()
 
         xInputMin = np.min (xInput)
         xInputMax = np.max (xInput)
         xInputRange = xInputMax - xInputMin
         xInputBinSize = xInputRange / 100
 
-        bins = [ (xInputMin + i * xInputBinSize)  for i in range (-1, 102) ]
+        bins = xInputMin + np.arange (-1, 102) * xInputBinSize
         xInputHistogram = np.histogram (xInput, bins = bins)
         xInputHistogramMax = np.max (xInputHistogram [0])
 
-        plt.hist (xInput, bins = bins, color = 'green')
-        plt.xlim (xInputMin - 10 * xInputBinSize, xInputMax + 10 * xInputBinSize)
-        plt.ylim (0, xInputHistogramMax * 1.17)
-        plt.xlabel (xlabelToPrint, fontsize = 12)
-        plt.ylabel ('frequency', fontsize = 12)
+        # Draw the histogram that has already been calculated, rather than letting matplotlib calculate it again.
+        axisHistogram.stairs (xInputHistogram [0], xInputHistogram [1], fill = True, color = 'green')
+        axisHistogram.set_xlim (xInputMin - 10 * xInputBinSize, xInputMax + 10 * xInputBinSize)
+        axisHistogram.set_ylim (0, xInputHistogramMax * 1.17)
+        axisHistogram.set_xlabel (xlabelToPrint, fontsize = 12)
+        axisHistogram.set_ylabel ('frequency', fontsize = 12)
 
-        plt.title (HistTitleToPrint)
+        axisHistogram.set_title (HistTitleToPrint)
 
         if plotTextAverageMedian:
         
-            plt.text (xInputMin - 5 * xInputBinSize, 1.10 * xInputHistogramMax , labelMeanToPrint, color = 'green')
-            plt.text (xInputMin - 5 * xInputBinSize, 1.04 * xInputHistogramMax, labelSTDToPrint, color = 'green')
+            axisHistogram.text (xInputMin - 5 * xInputBinSize, 1.10 * xInputHistogramMax , labelMeanToPrint, color = 'green')
+            axisHistogram.text (xInputMin - 5 * xInputBinSize, 1.04 * xInputHistogramMax, labelSTDToPrint, color = 'green')
 
         
         # Save the histogram plot if the user has selected this option.
         if savePlots:
         
-            plt.savefig (plotFileNameHistogram)
-            plt.close ()
+            figureHistogram.savefig (plotFileNameHistogram)
+            
+            if not headless:
+            
+                plt.close (figureHistogram)
 
-        else:            
+        elif not headless:
         
             plt.show ()
 
 
+        if headless:
+        
+            return figureQQ, figureHistogram
 
-    # Calculate the gaussian normal cumulative distribution curve N(mu,sigma) between -5*sigma and +5*sigma at stepsize 0.05*sigma.
+
+
+    # Determine the file names of the QQ-plot and the histogram plot made by DataTools.QQPlot.
     @staticmethod
-    def getCumulativeNormalDistribution (mu,sigma):
+    def getQQPlotFileNames (plotBaseFileName = 'QQPlot.png'):
+        '''
+        :param plotBaseFileName: file name of the plots. It can be given with or without file  type extension (.png, .jpg, .jpeg or .gif). Spaces in the file name are replaced with :file:`_`.  
+        :type plotBaseFileName: str
+        
+        :return: the file names of the QQ-plot and of the histogram plot.
+        :rtype: str, str
+        
+        **Description:**
+        Determine the file names of the plots saved by the :py:meth:`~.QQPlot` function: 
+        the strings :file:`_QQPlot` and :file:`_Histogram` are added at the end of the :code:`plotBaseFileName`, before the extension. 
+        The default plot image file type is .png, if the user does not indicate any (.jpg, .jpeg or .gif).
         '''
-        :param mu: the average values of the data values.
-        :type mu: list [float]
 
-        :param sigma: the standard deviation of the data values.
-        :type sigma: float.
+        plotBaseFileName = plotBaseFileName.replace (' ', '_')
+   
+        extension = ' '
+        if '.png' in plotBaseFileName:
+        
+            extension = '.png'
+        
+        if '.jpg' in plotBaseFileName:
+
+            extension = '.jpg'
+            
+        if '.jpeg' in plotBaseFileName:
+        
+            extension = '.jpeg'
+
+        if '.gif' in plotBaseFileName:
+        
+            extension = '.gif'
+            
+        plotFileNameQQ = plotBaseFileName.split (extension)[0] + '_QQPlot'
+        plotFileNameQQ += '.png'  if extension == ' ' else  extension
+
+        plotFileNameHistogram = plotBaseFileName.split (extension)[0] + '_Histogram'
+        plotFileNameHistogram += '.png'  if extension == ' ' else  extension
+
+
+        return plotFileNameQQ, plotFileNameHistogram
+
+
+
+    # Select a bounded number of representative indices from a sorted list of values, keeping the tails.
+    @staticmethod
+    def getDecimatedIndices (numberOfValues, maximumNumberOfValues, fractionInTails = 0.2):
+        '''
+        :param numberOfValues: the number of values in the (sorted) list.
+        :type numberOfValues: int
+
+        :param maximumNumberOfValues: the maximum number of indices to return.
+        :type maximumNumberOfValues: int
+
+        :param fractionInTails: the fraction of :code:`maximumNumberOfValues` that is used to keep all the first and last values of the list (half at each end), default 0.2.
+        :type fractionInTails: float
+        
+        :return: the indices of the selected values, in increasing order.
+        :rtype: NumPy array 
+        
+        **Description:**
+        If :code:`numberOfValues` is larger than :code:`maximumNumberOfValues`, then select :code:`maximumNumberOfValues` indices: 
+        all the indices at both ends of the list (the tails of a sorted distribution, where the points of a QQ-plot are far apart), 
+        and equally spaced indices in between (where the points are so dense that they overlap anyway).
+        Otherwise all the indices are returned.
+        '''
+
+        if numberOfValues <= maximumNumberOfValues:
+        
+            return np.arange (numberOfValues)
+
+
+        numberOfValuesPerTail = int (maximumNumberOfValues * fractionInTails / 2)
+        numberOfValuesCentre = maximumNumberOfValues - 2 * numberOfValuesPerTail
+        
+        iLowerTail = np.arange (numberOfValuesPerTail)
+        iUpperTail = np.arange (numberOfValues - numberOfValuesPerTail, numberOfValues)
+        iCentre = np.linspace (numberOfValuesPerTail, numberOfValues - numberOfValuesPerTail - 1, numberOfValuesCentre).round ().astype (int)
+
+        return np.unique ( np.concatenate ( [iLowerTail, iCentre, iUpperTail] ) )
+
+
+
+    # Make and save the QQ-plot and histogram of a given list of input values, without showing them.
+    @staticmethod
+    def saveQQPlotFiles (xInput, plotBaseFileName = 'QQPlot.png', **QQPlotArguments):
+        '''
+        :param xInput: the list of data points.
+        :type xInput: list [float]
+
+        :param plotBaseFileName: file name of the plots, see :py:meth:`~.QQPlot`.
+        :type plotBaseFileName: str
+
+        :param QQPlotArguments: any other keyword arguments of :py:meth:`~.QQPlot`, for example :code:`xlabelToPrint`.
+
+        :return: the file names of the QQ-plot and the histogram.
+        :rtype: str, str
+        
+        **Description:**
+        Call :py:meth:`~.QQPlot` with :code:`headless = True` and :code:`savePlots = True` and return the file names of the saved plots.
+        This function is called by the workers of :py:meth:`~.saveQQPlotsWithProcessPool`.
+        '''
+
+        QQPlotArguments ['headless'] = True
+        QQPlotArguments ['savePlots'] = True
+
+        DataTools.QQPlot (xInput, plotBaseFileName = plotBaseFileName, **QQPlotArguments)
+
+        return DataTools.getQQPlotFileNames (plotBaseFileName)
+
+
+
+    # Make and save the QQ-plots and histograms of many data sets in parallel.
+    @staticmethod
+    def saveQQPlotsWithProcessPool (listOfxInputs, listOfPlotBaseFileNames, numberOfProcesses = None, **QQPlotArguments):
+        '''
+        :param listOfxInputs: list of data sets, each a list of data points.
+        :type listOfxInputs: list [ list [float] or NumPy array ]
+
+        :param listOfPlotBaseFileNames: the file name of the plots for each data set, see :py:meth:`~.QQPlot`.
+        :type listOfPlotBaseFileNames: list [str]
+
+        :param numberOfProcesses: the number of worker processes, default :code:`None` is the number of processors of the machine.
+        :type numberOfProcesses: int
+        
+        :param QQPlotArguments: any other keyword arguments of :py:meth:`~.QQPlot`, for example :code:`xlabelToPrint`.
+        
+        :return: the file names of the QQ-plot and the histogram of each data set; empty strings for a data set that could not be plotted.
+        :rtype: list [ (str, str) ]
         
-        :return: x and 
-        :rtype: list [float], list [float]
+        **Description:**
+        Make and save the QQ-plot and histogram of each data set in :code:`listOfxInputs`, using a pool of worker processes.
+        Each worker calls the :py:meth:`~.saveQQPlotFiles` function. 
+        '''
+
+        if len (listOfxInputs) != len (listOfPlotBaseFileNames):
+        
+            print ()
+            print ('---WARNING---')
+            print (' Number of data sets does not correspond to the number of plot file names.')
+
+            return []
+
+
+        with ProcessPoolExecutor (max_workers = numberOfProcesses) as processPool:
+
+            futures = [ processPool.submit (DataTools.saveQQPlotFiles, xInput, plotBaseFileName, **QQPlotArguments)  
+                        for xInput, plotBaseFileName in zip (listOfxInputs, listOfPlotBaseFileNames) ]
+
+
+            plotFileNames = []
+            for future, plotBaseFileName in zip (futures, listOfPlotBaseFileNames):
+            
+                try:
+
+                    plotFileNames.append ( future.result () )
+
+                except Exception as exception:
+                
+                    print ()
+                    print ('---WARNING---')
+                    print (' QQ-plot {} could not be made: {}'.format (plotBaseFileName, exception))
+                    
+                    plotFileNames.append ( ('', '') )
+
+
+        return plotFileNames
+
+
+
+    # Calculate the values of the QQ-plot (or Quantile-Quantile plot) of a given list of input values, without plotting.
+    @staticmethod
+    def getQQData (xInput):
+        '''
+        :param xInput: the list of data points.
+        :type xInput: list [float] or NumPy array (one dimension)
+
+        :return: the sorted input values normalised to N(mu,sigma), the corresponding theoretical quantiles z (in sigma) of the normal distribution, the mean, median and standard deviation of the input values.
+        :rtype: NumPy array, NumPy array, float, float, float
         
         
         **Description:**
-        Calculate the gaussian normal cumulative distribution curve N(mu,sigma) between -5 x sigma and +5 x sigma at stepsize 0.05 x sigma.
-        The results of the :py:meth:`~.getNormalDistribution` function call is used. 
-        This function is called from the :py:meth:`~.QQPlot` function.
+        Calculate the values of the QQ-plot (or Quantile-Quantile plot) of a given list of data values. 
+        The input values are sorted and each value is assigned an estimated cumulative distribution value i / N (i = 0, ..., N - 1).
+        The x-value that corresponds to this cumulative value in a true normal distribution N (mu, sigma), with mu and sigma the mean and standard deviation of the input values, 
+        is found by linear interpolation in the curve of the :py:meth:`~.getCumulativeNormalDistribution` function, for all values at once. 
+        Cumulative values beyond the range of this curve are given the first or last x-value of the curve.
+        
+        This function does not plot anything, it is called by the :py:meth:`~.QQPlot` function to do the calculations.
         '''
 
-        x, normalDistribution = DataTools.getNormalDistribution (mu, sigma)
+        xInput = np.asarray (xInput)
+        xInputMean = np.mean (xInput)
+        xInputMedian = np.median (xInput)
+        xInputStd = np.std (xInput)
+
+        x, cumulativeNormalDistribution = DataTools.getCumulativeNormalDistribution (xInputMean, xInputStd)
+
+        xInputfilterOrdered = np.sort (xInput)
+        numberOfValues = len (xInputfilterOrdered)
+
+        # The estimated cumulative distribution value of each of the ordered input values.
+        xInputCumulativeNormalDistribution = np.arange (numberOfValues) / numberOfValues
+
+        # Find where the estimated cumulative distribution values lie in the true normally distributed cumulativeNormalDistribution
+        #  and calculate by interpolation the x-value of the normal distribution that would correspond to each of them.
+        xValues = np.interp (xInputCumulativeNormalDistribution, cumulativeNormalDistribution, x)
+
+        zValues = (xValues - xInputMean) / xInputStd
+        zValuesxInputfilterOrdered = (xInputfilterOrdered - xInputMean) / xInputStd
+
+
+        return zValuesxInputfilterOrdered, zValues, xInputMean, xInputMedian, xInputStd
 
-        cumulativeNormalDistribution = []
 
-        cumulativeNormalDistribution.append ( normalDistribution [0] )
 
-        for i in range ( 1, len (x) - 1 ):
+    # Calculate the gaussian normal cumulative distribution curve N(mu,sigma) between -5*sigma and +5*sigma at stepsize 0.05*sigma.
+    @staticmethod
+    def getCumulativeNormalDistribution (mu, sigma, rangeInSigma = 5, stepInSigma = 0.05):
+        '''
+        :param mu: the average values of the data values.
+        :type mu: float
+
+        :param sigma: the standard deviation of the data values.
+        :type sigma: float
+        
+        :param rangeInSigma: the curve is calculated between -rangeInSigma x sigma and +rangeInSigma x sigma, default = 5.
+        :type rangeInSigma: float
+
+        :param stepInSigma: the step size of the curve in units of sigma, default = 0.05.
+        :type stepInSigma: float
+        
+        :return: the equally separated x values and the corresponding values of the cumulative normal distribution.
+        :rtype: NumPy array, NumPy array
+        
+        
+        **Description:**
+        Calculate the gaussian normal cumulative distribution curve N(mu,sigma) between -5 x sigma and +5 x sigma at stepsize 0.05 x sigma (default values).
+        The cumulative values are exact (evaluated with the error function), they are taken from the standard normal curve 
+        of the :py:meth:`~.getStandardNormalDistributionGrid` function, since they do not depend on mu and sigma.
+        This function is called from the :py:meth:`~.getQQData` function.
+        '''
 
-            cumulativeNormalDistribution.append ( cumulativeNormalDistribution [-1] + 
-                                                  ( x [i]- x [i-1] ) * ( normalDistribution [i] + normalDistribution [i-1] ) / 2 )
+        z, standardNormalDistribution, cumulativeNormalDistribution = DataTools.getStandardNormalDistributionGrid (rangeInSigma, stepInSigma)
 
-        cumulativeNormalDistribution.append ( cumulativeNormalDistribution [-1] )
+        x = mu + sigma * z
 
-        return x, cumulativeNormalDistribution
+        return x, cumulativeNormalDistribution.copy ()
 
 
 
     # Calculate the gaussian normal distribution curve N(mu,sigma) between -5*sigma and +5*sigma at stepsize 0.05*sigma.
     @staticmethod
-    def getNormalDistribution (mu,sigma):
+    def getNormalDistribution (mu, sigma, rangeInSigma = 5, stepInSigma = 0.05):
         '''
         :param mu: the average values of the data values.
         :type mu: float
 
         :param sigma: the standard deviation of the data values.
         :type sigma: float
+
+        :param rangeInSigma: the curve is calculated between -rangeInSigma x sigma and +rangeInSigma x sigma, default = 5.
+        :type rangeInSigma: float
+
+        :param stepInSigma: the step size of the curve in units of sigma, default = 0.05.
+        :type stepInSigma: float
  
         :return: the equally separated x values along the gaussian distribution and the corresponding values of a pure normal distribution.
-        :rtype: list [float], list [float]
+        :rtype: NumPy array, NumPy array
                
         **Description:**
-        Calculate the gaussian normal distribution curve N (mu,sigma) between -5 x sigma and +5 x sigma at stepsize 0.05 x sigma.
-        This function calls the :py:meth:`~.getNormalDistributionValue` function and it is called by the :py:meth:`~.getCumulativeNormalDistribution` function.
+        Calculate the gaussian normal distribution curve N (mu,sigma) between -5 x sigma and +5 x sigma at stepsize 0.05 x sigma (default values).
+        The shape of the curve does not depend on mu and sigma, so the standard normal curve of the :py:meth:`~.getStandardNormalDistributionGrid` function 
+        is rescaled.
         '''
 
-        constant = 1 / (sigma * np.sqrt (2 * np.pi))
-
-        x = [ (mu + i*sigma / 20) for i in range (-100, 101) ]
+        z, standardNormalDistribution, standardCumulativeNormalDistribution = DataTools.getStandardNormalDistributionGrid (rangeInSigma, stepInSigma)
 
-        normalDistribution = [ constant * DataTools.getNormalDistributionValue (x [i], mu, sigma)  for i in range ( len (x) ) ]
+        x = mu + sigma * z
+        normalDistribution = standardNormalDistribution / sigma
 
         return x, normalDistribution
 
 
 
+    # Calculate (once) the standard gaussian normal distribution and cumulative distribution curves N(0,1).
+    @staticmethod
+    def getStandardNormalDistributionGrid (rangeInSigma = 5, stepInSigma = 0.05):
+        '''
+        :param rangeInSigma: the curves are calculated between -rangeInSigma and +rangeInSigma, default = 5.
+        :type rangeInSigma: float
+
+        :param stepInSigma: the step size of the curves, default = 0.05.
+        :type stepInSigma: float
+ 
+        :return: the equally separated z values, the corresponding values of the standard normal distribution and of the cumulative standard normal distribution.
+        :rtype: NumPy array, NumPy array, NumPy array
+               
+        **Description:**
+        Calculate the standard gaussian normal distribution N (0,1) and its cumulative distribution, 0.5 x (1 + erf (z / sqrt (2) ) ), at the z values between 
+        -rangeInSigma and +rangeInSigma at stepsize stepInSigma. 
+        The curves are calculated only once for each combination of :code:`rangeInSigma` and :code:`stepInSigma` and are kept in memory; 
+        the returned arrays are therefore read-only. 
+        They are used by the :py:meth:`~.getNormalDistribution` and :py:meth:`~.getCumulativeNormalDistribution` functions.
+        '''
+
+        gridKey = (rangeInSigma, stepInSigma)
+        if gridKey not in standardNormalDistributionGrids:
+        
+            numberOfSteps = int ( round (rangeInSigma / stepInSigma) )
+            z = np.arange (-numberOfSteps, numberOfSteps + 1) * stepInSigma
+
+            # scipy.special is only imported here, so that importing DataTools stays fast.
+            from scipy import special
+
+            standardNormalDistribution = DataTools.getNormalDistributionValue (z, 0, 1) / np.sqrt (2 * np.pi)
+            cumulativeNormalDistribution = 0.5 * ( 1 + special.erf ( z / np.sqrt (2) ) )
+
+            for gridArray in [z, standardNormalDistribution, cumulativeNormalDistribution]:
+            
+                gridArray.setflags (write = False)
+
+            standardNormalDistributionGrids [gridKey] = z, standardNormalDistribution, cumulativeNormalDistribution
+
+
+        return standardNormalDistributionGrids [gridKey]
+
+
+
     # The value of the gaussian normal distribution defined by N(mu, sigma) at xi.
     @staticmethod
     def getNormalDistributionValue (xi,mu,sigma):
         '''
-        :param xi: the x-value to calculate the normal distribution value for.
-        :type xi: float
+        :param xi: the x-value(s) to calculate the normal distribution value for.
+        :type xi: float, list [float] or NumPy array
 
         :param mu: the average values of the data values.
         :type mu: float
@@ -867,15 +1223,21 @@ class DataTools:
         :param sigma: the standard deviation of the data values.
         :type sigma: float
  
-        :return: the normal distribution value for the point x-i in the normal distribution with average mu and standard deviation sigma.
-        :rtype: float
+        :return: the normal distribution value(s) for the point(s) x-i in the normal distribution with average mu and standard deviation sigma.
+        :rtype: float or NumPy array
         
         
         **Description:**
-        The value of the gaussian normal distribution defined by N (mu, sigma) at xi.
-        This function is called by the :py:meth:`~.getNormalDistribution` function.
+        The value of the gaussian normal distribution defined by N (mu, sigma) at xi, not normalised (the value at xi = mu is 1).
+        If :code:`xi` is a list or NumPy array, then the values for all the elements are calculated at once.
+        This function is called by the :py:meth:`~.getStandardNormalDistributionGrid` function.
         '''
 
+        if type (xi) in [list, tuple]:
+        
+            xi = np.asarray (xi)
+            
+
         normalValue = np.exp ( -0.5 * (xi - mu) * (xi - mu) / sigma / sigma )
 
         return normalValue
@@ -911,17 +1273,8 @@ class DataTools:
         if len (dataValues):
                     
                     
-            if PYtoCPP and DataWranglingToolsPYtoCPPExists:
-            
-                averageValue, standardDeviation, variance = DataWranglingToolsPYtoCPP.getAverageVarAndSDPYtoCPP (dataValues)
-
-
-            elif not PYtoCPP or not DataWranglingToolsPYtoCPPExists:
-
-                averageValue = np.average (dataValues)
-                standardDeviation = np.std (dataValues)
-                variance = standardDeviation ** 2
-                
+            backendName, backendFunction = DataTools.selectBackend ('getAverageVarAndSD', len (dataValues), PYtoCPP)
+            averageValue, standardDeviation, variance = backendFunction (dataValues)
 
 
             return averageValue, standardDeviation, variance
@@ -938,7 +1291,8 @@ class DataTools:
                                        upperQuantilePercentage = 75, 
                                        removeNaN = False,
                                        uncertainties = [],
-                                       numberOfUncertaintyExperiments = 1000 ):
+                                       numberOfUncertaintyExperiments = 1000,
+                                       randomGenerator = None ):
         '''
         :param dataValues: list of data values.
         :type dataValues: list [float] or NumPy array (one dimension)
@@ -958,6 +1312,9 @@ class DataTools:
         :param numberOfUncertaintyExperiments: number of experiments to perform to create gaussian-randomised dataValues for the determination of the uncertainty in the median.
         :type numberOfUncertaintyExperiments: int
 
+        :param randomGenerator: a seed or NumPy random Generator for the experiments, for reproducible results, default :code:`None`.
+        :type randomGenerator: int or np.random.Generator
+
         
         :return: median, lower and upper quantile as defined by lowerQuantilePercentage and upperQuantilePercentage, uncertainty in the median.
         :rtype: float, float, float, float
@@ -966,7 +1323,7 @@ class DataTools:
         Calculate the median, lower and upper quantiles of the list of data values using C++ code.   
         If :code:`removeNaN = True`, then call the :py:meth:`~.getNanFreeNumpyArray` function to remove any NaN values from the data list.
         
-        If there are uncertainties associated with the data values, then the uncertainty in the median can be estimated from running a number of experiments. In each experiment, a new set of data values is created from the original set by adding random gaussian noise (using the NumPy random.normal method) with a standard deviation equal to the uncertainty in each data value. The medians of these experiments are collected and at the end, the standard deviation of these medians is returned. This value can be considered a good approximation of the uncertainty in the median of the original set due to the uncertainties in the data values. The default number of experiments is 1000, and this is only done if the uncertainties in the data values are passed as a list to the :code:`uncertainties` variable.
+        If there are uncertainties associated with the data values, then the uncertainty in the median can be estimated from running a number of experiments. In each experiment, a new set of data values is created from the original set by adding random gaussian noise (using the :py:meth:`~.getDataValuesWithGaussianNoiseChunks` function) with a standard deviation equal to the uncertainty in each data value. The medians of these experiments are collected and at the end, the standard deviation of these medians is returned. This value can be considered a good approximation of the uncertainty in the median of the original set due to the uncertainties in the data values. The default number of experiments is 1000, and this is only done if the uncertainties in the data values are passed as a list to the :code:`uncertainties` variable.
         '''
 
         if removeNaN:
@@ -980,8 +1337,8 @@ class DataTools:
         numberOfUncertainties = len (uncertainties)
         if numberOfDataValues:
     
-            medianValue, lowerQuantileValue, upperQuantileValue = \
-             DataWranglingToolsPYtoCPP.getMedianAndQuantilesPYtoCPP (dataValues, lowerQuantilePercentage / 100, upperQuantilePercentage / 100)   
+            backendName, backendFunction = DataTools.selectBackend ('getMedianAndQuantiles', numberOfDataValues)
+            medianValue, lowerQuantileValue, upperQuantileValue = backendFunction (dataValues, lowerQuantilePercentage / 100, upperQuantilePercentage / 100)   
 
             medianValueUncertainty = 0
             # If there are uncertainties associated with every data values, then use these to run experiments to determine the uncertainty in the median value.
@@ -995,12 +1352,16 @@ class DataTools:
                 
             
                     medianValuesExperiments = []
-                    for iExperiment in range (numberOfUncertaintyExperiments):
+                    
+                    # Assume that the uncertainty in each data value represents the standard deviation of a normal distribution around this data value.                 
+                    for dataValuesRandomisedChunk in DataTools.getDataValuesWithGaussianNoiseChunks ( dataValues, 
+                                                                                                      uncertainties, 
+                                                                                                      numberOfRealizations = numberOfUncertaintyExperiments, 
+                                                                                                      randomGenerator = randomGenerator ):
     
-                        # Assume that the uncertainty in each data value represents the standard deviation of a normal distribution around this data value.                 
-                        dataValuesRandomised = DataTools.getDataValuesWithGaussianNoise (dataValues, uncertainties)
+                        for dataValuesRandomised in dataValuesRandomisedChunk:
                        
-                        medianValuesExperiments.append ( DataWranglingToolsPYtoCPP.getMedianAndQuantilesPYtoCPP (dataValuesRandomised, 0, 1)[0] )
+                            medianValuesExperiments.append ( backendFunction (dataValuesRandomised, 0, 1)[0] )
                 
                     medianValueUncertainty = DataTools.getAverageVarAndSDPYtoCPP (medianValuesExperiments) [1]
                 
@@ -1015,7 +1376,7 @@ class DataTools:
 
     #
     @staticmethod
-    def getNanFreeNumpyArray (dataValues, replaceWithValue = False, valueToReplace = 0.):
+    def getNanFreeNumpyArray (dataValues, replaceWithValue = False, valueToReplace = 0., out = None, workspace = None):
         '''
         :param dataValues: complete list of data values.
         :type dataValues: list [float] or NumPy array (one dimension)
@@ -1025,27 +1386,70 @@ class DataTools:
         
         :param valueToReplace: value to replace NaN elements if :code:`replaceWithZero == True`, default = 0.
         :type valueToReplace: float
+
+        :param out: array in which the cleansed data values are stored, with the same data type and (at least) the same number of values as :code:`dataValues`, 
+            default :code:`None`.
+        :type out: NumPy array
+
+        :param workspace: boolean array with (at least) the same number of values as :code:`dataValues`, in which the NaN elements are marked, default :code:`None`.
+        :type workspace: NumPy array <bool>
         
         :return: list of data values with any NaN values removed or replaced with :code:`valueToReplace`. value.
         :rtype: NumPy array 
         
         **Description:**
         Remove or replace with zero values all the NaN values from a list of data values and return the cleansed list as a NumPy array (one dimension).
+
+        If an :code:`out` array is given, then the :code:`dataValues` are not changed and the cleansed list is stored in (the first part of) :code:`out`,
+        which is returned. Together with a :code:`workspace`, no new arrays are made, so that the same arrays can be reused when many lists are cleansed in a loop.
         '''
         
-        if type (dataValues) == list:
-                
-            iNaNValues = np.isnan ( np.asarray (dataValues) )  
-            
+        if out is not None or workspace is not None:
+
+            dataValues = np.asarray (dataValues)
+            out = DataTools.checkOutputArray ( out, len (dataValues), [dataValues.dtype.type], 'getNanFreeNumpyArray', exactLength = False )
+            workspace = DataTools.checkOutputArray ( workspace, len (dataValues), [np.bool_], 'getNanFreeNumpyArray', exactLength = False )
+            iNaNValues = np.isnan ( dataValues, out = workspace [:len (dataValues)] ) if workspace is not None else np.isnan (dataValues)
+
             if replaceWithValue:
-            
-                dataValues = np.asarray (dataValues)
-                dataValues [iNaNValues] = valueToReplace
-                return dataValues
-               
-            else:
-              
-                return np.asarray (dataValues) [~iNaNValues]
+
+                if out is None:
+
+                    dataValues [iNaNValues] = valueToReplace
+                    return dataValues
+
+
+                out = out [:len (dataValues)]
+                np.copyto (out, dataValues)
+                out [iNaNValues] = valueToReplace
+                return out
+
+            else:
+
+                if out is None:
+
+                    return dataValues [~iNaNValues]
+
+
+                # Invert the marks in place, so that no new array is made for them either.
+                iValues = np.logical_not (iNaNValues, out = iNaNValues)
+                numberOfValues = np.count_nonzero (iValues)
+                return np.compress ( iValues, dataValues, out = out [:numberOfValues] )
+
+
+        if type (dataValues) == list:
+                
+            iNaNValues = np.isnan ( np.asarray (dataValues) )  
+            
+            if replaceWithValue:
+            
+                dataValues = np.asarray (dataValues)
+                dataValues [iNaNValues] = valueToReplace
+                return dataValues
+               
+            else:
+              
+                return np.asarray (dataValues) [~iNaNValues]
         
         else:
         
@@ -1064,7 +1468,12 @@ class DataTools:
 
     #
     @staticmethod
-    def getDataValuesWithGaussianNoise (dataValues, uncertainties):
+    def getDataValuesWithGaussianNoise ( dataValues, 
+                                         uncertainties, 
+                                         numberOfRealizations = None, 
+                                         useSingle = False, 
+                                         numberOfRealizationsPerChunk = 1000, 
+                                         randomGenerator = None ):
         '''
         :param dataValues: complete list of data values.
         :type dataValues: list [float] or NumPy array (one dimension)
@@ -1072,20 +1481,52 @@ class DataTools:
         :param uncertainties: list of uncertainties for each data point.
         :type uncertainties: list [float] or NumPy array (one dimension)
         
-        :return: list of data values with random Gaussian noise added.
+        :param numberOfRealizations: the number K of noisy versions of the data values to return, default :code:`None` for one version. 
+        :type numberOfRealizations: int
+        
+        :param useSingle: if :code:`True` then return 32-float (np.single) values, default :code:`False` (64-float).
+        :type useSingle: bool
+        
+        :param numberOfRealizationsPerChunk: the number of realizations for which the random numbers are generated at once, default 1000.
+        :type numberOfRealizationsPerChunk: int
+
+        :param randomGenerator: a seed or NumPy random Generator, for reproducible results, default :code:`None` (a new unpredictable seed).
+        :type randomGenerator: int or np.random.Generator
+        
+        :return: list of data values with random Gaussian noise added, or array (K x N) of K lists of data values with noise if :code:`numberOfRealizations` is given.
         :rtype: NumPy array 
         
         **Description:**
-        Add Gaussian noise to a list of data values using the NumPy random.normal method. The user-provided uncertainty values for each data value are fed
-        into the np.random.normal method as the standard deviation of the normal distribution with mean value the data value.
+        Add Gaussian noise to a list of data values using the NumPy random Generator standard_normal method. The user-provided uncertainty values for each data value 
+        are used as the standard deviation of the normal distribution with mean value the data value.
+        
+        The random numbers are written in place into the output array, :code:`numberOfRealizationsPerChunk` realizations at the time,
+        see :py:meth:`~.getDataValuesWithGaussianNoiseChunks`. 
+        Pass the same :code:`randomGenerator` seed to obtain the same result in different runs, or a separate np.random.Generator per thread.
         '''
 
         # Only do the noise adding if all the data values have associated uncertainties.
         if len (dataValues) == len (uncertainties):
         
-            # Assume that the uncertainty in each data value represents the standard deviation of a normal distribution around this data value.                 
-            dataValuesWithGaussianNoise = [ np.random.normal (dataValues [iDataValue], uncertainties [iDataValue], 1)[0]  
-                                            for iDataValue in range ( len (uncertainties) ) ]            
+            numberOfRealizationsToGenerate = numberOfRealizations  if numberOfRealizations  else 1
+
+            dataValuesWithGaussianNoise = np.empty ( ( numberOfRealizationsToGenerate, len (dataValues) ), dtype = np.single if useSingle else np.double )
+
+            # The chunks are written directly into the  dataValuesWithGaussianNoise  array.
+            for dataValuesWithGaussianNoiseChunk in DataTools.getDataValuesWithGaussianNoiseChunks ( dataValues, 
+                                                                                                     uncertainties, 
+                                                                                                     numberOfRealizations = numberOfRealizationsToGenerate,
+                                                                                                     useSingle = useSingle,
+                                                                                                     numberOfRealizationsPerChunk = numberOfRealizationsPerChunk,
+                                                                                                     randomGenerator = randomGenerator,
+                                                                                                     out = dataValuesWithGaussianNoise ):
+
+                pass
+
+
+            if not numberOfRealizations:
+            
+                dataValuesWithGaussianNoise = dataValuesWithGaussianNoise [0]
             
             
         # If the number of data values does not match the number of uncertainty values, then issue a warning and return the data values.
@@ -1096,10 +1537,98 @@ class DataTools:
             print (' Number of data values does not correspond to the number of uncertainty values.')
 
         
-            dataValuesWithGaussianNoise = dataValues
+            dataValuesWithGaussianNoise = np.asarray (dataValues)
+            
+            if numberOfRealizations:
+            
+                dataValuesWithGaussianNoise = np.tile ( dataValuesWithGaussianNoise, (numberOfRealizations, 1) )
+
+            
+        return  dataValuesWithGaussianNoise
+
+
+
+    #
+    @staticmethod
+    def getDataValuesWithGaussianNoiseChunks ( dataValues, 
+                                               uncertainties, 
+                                               numberOfRealizations = 1000, 
+                                               useSingle = False, 
+                                               numberOfRealizationsPerChunk = 1000, 
+                                               randomGenerator = None,
+                                               out = None ):
+        '''
+        :param dataValues: complete list of data values.
+        :type dataValues: list [float] or NumPy array (one dimension)
+
+        :param uncertainties: list of uncertainties for each data point, with the same length as :code:`dataValues`.
+        :type uncertainties: list [float] or NumPy array (one dimension)
+        
+        :param numberOfRealizations: the total number K of noisy versions of the data values, default 1000. 
+        :type numberOfRealizations: int
+        
+        :param useSingle: if :code:`True` then generate 32-float (np.single) values, default :code:`False` (64-float).
+        :type useSingle: bool
+        
+        :param numberOfRealizationsPerChunk: the maximum number of realizations in each chunk, default 1000.
+        :type numberOfRealizationsPerChunk: int
+
+        :param randomGenerator: a seed or NumPy random Generator, for reproducible results, default :code:`None` (a new unpredictable seed).
+        :type randomGenerator: int or np.random.Generator
+
+        :param out: optional array (K x N) in which the chunks are written; if :code:`None`, one chunk-sized array is re-used for all the chunks.
+        :type out: NumPy array
+        
+        :return: generator of arrays (at most numberOfRealizationsPerChunk x N) of data values with random Gaussian noise added.
+        :rtype: generator [NumPy array]
+        
+        **Description:**
+        Generate K noisy versions of the data values in chunks, so that memory use is bounded by the chunk size rather than by K.
+        The random numbers are drawn directly into the chunk array, scaled with the uncertainties and shifted by the data values in place.
+        
+        .. attention::
+        
+            If :code:`out` is not given, then the same array is filled again for the next chunk: 
+            copy a chunk if it needs to be kept after the next iteration.
+        
+        .. code-block:: Python
+        
+            for dataValuesRandomisedChunk in DataTools.getDataValuesWithGaussianNoiseChunks (dataValues, uncertainties, numberOfRealizations = 100000, randomGenerator = 42):
+            
+                medians = np.median (dataValuesRandomisedChunk, axis = 1)
+        '''
+
+        randomGenerator = np.random.default_rng (randomGenerator)
+        dataType = np.single if useSingle else np.double
+        
+        dataValues = np.asarray (dataValues, dtype = dataType)
+        uncertainties = np.asarray (uncertainties, dtype = dataType)
+        
+        if out is None:
+        
+            chunkBuffer = np.empty ( ( min (numberOfRealizations, numberOfRealizationsPerChunk), len (dataValues) ), dtype = dataType )
 
+        
+        for iRealizationStart in range (0, numberOfRealizations, numberOfRealizationsPerChunk):
+        
+            iRealizationEnd = min (iRealizationStart + numberOfRealizationsPerChunk, numberOfRealizations)
             
-        return  np.asarray (dataValuesWithGaussianNoise)
+            if out is None:
+            
+                dataValuesWithGaussianNoiseChunk = chunkBuffer [ 0 : iRealizationEnd - iRealizationStart ]
+                
+            else:
+            
+                dataValuesWithGaussianNoiseChunk = out [iRealizationStart : iRealizationEnd]
+
+
+            # Assume that the uncertainty in each data value represents the standard deviation of a normal distribution around this data value.                 
+            randomGenerator.standard_normal (out = dataValuesWithGaussianNoiseChunk, dtype = dataType)
+            dataValuesWithGaussianNoiseChunk *= uncertainties
+            dataValuesWithGaussianNoiseChunk += dataValues
+
+            yield dataValuesWithGaussianNoiseChunk
+
 
 
     #
@@ -1125,21 +1654,14 @@ class DataTools:
         than the :code:`valueToCompare`. 
         The user must indicate whether the values in the list are strictly monotonically in(de)creasing or not.
         If there are sequential values in a monotonic list that are the same, and if these happen to be the nearest value, 
-        then the C++ version will chose the last one! This is **different** from the :code:`np.argmin` version that is called if :code:`PYtoCPP` and/or
-        :code:`DataWranglingToolsPYtoCPPExists` are set to :code:`False`, which will chose the first one!        
+        then the last one is chosen, both by the C++ version and by the NumPy version that is called if :code:`PYtoCPP` and/or
+        :code:`DataWranglingToolsPYtoCPPExists` are set to :code:`False` (see also :py:meth:`~.setBackendPreference`).
         '''
 
         if len (dataValues):
 
-            if PYtoCPP and DataWranglingToolsPYtoCPPExists:
-                        
-                iNearestValue, smallestDifference = DataWranglingToolsPYtoCPP.getNearestValuePYtoCPP (dataValues, valueToCompare, monotonicList)
-
-
-            elif not PYtoCPP or not DataWranglingToolsPYtoCPPExists:
-
-                iNearestValue = np.argmin ( np.abs ( np.asarray (dataValues) - valueToCompare ) )
-                smallestDifference = dataValues [iNearestValue] - valueToCompare              
+            backendName, backendFunction = DataTools.selectBackend ('getNearestValue', len (dataValues), PYtoCPP)
+            iNearestValue, smallestDifference = backendFunction (dataValues, valueToCompare, monotonicList)
             
         
             return iNearestValue, smallestDifference
@@ -1149,3 +1671,2032 @@ class DataTools:
             return np.nan, np.nan
 
 
+
+    # Open a (large) list of data values stored in a file as a memory-mapped array, so that it does not need to be read into memory.
+    @staticmethod
+    def openMemoryMappedArray (dataValues, dataType = None, offset = 0, numberOfValues = None):
+        '''
+        :param dataValues: the name of a NumPy (.npy) file or of a raw binary file, or a NumPy array (one dimension) such as an np.memmap.
+        :type dataValues: str, Path or NumPy array
+
+        :param dataType: the data type of the values in a raw binary file, for example :code:`np.short`, default :code:`None`. Not used for a .npy file.
+        :type dataType: NumPy dtype
+
+        :param offset: the number of bytes before the first value in a raw binary file (for example a header), default 0.
+        :type offset: int
+
+        :param numberOfValues: the number of values to use from a raw binary file, default :code:`None` (up to the end of the file).
+        :type numberOfValues: int
+
+        :return: the read-only memory-mapped array, :code:`dataValues` itself if it is already an array, or :code:`None` if the file cannot be opened.
+        :rtype: np.memmap or NumPy array
+
+
+        **Description:**
+        Used by the *out-of-core* methods (:py:meth:`~.getAverageVarAndSDOutOfCore`, :py:meth:`~.getMedianAndQuantilesOutOfCore`, 
+        :py:meth:`~.passFilterOutOfCore`, :py:meth:`~.applyWindowOperationOutOfCore` and :py:meth:`~.getSegmentSpecsFromDataValuesOutOfCore`), 
+        which run over the data values chunk by chunk (see :py:meth:`~.getMemoryMappedChunks`), so that files that are much larger than the memory 
+        can be analysed. Only the parts of the file that are being used are read from disk, by the operating system.
+        '''
+
+        if isinstance (dataValues, (str, Path)):
+
+            if not os.path.isfile (dataValues):
+
+                print ()
+                print ('---WARNING---')
+                print (' From DataTools.openMemoryMappedArray: ')
+                print ('  file {} does not exist.'.format (dataValues) )
+
+                return None
+
+
+            if str (dataValues).endswith ('.npy'):
+
+                dataValues = np.load (dataValues, mmap_mode = 'r')
+
+            elif dataType is None:
+
+                print ()
+                print ('---WARNING---')
+                print (' From DataTools.openMemoryMappedArray: ')
+                print ('  the data type of the values in raw binary file {} needs to be given.'.format (dataValues) )
+
+                return None
+
+            else:
+
+                dataValues = np.memmap ( dataValues, dtype = dataType, mode = 'r', offset = offset, shape = None if numberOfValues is None else (numberOfValues,) )
+
+
+        dataValues = np.asanyarray (dataValues)
+        if dataValues.ndim != 1:
+
+            print ()
+            print ('---WARNING---')
+            print (' From DataTools.openMemoryMappedArray: ')
+            print ('  the data values need to be a list of one dimension, not {}.'.format (dataValues.shape) )
+
+            return None
+
+
+        return dataValues
+
+
+
+    # Run over a (memory-mapped) list of data values chunk by chunk, with the overlap (halo) that window operations need at each side of a chunk.
+    @staticmethod
+    def getMemoryMappedChunks (dataValues, numberOfValuesPerChunk = 4194304, haloWidth = 0):
+        '''
+        :param dataValues: list of data values, for example opened with :py:meth:`~.openMemoryMappedArray`.
+        :type dataValues: NumPy array or np.memmap (one dimension)
+
+        :param numberOfValuesPerChunk: the number of values in each chunk (without the halo), default 4194304.
+        :type numberOfValuesPerChunk: int
+
+        :param haloWidth: the number of values before and after each chunk that are added to it (as far as they exist), default 0.
+        :type haloWidth: int
+
+        :return: generator of iChunkStart, iChunkEnd, iHaloStart and the chunk (with the halo), which holds the values :code:`dataValues [iHaloStart : iHaloEnd]`.
+        :rtype: generator [int, int, int, NumPy array]
+
+
+        **Description:**
+        The chunks are views on :code:`dataValues`, not copies: the values of a memory-mapped file are only read when they are used. 
+        The result of a window operation with a (half) window width of at most :code:`haloWidth` on a chunk is correct for the values 
+        :code:`iChunkStart` to :code:`iChunkEnd`, which start at index :code:`iChunkStart - iHaloStart` of the chunk.
+
+        .. code-block:: Python
+
+            dataValues = DataTools.openMemoryMappedArray ('recording.npy')
+            for iChunkStart, iChunkEnd, iHaloStart, dataValuesChunk in DataTools.getMemoryMappedChunks (dataValues, haloWidth = 5):
+
+                dataValuesFiltered = DataTools.passAverageFilter (dataValuesChunk, 11) [iChunkStart - iHaloStart : iChunkEnd - iHaloStart]
+        '''
+
+        numberOfValues = len (dataValues)
+        for iChunkStart in range (0, numberOfValues, numberOfValuesPerChunk):
+
+            iChunkEnd = min (iChunkStart + numberOfValuesPerChunk, numberOfValues)
+            iHaloStart = max (iChunkStart - haloWidth, 0)
+            iHaloEnd = min (iChunkEnd + haloWidth, numberOfValues)
+
+            yield iChunkStart, iChunkEnd, iHaloStart, np.asarray ( dataValues [iHaloStart : iHaloEnd] )
+
+
+
+    # Average, standard deviation and variance of a list of data values that does not fit in memory.
+    @staticmethod
+    def getAverageVarAndSDOutOfCore (dataValues, dataType = None, offset = 0, numberOfValuesPerChunk = 4194304, removeNaN = False, PYtoCPP = True):
+        '''
+        :param dataValues: the name of a NumPy (.npy) or raw binary file, or a (memory-mapped) NumPy array, see :py:meth:`~.openMemoryMappedArray`.
+        :type dataValues: str, Path or NumPy array
+
+        :param dataType: the data type of the values in a raw binary file, default :code:`None`.
+        :type dataType: NumPy dtype
+
+        :param offset: the number of bytes before the first value in a raw binary file, default 0.
+        :type offset: int
+
+        :param numberOfValuesPerChunk: the number of values that are analysed at a time, default 4194304.
+        :type numberOfValuesPerChunk: int
+
+        :param removeNaN: if True then ignore any NaN values.
+        :type removeNaN: bool
+
+        :param PYtoCPP: if :code:`False`, do not use the C++ version, default :code:`True`.
+        :type PYtoCPP: bool
+
+        :return: average, standard deviation and variance of the list of data values.
+        :rtype: float, float, float.
+
+
+        **Description:**
+        The same as :py:meth:`~.getAverageVarAndSDPYtoCPP`, but the data values are analysed chunk by chunk, so that the memory use is bounded by the chunk size. 
+        The results of the chunks are combined with the pairwise update formulas of Chan, Golub and LeVeque, which keep the rounding errors as small 
+        as those of a single pass over all the data values.
+        '''
+
+        dataValues = DataTools.openMemoryMappedArray (dataValues, dataType, offset)
+        if dataValues is None:
+
+            return None, None, None
+
+
+        numberOfValuesTotal = 0
+        averageValueTotal = 0.
+        sumOfSquaredDeviationsTotal = 0.
+
+        nanFreeDataValues = np.empty ( min (numberOfValuesPerChunk, len (dataValues)), dtype = dataValues.dtype ) if removeNaN else None
+        nanValuesWorkspace = np.empty ( min (numberOfValuesPerChunk, len (dataValues)), dtype = np.bool_ ) if removeNaN else None
+        for iChunkStart, iChunkEnd, iHaloStart, dataValuesChunk in DataTools.getMemoryMappedChunks (dataValues, numberOfValuesPerChunk):
+
+            if removeNaN:
+
+                dataValuesChunk = DataTools.getNanFreeNumpyArray (dataValuesChunk, out = nanFreeDataValues, workspace = nanValuesWorkspace)
+
+
+            numberOfValues = len (dataValuesChunk)
+            if not numberOfValues:
+
+                continue
+
+
+            averageValue, standardDeviation, variance = DataTools.getAverageVarAndSDPYtoCPP (dataValuesChunk, PYtoCPP = PYtoCPP)
+
+            # Combine the average and the sum of the squared deviations of the chunk with those of the previous chunks.
+            deltaAverage = averageValue - averageValueTotal
+            numberOfValuesCombined = numberOfValuesTotal + numberOfValues
+            averageValueTotal += deltaAverage * numberOfValues / numberOfValuesCombined
+            sumOfSquaredDeviationsTotal += variance * numberOfValues + deltaAverage ** 2 * numberOfValuesTotal * numberOfValues / numberOfValuesCombined
+            numberOfValuesTotal = numberOfValuesCombined
+
+
+        if not numberOfValuesTotal:
+
+            return None, None, None
+
+
+        variance = sumOfSquaredDeviationsTotal / numberOfValuesTotal
+
+        return averageValueTotal, math.sqrt (variance), variance
+
+
+
+    # Median and quantiles of a list of data values that does not fit in memory.
+    @staticmethod
+    def getMedianAndQuantilesOutOfCore ( dataValues, 
+                                         lowerQuantilePercentage = 25, 
+                                         upperQuantilePercentage = 75, 
+                                         dataType = None, 
+                                         offset = 0, 
+                                         numberOfValuesPerChunk = 4194304, 
+                                         numberOfBins = 65536,
+                                         removeNaN = False ):
+        '''
+        :param dataValues: the name of a NumPy (.npy) or raw binary file, or a (memory-mapped) NumPy array, see :py:meth:`~.openMemoryMappedArray`.
+        :type dataValues: str, Path or NumPy array
+
+        :param lowerQuantilePercentage: the lower quantile.
+        :type lowerQuantilePercentage: float
+
+        :param upperQuantilePercentage: the upper quantile.
+        :type upperQuantilePercentage: float
+
+        :param dataType: the data type of the values in a raw binary file, default :code:`None`.
+        :type dataType: NumPy dtype
+
+        :param offset: the number of bytes before the first value in a raw binary file, default 0.
+        :type offset: int
+
+        :param numberOfValuesPerChunk: the number of values that are analysed at a time, default 4194304.
+        :type numberOfValuesPerChunk: int
+
+        :param numberOfBins: the number of bins of the histograms, default 65536.
+        :type numberOfBins: int
+
+        :param removeNaN: if True then ignore any NaN values, otherwise the results are NaN if there are NaN values.
+        :type removeNaN: bool
+
+        :return: median, lower and upper quantile as defined by lowerQuantilePercentage and upperQuantilePercentage.
+        :rtype: float, float, float
+
+
+        **Description:**
+        The same results as :py:meth:`~.getMedianAndQuantilesPYtoCPP` (linear interpolation between the sorted data values), but without sorting 
+        all the data values in memory. A histogram of the data values (the *sketch*) is made chunk by chunk, which gives the bin in which each 
+        of the sorted data values that are needed lies. The data values in these bins are then collected and sorted. If a bin holds more 
+        than :code:`numberOfValuesPerChunk` values, then a histogram of that bin is made first, and so on. Each step is one pass over the data values:
+        usually three passes are needed (range, histogram and collection), and the memory use is bounded by the chunk size and the number of bins.
+        Infinite values are counted in the first pass, as the smallest (-inf) and largest (+inf) sorted values, and are left out of the histograms.
+        '''
+
+        dataValues = DataTools.openMemoryMappedArray (dataValues, dataType, offset)
+        if dataValues is None:
+
+            return None, None, None
+
+
+        # The data values of each chunk, as double (NumPy) floats, without NaN values if removeNaN.
+        def getChunks ():
+
+            for iChunkStart, iChunkEnd, iHaloStart, dataValuesChunk in DataTools.getMemoryMappedChunks (dataValues, numberOfValuesPerChunk):
+
+                dataValuesChunk = np.asarray (dataValuesChunk, dtype = np.double)
+                if removeNaN:
+
+                    dataValuesChunk = dataValuesChunk [ ~np.isnan (dataValuesChunk) ]
+
+
+                if len (dataValuesChunk):
+
+                    yield dataValuesChunk
+
+
+        # The first pass: the number of values, the number of infinite values and the range of the finite values.
+        numberOfValues = 0
+        numberOfNegativeInfiniteValues = 0
+        numberOfPositiveInfiniteValues = 0
+        minimumValue = np.inf
+        maximumValue = -np.inf
+        for dataValuesChunk in getChunks ():
+
+            if np.isnan ( np.min (dataValuesChunk) ):
+
+                return np.nan, np.nan, np.nan
+
+
+            numberOfValues += len (dataValuesChunk)
+            isFinite = np.isfinite (dataValuesChunk)
+            if not isFinite.all ():
+
+                numberOfNegativeInfiniteValues += int ( np.count_nonzero (dataValuesChunk == -np.inf) )
+                numberOfPositiveInfiniteValues += int ( np.count_nonzero (dataValuesChunk == np.inf) )
+                dataValuesChunk = dataValuesChunk [isFinite]
+
+
+            if len (dataValuesChunk):
+
+                minimumValue = min ( minimumValue, np.min (dataValuesChunk) )
+                maximumValue = max ( maximumValue, np.max (dataValuesChunk) )
+
+
+        if not numberOfValues:
+
+            return None, None, None
+
+
+        # The ranks of the sorted data values that are needed for each quantile, and the fraction of the difference between them that is added.
+        quantiles = [0.5, lowerQuantilePercentage / 100, upperQuantilePercentage / 100]
+        ranks = []
+        for quantile in quantiles:
+
+            position = quantile * (numberOfValues - 1)
+            ranks.append ( ( math.floor (position), min (math.floor (position) + 1, numberOfValues - 1), position - math.floor (position) ) )
+
+
+        # For each rank that is needed: the range of data values (inclusive) in which it lies, the rank within that range, and the value once it is known.
+        #  The infinite values are the first and last ranks, the other ranks are searched in the range of the finite values.
+        #  Each bin of a histogram holds a contiguous range of data values, because the bin index is a monotonic function of the value.
+        rankSearches = {}
+        for rankLower, rankUpper, fraction in ranks:
+
+            for rank in (rankLower, rankUpper):
+
+                rankSearches [rank] = { 'lowerValue': minimumValue, 'upperValue': maximumValue, 'rankInRange': rank - numberOfNegativeInfiniteValues, 'value': None }
+                if rank < numberOfNegativeInfiniteValues:
+
+                    rankSearches [rank] ['value'] = -np.inf
+
+                elif rank >= numberOfValues - numberOfPositiveInfiniteValues:
+
+                    rankSearches [rank] ['value'] = np.inf
+
+
+        # The bin of each data value in a range of finite values. The values are halved first if the width of the range is larger than the largest float.
+        def getBins (dataValuesInRange, lowerValue, upperValue):
+
+            with np.errstate (over = 'ignore'):
+
+                rangeWidth = upperValue - lowerValue
+
+
+            if np.isfinite (rangeWidth):
+
+                binPositions = (dataValuesInRange - lowerValue) / rangeWidth * numberOfBins
+
+            else:
+
+                binPositions = (0.5 * dataValuesInRange - 0.5 * lowerValue) / (0.5 * upperValue - 0.5 * lowerValue) * numberOfBins
+
+
+            return np.clip (binPositions, 0, numberOfBins - 1).astype (np.int64)
+
+
+        while any ( rankSearch ['value'] is None for rankSearch in rankSearches.values () ):
+
+            rangesToSearch = { ( rankSearch ['lowerValue'], rankSearch ['upperValue'] ) for rankSearch in rankSearches.values () if rankSearch ['value'] is None }
+            for lowerValue, upperValue in rangesToSearch:
+
+                if lowerValue == upperValue:
+
+                    for rankSearch in rankSearches.values ():
+
+                        if ( rankSearch ['lowerValue'], rankSearch ['upperValue'] ) == (lowerValue, upperValue):
+
+                            rankSearch ['value'] = lowerValue
+
+
+            rangesToSearch = [ (lowerValue, upperValue) for lowerValue, upperValue in rangesToSearch if lowerValue < upperValue ]
+            if not rangesToSearch:
+
+                break
+
+
+            # Make a histogram of the data values in each range.
+            histograms = { rangeToSearch: np.zeros (numberOfBins, dtype = np.int64) for rangeToSearch in rangesToSearch }
+            for dataValuesChunk in getChunks ():
+
+                for lowerValue, upperValue in rangesToSearch:
+
+                    dataValuesInRange = dataValuesChunk [ (dataValuesChunk >= lowerValue) & (dataValuesChunk <= upperValue) ]
+                    histograms [ (lowerValue, upperValue) ] += np.bincount ( getBins (dataValuesInRange, lowerValue, upperValue), minlength = numberOfBins )
+
+
+            # Find the bin of each rank, and collect the data values in the bins that hold few enough values: their sorted values give the ranks.
+            #  For the other bins, find the range of their data values, which is searched in the next iteration.
+            binsToCollect = {}
+            binsToNarrow = {}
+            for rankSearch in rankSearches.values ():
+
+                if rankSearch ['value'] is not None:
+
+                    continue
+
+
+                rangeToSearch = ( rankSearch ['lowerValue'], rankSearch ['upperValue'] )
+                cumulativeCounts = np.cumsum ( histograms [rangeToSearch] )
+                iBin = int ( np.searchsorted (cumulativeCounts, rankSearch ['rankInRange'], side = 'right') )
+                rankSearch ['rankInRange'] -= int (cumulativeCounts [iBin - 1]) if iBin else 0
+                rankSearch ['bin'] = (rangeToSearch, iBin)
+
+                if histograms [rangeToSearch] [iBin] <= numberOfValuesPerChunk:
+
+                    binsToCollect [ (rangeToSearch, iBin) ] = []
+
+                else:
+
+                    binsToNarrow [ (rangeToSearch, iBin) ] = [np.inf, -np.inf]
+
+
+            for dataValuesChunk in getChunks ():
+
+                for (lowerValue, upperValue), iBin in list (binsToCollect) + list (binsToNarrow):
+
+                    dataValuesInRange = dataValuesChunk [ (dataValuesChunk >= lowerValue) & (dataValuesChunk <= upperValue) ]
+                    dataValuesInBin = dataValuesInRange [ getBins (dataValuesInRange, lowerValue, upperValue) == iBin ]
+                    if ( (lowerValue, upperValue), iBin ) in binsToCollect:
+
+                        binsToCollect [ ( (lowerValue, upperValue), iBin ) ].append (dataValuesInBin)
+
+                    elif len (dataValuesInBin):
+
+                        binRange = binsToNarrow [ ( (lowerValue, upperValue), iBin ) ]
+                        binRange [0] = min ( binRange [0], np.min (dataValuesInBin) )
+                        binRange [1] = max ( binRange [1], np.max (dataValuesInBin) )
+
+
+            for binToCollect in binsToCollect:
+
+                binsToCollect [binToCollect] = np.sort ( np.concatenate (binsToCollect [binToCollect]) )
+
+
+            for rankSearch in rankSearches.values ():
+
+                if rankSearch ['value'] is None:
+
+                    if rankSearch ['bin'] in binsToCollect:
+
+                        rankSearch ['value'] = binsToCollect [ rankSearch ['bin'] ] [ rankSearch ['rankInRange'] ]
+
+                    else:
+
+                        rankSearch ['lowerValue'], rankSearch ['upperValue'] = binsToNarrow [ rankSearch ['bin'] ]
+
+
+        # If a quantile falls exactly on a data value, or between equal values (also two infinite values), that value is taken as it is,
+        #  so that the difference with an infinite value is not needed.
+        medianValue, lowerQuantileValue, upperQuantileValue = [ rankSearches [rankLower] ['value'] if fraction == 0 or rankSearches [rankLower] ['value'] == rankSearches [rankUpper] ['value'] 
+                                                                else rankSearches [rankLower] ['value'] + fraction * ( rankSearches [rankUpper] ['value'] - rankSearches [rankLower] ['value'] ) 
+                                                                for rankLower, rankUpper, fraction in ranks ]
+
+        return float (medianValue), float (lowerQuantileValue), float (upperQuantileValue)
+
+
+
+    # Run a window operation (such as a filter) over a list of data values that does not fit in memory, and write the results to a file.
+    @staticmethod
+    def applyWindowOperationOutOfCore ( dataValues, 
+                                        windowOperation, 
+                                        haloWidth, 
+                                        outputFileName = None, 
+                                        outputDataType = None, 
+                                        dataType = None, 
+                                        offset = 0, 
+                                        numberOfValuesPerChunk = 4194304 ):
+        '''
+        :param dataValues: the name of a NumPy (.npy) or raw binary file, or a (memory-mapped) NumPy array, see :py:meth:`~.openMemoryMappedArray`.
+        :type dataValues: str, Path or NumPy array
+
+        :param windowOperation: function that takes a list of data values and returns a list of results with the same length, each result 
+            only depending on the data values at most :code:`haloWidth` values away.
+        :type windowOperation: function
+
+        :param haloWidth: the number of values at each side of a chunk that the results of the chunk depend on.
+        :type haloWidth: int
+
+        :param outputFileName: the name of the file in which the results are stored: a NumPy (.npy) file or otherwise a raw binary file, 
+            default :code:`None` (the results are kept in memory).
+        :type outputFileName: str or Path
+
+        :param outputDataType: the data type of the results, default :code:`None` (the data type returned by :code:`windowOperation`).
+        :type outputDataType: NumPy dtype
+
+        :param dataType: the data type of the values in a raw binary file, default :code:`None`.
+        :type dataType: NumPy dtype
+
+        :param offset: the number of bytes before the first value in a raw binary file, default 0.
+        :type offset: int
+
+        :param numberOfValuesPerChunk: the number of values that are processed at a time, default 4194304.
+        :type numberOfValuesPerChunk: int
+
+        :return: the results, memory-mapped to :code:`outputFileName` if given, or :code:`None` if the data values cannot be opened.
+        :rtype: np.memmap or NumPy array
+
+
+        **Description:**
+        The :code:`windowOperation` is called for each chunk of the data values together with :code:`haloWidth` values at each side 
+        (see :py:meth:`~.getMemoryMappedChunks`), and the results for the values of the chunk itself are written to the output file. 
+        The results are therefore the same as those of the :code:`windowOperation` on all the data values at once, while the memory use 
+        is bounded by the chunk size: the output file is flushed to disk after each chunk. 
+        :py:meth:`~.passFilterOutOfCore` uses this method for the DataTools filters.
+        '''
+
+        dataValues = DataTools.openMemoryMappedArray (dataValues, dataType, offset)
+        if dataValues is None:
+
+            return None
+
+
+        numberOfValues = len (dataValues)
+        outputValues = None
+        for iChunkStart, iChunkEnd, iHaloStart, dataValuesChunk in DataTools.getMemoryMappedChunks (dataValues, numberOfValuesPerChunk, haloWidth):
+
+            outputValuesChunk = np.asarray ( windowOperation (dataValuesChunk) )
+
+            # Create the output file once the data type of the results is known.
+            if outputValues is None:
+
+                outputDataType = outputValuesChunk.dtype if outputDataType is None else outputDataType
+                if outputFileName is None:
+
+                    outputValues = np.empty (numberOfValues, dtype = outputDataType)
+
+                elif str (outputFileName).endswith ('.npy'):
+
+                    outputValues = np.lib.format.open_memmap ( outputFileName, mode = 'w+', dtype = outputDataType, shape = (numberOfValues,) )
+
+                else:
+
+                    outputValues = np.memmap ( outputFileName, dtype = outputDataType, mode = 'w+', shape = (numberOfValues,) )
+
+
+            outputValues [iChunkStart : iChunkEnd] = outputValuesChunk [iChunkStart - iHaloStart : iChunkEnd - iHaloStart]
+            if isinstance (outputValues, np.memmap):
+
+                outputValues.flush ()
+
+
+        if outputValues is None:
+
+            print ()
+            print ('---WARNING---')
+            print (' From DataTools.applyWindowOperationOutOfCore: ')
+            print ('  there are no data values.')
+
+
+        return outputValues
+
+
+
+    # The number of values after which the response of a Butterworth (or any IIR) filter to a step has died out.
+    @staticmethod
+    def getButterworthHaloWidth (secondfilterOrderSections = [], bNotch = [], aNotch = [], relativeTolerance = 1e-7):
+        '''
+        :param secondfilterOrderSections: the filter settings of :py:meth:`~.passButterworthBandPassOrStopFilter`.
+        :type secondfilterOrderSections: NumPy array
+
+        :param bNotch: the filter settings of :py:meth:`~.passButterworthNotchFilter`, not used if :code:`secondfilterOrderSections` are given.
+        :type bNotch: NumPy array
+
+        :param aNotch: the filter settings of :py:meth:`~.passButterworthNotchFilter`, not used if :code:`secondfilterOrderSections` are given.
+        :type aNotch: NumPy array
+
+        :param relativeTolerance: the fraction to which the response needs to have decreased, default 1e-7 (the precision of 32-bit floats).
+        :type relativeTolerance: float
+
+        :return: the halo width.
+        :rtype: int
+
+
+        **Description:**
+        The Butterworth filters have an infinite impulse response, so that, unlike the average and median filters, the filtered value does not only depend 
+        on the values within a window. The response decreases as the largest absolute value of the poles of the filter to the power of the number of values, 
+        which gives the number of values after which it has decreased to :code:`relativeTolerance`. This is doubled, to allow for poles that 
+        are close together. With this halo width, the filtered values of :py:meth:`~.passFilterOutOfCore` differ by less than about 
+        :code:`relativeTolerance` (times the amplitude of the signal) from those of the filter on all the data values at once.
+        '''
+
+        if len (secondfilterOrderSections):
+
+            filterPoles = np.concatenate ( [ np.roots (section [3:6]) for section in np.atleast_2d (secondfilterOrderSections) ] )
+
+        else:
+
+            filterPoles = np.roots (aNotch)
+
+
+        maximumPoleMagnitude = np.max ( np.abs (filterPoles) ) if len (filterPoles) else 0.
+        if maximumPoleMagnitude <= 0.:
+
+            return len (secondfilterOrderSections) * 2 or len (bNotch)
+
+
+        if maximumPoleMagnitude >= 1.:
+
+            print ()
+            print ('---WARNING---')
+            print (' From DataTools.getButterworthHaloWidth: ')
+            print ('  the filter is not stable (the largest absolute value of its poles is {}): its response does not die out.'.format (maximumPoleMagnitude) )
+
+            return None
+
+
+        return 2 * math.ceil ( math.log (relativeTolerance) / math.log (maximumPoleMagnitude) )
+
+
+
+    # Pass a list of data values that does not fit in memory through one of the DataTools filters, and write the filtered values to a file.
+    @staticmethod
+    def passFilterOutOfCore ( dataValues, 
+                              outputFileName = None, 
+                              filterType = 'average', 
+                              windowWidth = 3, 
+                              secondfilterOrderSections = [], 
+                              bNotch = [], 
+                              aNotch = [], 
+                              haloWidth = None, 
+                              dataType = None, 
+                              offset = 0, 
+                              numberOfValuesPerChunk = 4194304, 
+                              PYtoCPP = True ):
+        '''
+        :param dataValues: the name of a NumPy (.npy) or raw binary file, or a (memory-mapped) NumPy array, see :py:meth:`~.openMemoryMappedArray`.
+        :type dataValues: str, Path or NumPy array
+
+        :param outputFileName: the name of the file in which the filtered values are stored: a NumPy (.npy) file or otherwise a raw binary file, 
+            default :code:`None` (the filtered values are kept in memory).
+        :type outputFileName: str or Path
+
+        :param filterType: :code:`'average'` (:py:meth:`~.passAverageFilter`), :code:`'median'` (:py:meth:`~.passMedianFilter`), 
+            :code:`'butterworth'` (:py:meth:`~.passButterworthBandPassOrStopFilter`) or :code:`'notch'` (:py:meth:`~.passButterworthNotchFilter`), default :code:`'average'`.
+        :type filterType: str
+
+        :param windowWidth: the width of the window of the average and median filters, default 3.
+        :type windowWidth: int
+
+        :param secondfilterOrderSections: the filter settings of the Butterworth band pass or band stop filter.
+        :type secondfilterOrderSections: NumPy array
+
+        :param bNotch: the filter settings of the notch filter.
+        :type bNotch: NumPy array
+
+        :param aNotch: the filter settings of the notch filter.
+        :type aNotch: NumPy array
+
+        :param haloWidth: the number of values at each side of a chunk that are used to filter it, default :code:`None`: half the window width 
+            for the average and median filters, or :py:meth:`~.getButterworthHaloWidth` for the Butterworth filters.
+        :type haloWidth: int
+
+        :param dataType: the data type of the values in a raw binary file, default :code:`None`.
+        :type dataType: NumPy dtype
+
+        :param offset: the number of bytes before the first value in a raw binary file, default 0.
+        :type offset: int
+
+        :param numberOfValuesPerChunk: the number of values that are filtered at a time, default 4194304.
+        :type numberOfValuesPerChunk: int
+
+        :param PYtoCPP: if :code:`False`, do not use the C++ version of the average filter, default :code:`True`.
+        :type PYtoCPP: bool
+
+        :return: the filtered values, memory-mapped to :code:`outputFileName` if given, or :code:`None` if the data values cannot be filtered.
+        :rtype: np.memmap or NumPy array
+
+
+        **Description:**
+        Filter the data values chunk by chunk with :py:meth:`~.applyWindowOperationOutOfCore`. The results of the average and median filters are the same 
+        as when all the data values are filtered at once. Those of the Butterworth filters are the same within the tolerance of :py:meth:`~.getButterworthHaloWidth`.
+        The filter settings of the Butterworth filters need to be calculated first, as described for these filters, for example:
+
+        .. code-block:: Python
+
+            secondfilterOrderSections = DataTools.passButterworthBandPassOrStopFilter ( applyFilter = False, samplingFrequency = 2000, cutoffFrequency = 100 )
+            DataTools.passFilterOutOfCore ( 'recording.npy', 'recordingFiltered.npy', filterType = 'butterworth', secondfilterOrderSections = secondfilterOrderSections )
+        '''
+
+        if filterType == 'average':
+
+            windowOperation = lambda dataValuesChunk: DataTools.passAverageFilter (dataValuesChunk, windowWidth, PYtoCPP = PYtoCPP)
+            haloWidth = windowWidth // 2 if haloWidth is None else haloWidth
+
+        elif filterType == 'median':
+
+            windowOperation = lambda dataValuesChunk: DataTools.passMedianFilter (dataValuesChunk, windowWidth)
+            haloWidth = windowWidth // 2 if haloWidth is None else haloWidth
+
+        elif filterType == 'butterworth' and len (secondfilterOrderSections):
+
+            windowOperation = lambda dataValuesChunk: DataTools.passButterworthBandPassOrStopFilter ( inputSignal = dataValuesChunk, 
+                                                                                                     secondfilterOrderSections = secondfilterOrderSections, 
+                                                                                                     getFilterSettings = False )
+            haloWidth = DataTools.getButterworthHaloWidth (secondfilterOrderSections = secondfilterOrderSections) if haloWidth is None else haloWidth
+
+        elif filterType == 'notch' and len (bNotch) and len (aNotch):
+
+            windowOperation = lambda dataValuesChunk: DataTools.passButterworthNotchFilter ( inputSignal = dataValuesChunk, 
+                                                                                            bNotch = bNotch, 
+                                                                                            aNotch = aNotch, 
+                                                                                            getFilterSettings = False )
+            haloWidth = DataTools.getButterworthHaloWidth (bNotch = bNotch, aNotch = aNotch) if haloWidth is None else haloWidth
+
+        else:
+
+            print ()
+            print ('---WARNING---')
+            print (' From DataTools.passFilterOutOfCore: ')
+            print ('  unknown filter type {}, or the filter settings have not been given.'.format (filterType) )
+
+            return None
+
+
+        if haloWidth is None:
+
+            return None
+
+
+        return DataTools.applyWindowOperationOutOfCore ( dataValues, windowOperation, haloWidth, outputFileName = outputFileName, 
+                                                         dataType = dataType, offset = offset, numberOfValuesPerChunk = numberOfValuesPerChunk )
+
+
+
+    # Determine the list of amplitude segments for a list of data values that does not fit in memory.
+    @staticmethod
+    def getSegmentSpecsFromDataValuesOutOfCore (dataValues, dataType = None, offset = 0, numberOfValuesPerChunk = 4194304, PYtoCPP = True):
+        '''
+        :param dataValues: the name of a NumPy (.npy) or raw binary file, or a (memory-mapped) NumPy array, see :py:meth:`~.openMemoryMappedArray`.
+        :type dataValues: str, Path or NumPy array
+
+        :param dataType: the data type of the values in a raw binary file, default :code:`None`.
+        :type dataType: NumPy dtype
+
+        :param offset: the number of bytes before the first value in a raw binary file, default 0.
+        :type offset: int
+
+        :param numberOfValuesPerChunk: the number of values that are analysed at a time, default 4194304.
+        :type numberOfValuesPerChunk: int
+
+        :param PYtoCPP: needs to be :code:`True` (the C++ version, or the Numba version if the C++ version cannot be loaded), default :code:`True`.
+            The Python version (:code:`PYtoCPP = False`) only returns the amplitudes and start indices, and cannot be run chunk by chunk: :code:`None` is returned.
+        :type PYtoCPP: bool
+
+        :return: the same tuple as :py:meth:`~.getSegmentSpecsFromDataValues`, with 64-bit start indices, or :code:`None` if the data values cannot be analysed.
+        :rtype: tuple
+
+
+        **Description:**
+        The same results as :py:meth:`~.getSegmentSpecsFromDataValues` (with :code:`PYtoCPP = True`), but the data values are analysed chunk by chunk.
+        A segment can continue beyond the end of a chunk, hence the last segment of each chunk is not kept: the next chunk starts at the start of that segment, 
+        so that it is analysed as a whole. A segment that is longer than a chunk is analysed in a larger chunk.
+        The memory use of the analysis is bounded by the chunk size, but the arrays of the results grow with the number of segments.
+        '''
+
+        dataValues = DataTools.openMemoryMappedArray (dataValues, dataType, offset)
+        if dataValues is None:
+
+            return None
+
+
+        backendName, backendFunction = DataTools.selectBackend ('getSegmentSpecsFromDataValues', numberOfValuesPerChunk)  if PYtoCPP  else (None, None)
+        if backendFunction is None:
+
+            print ()
+            print ('---WARNING---')
+            print (' From DataTools.getSegmentSpecsFromDataValuesOutOfCore: ')
+            print ('  the C++ or Numba version of getSegmentSpecsFromDataValues (PYtoCPP = True) is needed.')
+
+            return None
+
+
+        numberOfValues = len (dataValues)
+        if numberOfValues <= numberOfValuesPerChunk:
+
+            return DataTools.getSegmentSpecsFromDataValues ( np.asarray (dataValues) )
+
+
+        segmentStartIndicesChunks = []
+        segmentAmplitudesChunks = []
+        segmentSlopesChunks = []
+        segmentDurationsChunks = []
+
+        workspace = DataTools.getSegmentSpecsWorkspace (numberOfValuesPerChunk)
+        iChunkStart = 0
+        numberOfValuesInChunk = numberOfValuesPerChunk
+        while True:
+
+            iChunkEnd = min (iChunkStart + numberOfValuesInChunk, numberOfValues)
+            if len (workspace ['segmentStartIndices']) < iChunkEnd - iChunkStart:
+
+                workspace = DataTools.getSegmentSpecsWorkspace (iChunkEnd - iChunkStart)
+
+
+            segmentSpecs = backendFunction ( np.asarray ( dataValues [iChunkStart : iChunkEnd] ), workspace = workspace )
+            numberOfSegments = segmentSpecs [0]
+
+            # A single segment that continues beyond the end of the chunk: analyse a larger chunk.
+            if iChunkEnd < numberOfValues and numberOfSegments < 2:
+
+                numberOfValuesInChunk *= 2
+                continue
+
+
+            # Keep all the segments of the last chunk, and all but the last segment of the other chunks.
+            numberOfSegmentsToKeep = numberOfSegments if iChunkEnd == numberOfValues else numberOfSegments - 1
+            segmentStartIndicesChunks.append ( segmentSpecs [1] [:numberOfSegmentsToKeep].astype (np.int64) + iChunkStart )
+            segmentAmplitudesChunks.append ( segmentSpecs [2] [:numberOfSegmentsToKeep].copy () )
+            segmentSlopesChunks.append ( segmentSpecs [3] [:numberOfSegmentsToKeep].copy () )
+            segmentDurationsChunks.append ( segmentSpecs [4] [:numberOfSegmentsToKeep].copy () )
+
+            if iChunkEnd == numberOfValues:
+
+                break
+
+
+            iChunkStart += int ( segmentSpecs [1] [numberOfSegments - 1] )
+            numberOfValuesInChunk = numberOfValuesPerChunk
+
+
+        segmentStartIndices = np.concatenate (segmentStartIndicesChunks)
+        segmentAmplitudes = np.concatenate (segmentAmplitudesChunks)
+        segmentSlopes = np.concatenate (segmentSlopesChunks)
+        segmentDurations = np.concatenate (segmentDurationsChunks)
+
+        # The negative (positive) segments and the steepest of them, as determined by getSegmentSpecsFromDataValues: the last start index is that of 
+        #  the last segment if it is negative (positive), and zero otherwise, and the steepest segment is the first one with the smallest (largest) slope.
+        segmentSpecsNegativeAndPositive = []
+        for isSegmentOfSign, getSteepestSegment in ( (segmentAmplitudes < 0, np.argmin), (segmentAmplitudes > 0, np.argmax) ):
+
+            segmentStartIndicesOfSign = np.append ( segmentStartIndices [:-1] [ isSegmentOfSign [:-1] ], segmentStartIndices [-1] if isSegmentOfSign [-1] else 0 )
+            iSegmentsOfSign = np.flatnonzero (isSegmentOfSign)
+            iSegmentSteepest = int ( iSegmentsOfSign [ getSteepestSegment ( segmentSlopes [iSegmentsOfSign] ) ] ) if len (iSegmentsOfSign) else 0
+            iSteepestSegment = int ( segmentStartIndices [iSegmentSteepest] ) if len (iSegmentsOfSign) else 0
+
+            segmentSpecsNegativeAndPositive.append ( ( len (segmentStartIndicesOfSign), segmentStartIndicesOfSign, iSteepestSegment, iSegmentSteepest ) )
+
+
+        return ( len (segmentStartIndices), segmentStartIndices, segmentAmplitudes, segmentSlopes, segmentDurations ) + \
+               segmentSpecsNegativeAndPositive [0] + segmentSpecsNegativeAndPositive [1]
+
+
+
+    # Check whether an array given by the caller can be used to store the results of a function in.
+    @staticmethod
+    def checkOutputArray (out, numberOfValues, dataTypes, functionName, exactLength = True, contiguous = False):
+        '''
+        :param out: the array given by the caller, or :code:`None`.
+        :type out: NumPy array
+
+        :param numberOfValues: the number of values that need to be stored in the array.
+        :type numberOfValues: int
+
+        :param dataTypes: the data types the array can have.
+        :type dataTypes: list [NumPy dtype]
+
+        :param functionName: the name of the function that uses the array, for the warning.
+        :type functionName: str
+
+        :param exactLength: if :code:`True` (default), then the array needs to have exactly :code:`numberOfValues` values, otherwise at least :code:`numberOfValues` values.
+        :type exactLength: bool
+
+        :param contiguous: if :code:`True`, then the array needs to be contiguous, default :code:`False`.
+        :type contiguous: bool
+
+        :return: :code:`out` if it can be used, otherwise :code:`None`.
+        :rtype: NumPy array
+
+
+        **Description:**
+        Several functions can store their results in arrays given by the caller (the :code:`out` and :code:`workspace` arguments), 
+        so that the same arrays can be reused when the function is called many times in a loop, instead of making new arrays on every call.
+        Such an array needs to be a writable, one-dimensional NumPy array of the right data type and length. If it is not, then a warning is issued
+        and :code:`None` is returned, after which the function makes a new array, as if no array was given.
+        '''
+
+        if out is None:
+
+            return None
+
+
+        if not isinstance (out, np.ndarray) or out.dtype.type not in dataTypes or out.ndim != 1 or not out.flags ['WRITEABLE'] or \
+           ( contiguous and not out.flags ['C_CONTIGUOUS'] ) or ( out.shape [0] != numberOfValues if exactLength else out.shape [0] < numberOfValues ):
+
+            print ()
+            print ('---WARNING---')
+            print (' From DataTools.{}: '.format (functionName) )
+            print ('  the output array needs to be a writable{} NumPy array of {}{} {} values: a new array is used instead.'.format ( 
+                   ', contiguous' if contiguous else '', '' if exactLength else 'at least ', numberOfValues, 
+                   ' or '.join ( [ np.dtype (dataType).name for dataType in dataTypes ] ) ) )
+
+            return None
+
+
+        return out
+
+
+
+    # Store the results of a function in the array given by the caller, if any.
+    @staticmethod
+    def copyToOutputArray (outputSignal, out, functionName):
+        '''
+        :param outputSignal: the results of the function.
+        :type outputSignal: NumPy array
+
+        :param out: the array given by the caller, or :code:`None`.
+        :type out: NumPy array
+
+        :param functionName: the name of the function, for the warning (see :py:meth:`~.checkOutputArray`).
+        :type functionName: str
+
+        :return: :code:`out` with the results, or :code:`outputSignal` if no (valid) :code:`out` was given.
+        :rtype: NumPy array
+
+
+        **Description:**
+        Used by the functions that get their results from a SciPy function without an :code:`out` argument, such as the Butterworth filters, 
+        so that the caller can still keep using the same array for the results.
+        '''
+
+        out = DataTools.checkOutputArray ( out, len (outputSignal), [outputSignal.dtype.type], functionName )
+        if out is None:
+
+            return outputSignal
+
+
+        np.copyto (out, outputSignal)
+
+        return out
+
+
+
+    # Make the arrays in which DataTools.getSegmentSpecsFromDataValues can store its results.
+    @staticmethod
+    def getSegmentSpecsWorkspace (numberOfDataValues):
+        '''
+        :param numberOfDataValues: the (largest) number of data values that will be analysed.
+        :type numberOfDataValues: int
+
+        :return: the arrays, by name.
+        :rtype: dict
+
+
+        **Description:**
+        The workspace can be passed to :py:meth:`~.getSegmentSpecsFromDataValues` for any list of at most :code:`numberOfDataValues` data values.
+        '''
+
+        return { arrayName: np.zeros (numberOfDataValues, dtype = dataType) for arrayName, dataType in segmentSpecsWorkspaceDataTypes.items () }
+
+
+
+    # Check the arrays of a workspace made with DataTools.getSegmentSpecsWorkspace, and replace the ones that cannot be used.
+    @staticmethod
+    def checkSegmentSpecsWorkspace (workspace, numberOfDataValues):
+        '''
+        :param workspace: the arrays, by name.
+        :type workspace: dict
+
+        :param numberOfDataValues: the number of data values that will be analysed.
+        :type numberOfDataValues: int
+
+        :return: the workspace, with new arrays for the ones that are missing or cannot be used (see :py:meth:`~.checkOutputArray`).
+        :rtype: dict
+        '''
+
+        for arrayName, dataType in segmentSpecsWorkspaceDataTypes.items ():
+
+            if DataTools.checkOutputArray ( workspace.get (arrayName), numberOfDataValues, [dataType], 'getSegmentSpecsFromDataValues', 
+                                            exactLength = False, contiguous = True ) is None:
+
+                workspace [arrayName] = np.zeros (numberOfDataValues, dtype = dataType)
+
+
+        return workspace
+
+
+
+    # Add an implementation of an operation to the backend registry.
+    @staticmethod
+    def registerBackend (operationName, backendName, backendFunction, inputDType = None):
+        '''
+        :param operationName: name of the operation, for example :code:`'passAverageFilter'`.
+        :type operationName: str
+
+        :param backendName: name of the implementation, for example :code:`'native'` (C++) or :code:`'numpy'`.
+        :type backendName: str
+
+        :param backendFunction: the function that implements the operation, with the same arguments and results as the other backends of the operation.
+        :type backendFunction: function
+
+        :param inputDType: the data type the function converts the input data values to (if any), used to predict the copies in the profile (see :py:meth:`~.enableProfile`).
+        :type inputDType: NumPy dtype
+
+
+        **Description:**
+        Some operations exist in more than one version (backend): the C++ version (:code:`'native'`), a Numba version (:code:`'numba'`, if Numba is installed)
+        and a NumPy version (:code:`'numpy'`).
+        All backends of the same operation take the same arguments and return the same results, so that :py:meth:`~.selectBackend` can choose
+        any of them. Registering a backend with an existing name replaces the previous one. The operations and the arguments of their backends are
+        (the :code:`out` and :code:`workspace` arguments are only passed if the caller gave them, see :py:meth:`~.checkOutputArray`):
+
+            | getSegmentSpecsFromDataValues (dataValues, workspace = None);
+            | passAverageFilter (dataValues, halfWindowWidth, out = None);
+            | getAverageVarAndSD (dataValues);
+            | getMedianAndQuantiles (dataValues, lowerQuantile = 0.25, upperQuantile = 0.75);
+            | getNearestValue (dataValues, valueToCompare, monotonicList = 1).
+        '''
+
+        dataToolsBackends.setdefault (operationName, {}) [backendName] = backendFunction
+        dataToolsBackendInputDTypes [ (operationName, backendName) ] = inputDType
+        dataToolsLazyBackends.pop ( (operationName, backendName), None )
+
+
+
+    # Add an implementation of an operation to the backend registry, without importing its library yet.
+    @staticmethod
+    def registerLazyBackend (operationName, backendName, moduleName, functionName, inputDType = None, requiredModuleNames = []):
+        '''
+        :param operationName: name of the operation, for example :code:`'passAverageFilter'`.
+        :type operationName: str
+
+        :param backendName: name of the implementation, for example :code:`'native'` (C++) or :code:`'numba'`.
+        :type backendName: str
+
+        :param moduleName: name of the library (module) that contains the function.
+        :type moduleName: str
+
+        :param functionName: name of the function in the library that implements the operation.
+        :type functionName: str
+
+        :param inputDType: the data type the function converts the input data values to (if any), see :py:meth:`~.registerBackend`.
+        :type inputDType: NumPy dtype
+
+        :param requiredModuleNames: names of other libraries that the library needs, for example :code:`['numba']`, default none.
+        :type requiredModuleNames: list [str]
+
+        :return: :code:`True` if the backend has been registered, :code:`False` if the library (or one of the libraries it needs) cannot be found.
+        :rtype: bool
+
+
+        **Description:**
+        Same as :py:meth:`~.registerBackend`, but the library is only imported when the backend is selected for the first time
+        (see :py:meth:`~.selectBackend`), which keeps the import of DataTools fast. If the library cannot be loaded at that moment,
+        then all backends from this library are removed and another backend is selected.
+        '''
+
+        if dataToolsBackendModules.get (moduleName, True) is None:
+
+            return False
+
+
+        for requiredModuleName in [moduleName] + list (requiredModuleNames):
+
+            if requiredModuleName not in sys.modules and importlib.util.find_spec (requiredModuleName) is None:
+
+                return False
+
+
+        dataToolsBackends.setdefault (operationName, {}) [backendName] = None
+        dataToolsBackendInputDTypes [ (operationName, backendName) ] = inputDType
+        dataToolsLazyBackends [ (operationName, backendName) ] = (moduleName, functionName)
+
+        return True
+
+
+
+    # Import a library that contains backends.
+    @staticmethod
+    def importBackendModule (moduleName):
+        '''
+        :param moduleName: name of the library (module).
+        :type moduleName: str
+
+        :return: the library, or :code:`None` if it cannot be loaded.
+        :rtype: module
+        '''
+
+        if moduleName not in dataToolsBackendModules:
+
+            try:
+
+                dataToolsBackendModules [moduleName] = importlib.import_module (moduleName)
+
+            except:
+
+                dataToolsBackendModules [moduleName] = None
+
+
+        return dataToolsBackendModules [moduleName]
+
+
+
+    # Import the library of a backend that has been registered with DataTools.registerLazyBackend.
+    @staticmethod
+    def loadLazyBackend (operationName, backendName):
+        '''
+        :param operationName: name of the operation.
+        :type operationName: str
+
+        :param backendName: name of the backend.
+        :type backendName: str
+
+        :return: the function of the backend, or :code:`None` if its library cannot be loaded (the backend is then removed from the registry).
+        :rtype: function
+        '''
+
+        with dataToolsLazyBackendsLock:
+
+            if (operationName, backendName) in dataToolsLazyBackends:
+
+                moduleName, functionName = dataToolsLazyBackends.pop ( (operationName, backendName) )
+                backendModule = DataTools.importBackendModule (moduleName)
+                if backendModule is None:
+
+                    del dataToolsBackends [operationName] [backendName]
+
+                else:
+
+                    dataToolsBackends [operationName] [backendName] = getattr (backendModule, functionName)
+
+
+            return dataToolsBackends.get (operationName, {}).get (backendName)
+
+
+
+    # Get the names of the backends that are registered for an operation.
+    @staticmethod
+    def getBackends (operationName):
+        '''
+        :param operationName: name of the operation.
+        :type operationName: str
+
+        :return: names of the backends, in the order in which they were registered.
+        :rtype: list [str]
+        '''
+
+        return list ( dataToolsBackends.get (operationName, {}) )
+
+
+
+    # Set the global backend preference.
+    @staticmethod
+    def setBackendPreference (backendPreference = ['native', 'numba', 'numpy']):
+        '''
+        :param backendPreference: name of a backend, list of names in order of preference, or :code:`'auto'`, default :code:`['native', 'numba', 'numpy']`.
+        :type backendPreference: str or list [str]
+
+
+        **Description:**
+        Set which backend is used for the operations that exist in more than one version (see :py:meth:`~.registerBackend`). If none of the preferred backends
+        is available for an operation, then the first registered one is used. With :code:`'auto'` the fastest backend for the size of the data is used,
+        as measured by :py:meth:`~.autotuneBackends`, once per machine.
+        To change the preference temporarily, use :py:meth:`~.useBackend`.
+        '''
+
+        dataToolsBackendSettings ['backendPreference'] = [backendPreference] if type (backendPreference) == str and backendPreference != 'auto' else backendPreference
+
+
+
+    # Set the backend preference within a  with  block.
+    @staticmethod
+    @contextlib.contextmanager
+    def useBackend (backendPreference):
+        '''
+        :param backendPreference: name of a backend, list of names in order of preference, or :code:`'auto'`.
+        :type backendPreference: str or list [str]
+
+
+        **Description:**
+        Context manager to use a backend preference only within a :code:`with` block, for example::
+
+            with DataTools.useBackend ('numpy'):
+
+                dataValuesFiltered = DataTools.passAverageFilter (dataValues, 5)
+
+        The preference only applies to the current thread. See :py:meth:`~.setBackendPreference` for the possible values.
+        '''
+
+        token = dataToolsBackendPreferenceContext.set ( [backendPreference] if type (backendPreference) == str and backendPreference != 'auto' else backendPreference )
+
+        try:
+
+            yield
+
+        finally:
+
+            dataToolsBackendPreferenceContext.reset (token)
+
+
+
+    # Select the backend of an operation.
+    @staticmethod
+    def selectBackend (operationName, numberOfValues = 0, PYtoCPP = True):
+        '''
+        :param operationName: name of the operation.
+        :type operationName: str
+
+        :param numberOfValues: number of data values that the operation is applied to, used when the backend preference is :code:`'auto'`.
+        :type numberOfValues: int
+
+        :param PYtoCPP: if :code:`False`, do not select the C++ (:code:`'native'`) backend, default :code:`True`.
+        :type PYtoCPP: bool
+
+        :return: name and function of the selected backend, or :code:`None, None` if the operation has no (allowed) backend.
+        :rtype: str, function
+
+        **Description:**
+        Select the backend of an operation according to the backend preference (see :py:meth:`~.setBackendPreference` and :py:meth:`~.useBackend`).
+        '''
+
+        backendPreference = dataToolsBackendPreferenceContext.get ()
+        if backendPreference is None:
+
+            backendPreference = dataToolsBackendSettings ['backendPreference']
+
+
+        if backendPreference == 'auto':
+
+            if not dataToolsBackendSettings ['autotuneResults']:
+
+                DataTools.autotuneBackends ()
+
+
+            # Use the result of the nearest size class that has been measured.
+            autotuneResults = dataToolsBackendSettings ['autotuneResults'].get (operationName, {})
+            backendPreference = []
+            if autotuneResults:
+
+                sizeClass = DataTools.getSizeClass (numberOfValues)
+                sizeClassNearest = min ( autotuneResults, key = lambda sizeClassMeasured: abs ( int (sizeClassMeasured) - sizeClass ) )
+                backendPreference = [ autotuneResults [sizeClassNearest] ]
+
+
+        # Import the library of the selected backend if that has not been done yet. If it cannot be loaded, the backend is removed: select again.
+        backendFunction = None
+        while backendFunction is None:
+
+            backends = dataToolsBackends.get (operationName, {})
+            backendNames = [ backendName for backendName in backends if PYtoCPP or backendName != 'native' ]
+            if not backendNames:
+
+                return None, None
+
+
+            backendName = next ( ( backendName for backendName in backendPreference if backendName in backendNames ), backendNames [0] )
+            backendFunction = backends [backendName]
+            if backendFunction is None:
+
+                backendFunction = DataTools.loadLazyBackend (operationName, backendName)
+
+
+        # Add the selected backend to the call that is being profiled.
+        if dataToolsProfileSettings ['enabled']:
+
+            callRecord = dataToolsProfileCurrentCall.get ()
+            if callRecord is not None:
+
+                callRecord ['backends'].append ( (operationName, backendName) )
+
+
+        return backendName, backendFunction
+
+
+
+    # The size class of a number of data values.
+    @staticmethod
+    def getSizeClass (numberOfValues):
+        '''
+        :param numberOfValues: number of data values.
+        :type numberOfValues: int
+
+        :return: the size class: the power of ten of the number of data values, rounded down (0 for fewer than 10 values).
+        :rtype: int
+        '''
+
+        return int ( math.log10 (numberOfValues) ) if numberOfValues >= 10 else 0
+
+
+
+    # Measure which backend is the fastest for each operation and size class.
+    @staticmethod
+    def autotuneBackends (sizeClasses = range (1, 7), numberOfRepeats = 3, cacheFileName = None, rerun = False):
+        '''
+        :param sizeClasses: the size classes to measure, with random data of :code:`10 ** sizeClass` values, default 1 to 6.
+        :type sizeClasses: list [int]
+
+        :param numberOfRepeats: number of times each backend is timed, the fastest time counts, default 3.
+        :type numberOfRepeats: int
+
+        :param cacheFileName: the file in which the results are stored, default :code:`~/.cache/DataTools/backendAutotune_<machine>.json`.
+        :type cacheFileName: str
+
+        :param rerun: if :code:`True`, measure again even if the results have been stored already, default :code:`False`.
+        :type rerun: bool
+
+        :return: the fastest backend for each operation and size class, :code:`{ operationName: { sizeClass: backendName } }`.
+        :rtype: dict
+
+        **Description:**
+        Time all registered backends of all operations on random data of each size class, and keep the fastest. The results are used when
+        the backend preference is :code:`'auto'` (see :py:meth:`~.setBackendPreference`). They are stored in a JSON file per machine,
+        so that the measurements only need to be done once: the next time the results are read from this file, unless the registered backends, 
+        the size classes or the fingerprint of the backends have changed. The fingerprint contains the modification time and version of the libraries of the backends, 
+        the SIMD level that the C++ libraries use and the versions of NumPy and Numba, so that the measurements are done again after an update or a rebuild.
+        '''
+
+        if cacheFileName is None:
+
+            machineName = ''.join ( character if character.isalnum () else '_' for character in platform.node () + '_' + platform.machine () )
+            cacheFileName = os.path.join ( os.path.expanduser ('~'), '.cache', 'DataTools', 'backendAutotune_' + machineName + '.json' )
+
+
+        autotuneResults = {}
+        if not rerun and os.path.isfile (cacheFileName):
+
+            try:
+
+                with open (cacheFileName, 'r') as cacheFile:
+
+                    autotuneResults = json.load (cacheFile)
+
+            except (OSError, ValueError):
+
+                autotuneResults = {}
+
+
+        # Import the libraries of all backends first, so that the backends that cannot be loaded are not counted.
+        for operationName, backendName in list (dataToolsLazyBackends):
+
+            DataTools.loadLazyBackend (operationName, backendName)
+
+
+        # The fingerprint of the backends: their libraries (modification time and version), the SIMD level of the C++ libraries and the NumPy and Numba versions.
+        backendsFingerprint = { 'numpy': np.__version__, 'numba': getattr ( sys.modules.get ('numba'), '__version__', None ) }
+        for backendModuleName in sorted ( set ( getattr (backendFunction, '__module__', None) or '' for backends in dataToolsBackends.values () for backendFunction in backends.values () ) ):
+
+            backendModule = sys.modules.get (backendModuleName)
+            if backendModule is None:
+
+                continue
+
+
+            backendModuleFileName = getattr (backendModule, '__file__', None)
+            backendsFingerprint [backendModuleName] = { 'modificationTime': os.path.getmtime (backendModuleFileName)  if backendModuleFileName and os.path.isfile (backendModuleFileName)  else None,
+                                                        'version': getattr (backendModule, '__version__', None),
+                                                        'SIMDLevel': backendModule.getSIMDLevelPYtoCPP ()  if hasattr (backendModule, 'getSIMDLevelPYtoCPP')  else None }
+
+
+        # Only measure if there are no stored results for the backends that are registered now, the same size classes and the same fingerprint.
+        backendsRegistered = { operationName: sorted (backends) for operationName, backends in dataToolsBackends.items () }
+        if ( autotuneResults.get ('backendsRegistered') != backendsRegistered or autotuneResults.get ('sizeClasses') != list (sizeClasses) 
+             or autotuneResults.get ('backendsFingerprint') != backendsFingerprint ):
+
+            print ()
+            print ('Measuring the speed of the DataTools backends, this is done once for this machine ...')
+
+            # The arguments, besides the data values, for the operations that need them.
+            benchmarkArguments = { 'passAverageFilter': (5,), 'getNearestValue': (0., 0) }
+
+            randomGenerator = np.random.default_rng (0)
+            autotuneResults = { 'backendsRegistered': backendsRegistered, 'sizeClasses': list (sizeClasses), 'backendsFingerprint': backendsFingerprint, 'fastestBackends': {} }
+            for operationName, backends in dataToolsBackends.items ():
+
+                autotuneResults ['fastestBackends'] [operationName] = {}
+                for sizeClass in sizeClasses:
+
+                    dataValues = randomGenerator.normal ( size = 10 ** sizeClass ).astype (np.single)
+                    backendTimes = {}
+                    for backendName, backendFunction in backends.items ():
+
+                        backendTimes [backendName] = np.inf
+                        for iRepeat in range (numberOfRepeats):
+
+                            timeStart = time.perf_counter ()
+                            backendFunction ( dataValues, *benchmarkArguments.get (operationName, ()) )
+                            backendTimes [backendName] = min ( backendTimes [backendName], time.perf_counter () - timeStart )
+
+                    autotuneResults ['fastestBackends'] [operationName] [ str (sizeClass) ] = min (backendTimes, key = backendTimes.get)
+
+
+            # The results are written to a temporary file first, so that another process never reads a partly written file.
+            temporaryCacheFileName = '{}.{}.tmp'.format ( cacheFileName, os.getpid () )
+            try:
+
+                os.makedirs ( os.path.dirname ( os.path.abspath (cacheFileName) ), exist_ok = True )
+                with open (temporaryCacheFileName, 'w') as cacheFile:
+
+                    json.dump (autotuneResults, cacheFile, indent = 4)
+
+                os.replace (temporaryCacheFileName, cacheFileName)
+
+            except OSError:
+
+                if os.path.isfile (temporaryCacheFileName):
+
+                    os.remove (temporaryCacheFileName)
+
+
+                print ()
+                print ('---WARNING---')
+                print (' The backend speed measurements could not be stored in {}'.format (cacheFileName) )
+
+
+        dataToolsBackendSettings ['autotuneResults'] = autotuneResults ['fastestBackends']
+
+        return autotuneResults ['fastestBackends']
+
+
+
+    # Switch the profiling of the DataTools calls on or off.
+    @staticmethod
+    def enableProfile (enable = True):
+        '''
+        :param enable: switch profiling on (:code:`True`, default) or off (:code:`False`).
+        :type enable: bool
+
+
+        **Description:**
+        When profiling is on, every call of the main DataTools functions is recorded: the number of calls, the time they take, the number of bytes of the
+        input arrays, the copies of the input data that the selected backend needs (because of a different data type or non-contiguous data) and
+        which backend was used (see :py:meth:`~.selectBackend`). Use :py:meth:`~.getProfile` to see the results, :py:meth:`~.resetProfile` to start again
+        and :py:meth:`~.saveProfileToJSON` to store them. Profiling can also be switched on by setting the environment variable :code:`DATATOOLS_PROFILE=1`
+        before DataTools is imported.
+
+        Profiling replaces the functions by profiled versions, so that when it is off, there is no overhead at all.
+        Only the calls made after profiling has been switched on are recorded, the profile is kept when it is switched off.
+        '''
+
+        if enable and not dataToolsProfileSettings ['enabled']:
+
+            for functionName in dataToolsProfiledFunctionNames:
+
+                originalFunction = DataTools.__dict__ [functionName].__func__
+                dataToolsProfileSettings ['originalFunctions'] [functionName] = originalFunction
+                setattr ( DataTools, functionName, staticmethod ( DataTools.getProfiledFunction (functionName, originalFunction) ) )
+
+
+        elif not enable and dataToolsProfileSettings ['enabled']:
+
+            for functionName, originalFunction in dataToolsProfileSettings ['originalFunctions'].items ():
+
+                setattr ( DataTools, functionName, staticmethod (originalFunction) )
+
+            dataToolsProfileSettings ['originalFunctions'] = {}
+
+
+        dataToolsProfileSettings ['enabled'] = enable
+
+
+
+    # The profiled version of a DataTools function.
+    @staticmethod
+    def getProfiledFunction (functionName, originalFunction):
+        '''
+        :param functionName: the name of the function in the profile.
+        :type functionName: str
+
+        :param originalFunction: the function to profile.
+        :type originalFunction: function
+
+        :return: a function that calls :code:`originalFunction` and records the call in the profile.
+        :rtype: function
+        '''
+
+        @functools.wraps (originalFunction)
+        def profiledFunction (*arguments, **keywordArguments):
+
+            # The backends selected during the call are added to this record by DataTools.selectBackend.
+            callRecord = { 'backends': [] }
+            token = dataToolsProfileCurrentCall.set (callRecord)
+            timeStart = time.perf_counter ()
+
+            try:
+
+                return originalFunction (*arguments, **keywordArguments)
+
+            finally:
+
+                seconds = time.perf_counter () - timeStart
+                dataToolsProfileCurrentCall.reset (token)
+                DataTools.addCallToProfile (functionName, seconds, arguments, keywordArguments, callRecord ['backends'])
+
+
+        return profiledFunction
+
+
+
+    # Add a call to the profile.
+    @staticmethod
+    def addCallToProfile (functionName, seconds, arguments = (), keywordArguments = {}, backends = []):
+        '''
+        :param functionName: the name of the function.
+        :type functionName: str
+
+        :param seconds: the duration of the call.
+        :type seconds: float
+
+        :param arguments: the positional arguments of the call.
+        :type arguments: tuple
+
+        :param keywordArguments: the keyword arguments of the call.
+        :type keywordArguments: dict
+
+        :param backends: the (operation name, backend name) of each backend selected during the call.
+        :type backends: list [tuple]
+
+
+        **Description:**
+        The input bytes are the sizes of the NumPy arrays in the arguments, with lists and tuples counted as 8 bytes per element.
+        The copy of the input data is predicted from the input data type of the first selected backend (see :py:meth:`~.registerBackend`):
+        a list, or an array of a different data type, is copied before the backend can use it. Arrays that are not contiguous (for example a column
+        of a two-dimensional array), read-only arrays and other objects that support the buffer protocol are not copied.
+        The :code:`out` and :code:`workspace` arrays given by the caller (see :py:meth:`~.checkOutputArray`) are not counted as input.
+        '''
+
+        inputBytes = 0
+        for argument in list (arguments) + [ keywordValue for keywordName, keywordValue in keywordArguments.items () if keywordName not in ('out', 'workspace') ]:
+
+            if isinstance (argument, np.ndarray):
+
+                inputBytes += argument.nbytes
+
+            elif isinstance (argument, (list, tuple)):
+
+                inputBytes += 8 * len (argument)
+
+
+        numberOfCopies = 0
+        bytesCopied = 0
+        if backends:
+
+            inputDType = dataToolsBackendInputDTypes.get ( backends [0] )
+            dataValues = arguments [0] if arguments else next ( iter ( keywordArguments.values () ), None )
+            if inputDType is not None and hasattr (dataValues, '__len__'):
+
+                # Arrays (and other buffers) of the right data type are used as they are, also when they are not contiguous.
+                dataValuesArray = None if isinstance (dataValues, (list, tuple)) else np.asarray (dataValues)
+                if dataValuesArray is None or dataValuesArray.ndim != 1 or dataValuesArray.dtype != inputDType or dataValuesArray.strides [0] % dataValuesArray.itemsize:
+
+                    numberOfCopies = 1
+                    bytesCopied = len (dataValues) * np.dtype (inputDType).itemsize
+
+
+        with dataToolsProfileLock:
+
+            functionProfile = dataToolsProfile.setdefault ( functionName, { 'numberOfCalls': 0,
+                                                                            'totalSeconds': 0.,
+                                                                            'maximumSeconds': 0.,
+                                                                            'latencies': [],
+                                                                            'inputBytes': 0,
+                                                                            'numberOfCopies': 0,
+                                                                            'bytesCopied': 0,
+                                                                            'backends': {} } )
+            functionProfile ['numberOfCalls'] += 1
+            functionProfile ['totalSeconds'] += seconds
+            functionProfile ['maximumSeconds'] = max (functionProfile ['maximumSeconds'], seconds)
+            functionProfile ['inputBytes'] += inputBytes
+            functionProfile ['numberOfCopies'] += numberOfCopies
+            functionProfile ['bytesCopied'] += bytesCopied
+
+            for operationName, backendName in backends:
+
+                functionProfile ['backends'] [backendName] = functionProfile ['backends'].get (backendName, 0) + 1
+
+
+            # Keep a random sample of a limited number of latencies (reservoir sampling), so that the memory use stays the same in long runs.
+            latencies = functionProfile ['latencies']
+            if len (latencies) < dataToolsProfileSettings ['maximumNumberOfLatencies']:
+
+                latencies.append (seconds)
+
+            else:
+
+                iLatency = random.randrange ( functionProfile ['numberOfCalls'] )
+                if iLatency < len (latencies):
+
+                    latencies [iLatency] = seconds
+
+
+
+    # Get a snapshot of the profile.
+    @staticmethod
+    def getProfile ():
+        '''
+        :return: for each profiled function that has been called: the number of calls, total, average and maximum time (s), the 50, 90 and 99 percentile
+                 latencies (s), the number of input bytes, the number of copies of the input data and bytes copied, and the number of times each backend was used.
+        :rtype: dict
+
+
+        **Description:**
+        See :py:meth:`~.enableProfile`.
+        '''
+
+        profileSnapshot = {}
+        with dataToolsProfileLock:
+
+            for functionName, functionProfile in dataToolsProfile.items ():
+
+                latencyPercentiles = np.percentile ( functionProfile ['latencies'], [50, 90, 99] )
+                profileSnapshot [functionName] = { 'numberOfCalls': functionProfile ['numberOfCalls'],
+                                                   'totalSeconds': functionProfile ['totalSeconds'],
+                                                   'averageSeconds': functionProfile ['totalSeconds'] / functionProfile ['numberOfCalls'],
+                                                   'maximumSeconds': functionProfile ['maximumSeconds'],
+                                                   'latencyPercentiles': { 'p50': float ( latencyPercentiles [0] ),
+                                                                           'p90': float ( latencyPercentiles [1] ),
+                                                                           'p99': float ( latencyPercentiles [2] ) },
+                                                   'inputBytes': functionProfile ['inputBytes'],
+                                                   'numberOfCopies': functionProfile ['numberOfCopies'],
+                                                   'bytesCopied': functionProfile ['bytesCopied'],
+                                                   'backends': dict ( functionProfile ['backends'] ) }
+
+
+        return profileSnapshot
+
+
+
+    # Clear the profile.
+    @staticmethod
+    def resetProfile ():
+        '''
+        **Description:**
+        Remove all the recorded calls from the profile, see :py:meth:`~.enableProfile`.
+        '''
+
+        with dataToolsProfileLock:
+
+            dataToolsProfile.clear ()
+
+
+
+    # Store the profile in a JSON file.
+    @staticmethod
+    def saveProfileToJSON (fileName = 'DataToolsProfile.json'):
+        '''
+        :param fileName: name of the JSON file, default :code:`'DataToolsProfile.json'`.
+        :type fileName: str
+
+        :return: the snapshot of the profile that has been stored, see :py:meth:`~.getProfile`.
+        :rtype: dict
+        '''
+
+        profileSnapshot = DataTools.getProfile ()
+        with open (fileName, 'w') as profileFile:
+
+            json.dump (profileSnapshot, profileFile, indent = 4)
+
+
+        return profileSnapshot
+
+
+
+
+# The NumPy implementations of the operations that also have a C++ implementation.
+class DataToolsNumPyBackend:
+    """
+    DataToolsNumPyBackend is a pseudo-class (no instantiation, no 'self') bundling the NumPy versions of the DataTools operations that also have a C++ version.
+    They are registered as the :code:`'numpy'` backend (see :py:meth:`~.DataTools.registerBackend`), take the same arguments and return the same results as the C++ versions,
+    but calculated in double precision.
+    """
+
+
+    # Running average filter, with the window limited to the available data values at the beginning and the end of the list.
+    @staticmethod
+    def passAverageFilter (dataValues, halfWindowWidth, out = None):
+        '''
+        :param dataValues: list of data values that represent the signal to be filtered.
+        :type dataValues: list or NumPy array
+
+        :param halfWindowWidth: number of data values on either side of the central value in the window.
+        :type halfWindowWidth: int
+
+        :param out: array with the same number of values as :code:`dataValues`, in which the filtered data values are stored, default :code:`None` (a new array).
+        :type out: NumPy array
+
+        :return: filtered data values (:code:`out`, if given).
+        :rtype: NumPy array
+        '''
+
+        dataValues = np.asarray (dataValues, dtype = np.double)
+        numberOfElements = len (dataValues)
+
+        iElements = np.arange (numberOfElements)
+        iWindowStart = np.maximum (iElements - halfWindowWidth, 0)
+        iWindowEnd = np.minimum (iElements + halfWindowWidth + 1, numberOfElements)
+
+        # The sum of each window is the difference of two cumulative sums. These are sums of the deviations from the average value,
+        #  to keep the rounding errors small. NaN or infinite values would spoil all the cumulative sums after them, hence then average each window separately.
+        if np.isfinite (dataValues).all ():
+
+            averageValue = np.mean (dataValues)
+            cumulativeSums = np.zeros (numberOfElements + 1)
+            np.cumsum (dataValues - averageValue, out = cumulativeSums [1:])
+
+            listOfNumbersFiltered = ( cumulativeSums [iWindowEnd] - cumulativeSums [iWindowStart] ) / (iWindowEnd - iWindowStart) + averageValue
+
+        else:
+
+            listOfNumbersFiltered = np.asarray ( [ np.mean ( dataValues [ iWindowStart [iElement] : iWindowEnd [iElement] ] ) for iElement in iElements ] )
+
+
+        if out is None:
+
+            return listOfNumbersFiltered
+
+
+        np.copyto (out, listOfNumbersFiltered, casting = 'same_kind')
+
+        return out
+
+
+
+    # Average, standard deviation and variance.
+    @staticmethod
+    def getAverageVarAndSD (dataValues):
+        '''
+        :param dataValues: list of data values.
+        :type dataValues: list [float] or NumPy array (one dimension)
+
+        :return: average, standard deviation and variance of the list of data values.
+        :rtype: float, float, float.
+        '''
+
+        dataValues = np.asarray (dataValues, dtype = np.double)
+        averageValue = np.mean (dataValues)
+        variance = np.mean ( np.square (dataValues - averageValue) )
+
+        return averageValue, np.sqrt (variance), variance
+
+
+
+    # Median and quantiles, by linear interpolation between the sorted data values.
+    @staticmethod
+    def getMedianAndQuantiles (dataValues, lowerQuantile = 0.25, upperQuantile = 0.75):
+        '''
+        :param dataValues: list of data values.
+        :type dataValues: list [float] or NumPy array (one dimension)
+
+        :param lowerQuantile: the lower quantile (between 0 and 1), default 0.25.
+        :type lowerQuantile: float
+
+        :param upperQuantile: the upper quantile (between 0 and 1), default 0.75.
+        :type upperQuantile: float
+
+        :return: median, lower and upper quantile.
+        :rtype: float, float, float
+        '''
+
+        medianValue, lowerQuantileValue, upperQuantileValue = np.quantile ( np.asarray (dataValues, dtype = np.double), [0.5, lowerQuantile, upperQuantile] )
+
+        return medianValue, lowerQuantileValue, upperQuantileValue
+
+
+
+    # The nearest value in a list.
+    @staticmethod
+    def getNearestValue (dataValues, valueToCompare, monotonicList = 1):
+        '''
+        :param dataValues: list of data values.
+        :type dataValues: list [float] or NumPy array (one dimension)
+
+        :param valueToCompare: value to compare the values in :code:`dataValues` with.
+        :type valueToCompare: float
+
+        :param monotonicList: not used, all the values are compared.
+        :type monotonicList: int
+
+        :return: index of the nearest value and its difference with the value to compare.
+        :rtype: int, float
+        '''
+
+        dataValues = np.asarray (dataValues, dtype = np.double)
+
+        # NaN values are never the nearest, and when several values are equally near, the last one is chosen, as in the C++ version.
+        valueDifferencesABS = np.abs (dataValues - valueToCompare)
+        np.fmin (valueDifferencesABS, np.inf, out = valueDifferencesABS)
+        iSmallestDifference = len (dataValues) - 1 - int ( np.argmin ( valueDifferencesABS [::-1] ) )
+
+        return iSmallestDifference, dataValues [iSmallestDifference] - valueToCompare
+
+
+
+
+# An incremental and mergeable version of the DataTools.linearLeastSquare fit.
+class LinearFitAccumulator:
+    '''
+    **Description**:
+    Accumulate the (weighted) statistics needed for the linear least square solution y (x) = ax + b, without keeping any of the data points in memory.
+    Data can be added in chunks with :py:meth:`~.LinearFitAccumulator.update`, and accumulators filled in different processes can be combined 
+    with :py:meth:`~.LinearFitAccumulator.merge`. The :py:meth:`~.LinearFitAccumulator.result` method returns the same outputs as :py:meth:`~.DataTools.linearLeastSquare`.
+    
+    .. code-block:: Python
+    
+        linearFit = LinearFitAccumulator ()
+        for xChunk, yChunk in someChunkedData:
+        
+            linearFit.update (xChunk, yChunk)
+        
+        a, b, uncertaintyA, uncertaintyB, rSquared, xValuesFitLine, yValuesFitLine = linearFit.result ()
+    '''
+
+    #
+    def __init__ (self):
+        '''
+        **Description**: 
+        Initialise an empty accumulator.
+        The sums are kept around the running (weighted) averages of x and y, rather than as raw sums of x, x^2, y, xy and y^2,
+        so that the results do not suffer from round-off errors when the x- or y-values have a large offset (time stamps, for example).  
+        '''
+
+        self.numberOfValues = 0
+        self.sumWeights = 0.
+        self.averageX = 0.
+        self.averageY = 0.
+        
+        # Weighted sums of (x - averageX)^2, (y - averageY)^2 and (x - averageX) * (y - averageY).
+        self.sumSquaredDeviationsX = 0.
+        self.sumSquaredDeviationsY = 0.
+        self.sumCrossDeviationsXY = 0.
+        
+        # Needed for the fitted line, which in DataTools.linearLeastSquare is based on the range of all the xInput values.
+        self.minimumX = np.inf
+        self.maximumX = -np.inf
+
+
+
+    # Add a chunk of data points to the accumulator.
+    def update (self, xInput, yInput, weights = []):
+        '''
+        :param xInput: the x-values of the data to fit.
+        :type xInput: list [float] or NumPy array
+        
+        :param yInput: the y-values of the data to fit.
+        :type yInput: list [float] or NumPy array
+        
+        :param weights: the weights of the data to fit, default all ones.
+        :type weights: list [float] or NumPy array
+
+        :return: the accumulator itself, so that calls can be chained.
+        :rtype: LinearFitAccumulator
+        
+        **Description**:
+        Add a chunk of data points to the accumulator. As in :py:meth:`~.DataTools.linearLeastSquare`, points where the y-value is NaN (or infinite) 
+        are not taken into account for the fit, but their x-values are used for the range of the fitted line.
+        '''
+
+        xInput = np.asarray (xInput, dtype = np.double)
+        yInput = np.asarray (yInput, dtype = np.double)
+
+        if len (xInput):
+        
+            self.minimumX = min ( self.minimumX, np.min (xInput) )
+            self.maximumX = max ( self.maximumX, np.max (xInput) )
+
+
+        if not len (weights):
+
+            weights = np.ones ( len (xInput) )
+
+        else:
+        
+            weights = np.asarray (weights, dtype = np.double)
+        
+
+        # Do not take into account any NaN values in yInput.
+        iValid = np.isfinite (yInput)
+
+        x = xInput [iValid]
+        y = yInput [iValid]
+        w = weights [iValid]
+
+        numberOfValuesChunk = len (x)
+        if not numberOfValuesChunk:
+        
+            return self
+
+
+        # Statistics of this chunk around its own averages, then merged with what has been accumulated so far.
+        sumWeightsChunk = np.sum (w)
+        averageXChunk = np.sum (w * x) / sumWeightsChunk
+        averageYChunk = np.sum (w * y) / sumWeightsChunk
+        
+        deviationsX = x - averageXChunk
+        deviationsY = y - averageYChunk
+
+        chunkAccumulator = LinearFitAccumulator ()
+        chunkAccumulator.numberOfValues = numberOfValuesChunk
+        chunkAccumulator.sumWeights = sumWeightsChunk
+        chunkAccumulator.averageX = averageXChunk
+        chunkAccumulator.averageY = averageYChunk
+        chunkAccumulator.sumSquaredDeviationsX = np.sum (w * deviationsX * deviationsX)
+        chunkAccumulator.sumSquaredDeviationsY = np.sum (w * deviationsY * deviationsY)
+        chunkAccumulator.sumCrossDeviationsXY = np.sum (w * deviationsX * deviationsY)
+
+        return self.merge (chunkAccumulator)
+
+
+
+    # Combine the statistics of another accumulator with this one.
+    def merge (self, otherAccumulator):
+        '''
+        :param otherAccumulator: accumulator filled with another part of the data.
+        :type otherAccumulator: LinearFitAccumulator
+
+        :return: the accumulator itself, so that calls can be chained.
+        :rtype: LinearFitAccumulator
+        
+        **Description**:
+        Combine the statistics of :code:`otherAccumulator` with this one, as if all the data points had been added to this accumulator. 
+        The pairwise update formulas of `Chan et al. <https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Parallel_algorithm>`_ are used.
+        '''
+
+        self.minimumX = min (self.minimumX, otherAccumulator.minimumX)
+        self.maximumX = max (self.maximumX, otherAccumulator.maximumX)
+
+        if not otherAccumulator.numberOfValues:
+        
+            return self
+            
+            
+        sumWeightsCombined = self.sumWeights + otherAccumulator.sumWeights
+        deltaX = otherAccumulator.averageX - self.averageX
+        deltaY = otherAccumulator.averageY - self.averageY
+        weightProduct = self.sumWeights * otherAccumulator.sumWeights / sumWeightsCombined
+
+        self.sumSquaredDeviationsX += otherAccumulator.sumSquaredDeviationsX + deltaX * deltaX * weightProduct
+        self.sumSquaredDeviationsY += otherAccumulator.sumSquaredDeviationsY + deltaY * deltaY * weightProduct
+        self.sumCrossDeviationsXY += otherAccumulator.sumCrossDeviationsXY + deltaX * deltaY * weightProduct
+
+        self.averageX += deltaX * otherAccumulator.sumWeights / sumWeightsCombined
+        self.averageY += deltaY * otherAccumulator.sumWeights / sumWeightsCombined
+        
+        self.sumWeights = sumWeightsCombined
+        self.numberOfValues += otherAccumulator.numberOfValues
+
+        return self
+
+
+
+    # Determine the values of the variables a and b for the linear least square solution y  =  a * x  +  b.
+    def result (self, fractionBeyondXRange = 0.1):
+        '''
+        :param fractionBeyondXRange: the fraction of the x range beyond which to calculate the fitting line (default = 0.1).
+        :type fractionBeyondXRange: float
+
+        :return: a, b, uncertaintyA, uncertaintyB, rSquared, xValuesFitLine, yValuesFitLine
+        :rtype: float, float, float, float, float, NumPy array (2), NumPy array (2)
+        
+        **Description**:
+        Determine the values of the variables a and b for the linear least square solution y (x) =  ax + b, along with their uncertainties and the 
+        coefficient of determination (r-squared), from the statistics accumulated so far. 
+        With all weights equal to one, the results are the same as those of :py:meth:`~.DataTools.linearLeastSquare` for all the data points together.
+        As with :py:meth:`~.DataTools.linearLeastSquare`, the results are NaN (or infinite) if there are too few data points to fit a line,
+        for example for an empty accumulator.
+        '''
+
+        # The sums are NumPy floats, so that too few data points give NaN values instead of a ZeroDivisionError.
+        numberOfValues = np.double (self.numberOfValues)
+        sumWeights = np.double (self.sumWeights)
+        sumSquaredDeviationsX = np.double (self.sumSquaredDeviationsX)
+        sumSquaredDeviationsY = np.double (self.sumSquaredDeviationsY)
+        sumCrossDeviationsXY = np.double (self.sumCrossDeviationsXY)
+
+        with np.errstate (divide = 'ignore', invalid = 'ignore'):
+
+            a = sumCrossDeviationsXY / sumSquaredDeviationsX
+            b = self.averageY - a * self.averageX
+
+            # The sum of the squared residuals follows from the accumulated sums without having to go through the data points again.
+            sumResidu2 = sumSquaredDeviationsY - a * sumCrossDeviationsXY
+        
+            averageErrorY = sumResidu2 / (numberOfValues - 2)
+            averageErrorA = averageErrorY / sumSquaredDeviationsX
+            averageErrorB = averageErrorY * ( 1 / sumWeights + self.averageX * self.averageX / sumSquaredDeviationsX )
+
+            uncertaintyA = np.sqrt (averageErrorA)
+            uncertaintyB = np.sqrt (averageErrorB)
+        
+        
+            # Calculate the r-squared value, an indication for the goodness of the fit. The closer to 1, the better the fit.
+            rSquared = 1 - sumResidu2 / sumSquaredDeviationsY
+
+
+        # Calculate and return the fitted line with two points slightly outside the range of the x values (NaN if no x values have been added).
+        if self.minimumX > self.maximumX:
+
+            return a, b, uncertaintyA, uncertaintyB, rSquared, np.full (2, np.nan), np.full (2, np.nan)
+
+
+        xRange = self.maximumX - self.minimumX
+        xValuesFitLine = np.asarray ( [ self.minimumX - fractionBeyondXRange * xRange, self.maximumX + fractionBeyondXRange * xRange ] )
+        yValuesFitLine = a * xValuesFitLine + b
+
+
+        return a, b, uncertaintyA, uncertaintyB, rSquared, xValuesFitLine, yValuesFitLine
+
+
+
+
+# Register the backends of the operations that exist in more than one version: the C++ versions if they can be found, the Numba versions if Numba is installed,
+#  and the NumPy versions. The C++ and Numba libraries are only imported when they are used for the first time.
+DataTools.registerLazyBackend ('getSegmentSpecsFromDataValues', 'native', 'DataWranglingToolsPYtoCPP', 'getSegmentSpecsFromDataValuesPYtoCPP', np.single)
+DataTools.registerLazyBackend ('getAverageVarAndSD', 'native', 'DataWranglingToolsPYtoCPP', 'getAverageVarAndSDPYtoCPP', np.double)
+DataTools.registerLazyBackend ('getMedianAndQuantiles', 'native', 'DataWranglingToolsPYtoCPP', 'getMedianAndQuantilesPYtoCPP', np.double)
+DataTools.registerLazyBackend ('getNearestValue', 'native', 'DataWranglingToolsPYtoCPP', 'getNearestValuePYtoCPP', np.double)
+
+DataTools.registerLazyBackend ('passAverageFilter', 'native', 'FilterToolsPYtoCPP', 'passAverageFilterPYtoCPP', np.single)
+
+DataTools.registerLazyBackend ('getSegmentSpecsFromDataValues', 'numba', 'DataToolsNumba', 'getSegmentSpecsFromDataValuesNumba', np.single, ['numba'])
+DataTools.registerLazyBackend ('passAverageFilter', 'numba', 'DataToolsNumba', 'passAverageFilterNumba', np.single, ['numba'])
+DataTools.registerLazyBackend ('getAverageVarAndSD', 'numba', 'DataToolsNumba', 'getAverageVarAndSDNumba', np.double, ['numba'])
+DataTools.registerLazyBackend ('getMedianAndQuantiles', 'numba', 'DataToolsNumba', 'getMedianAndQuantilesNumba', np.double, ['numba'])
+DataTools.registerLazyBackend ('getNearestValue', 'numba', 'DataToolsNumba', 'getNearestValueNumba', np.double, ['numba'])
+
+DataTools.registerBackend ('passAverageFilter', 'numpy', DataToolsNumPyBackend.passAverageFilter, np.double)
+DataTools.registerBackend ('getAverageVarAndSD', 'numpy', DataToolsNumPyBackend.getAverageVarAndSD, np.double)
+DataTools.registerBackend ('getMedianAndQuantiles', 'numpy', DataToolsNumPyBackend.getMedianAndQuantiles, np.double)
+DataTools.registerBackend ('getNearestValue', 'numpy', DataToolsNumPyBackend.getNearestValue, np.double)
+
+
+# Switch on the profiling of the DataTools calls, if requested with the environment variable DATATOOLS_PROFILE.
+if os.environ.get ('DATATOOLS_PROFILE', '0') not in ('', '0'):
+
+    DataTools.enableProfile ()
+
+
+
+# Module attributes that load a library when they are read for the first time: DataWranglingToolsPYtoCPPExists, FilterToolsPYtoCPPExists and DataToolsNumbaExists
+#  (True if the library can be loaded), and the libraries themselves.
+def __getattr__ (attributeName):
+
+    if attributeName in dataToolsBackendModuleNames:
+
+        return DataTools.importBackendModule ( dataToolsBackendModuleNames [attributeName] ) is not None
+
+    if attributeName in dataToolsBackendModuleNames.values ():
+
+        backendModule = DataTools.importBackendModule (attributeName)
+        if backendModule is not None:
+
+            return backendModule
+
+
+    raise AttributeError ( "module '{}' has no attribute '{}'".format (__name__, attributeName) )
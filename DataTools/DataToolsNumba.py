@@ -0,0 +1,381 @@
+# DataToolsNumba: the Numba versions of the C++ kernels of DataTools
+#
+# These functions are used by DataTools when the compiled C++ modules (DataWranglingToolsPYtoCPP and FilterToolsPYtoCPP) cannot be loaded,
+# for example because they have not been compiled for the platform. The kernels follow the C++ code step by step, so that the results are the same.
+# They are compiled the first time they are called, and the compiled code is cached on disk (cache = True), so that this only happens once.
+# The data values are only copied if they have another data type: non-contiguous (for example a column of a two-dimensional array) and 
+# read-only arrays are passed to the kernels as they are, Numba compiles a version of the kernel for each of these kinds of arrays.
+# If Numba is not installed, importing this module fails and DataTools does not use it.
+
+import numpy as np
+
+from numba import njit
+
+
+
+@njit (cache = True)
+def getSegmentSpecsFromDataValuesKernel (dataValues, segmentStartIndices, segmentAmplitudes, segmentSlopes, segmentDurations, segmentStartIndicesNegative, segmentStartIndicesPositive):
+
+    numberOfDataValues = len (dataValues)
+
+    # Use these variables as an index counter, until the end of this function.
+    numberOfSegments = 0
+    numberOfSegmentsNegative = 0
+    numberOfSegmentsPositive = 0
+
+    # Initialise the  segmentAmplitudes  first value with the first difference in  dataValues .
+    segmentAmplitudes [numberOfSegments] = dataValues [1] - dataValues [0]
+    segmentStartIndices [numberOfSegments] = 0
+    numberOfSamplesInSegment = 1
+
+    # Initialise the steepest segment variables.
+    steepestNegativeSlope = np.float32 (0)
+    iSteepestNegativeSlopeSegment = 0
+    iSegmentStartIndicesSteepestNegativeSlope = 0
+
+    steepestPositiveSlope = np.float32 (0)
+    iSteepestPositiveSlopeSegment = 0
+    iSegmentStartIndicesSteepestPositiveSlope = 0
+
+    # Go through the  dataValues  list: the iteration after the last one closes the last segment.
+    for iSample in range (1, numberOfDataValues):
+
+        if iSample < numberOfDataValues - 1:
+
+            deltaValue = dataValues [iSample + 1] - dataValues [iSample]
+
+            # The "=" in the comparisons deals with the situation when the list of data points starts as a flat line, i.e. the first segments have a delta of zero.
+            if ( segmentAmplitudes [numberOfSegments] >= 0 and deltaValue >= 0 ) or ( segmentAmplitudes [numberOfSegments] <= 0 and deltaValue <= 0 ):
+
+                segmentAmplitudes [numberOfSegments] += deltaValue
+                numberOfSamplesInSegment += 1
+
+                continue
+
+
+        # The segment has ended.
+        segmentDurations [numberOfSegments] = numberOfSamplesInSegment
+        segmentSlopes [numberOfSegments] = segmentAmplitudes [numberOfSegments] / segmentDurations [numberOfSegments]
+
+        # Reset the number of samples in the new segment to 1.
+        numberOfSamplesInSegment = 1
+
+        if segmentAmplitudes [numberOfSegments] < 0:
+
+            # Check if the segment is the steepest of the negative segments.
+            if segmentSlopes [numberOfSegments] < steepestNegativeSlope:
+
+                steepestNegativeSlope = segmentSlopes [numberOfSegments]
+                iSteepestNegativeSlopeSegment = segmentStartIndices [numberOfSegments]
+                iSegmentStartIndicesSteepestNegativeSlope = numberOfSegments
+
+            segmentStartIndicesNegative [numberOfSegmentsNegative] = segmentStartIndices [numberOfSegments]
+            if iSample < numberOfDataValues - 1:
+
+                numberOfSegmentsNegative += 1
+
+
+        if segmentAmplitudes [numberOfSegments] > 0:
+
+            # Check if the segment is the steepest of the positive segments.
+            if segmentSlopes [numberOfSegments] > steepestPositiveSlope:
+
+                steepestPositiveSlope = segmentSlopes [numberOfSegments]
+                iSteepestPositiveSlopeSegment = segmentStartIndices [numberOfSegments]
+                iSegmentStartIndicesSteepestPositiveSlope = numberOfSegments
+
+            segmentStartIndicesPositive [numberOfSegmentsPositive] = segmentStartIndices [numberOfSegments]
+            if iSample < numberOfDataValues - 1:
+
+                numberOfSegmentsPositive += 1
+
+
+        # Initialise the new segment's amplitude value and store its start index.
+        if iSample < numberOfDataValues - 1:
+
+            numberOfSegments += 1
+            segmentAmplitudes [numberOfSegments] = deltaValue
+            segmentStartIndices [numberOfSegments] = iSample
+
+
+    # The actual number of segments is one more, because the initial value was set to zero so that it could be used as an index counter.
+    return numberOfSegments + 1, \
+           numberOfSegmentsNegative + 1, \
+           iSteepestNegativeSlopeSegment, \
+           iSegmentStartIndicesSteepestNegativeSlope, \
+           numberOfSegmentsPositive + 1, \
+           iSteepestPositiveSlopeSegment, \
+           iSegmentStartIndicesSteepestPositiveSlope
+
+
+
+@njit (cache = True)
+def passAverageFilterKernel (listOfNumbers, listOfNumbersFiltered, widthOfWindow):
+
+    numberOfElements = len (listOfNumbers)
+
+    # Filter the first  widthOfWindow  elements of the  listOfNumbers . The windows are clamped to the  listOfNumbers , which can be shorter than a window.
+    for iElement in range (0, min (widthOfWindow, numberOfElements)):
+
+        iWindowEnd = min (iElement + widthOfWindow + 1, numberOfElements)
+        sumOfWindow = np.float32 (0)
+        for iWindow in range (0, iWindowEnd):
+
+            sumOfWindow += listOfNumbers [iWindow]
+
+        listOfNumbersFiltered [iElement] = sumOfWindow / iWindowEnd
+
+
+    # Run the filter over all the elements.
+    for iElement in range (widthOfWindow, numberOfElements - widthOfWindow):
+
+        sumOfWindow = np.float32 (0)
+        for iWindow in range (-widthOfWindow, widthOfWindow + 1):
+
+            sumOfWindow += listOfNumbers [iElement + iWindow]
+
+        listOfNumbersFiltered [iElement] = sumOfWindow / (2 * widthOfWindow + 1)
+
+
+    # Filter the last  widthOfWindow  elements of the  listOfNumbers  (that have not been filtered with the first ones).
+    for iElement in range (max (numberOfElements - widthOfWindow, min (widthOfWindow, numberOfElements)), numberOfElements):
+
+        iWindowStart = max (iElement - widthOfWindow, 0)
+        sumOfWindow = np.float32 (0)
+        for iWindow in range (iWindowStart, numberOfElements):
+
+            sumOfWindow += listOfNumbers [iWindow]
+
+        listOfNumbersFiltered [iElement] = sumOfWindow / (numberOfElements - iWindowStart)
+
+
+
+@njit (cache = True)
+def getAverageVarAndSDKernel (dataValues):
+
+    numberOfValues = len (dataValues)
+
+    # Calculate the average value.
+    sumOfDataValues = 0.
+    for iValue in range (numberOfValues):
+
+        sumOfDataValues += dataValues [iValue]
+
+    averageValue = sumOfDataValues / numberOfValues
+
+    # Calculate the variance and the standard deviation.
+    sumOfSquaredDeviations = 0.
+    for iValue in range (numberOfValues):
+
+        sumOfSquaredDeviations += (dataValues [iValue] - averageValue) ** 2
+
+    variance = sumOfSquaredDeviations / numberOfValues
+
+    return averageValue, np.sqrt (variance), variance
+
+
+
+@njit (cache = True)
+def getQuantileValueKernel (dataValuesSorted, quantile):
+
+    numberOfValues = len (dataValuesSorted)
+
+    # The virtual index is calculated in 32-float, as in the C++ version.
+    virtualIndex = np.float32 (quantile) * np.float32 (numberOfValues - 1)
+    iVirtualIndex = int (virtualIndex)
+    fractionVirtualIndex = virtualIndex - np.float32 (iVirtualIndex)
+
+    if iVirtualIndex == numberOfValues - 1:
+
+        return dataValuesSorted [iVirtualIndex]
+
+    return dataValuesSorted [iVirtualIndex] + (dataValuesSorted [iVirtualIndex + 1] - dataValuesSorted [iVirtualIndex]) * fractionVirtualIndex
+
+
+
+@njit (cache = True)
+def getMedianAndQuantilesKernel (dataValues, lowerQuantile, upperQuantile):
+
+    numberOfValues = len (dataValues)
+    dataValuesSorted = np.sort (dataValues)
+
+    if numberOfValues % 2:
+
+        medianValue = dataValuesSorted [numberOfValues // 2]
+
+    else:
+
+        medianValue = ( dataValuesSorted [numberOfValues // 2] + dataValuesSorted [numberOfValues // 2 - 1] ) / 2
+
+    return medianValue, getQuantileValueKernel (dataValuesSorted, lowerQuantile), getQuantileValueKernel (dataValuesSorted, upperQuantile)
+
+
+
+@njit (cache = True)
+def getNearestValueKernel (dataValues, valueToCompare, monotonicList):
+
+    numberOfValues = len (dataValues)
+
+    iSmallestDifference = 0
+    smallestDifferenceABS = abs (dataValues [0] - valueToCompare)
+
+    for iValue in range (1, numberOfValues):
+
+        valueDifferenceABS = abs (dataValues [iValue] - valueToCompare)
+
+        # When there are two or more equal values that are the nearest to the value to compare, then the last one is chosen, due to the "=" in "<=".
+        if valueDifferenceABS <= smallestDifferenceABS:
+
+            smallestDifferenceABS = valueDifferenceABS
+            iSmallestDifference = iValue
+
+        # If the list is strictly monotonic, then the search can be stopped once the differences start to increase.
+        elif monotonicList:
+
+            break
+
+    return iSmallestDifference, dataValues [iSmallestDifference] - valueToCompare
+
+
+
+
+# The functions below take and return the same as the corresponding functions of the PYtoCPP modules.
+def getSegmentSpecsFromDataValuesNumba (dataValues, workspace = None):
+    '''
+    :param dataValues: list (one dimension) of data values, converted to 32-float.
+    :type dataValues: list or NumPy array
+
+    :param workspace: the arrays in which the results are stored, see :py:meth:`~.DataTools.getSegmentSpecsWorkspace`, default :code:`None` (new arrays).
+    :type workspace: dict
+
+    :return: characteristics of the *segments* defined by :code:`dataValues`, the same tuple as :py:meth:`~.DataTools.getSegmentSpecsFromDataValues`.
+    :rtype: tuple
+    '''
+
+    dataValues = np.asarray (dataValues, dtype = np.single)
+    numberOfDataValues = len (dataValues)
+
+    if workspace is None:
+
+        segmentStartIndices = np.zeros (numberOfDataValues, dtype = np.uintc)
+        segmentAmplitudes = np.zeros (numberOfDataValues, dtype = np.single)
+        segmentSlopes = np.zeros (numberOfDataValues, dtype = np.single)
+        segmentDurations = np.zeros (numberOfDataValues, dtype = np.uintc)
+        segmentStartIndicesNegative = np.zeros (numberOfDataValues, dtype = np.uintc)
+        segmentStartIndicesPositive = np.zeros (numberOfDataValues, dtype = np.uintc)
+
+    else:
+
+        segmentStartIndices = workspace ['segmentStartIndices']
+        segmentAmplitudes = workspace ['segmentAmplitudes']
+        segmentSlopes = workspace ['segmentSlopes']
+        segmentDurations = workspace ['segmentDurations']
+        segmentStartIndicesNegative = workspace ['segmentStartIndicesNegative']
+        segmentStartIndicesPositive = workspace ['segmentStartIndicesPositive']
+
+        # The last value of the negative and positive start indices that is returned is not always set by the kernel (it is then 0), as in the C++ version.
+        segmentStartIndicesNegative [:numberOfDataValues] = 0
+        segmentStartIndicesPositive [:numberOfDataValues] = 0
+
+    numberOfSegments, \
+    numberOfSegmentsNegative, \
+    iSteepestNegativeSlopeSegment, \
+    iSegmentStartIndicesSteepestNegativeSlope, \
+    numberOfSegmentsPositive, \
+    iSteepestPositiveSlopeSegment, \
+    iSegmentStartIndicesSteepestPositiveSlope = getSegmentSpecsFromDataValuesKernel ( dataValues,
+                                                                                      segmentStartIndices,
+                                                                                      segmentAmplitudes,
+                                                                                      segmentSlopes,
+                                                                                      segmentDurations,
+                                                                                      segmentStartIndicesNegative,
+                                                                                      segmentStartIndicesPositive )
+
+    return numberOfSegments, \
+           segmentStartIndices [0:numberOfSegments], \
+           segmentAmplitudes [0:numberOfSegments], \
+           segmentSlopes [0:numberOfSegments], \
+           segmentDurations [0:numberOfSegments], \
+           numberOfSegmentsNegative, \
+           segmentStartIndicesNegative [0:numberOfSegmentsNegative], \
+           int (iSteepestNegativeSlopeSegment), \
+           iSegmentStartIndicesSteepestNegativeSlope, \
+           numberOfSegmentsPositive, \
+           segmentStartIndicesPositive [0:numberOfSegmentsPositive], \
+           int (iSteepestPositiveSlopeSegment), \
+           iSegmentStartIndicesSteepestPositiveSlope
+
+
+
+def passAverageFilterNumba (listOfNumbers, widthOfWindow, out = None):
+    '''
+    :param listOfNumbers: list of data values, converted to 32-float.
+    :type listOfNumbers: list or NumPy array
+
+    :param widthOfWindow: number of data values on either side of the central value in the window.
+    :type widthOfWindow: int
+
+    :param out: array in which the filtered data values are stored, with the same number of values as :code:`listOfNumbers`, default :code:`None` (a new array).
+    :type out: NumPy array <np.single>
+
+    :return: filtered data values (:code:`out`, if given).
+    :rtype: NumPy array <np.single>
+    '''
+
+    listOfNumbers = np.asarray (listOfNumbers, dtype = np.single)
+    listOfNumbersFiltered = np.zeros (len (listOfNumbers), dtype = np.single) if out is None else out
+
+    passAverageFilterKernel (listOfNumbers, listOfNumbersFiltered, int (widthOfWindow))
+
+    return listOfNumbersFiltered
+
+
+
+def getAverageVarAndSDNumba (dataValues):
+    '''
+    :param dataValues: list of data values, converted to double.
+    :type dataValues: list or NumPy array
+
+    :return: average, standard deviation and variance.
+    :rtype: float, float, float
+    '''
+
+    return getAverageVarAndSDKernel ( np.asarray (dataValues, dtype = np.double) )
+
+
+
+def getMedianAndQuantilesNumba (dataValues, lowerQuantile = 0.25, upperQuantile = 0.75):
+    '''
+    :param dataValues: list of data values, converted to double.
+    :type dataValues: list or NumPy array
+
+    :param lowerQuantile: the lower quantile (between 0 and 1), default 0.25.
+    :type lowerQuantile: float
+
+    :param upperQuantile: the upper quantile (between 0 and 1), default 0.75.
+    :type upperQuantile: float
+
+    :return: median, lower and upper quantile.
+    :rtype: float, float, float
+    '''
+
+    return getMedianAndQuantilesKernel ( np.asarray (dataValues, dtype = np.double), float (lowerQuantile), float (upperQuantile) )
+
+
+
+def getNearestValueNumba (dataValues, valueToCompare, monotonicList = 1):
+    '''
+    :param dataValues: list of data values, converted to double.
+    :type dataValues: list or NumPy array
+
+    :param valueToCompare: value to compare the values in :code:`dataValues` with.
+    :type valueToCompare: float
+
+    :param monotonicList: :code:`1` (default) when the values in the list are strictly monotonically increasing or decreasing, :code:`0` when not.
+    :type monotonicList: int
+
+    :return: index of the nearest value and its difference with the value to compare.
+    :rtype: int, float
+    '''
+
+    return getNearestValueKernel ( np.asarray (dataValues, dtype = np.double), float (valueToCompare), bool (monotonicList) )
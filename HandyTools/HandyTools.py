@@ -13,14 +13,40 @@ from pathlib import Path
 
 import datetime
 import time
+import json
+import re
+import fnmatch
+import itertools
+import pickle
+import struct
+import zipfile
+import mmap
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+# matplotlib is only imported in HandyTools.plotErrorBars, so that importing HandyTools stays fast.
 
 
 separatorCharacter = '\\' if sys.platform == 'win32' else '/'
 
 
+# The version of the scan cache files of HandyTools.iterateFilesInDirectoryTree: files of another version are not used.
+scanCacheVersion = 1
+
+# A directory that changed less than this (in ns) before it was read is read again next time, because a change within the resolution of 
+#  the modification times of the file system (2 s on FAT file systems) does not always give a new modification time.
+scanCacheRacyNanoseconds = 2000000000
+
+# The version of the table caches of HandyTools.readTable: table caches of another version are not used.
+tableCacheVersion = 1
+
+# The version of the line offsets cache files of HandyTools.getTextFileLineOffsets: files of another version are not used.
+lineOffsetsCacheVersion = 1
+
+
 class HandyTools:
     '''
     HandyTools is a pseudo-class (no instantiation, no 'self'), bundling a couple of functions that I have found to come in handy in many situations.
@@ -29,13 +55,13 @@ class HandyTools:
 
     # A handy function to get the list of absolute paths of all files of a certain extension (default .png) down a directory tree
     @staticmethod
-    def getFilesInDirectoryTree (startPath, extension = '', stringsToExclude = [], checkStartPathOnly = False):
+    def getFilesInDirectoryTree (startPath, extension = '', stringsToExclude = [], checkStartPathOnly = False, filePatterns = [], numberOfThreads = 1, scanCacheFileName = ''):
         '''
         :param startPath: directory where to start the search.
         :type startPath: str
 
-        :param extension: extension of files to return. If ``extension = ''``, then all files are returned. If ``extension = ''`` and ``checkStartPathOnly = True``, then all files and directories in ``startPath`` are returned.
-        :type extension: str
+        :param extension: extension of files to return, or a list of extensions. If ``extension = ''``, then all files are returned. If ``extension = ''`` and ``checkStartPathOnly = True``, then all files and directories in ``startPath`` are returned.
+        :type extension: str or list [str]
 
         :param stringsToExclude: list of strings that when in the file name are excluded from the file list.
         :type stringsToExclude: list [str]
@@ -43,6 +69,16 @@ class HandyTools:
         :param checkStartPathOnly: if ``True``, then only search the startPath folder.
         :type checkStartPathOnly: bool; default = ``False`` 
 
+        :param filePatterns: list of glob patterns (for example ``'run_*_v?.dat'``), of which a file name needs to match at least one, default ``[]`` (all file names).
+        :type filePatterns: list [str]
+
+        :param numberOfThreads: the number of threads that read the directories, see :py:meth:`~.iterateFilesInDirectoryTree`, default 1.
+        :type numberOfThreads: int
+
+        :param scanCacheFileName: name of the file in which the listings of the directories are kept, so that only the directories that have changed 
+            are read next time, see :py:meth:`~.iterateFilesInDirectoryTree`, default ``''`` (no scan cache).
+        :type scanCacheFileName: str
+
         :return: list of file names and absolute paths of all the files ending on ``extension`` down the directory tree starting at ``startPath``.
         :rtype: list [str]  
 
@@ -51,352 +87,2265 @@ class HandyTools:
         This function is used to perform a recursively search for all files with a user defined ``extension``, starting at the user defined ``startPath`` in the directory tree. 
         Files that contain any of the strings in the  ``stringsToExclude`` list, are excluded from the returned file list. If the boolean `checkStartPathOnly`` is set to ``True``, 
         then the search is restricted to the ``startPath`` folder only.
+
+        The files are listed directory by directory, each directory followed by its subdirectories, both in alphabetical order. 
+        The list is made with :py:meth:`~.iterateFilesInDirectoryTree`, which can also be used to get the file names one by one, without making the list.
+        '''
+
+        return list ( HandyTools.iterateFilesInDirectoryTree ( startPath, extension, stringsToExclude, checkStartPathOnly, filePatterns, numberOfThreads, 
+                                                               scanCacheFileName = scanCacheFileName ) )
+
+
+
+    # Get the absolute paths of all files of a certain extension down a directory tree one by one, while the directory tree is being searched.
+    @staticmethod
+    def iterateFilesInDirectoryTree ( startPath, 
+                                      extension = '', 
+                                      stringsToExclude = [], 
+                                      checkStartPathOnly = False, 
+                                      filePatterns = [], 
+                                      numberOfThreads = 1, 
+                                      followSymlinks = False, 
+                                      scanCacheFileName = '' ):
+        '''
+        :param startPath: directory where to start the search.
+        :type startPath: str
+
+        :param extension: extension of files to return, or a list of extensions, see :py:meth:`~.getFilesInDirectoryTree`.
+        :type extension: str or list [str]
+
+        :param stringsToExclude: list of strings that when in the file name (with its path) are excluded.
+        :type stringsToExclude: list [str]
+
+        :param checkStartPathOnly: if ``True``, then only search the startPath folder.
+        :type checkStartPathOnly: bool; default = ``False`` 
+
+        :param filePatterns: list of glob patterns, of which a file name needs to match at least one, default ``[]`` (all file names).
+        :type filePatterns: list [str]
+
+        :param numberOfThreads: the number of threads that read the directories, default 1 (no threads).
+        :type numberOfThreads: int
+
+        :param followSymlinks: if ``True``, then also search the directories that symbolic links point to, default ``False``.
+        :type followSymlinks: bool
+
+        :param scanCacheFileName: name of the file in which the listings of the directories are kept, default ``''`` (no scan cache).
+        :type scanCacheFileName: str
+
+        :return: generator of the file names with absolute paths, in the same order as :py:meth:`~.getFilesInDirectoryTree`.
+        :rtype: generator [str]
+
+
+        **Description:**
+        The directories are read with ``os.scandir``, which gives the type of each entry without asking the file system again for each file, 
+        and the file names are given as soon as their directory has been read, so that their processing can start before the whole tree has been searched
+        (see for example :py:meth:`~.analyseFilesInDirectoryTree`). A directory whose path contains one of the ``stringsToExclude`` is not searched at all, 
+        because all the files in it would be excluded, and the other files are excluded in the same pass in which they are found.
+
+        On slow (network) file systems with many directories, reading the directories takes most of the time. With ``numberOfThreads > 1``, the subdirectories 
+        of each directory are read by a pool of threads while the files of the directories before them are given, in the same order as without threads.
+        Directories that cannot be read are skipped, as ``os.walk`` does.
+
+        When the same directory tree is searched many times while only a few directories change, a ``scanCacheFileName`` can be given.
+        The listing and the modification time of each directory are then kept in this file, and a directory is only read again if its modification time 
+        has changed (see :py:meth:`~.getDirectoryListing`): all the other directories only need to be checked, which is much faster, while the result is the same 
+        as that of a full search. The listings include all the files and subdirectories, so that the same scan cache file can be used with any ``extension``,
+        ``stringsToExclude`` and ``filePatterns``, and for any ``startPath`` in the tree. The scan cache is not used if ``checkStartPathOnly = True``.
         '''
 
-        dirPath = Path (startPath)
+        extensions = tuple (extension) if isinstance ( extension, (list, tuple) ) else (extension,)
+        stringsToExcludeExpression = re.compile ( '|'.join ( [ re.escape (stringToExclude) for stringToExclude in stringsToExclude ] ) ) if len (stringsToExclude) else None
+        startPath = os.path.abspath (startPath)
 
-        listOfFileNames = []
         if checkStartPathOnly:
 
-            listOfAllFileNames = sorted ( os.listdir (startPath) )         
-            if extension == '':
+            # All files and directories in the  startPath  folder, as with os.listdir.
+            for fileName in sorted ( os.listdir (startPath) ):
 
-                # The files '.DS_Store' is a MAC OS administration file, that is not of interest to keep.
-                listOfFileNames = [ os.path.abspath (startPath + separatorCharacter + fileName)  for fileName in listOfAllFileNames  if fileName != '.DS_Store']
-       
-        
-            else:
-                
-                listOfFileNames = [ os.path.abspath (startPath + separatorCharacter + fileName)  for fileName in listOfAllFileNames 
-                                    if fileName.endswith (extension) ]
+                filePath = startPath + separatorCharacter + fileName
+                if ( fileName != '.DS_Store' if extensions == ('',) else fileName.endswith (extensions) ) and \
+                   ( not filePatterns or any ( fnmatch.fnmatch (fileName, filePattern) for filePattern in filePatterns ) ) and \
+                   ( stringsToExcludeExpression is None or not stringsToExcludeExpression.search (filePath) ):
 
-    
-        else:
+                    yield filePath
 
-            if extension == '':
 
-                # The files '.DS_Store' is a MAC OS administration file, that is not of interest to keep.
-                listOfFileNames = [ os.path.abspath ( os.path.join (root, name) )
-                                    for root, dirs, files in os.walk (dirPath)
-                                    for name in sorted (files)
-                                    if name != '.DS_Store' ]
-    
-    
-            else:
+            return
 
-                listOfFileNames = [ os.path.abspath ( os.path.join (root, name) )
-                                    for root, dirs, files in os.walk (dirPath)
-                                    for name in sorted (files)
-                                    if name.endswith (extension) ]
 
+        if stringsToExcludeExpression is not None and stringsToExcludeExpression.search (startPath):
 
-    
-        # The user can specify certains string that, when part of a file name, this file deleted from the  listOfFileNames
-        if len (stringsToExclude):
-        
-            iDeleteFromList = []
-            for iFileName, fileName in enumerate (listOfFileNames):
-            
-                for stringToExclude in stringsToExclude:
-                
-                    if stringToExclude in fileName:
-                    
-                        iDeleteFromList.append (iFileName)  
-            
+            return
 
-            # If there are files to be deleted from the  listOfFileNames , then delete them.
-            if len (iDeleteFromList):
-            
-                # Sort the indices to be removed in reverse order, larger at the start of the  iDeleteFromList  list. 
-                iDeleteFromList = sorted (iDeleteFromList, reverse = True)                
-                for iDelete in iDeleteFromList:
-                
-                    listOfFileNames.pop (iDelete)
 
+        scanCache = HandyTools.readScanCache (scanCacheFileName) if scanCacheFileName else None
 
-        return listOfFileNames
+        listingArguments = (extensions, filePatterns, stringsToExcludeExpression, followSymlinks, scanCache)
+        threadPool = ThreadPoolExecutor (max_workers = numberOfThreads) if numberOfThreads > 1 else None
+        searchedDirectoryPaths = set ()
+        numberOfDirectoriesRead = 0
+        searchCompleted = False
+        try:
 
+            # The directories still to be searched, the next one last, each with (if threads are used) the listing that is being read.
+            directoriesToSearch = [ ( startPath, threadPool.submit (HandyTools.listDirectoryInTree, startPath, *listingArguments) if threadPool else None ) ]
+            while directoriesToSearch:
 
+                directoryPath, directoryListing = directoriesToSearch.pop ()
+                if threadPool:
 
-    # Get the absolute path for a file.
+                    filePaths, subdirectoryPaths, directoryWasRead = directoryListing.result ()
+                    subdirectoriesToSearch = [ ( subdirectoryPath, threadPool.submit (HandyTools.listDirectoryInTree, subdirectoryPath, *listingArguments) ) 
+                                               for subdirectoryPath in subdirectoryPaths ]
+
+                else:
+
+                    filePaths, subdirectoryPaths, directoryWasRead = HandyTools.listDirectoryInTree (directoryPath, *listingArguments)
+                    subdirectoriesToSearch = [ (subdirectoryPath, None) for subdirectoryPath in subdirectoryPaths ]
+
+
+                searchedDirectoryPaths.add (directoryPath)
+                numberOfDirectoriesRead += directoryWasRead
+
+                yield from filePaths
+
+                directoriesToSearch.extend ( reversed (subdirectoriesToSearch) )
+
+
+            searchCompleted = True
+
+
+        finally:
+
+            # The threads that are still reading a directory store its listing in the  scanCache, so they are waited for before it is saved.
+            if threadPool:
+
+                threadPool.shutdown (wait = True, cancel_futures = True)
+
+
+            # Once the whole tree has been searched, forget the directories below the  startPath  that no longer exist (or have been excluded),
+            #  and save the listings of the directories that have been read, also if the search was stopped before the end.
+            if scanCache is not None:
+
+                numberOfDirectoriesRemoved = 0
+                if searchCompleted:
+
+                    for directoryPath in [ directoryPath for directoryPath in scanCache if directoryPath not in searchedDirectoryPaths and 
+                                           ( directoryPath == startPath or directoryPath.startswith (startPath + separatorCharacter) ) ]:
+
+                        del scanCache [directoryPath]
+                        numberOfDirectoriesRemoved += 1
+
+
+                if numberOfDirectoriesRead or numberOfDirectoriesRemoved:
+
+                    HandyTools.saveScanCache (scanCache, scanCacheFileName)
+
+
+
+    # Read one directory for HandyTools.iterateFilesInDirectoryTree.
     @staticmethod
-    def getFileAndAbsolutePath (fileName):
+    def listDirectoryInTree (directoryPath, extensions = ('',), filePatterns = [], stringsToExcludeExpression = None, followSymlinks = False, scanCache = None):
         '''
-        :param fileName: file name (and path) of the file.
-        
-        :return: absolute path and file name, absolute directory, file name without path.
-        :rtype: str, str, str
+        :param directoryPath: absolute path of the directory.
+        :type directoryPath: str
 
-        **Description:**    
-        Get the full absolute path, absolute directory and root (= file name without path) of a file.
-        If '' are returned, then the file does not exist and an error message is printed to the Python console.
+        :param extensions: extensions of the files to return, ``('',)`` for all files.
+        :type extensions: tuple (str)
+
+        :param filePatterns: list of glob patterns, of which a file name needs to match at least one, or ``[]``.
+        :type filePatterns: list [str]
+
+        :param stringsToExcludeExpression: regular expression that finds the strings to exclude in a path, or ``None``.
+        :type stringsToExcludeExpression: compiled regular expression
+
+        :param followSymlinks: if ``True``, then also return the subdirectories that are symbolic links.
+        :type followSymlinks: bool
+
+        :param scanCache: the listings of the directories read before, see :py:meth:`~.getDirectoryListing`, default ``None``.
+        :type scanCache: dict
+
+        :return: the absolute paths of the files and of the subdirectories to search, in alphabetical order, and whether the directory was read 
+            (``False`` if its listing in the ``scanCache`` was used).
+        :rtype: list [str], list [str], bool
         '''
-        
-        absolutePath = ''
-        fileRootName = ''
-        absoluteDirectory = ''
 
-        if os.path.isfile (fileName):
-        
-            absolutePath = os.path.abspath (fileName)
-            fileRootName = absolutePath.split ('/') [-1]
-            absoluteDirectory = os.path.dirname (absolutePath)
-            
-        else:
-        
-            print ()
-            print ( ' WARNING - File  {}  does not exist'.format (fileName) )
-            print ()
+        fileNames, subdirectoryNames, subdirectorySymlinkNames, directoryWasRead = HandyTools.getDirectoryListing (directoryPath, scanCache)
 
+        # The file '.DS_Store' is a MAC OS administration file, that is not of interest to keep.
+        filePaths = [ directoryPath + separatorCharacter + fileName for fileName in fileNames 
+                      if ( fileName != '.DS_Store' if extensions == ('',) else fileName.endswith (extensions) ) and 
+                         ( not filePatterns or any ( fnmatch.fnmatch (fileName, filePattern) for filePattern in filePatterns ) ) ]
 
-        return absolutePath, absoluteDirectory, fileRootName
+        # As in os.walk, symbolic links to directories are not listed as files, and only searched if  followSymlinks .
+        subdirectoryPaths = [ directoryPath + separatorCharacter + subdirectoryName 
+                              for subdirectoryName in ( sorted (subdirectoryNames + subdirectorySymlinkNames) if followSymlinks else subdirectoryNames ) ]
 
+        if stringsToExcludeExpression is not None:
 
-  
-    # Create the full path for a given file with full path or just full path.   
+            filePaths = [ filePath for filePath in filePaths if not stringsToExcludeExpression.search (filePath) ]
+            subdirectoryPaths = [ subdirectoryPath for subdirectoryPath in subdirectoryPaths if not stringsToExcludeExpression.search (subdirectoryPath) ]
+
+
+        return filePaths, subdirectoryPaths, directoryWasRead
+
+
+
+    # Get the names of the files and subdirectories in a directory, from the scan cache if the directory has not changed since it was read.
     @staticmethod
-    def createPathToFile (fileNameAndFullPath = '', fullPath = ''):
+    def getDirectoryListing (directoryPath, scanCache = None):
         '''
-        :param fileNameAndFullPath: file name with full path.
-        :type fileNameAndFullPath: str
-        
-        :param fullPath: full path.
-        :type fullPath: str
-        
-        :return: full path created by the system.
-        :rtype: str
-        
+        :param directoryPath: absolute path of the directory.
+        :type directoryPath: str
+
+        :param scanCache: for each directory path, its modification time (in ns) and the names of its files, subdirectories and symbolic links to 
+            subdirectories, as returned by this function, default ``None`` (no cache).
+        :type scanCache: dict
+
+        :return: the names of the files, of the subdirectories and of the symbolic links to subdirectories, in alphabetical order, and whether the directory was read.
+        :rtype: list [str], list [str], list [str], bool
+
+
         **Description:**
-        Create the full path (all the folders in the directory tree) for a given file with full path ``fileNameAndFullPath``, or just full path ``fullPath``.
-        Return the full path that has been created as a string.
-        If not successful, because full path already exists or cannot be created due to writing permission restrictions, then return an empty string.
-        The ``os.makedirs`` method is used.
+        The modification time of a directory changes when a file or subdirectory is added to it, removed from it or renamed, hence a directory 
+        with the same modification time as in the ``scanCache`` has the same listing and is not read again. The listing of a directory that is read 
+        is stored in the ``scanCache``. 
+
+        A directory can however change again after it was read without getting a new modification time, if this happens within the resolution 
+        of the modification times of the file system (up to 2 s). Therefore, if a directory had changed less than ``scanCacheRacyNanoseconds`` before it was read, 
+        then its modification time is not stored, so that it is read again next time.
+        Returns empty lists if the directory cannot be read.
         '''
 
+        directoryModificationTime = None
+        if scanCache is not None:
 
-        if fileNameAndFullPath:
-        
-            fullPathToCreate = fileNameAndFullPath.split ( fileNameAndFullPath.split (separatorCharacter)[-1] ) [0]
+            try:
 
+                directoryModificationTime = os.stat (directoryPath).st_mtime_ns
+
+            except OSError:
+
+                scanCache.pop (directoryPath, None)
+                return [], [], [], True
+
+
+            directoryListing = scanCache.get (directoryPath)
+            if directoryListing is not None and directoryListing [0] == directoryModificationTime:
+
+                return directoryListing [1], directoryListing [2], directoryListing [3], False
 
-        if fullPath:
-        
-            fullPathToCreate = fullPath
 
+        readTime = time.time_ns ()
+        fileNames = []
+        subdirectoryNames = []
+        subdirectorySymlinkNames = []
         try:
-        
-            os.makedirs (fullPathToCreate)
-            return fullPathToCreate
-            
-        except:
-        
-            return ''
 
+            with os.scandir (directoryPath) as directoryEntries:
 
+                for directoryEntry in directoryEntries:
 
-    # Read and return the content of a text file.
+                    try:
+
+                        entryIsDirectory = directoryEntry.is_dir ()
+
+                    except OSError:
+
+                        entryIsDirectory = False
+
+
+                    if entryIsDirectory:
+
+                        ( subdirectorySymlinkNames if directoryEntry.is_symlink () else subdirectoryNames ).append (directoryEntry.name)
+
+                    else:
+
+                        fileNames.append (directoryEntry.name)
+
+
+        except OSError:
+
+            if scanCache is not None:
+
+                scanCache.pop (directoryPath, None)
+
+
+            return [], [], [], True
+
+
+        fileNames.sort ()
+        subdirectoryNames.sort ()
+        subdirectorySymlinkNames.sort ()
+
+        if scanCache is not None:
+
+            scanCache [directoryPath] = ( directoryModificationTime if directoryModificationTime < readTime - scanCacheRacyNanoseconds else None, 
+                                          fileNames, subdirectoryNames, subdirectorySymlinkNames )
+
+
+        return fileNames, subdirectoryNames, subdirectorySymlinkNames, True
+
+
+
+    # Read the scan cache of HandyTools.iterateFilesInDirectoryTree.
     @staticmethod
-    def getTextFileContent (textFileNameAndPath, stripLineFromBlanks = False):
+    def readScanCache (scanCacheFileName):
         '''
-        :param textFileNameAndPath: file name (and path) of the text file to load.
-        :type textFileNameAndPath: str
-        
-        :param stripLineFromBlanks: set to ``True`` to strip empty spaces from the beginning and end of each line.
-        :type stripLineFromBlanks: bool; default = False
-        
-        :return: content of file with *\\\\n* chopped off.
-        :rtype: list (str)
+        :param scanCacheFileName: name of the scan cache file.
+        :type scanCacheFileName: str
+
+        :return: the listings of the directories, see :py:meth:`~.getDirectoryListing`.
+        :rtype: dict
+
 
         **Description:**
-        Open, read and return the content of a text file.
-        Any *\\\\n* (= next line) characters at the end of lines are stripped.
-        If the ``stripLineFromBlanks`` boolean is set to ``True``, then also strip any blank spaces at the beginning and end of the lines.
-        Returns empty list if the file does not exist or there is an error in the reading.
+        Returns an empty dictionary if the file does not exist, or if it cannot be read or was saved by another version of HandyTools (with a warning), 
+        in which case all the directories are read again.
         '''
 
-        if os.path.isfile (textFileNameAndPath):
+        if not os.path.isfile (scanCacheFileName):
 
-            try:
-                              
-                fileOpen = open (textFileNameAndPath, 'r')
-                fileContent = fileOpen.readlines ()
-                fileOpen.close ()
-
-                fileContentClean = []
-                for fileLine in fileContent:
-                                
-                    fileContentClean.append ( fileLine [:-1] if fileLine [-1] == '\n'  else  fileLine )
-                    
-                    if stripLineFromBlanks:
-                                        
-                        fileContentClean [-1] = fileContentClean [-1].strip ()
-                        
-        
-                return fileContentClean
-                
-            except:
-                
-                print ('')
-                print ('---WARNING---')
-                print (' From HandyTools.getTextFileContent: ')
-                print ('  file {} cannot be opened and / or read correctly.'.format (textFileNameAndPath))                
-                return []
+            return {}
+
+
+        try:
+
+            with open (scanCacheFileName, 'rb') as scanCacheFile:
+
+                scanCacheContent = pickle.load (scanCacheFile)
+
+
+            if scanCacheContent ['version'] == scanCacheVersion:
+
+                return scanCacheContent ['directories']
+
+        except Exception:
+
+            pass
+
+
+        print ('')
+        print ('---WARNING---')
+        print (' From HandyTools.readScanCache: ')
+        print ('  scan cache file {} cannot be read: all the directories are read again.'.format (scanCacheFileName) )
+
+        return {}
+
+
+
+    # Save the scan cache of HandyTools.iterateFilesInDirectoryTree.
+    @staticmethod
+    def saveScanCache (scanCache, scanCacheFileName):
+        '''
+        :param scanCache: the listings of the directories, see :py:meth:`~.getDirectoryListing`.
+        :type scanCache: dict
+
+        :param scanCacheFileName: name of the scan cache file.
+        :type scanCacheFileName: str
+
+        :return: ``True`` if the scan cache has been saved.
+        :rtype: bool
+
+
+        **Description:**
+        The scan cache is first written to a temporary file, which then replaces the scan cache file, so that the scan cache file is never 
+        left half-written, for example if the program is interrupted.
+        '''
+
+        try:
+
+            with open (scanCacheFileName + '.tmp', 'wb') as scanCacheFile:
+
+                pickle.dump ( { 'version': scanCacheVersion, 'directories': scanCache }, scanCacheFile, protocol = pickle.HIGHEST_PROTOCOL )
+
+
+            os.replace (scanCacheFileName + '.tmp', scanCacheFileName)
+
+            return True
+
+        except OSError:
 
-            
-        else:
- 
             print ('')
             print ('---WARNING---')
-            print (' From HandyTools.getTextFileContent: ')
-            print ('  Warning: file {} does not exist!'.format (textFileNameAndPath))                
-            return []
-        
-            
+            print (' From HandyTools.saveScanCache: ')
+            print ('  scan cache file {} cannot be saved.'.format (scanCacheFileName) )
 
-    # Reads data from a tabular text file and return a list of NumPy arrays, strings and the header.
+            return False
+
+
+
+    # Analyse all the files of a certain extension down a directory tree with a pool of worker processes, and keep track of the files that have been analysed.
     @staticmethod
-    def readTable (textFileNameAndPath, endOfHeaderString = 'C_END', separatorString = ' '):
+    def analyseFilesInDirectoryTree ( startPath, 
+                                      analysisFunction, 
+                                      loadFunction = None, 
+                                      extension = '', 
+                                      stringsToExclude = [], 
+                                      checkpointFileName = '', 
+                                      numberOfProcesses = None, 
+                                      maximumNumberOfPendingFiles = None, 
+                                      **analysisArguments ):
+        '''
+        :param startPath: directory where to start the search, see :py:meth:`~.getFilesInDirectoryTree`.
+        :type startPath: str
+
+        :param analysisFunction: function that analyses one file: it gets the file name, or the content returned by :code:`loadFunction`, and returns the (compact) result.
+        :type analysisFunction: function
+
+        :param loadFunction: function that loads a file and returns its content, for example :code:`np.load`, default :code:`None` (the file name is passed to :code:`analysisFunction`).
+        :type loadFunction: function
+
+        :param extension: extension of the files to analyse, see :py:meth:`~.getFilesInDirectoryTree`.
+        :type extension: str
+
+        :param stringsToExclude: list of strings that when in the file name are excluded, see :py:meth:`~.getFilesInDirectoryTree`.
+        :type stringsToExclude: list [str]
+
+        :param checkpointFileName: name of the file in which the result of each file is stored as soon as it is known, default ``''`` (no checkpoint file).
+        :type checkpointFileName: str
+
+        :param numberOfProcesses: the number of worker processes, default ``None`` is the number of processors of the machine.
+        :type numberOfProcesses: int
+
+        :param maximumNumberOfPendingFiles: the maximum number of files that are given to the workers but not yet analysed, default ``None`` is twice the number of processes.
+        :type maximumNumberOfPendingFiles: int
+
+        :param analysisArguments: any other keyword arguments of :code:`analysisFunction`.
+
+        :return: the results and the error messages of the files, by file name.
+        :rtype: dict {str: result}, dict {str: str}
+
+
+        **Description:**
+        The file names found by :py:meth:`~.iterateFilesInDirectoryTree` are given one by one to a pool of worker processes, which load and analyse them 
+        while the directory tree is still being searched, so that only the (compact) results are sent back. At most ``maximumNumberOfPendingFiles`` files are waiting in the pool, so that the memory use 
+        does not grow with the number of files. If the analysis of a file fails, then the error message is stored instead of the result, and the other files 
+        are analysed as usual.
+
+        If a ``checkpointFileName`` is given, then the result (or error message) of each file is added to this file (a JSON record per line) as soon as it is known.
+        When the analysis is started again with the same checkpoint file, for example after it was interrupted, the files with a result in the checkpoint file 
+        are not analysed again (see :py:meth:`~.readAnalysisCheckpoint`), but the files that failed are. The results therefore need to be JSON serialisable:
+        NumPy arrays and numbers are stored as lists and numbers, and tuples are read back as lists.
+
+        The ``analysisFunction`` and ``loadFunction`` need to be defined at the top level of a module (not a lambda), so that they can be sent to the worker processes,
+        for example:
+
+        .. code-block:: Python
+
+            analysisResults, analysisErrors = HandyTools.analyseFilesInDirectoryTree ( '/data/recordings', DataTools.getMedianAndQuantilesPYtoCPP, np.load, 
+                                                                                        extension = '.npy', checkpointFileName = 'recordings.checkpoint', 
+                                                                                        removeNaN = True )
+        '''
+
+        analysisResults = HandyTools.readAnalysisCheckpoint (checkpointFileName) if checkpointFileName else {}
+        analysisErrors = {}
+        numberOfFilesInCheckpoint = len (analysisResults)
+
+        numberOfProcesses = numberOfProcesses or os.cpu_count () or 1
+        maximumNumberOfPendingFiles = maximumNumberOfPendingFiles or 2 * numberOfProcesses
+
+        checkpointFile = None
+        if checkpointFileName:
+
+            checkpointFile = open (checkpointFileName, 'a+')
+
+            # Start on a new line if the last record was not completely written, when the previous analysis was interrupted.
+            if checkpointFile.tell ():
+
+                checkpointFile.seek (checkpointFile.tell () - 1)
+                if checkpointFile.read (1) != '\n':
+
+                    checkpointFile.write ('\n')
+
+
+        pendingFiles = {}
+        fileNames = itertools.chain ( HandyTools.iterateFilesInDirectoryTree (startPath, extension, stringsToExclude), [None] )
+        fileName = None
+        try:
+
+            with ProcessPoolExecutor (max_workers = numberOfProcesses) as processPool:
+
+                # The file names are given to the pool while the directory tree is being searched, followed by None to collect the last results.
+                for fileName in fileNames:
+
+                    if fileName in analysisResults:
+
+                        continue
+
+
+                    # Wait until there is room in the pool for the next file, or, after the last file, until all the files have been analysed.
+                    while len (pendingFiles) >= (maximumNumberOfPendingFiles if fileName is not None else 1):
+
+                        analysedFiles, notAnalysedFiles = wait (pendingFiles, return_when = FIRST_COMPLETED)
+                        brokenProcessPool = None
+                        for analysedFile in analysedFiles:
+
+                            try:
+
+                                analysisResult, errorMessage = analysedFile.result ()
+
+                            # The files whose worker process stopped are not analysed, and stay pending (the results of the other files are kept first).
+                            except BrokenProcessPool as exception:
+
+                                brokenProcessPool = exception
+                                continue
+
+                            except Exception as exception:
+
+                                analysisResult, errorMessage = None, '{}: {}'.format (type (exception).__name__, exception)
+
+
+                            analysedFileName = pendingFiles.pop (analysedFile)
+                            if errorMessage:
+
+                                analysisErrors [analysedFileName] = errorMessage
+
+                            else:
+
+                                analysisResults [analysedFileName] = analysisResult
+
+
+                            if checkpointFile is not None:
+
+                                checkpointFile.write ( json.dumps ( { 'fileName': analysedFileName, 'result': analysisResult, 'error': errorMessage }, 
+                                                                    default = lambda value: value.tolist () if hasattr (value, 'tolist') else str (value) ) + '\n' )
+                                checkpointFile.flush ()
+
+
+                        if brokenProcessPool is not None:
+
+                            raise brokenProcessPool
+
+
+                    if fileName is not None:
+
+                        pendingFiles [ processPool.submit (HandyTools.analyseFile, fileName, analysisFunction, loadFunction, analysisArguments) ] = fileName
+
+
+        # If a worker process stops unexpectedly, then the pool cannot be used any more: the files that have been analysed are in the checkpoint file.
+        #  The files that have not been analysed are those given to the pool without a result, and those not given to it yet (the current file
+        #  and the rest of the directory tree).
+        except BrokenProcessPool:
+
+            numberOfFilesNotSubmitted = sum ( 1 for fileNameNotSubmitted in itertools.chain ( [fileName], fileNames ) 
+                                              if fileNameNotSubmitted is not None and fileNameNotSubmitted not in analysisResults )
+
+            print ('')
+            print ('---WARNING---')
+            print (' From HandyTools.analyseFilesInDirectoryTree: ')
+            print ( '  a worker process stopped unexpectedly, {} files have not been analysed ({} were being analysed, {} were not yet given to the workers).'.format ( 
+                    len (pendingFiles) + numberOfFilesNotSubmitted, len (pendingFiles), numberOfFilesNotSubmitted ) )
+            if checkpointFile is not None:
+
+                print ('  Start the analysis again with checkpoint file {} to continue.'.format (checkpointFileName) )
+
+
+        finally:
+
+            if checkpointFile is not None:
+
+                checkpointFile.close ()
+
+
+        print ('')
+        print ('-------------')
+        print (' From HandyTools.analyseFilesInDirectoryTree: ')
+        print ( '  {} files have been analysed ({} from the checkpoint file), {} files could not be analysed.'.format ( 
+                len (analysisResults), numberOfFilesInCheckpoint, len (analysisErrors) ) )
+
+
+        return analysisResults, analysisErrors
+
+
+
+    # Load and analyse one file, in a worker process of HandyTools.analyseFilesInDirectoryTree.
+    @staticmethod
+    def analyseFile (fileName, analysisFunction, loadFunction = None, analysisArguments = {}):
+        '''
+        :param fileName: the name of the file.
+        :type fileName: str
+
+        :param analysisFunction: function that analyses the file, see :py:meth:`~.analyseFilesInDirectoryTree`.
+        :type analysisFunction: function
+
+        :param loadFunction: function that loads the file, default :code:`None`.
+        :type loadFunction: function
+
+        :param analysisArguments: the keyword arguments of :code:`analysisFunction`.
+        :type analysisArguments: dict
+
+        :return: the result of the analysis and an empty error message, or :code:`None` and the error message if the file could not be loaded or analysed.
+        :rtype: any, str
+        '''
+
+        try:
+
+            fileContent = fileName if loadFunction is None else loadFunction (fileName)
+
+            return analysisFunction (fileContent, **analysisArguments), ''
+
+        except Exception as exception:
+
+            return None, '{}: {}'.format (type (exception).__name__, exception)
+
+
+
+    # Read the results of the files that have been analysed from a checkpoint file of HandyTools.analyseFilesInDirectoryTree.
+    @staticmethod
+    def readAnalysisCheckpoint (checkpointFileName):
+        '''
+        :param checkpointFileName: name of the checkpoint file.
+        :type checkpointFileName: str
+
+        :return: the results of the files that have been analysed successfully, by file name.
+        :rtype: dict {str: result}
+
+
+        **Description:**
+        Each line of the checkpoint file holds the file name, the result and the error message of one file. The files with an error message are not included, 
+        so that they are analysed again. A line that was not completely written, because the analysis was interrupted, is skipped.
+        Returns an empty dictionary if the file does not exist.
+        '''
+
+        analysisResults = {}
+        if os.path.isfile (checkpointFileName):
+
+            with open (checkpointFileName, 'r') as checkpointFile:
+
+                for checkpointLine in checkpointFile:
+
+                    try:
+
+                        checkpointRecord = json.loads (checkpointLine)
+
+                    except ValueError:
+
+                        continue
+
+
+                    if not checkpointRecord ['error']:
+
+                        analysisResults [ checkpointRecord ['fileName'] ] = checkpointRecord ['result']
+
+                    else:
+
+                        analysisResults.pop (checkpointRecord ['fileName'], None)
+
+
+        return analysisResults
+
+
+
+    # Get the absolute path for a file.
+    @staticmethod
+    def getFileAndAbsolutePath (fileName):
+        '''
+        :param fileName: file name (and path) of the file.
+        
+        :return: absolute path and file name, absolute directory, file name without path.
+        :rtype: str, str, str
+
+        **Description:**    
+        Get the full absolute path, absolute directory and root (= file name without path) of a file.
+        If '' are returned, then the file does not exist and an error message is printed to the Python console.
+        '''
+        
+        absolutePath = ''
+        fileRootName = ''
+        absoluteDirectory = ''
+
+        if os.path.isfile (fileName):
+        
+            absolutePath = os.path.abspath (fileName)
+            fileRootName = absolutePath.split ('/') [-1]
+            absoluteDirectory = os.path.dirname (absolutePath)
+            
+        else:
+        
+            print ()
+            print ( ' WARNING - File  {}  does not exist'.format (fileName) )
+            print ()
+
+
+        return absolutePath, absoluteDirectory, fileRootName
+
+
+  
+    # Create the full path for a given file with full path or just full path.   
+    @staticmethod
+    def createPathToFile (fileNameAndFullPath = '', fullPath = ''):
+        '''
+        :param fileNameAndFullPath: file name with full path.
+        :type fileNameAndFullPath: str
+        
+        :param fullPath: full path.
+        :type fullPath: str
+        
+        :return: full path created by the system.
+        :rtype: str
+        
+        **Description:**
+        Create the full path (all the folders in the directory tree) for a given file with full path ``fileNameAndFullPath``, or just full path ``fullPath``.
+        Return the full path that has been created as a string.
+        If not successful, because full path already exists or cannot be created due to writing permission restrictions, then return an empty string.
+        The ``os.makedirs`` method is used.
+        '''
+
+
+        if fileNameAndFullPath:
+        
+            fullPathToCreate = fileNameAndFullPath.split ( fileNameAndFullPath.split (separatorCharacter)[-1] ) [0]
+
+
+        if fullPath:
+        
+            fullPathToCreate = fullPath
+
+        try:
+        
+            os.makedirs (fullPathToCreate)
+            return fullPathToCreate
+            
+        except:
+        
+            return ''
+
+
+
+    # Read and return the content of a text file.
+    @staticmethod
+    def getTextFileContent (textFileNameAndPath, stripLineFromBlanks = False, lazy = False, lineOffsetsCacheFileName = ''):
+        '''
+        :param textFileNameAndPath: file name (and path) of the text file to load.
+        :type textFileNameAndPath: str
+        
+        :param stripLineFromBlanks: set to ``True`` to strip empty spaces from the beginning and end of each line.
+        :type stripLineFromBlanks: bool; default = False
+
+        :param lazy: set to ``True`` to get a generator of the lines, that reads the lines only when they are needed, see :py:meth:`~.iterateTextFileContent`.
+        :type lazy: bool; default = False
+
+        :param lineOffsetsCacheFileName: name of the file to store the offsets of the lines in, for the ``lazy`` generator, see :py:meth:`~.getTextFileLineOffsets`.
+        :type lineOffsetsCacheFileName: str; default = '' (no file)
+        
+        :return: content of file with *\\\\n* chopped off.
+        :rtype: list (str), or generator of str if ``lazy``
+
+        **Description:**
+        Open, read and return the content of a text file.
+        Any *\\\\n* (= next line) characters at the end of lines are stripped.
+        If the ``stripLineFromBlanks`` boolean is set to ``True``, then also strip any blank spaces at the beginning and end of the lines.
+        Returns empty list if the file does not exist or there is an error in the reading.
+
+        For large files of which only a part is needed, the ``lazy`` generator does not load the whole file, and :py:meth:`~.getTextFileLine` 
+        and :py:meth:`~.getTextFileLines` read single lines or ranges of lines.
+        '''
+
+        if lazy:
+
+            return HandyTools.iterateTextFileContent ( textFileNameAndPath, stripLineFromBlanks, lineOffsetsCacheFileName = lineOffsetsCacheFileName )
+
+
+        if os.path.isfile (textFileNameAndPath):
+
+            try:
+                              
+                # Split the content of the file at once, instead of first making a list of the lines with *\n* and then a second list without.
+                with open (textFileNameAndPath, 'r') as fileOpen:
+
+                    fileContentClean = fileOpen.read ().split ('\n')
+
+
+                if fileContentClean [-1] == '':
+
+                    del fileContentClean [-1]
+
+                    
+                if stripLineFromBlanks:
+                                    
+                    fileContentClean = [ fileLine.strip () for fileLine in fileContentClean ]
+                        
+        
+                return fileContentClean
+                
+            except:
+                
+                print ('')
+                print ('---WARNING---')
+                print (' From HandyTools.getTextFileContent: ')
+                print ('  file {} cannot be opened and / or read correctly.'.format (textFileNameAndPath))                
+                return []
+
+            
+        else:
+ 
+            print ('')
+            print ('---WARNING---')
+            print (' From HandyTools.getTextFileContent: ')
+            print ('  Warning: file {} does not exist!'.format (textFileNameAndPath))                
+            return []
+        
+            
+
+    # Get the offsets (in bytes) of the starts of the lines of a text file.
+    @staticmethod
+    def getTextFileLineOffsets (textFileNameAndPath, lineOffsetsCacheFileName = '', numberOfBytesPerChunk = 67108864):
+        '''
+        :param textFileNameAndPath: file name (and path) of the text file.
+        :type textFileNameAndPath: str
+
+        :param lineOffsetsCacheFileName: name of the file to store the offsets of the lines in, default '' (no file).
+        :type lineOffsetsCacheFileName: str
+
+        :param numberOfBytesPerChunk: the number of bytes of the file that are searched for new lines at a time, default 64 MB.
+        :type numberOfBytesPerChunk: int
+
+        :return: the offset of the start of each line, or ``None`` if the file cannot be read.
+        :rtype: NumPy array <np.int64>
+
+
+        **Description:**
+        The file is memory-mapped and searched for the *\\\\n* characters with NumPy, a chunk at a time, so that the file is not loaded in memory 
+        (only 8 bytes per line are needed for the offsets). With the offsets, single lines or ranges of lines can be read without reading 
+        the lines before them, see :py:meth:`~.getTextFileLines`.
+
+        If a ``lineOffsetsCacheFileName`` is given, then the offsets are stored in this file (with the size and modification time of the text file), 
+        and the next time read from it, as long as the text file has not changed, so that a large file needs to be searched only once. 
+        As for the scan cache of :py:meth:`~.iterateFilesInDirectoryTree`, the offsets are not stored if the text file has changed less than 
+        ``scanCacheRacyNanoseconds`` (2 s) before it is searched.
+        '''
+
+        try:
+
+            textFileStatus = os.stat (textFileNameAndPath)
+            if lineOffsetsCacheFileName and os.path.isfile (lineOffsetsCacheFileName):
+
+                try:
+
+                    with np.load (lineOffsetsCacheFileName, allow_pickle = False) as lineOffsetsCache:
+
+                        if int (lineOffsetsCache ['version']) == lineOffsetsCacheVersion and int (lineOffsetsCache ['size']) == textFileStatus.st_size and \
+                           int (lineOffsetsCache ['modificationTime']) == textFileStatus.st_mtime_ns:
+
+                            return lineOffsetsCache ['lineOffsets']
+
+                except (OSError, ValueError, KeyError):
+
+                    pass
+
+
+            lineOffsets = [ np.zeros (1, dtype = np.int64) ]
+            if textFileStatus.st_size:
+
+                with open (textFileNameAndPath, 'rb') as textFile, mmap.mmap (textFile.fileno (), 0, access = mmap.ACCESS_READ) as textFileMap:
+
+                    textFileBytes = np.frombuffer (textFileMap, dtype = np.uint8)
+                    for iByteStart in range (0, len (textFileBytes), numberOfBytesPerChunk):
+
+                        lineOffsets.append ( np.flatnonzero ( textFileBytes [iByteStart : iByteStart + numberOfBytesPerChunk] == ord ('\n') ) + (iByteStart + 1) )
+
+
+                    del textFileBytes
+
+
+            # A new line at the end of the file does not start another line.
+            lineOffsets = np.concatenate (lineOffsets)
+            lineOffsets = lineOffsets [lineOffsets < textFileStatus.st_size]
+
+        except (OSError, ValueError):
+
+            print ('')
+            print ('---WARNING---')
+            print (' From HandyTools.getTextFileLineOffsets: ')
+            print ('  file {} cannot be opened and / or read correctly.'.format (textFileNameAndPath))                
+
+            return None
+
+
+        if lineOffsetsCacheFileName and textFileStatus.st_mtime_ns < time.time_ns () - scanCacheRacyNanoseconds:
+
+            try:
+
+                with open (lineOffsetsCacheFileName + '.tmp', 'wb') as lineOffsetsCacheFile:
+
+                    np.savez ( lineOffsetsCacheFile, version = lineOffsetsCacheVersion, size = textFileStatus.st_size, 
+                               modificationTime = textFileStatus.st_mtime_ns, lineOffsets = lineOffsets )
+
+
+                os.replace (lineOffsetsCacheFileName + '.tmp', lineOffsetsCacheFileName)
+
+            except OSError:
+
+                print ('')
+                print ('---WARNING---')
+                print (' From HandyTools.getTextFileLineOffsets: ')
+                print ('  line offsets cache file {} cannot be saved.'.format (lineOffsetsCacheFileName) )
+
+
+        return lineOffsets
+
+
+
+    # Read a range of lines of a text file, without reading the lines before them.
+    @staticmethod
+    def getTextFileLines (textFileNameAndPath, iLineStart = 0, iLineEnd = None, stripLineFromBlanks = False, lineOffsets = None, lineOffsetsCacheFileName = ''):
+        '''
+        :param textFileNameAndPath: file name (and path) of the text file.
+        :type textFileNameAndPath: str
+
+        :param iLineStart: the index of the first line to read (starting at 0), default 0.
+        :type iLineStart: int
+
+        :param iLineEnd: the index after the last line to read, default ``None`` (up to the last line of the file).
+        :type iLineEnd: int
+
+        :param stripLineFromBlanks: set to ``True`` to strip empty spaces from the beginning and end of each line.
+        :type stripLineFromBlanks: bool; default = False
+
+        :param lineOffsets: the offsets of the lines from :py:meth:`~.getTextFileLineOffsets`, default ``None`` (they are determined first).
+        :type lineOffsets: NumPy array <np.int64>
+
+        :param lineOffsetsCacheFileName: name of the file to store the offsets of the lines in, see :py:meth:`~.getTextFileLineOffsets`, default '' (no file).
+        :type lineOffsetsCacheFileName: str
+
+        :return: the lines ``iLineStart`` to ``iLineEnd`` of the file, with *\\\\n* chopped off.
+        :rtype: list (str)
+
+
+        **Description:**
+        The lines are the same as those of :py:meth:`~.getTextFileContent`, but only the bytes of these lines are read from the (memory-mapped) file,
+        at the ``lineOffsets``. To read many ranges of lines of the same file, get the ``lineOffsets`` once, for example:
+
+        .. code-block:: python
+
+            lineOffsets = HandyTools.getTextFileLineOffsets ('large.log')
+            lastLines = HandyTools.getTextFileLines ( 'large.log', len (lineOffsets) - 10, lineOffsets = lineOffsets )
+
+        As with slices, ``iLineStart`` and ``iLineEnd`` can be negative (counted from the end of the file), and lines beyond the end of the file are left out.
+        Returns empty list if the file does not exist or there is an error in the reading.
+        '''
+
+        if lineOffsets is None:
+
+            lineOffsets = HandyTools.getTextFileLineOffsets (textFileNameAndPath, lineOffsetsCacheFileName)
+            if lineOffsets is None:
+
+                return []
+
+
+        iLineStart, iLineEnd, lineStep = slice (iLineStart, iLineEnd).indices ( len (lineOffsets) )
+        if iLineStart >= iLineEnd:
+
+            return []
+
+
+        # locale is only imported here, so that importing HandyTools stays fast: the lines are decoded as in text mode.
+        import locale
+
+        try:
+
+            with open (textFileNameAndPath, 'rb') as textFile, mmap.mmap (textFile.fileno (), 0, access = mmap.ACCESS_READ) as textFileMap:
+
+                iByteEnd = int (lineOffsets [iLineEnd])  if iLineEnd < len (lineOffsets)  else len (textFileMap)
+                textLines = textFileMap [ int (lineOffsets [iLineStart]) : iByteEnd ].decode ( locale.getpreferredencoding (False) ).split ('\n')
+
+        except (OSError, ValueError):
+
+            print ('')
+            print ('---WARNING---')
+            print (' From HandyTools.getTextFileLines: ')
+            print ('  file {} cannot be opened and / or read correctly.'.format (textFileNameAndPath))                
+
+            return []
+
+
+        # The last line ends with a new line, unless it is the last line of a file that does not end with a new line.
+        if textLines [-1] == '':
+
+            del textLines [-1]
+
+
+        # Lines that end with *\r\n* (Windows) end with *\n* in text mode. 
+        textLines = [ textLine [:-1]  if textLine.endswith ('\r')  else textLine  for textLine in textLines ]
+        if stripLineFromBlanks:
+
+            textLines = [ textLine.strip () for textLine in textLines ]
+
+
+        return textLines
+
+
+
+    # Read one line of a text file, without reading the lines before it.
+    @staticmethod
+    def getTextFileLine (textFileNameAndPath, iLine, stripLineFromBlanks = False, lineOffsets = None, lineOffsetsCacheFileName = ''):
+        '''
+        :param textFileNameAndPath: file name (and path) of the text file.
+        :type textFileNameAndPath: str
+
+        :param iLine: the index of the line (starting at 0, negative indices count from the end of the file).
+        :type iLine: int
+
+        :param stripLineFromBlanks: set to ``True`` to strip empty spaces from the beginning and end of the line.
+        :type stripLineFromBlanks: bool; default = False
+
+        :param lineOffsets: the offsets of the lines from :py:meth:`~.getTextFileLineOffsets`, default ``None`` (they are determined first).
+        :type lineOffsets: NumPy array <np.int64>
+
+        :param lineOffsetsCacheFileName: name of the file to store the offsets of the lines in, see :py:meth:`~.getTextFileLineOffsets`, default '' (no file).
+        :type lineOffsetsCacheFileName: str
+
+        :return: the line with *\\\\n* chopped off, or ``None`` if the file does not have this line.
+        :rtype: str
+
+
+        **Description:**
+        See :py:meth:`~.getTextFileLines`.
+        '''
+
+        textLines = HandyTools.getTextFileLines ( textFileNameAndPath, iLine, iLine + 1 if iLine != -1 else None, stripLineFromBlanks, lineOffsets, lineOffsetsCacheFileName )
+
+        return textLines [0]  if textLines  else None
+
+
+
+    # Read the lines of a text file one by one.
+    @staticmethod
+    def iterateTextFileContent (textFileNameAndPath, stripLineFromBlanks = False, iLineStart = 0, lineOffsets = None, lineOffsetsCacheFileName = ''):
+        '''
+        :param textFileNameAndPath: file name (and path) of the text file.
+        :type textFileNameAndPath: str
+
+        :param stripLineFromBlanks: set to ``True`` to strip empty spaces from the beginning and end of each line.
+        :type stripLineFromBlanks: bool; default = False
+
+        :param iLineStart: the index of the first line (starting at 0), default 0.
+        :type iLineStart: int
+
+        :param lineOffsets: the offsets of the lines from :py:meth:`~.getTextFileLineOffsets`, default ``None`` (they are determined if ``iLineStart`` is not 0).
+        :type lineOffsets: NumPy array <np.int64>
+
+        :param lineOffsetsCacheFileName: name of the file to store the offsets of the lines in, see :py:meth:`~.getTextFileLineOffsets`, default '' (no file).
+        :type lineOffsetsCacheFileName: str
+
+        :return: generator of the lines from ``iLineStart`` on, with *\\\\n* chopped off.
+        :rtype: generator of str
+
+
+        **Description:**
+        The lines are the same as those of :py:meth:`~.getTextFileContent`, but they are read one by one (through a buffer) when they are needed, 
+        so that only one line is in memory, and the rest of the file is not read if the generator is not used up, for example:
+
+        .. code-block:: python
+
+            for textLine in HandyTools.iterateTextFileContent ('large.log', stripLineFromBlanks = True):
+
+                if textLine.startswith ('ERROR'):
+
+                    break
+
+        If the ``iLineStart`` is not 0, then the reading starts at its offset, without reading the lines before it.
+        '''
+
+        iByteStart = 0
+        if iLineStart:
+
+            if lineOffsets is None:
+
+                lineOffsets = HandyTools.getTextFileLineOffsets (textFileNameAndPath, lineOffsetsCacheFileName)
+                if lineOffsets is None:
+
+                    return
+
+
+            if iLineStart >= len (lineOffsets):
+
+                return
+
+
+            iByteStart = int (lineOffsets [iLineStart])
+
+
+        try:
+
+            textFile = open (textFileNameAndPath, 'rb')
+            textFile.seek (iByteStart)
+
+        except OSError:
+
+            print ('')
+            print ('---WARNING---')
+            print (' From HandyTools.iterateTextFileContent: ')
+            print ('  file {} cannot be opened and / or read correctly.'.format (textFileNameAndPath))                
+
+            return
+
+
+        # Only *\n* starts a new line (as for the offsets of the lines), and a *\r* before it is chopped off as well.
+        import locale
+
+        encoding = locale.getpreferredencoding (False)
+        with textFile:
+
+            for textLine in textFile:
+
+                if textLine.endswith (b'\n'):
+
+                    textLine = textLine [:-2]  if textLine.endswith (b'\r\n')  else textLine [:-1]
+
+
+                textLine = textLine.decode (encoding)
+
+                yield textLine.strip ()  if stripLineFromBlanks  else textLine
+
+
+
+    # Reads data from a tabular text file and return a list of NumPy arrays, strings and the header.
+    @staticmethod
+    def readTable (textFileNameAndPath, endOfHeaderString = 'C_END', separatorString = ' ', usecols = None, returnStrings = True, 
+                   useTableCache = False, tableCacheDirectory = '', maximumTableCacheSize = None):
+        '''
+        :param textFileNameAndPath: file name (and path) of the table (text) file to read.
+        :type textFileNameAndPath: str
+
+        :param endOfHeaderString: string at the end of the header and the start of the tabular data, default = *C_END*
+        :type endOfHeaderString: str
+
+        :param separatorString: string that separates the elements in the table at each row, default is one empty space.
+        :type separatorString: str
+
+        :param usecols: the indices of the columns to read (starting at 0), default ``None`` (all columns).
+        :type usecols: list [int]
+
+        :param returnStrings: if ``False``, then the columns are not returned as strings (an empty list is returned instead), which saves memory, default ``True``.
+        :type returnStrings: bool
+
+        :param useTableCache: set to ``True`` to save the columns in a table cache and to read them from there the next time, default ``False``.
+        :type useTableCache: bool
+
+        :param tableCacheDirectory: the directory with the table caches, default '' (the table cache is saved next to the table file).
+        :type tableCacheDirectory: str
+
+        :param maximumTableCacheSize: the maximum total size (in bytes) of the table caches in the ``tableCacheDirectory``, default ``None`` (no maximum).
+        :type maximumTableCacheSize: int
+
+        :return: table content for each column as numbers (int or float, or NaN), as strings, and the content of a header.
+        :rtype: list [ list [1-D NumPy array] ], one for each column in the list, list [ list [str] ], list [str]
+
+        **Description:**
+        With this method formatted human-readable tabular data from a text file can be loaded as a list of 1-Dimensional NumPy arrays.
+
+        If the table file has header text, then the user can indicate the ``endOfHeaderString`` that signals the end of the header and the start of the data,
+        in the example below ``C_END``, which is also the default value.
+        
+        .. code-block:: console
+        
+            header line 1
+            header line 2
+            
+            C_END
+            entry1 1 4.5 6
+            entry2 2 5.3 7
+                    
+        Alternatively there can be no header and just data. 
+        
+        .. code-block:: console
+
+            entry1 1 4.5 6
+            entry2 2 5.3 7
+        
+        
+        .. attention:: 
+        
+            Empty rows amongst the data rows are skipped.
+
+                 
+        The tabular data is returned both as an array of NumPy arrays and as a list of strings. 
+        Each array (list) in the list contains the content of one of the columns from the table.
+        The format of the data (int or float) is determined for each whole column (see :py:meth:`~.getNumbersFromStrings`): a column is int if all its entrees
+        are integers (without a '.'), and float otherwise. Entrees that are not numbers are NaN.
+        In the example above, the 2nd and  4th columns are int and the 3rd column a float. The first column is not numerical and is returned as a list of NaN.
+
+        The file is read at once, and if all the rows have the same number of entrees (and the entrees do not contain any blank spaces, tabs or other separators), 
+        then all the entrees are split in one go and each column is converted to numbers as a whole by NumPy, which is much faster than converting the entrees 
+        one by one for large tables. Otherwise the rows are split one by one.
+
+        If the same large table file is read often (for example by many programs), the ``useTableCache`` can be set, to save the numbers and strings 
+        of each column as *.npy* files in a table cache (see :py:meth:`~.saveTableCache`) after reading the table file. 
+        The next time the columns are read from the table cache, as long as the table file has not changed (see :py:meth:`~.readTableCache`): 
+        the columns of numbers are then memory-mapped, read-only NumPy arrays. The table cache is either next to the table file, 
+        or in the ``tableCacheDirectory`` (see :py:meth:`~.getTableCachePath`), and if the ``maximumTableCacheSize`` is given, then the table caches 
+        in the ``tableCacheDirectory`` that have been used least recently are removed when a table cache is saved, to stay within that size
+        (see :py:meth:`~.removeTableCaches`).
+        '''
+        
+        tableContentDataNumbers = []
+        tableContentDataStrings = []
+        tableContentHeader = []
+
+        # The status of the table file is taken before it is read, so that the table cache does not get the content of a table file that was changed after it.
+        if useTableCache:
+
+            try:
+
+                tableFileStatus = os.stat (textFileNameAndPath)
+
+            except OSError:
+
+                useTableCache = False
+
+
+        if useTableCache:
+
+            tableCachePath = HandyTools.getTableCachePath (textFileNameAndPath, tableCacheDirectory)
+            tableCacheContent = HandyTools.readTableCache ( 
+                tableCachePath, textFileNameAndPath, tableFileStatus, endOfHeaderString, separatorString, usecols, returnStrings )
+            if tableCacheContent is not None:
+
+                tableContentDataNumbers, tableContentDataStrings, tableContentHeader, numberOfDataLines = tableCacheContent
+
+                print ('')
+                print ('-------------')
+                print (' From HandyTools.readTable: ')
+                print ( '  file {} has been loaded from the table cache {} with'.format (textFileNameAndPath, tableCachePath) )
+                print ( '  {} data lines and {} columns'.format ( numberOfDataLines, len (tableContentDataNumbers) ) )                
+
+                return tableContentDataNumbers, tableContentDataStrings, tableContentHeader
+
+
+        tableContent = HandyTools.readTableColumns (textFileNameAndPath, endOfHeaderString, separatorString, 'HandyTools.readTable')
+        if tableContent is not None:
+
+            tableContentColumnsStrings, tableContentHeader, numberOfDataLines = tableContent
+            numberOfEntriesPerLine = len (tableContentColumnsStrings)
+            iColumnsInTable = HandyTools.getColumnIndicesInTable (usecols, numberOfEntriesPerLine, textFileNameAndPath, 'HandyTools.readTable')
+
+            # The table cache has all the columns.
+            if useTableCache:
+
+                tableContentDataNumbers = [ HandyTools.getNumbersFromStrings (columnStrings) for columnStrings in tableContentColumnsStrings ]
+                if HandyTools.saveTableCache ( tableCachePath, textFileNameAndPath, tableFileStatus, endOfHeaderString, separatorString, 
+                                               tableContentDataNumbers, tableContentColumnsStrings, tableContentHeader, numberOfDataLines ) and \
+                   tableCacheDirectory and maximumTableCacheSize is not None:
+
+                    HandyTools.removeTableCaches (tableCacheDirectory, maximumTableCacheSize)
+
+
+                tableContentDataNumbers = [ tableContentDataNumbers [iColumn] for iColumn in iColumnsInTable ]
+
+            else:
+
+                tableContentDataNumbers = [ HandyTools.getNumbersFromStrings (tableContentColumnsStrings [iColumn]) for iColumn in iColumnsInTable ]
+
+
+            if returnStrings:
+
+                tableContentDataStrings = [ tableContentColumnsStrings [iColumn].astype (str).tolist () for iColumn in iColumnsInTable ]
+
+            
+            print ('')
+            print ('-------------')
+            print (' From HandyTools.readTable: ')
+            print ( '  file {} has been loaded with'.format (textFileNameAndPath) )
+            print ( '  {} data lines and {} columns'.format (numberOfDataLines, numberOfEntriesPerLine) )                
+
+            
+        else:
+        
+            print ('')
+            print ('---WARNING---')
+            print (' From HandyTools.readTable: ')
+            print ( '  file {} does not contain any readable data.'.format (textFileNameAndPath) )                
+
+            
+        return tableContentDataNumbers, tableContentDataStrings, tableContentHeader
+
+
+
+    # Read the header and the strings of the columns of a tabular text file, for HandyTools.readTable and HandyTools.readTables.
+    @staticmethod
+    def readTableColumns (textFileNameAndPath, endOfHeaderString = 'C_END', separatorString = ' ', functionName = 'HandyTools.readTableColumns'):
+        '''
+        :param textFileNameAndPath: file name (and path) of the table (text) file to read.
+        :type textFileNameAndPath: str
+
+        :param endOfHeaderString: string at the end of the header and the start of the tabular data, default = *C_END*
+        :type endOfHeaderString: str
+
+        :param separatorString: string that separates the elements in the table at each row, default is one empty space.
+        :type separatorString: str
+
+        :param functionName: the name of the function that reads the table, for the messages.
+        :type functionName: str
+
+        :return: the strings of each column, the content of the header and the number of data lines, or ``None`` if the file cannot be read or is empty.
+        :rtype: list [NumPy array <str or bytes>], list [str], int
+
+
+        **Description:**
+        The file is read at once and split in the header and the strings of each column, as described for :py:meth:`~.readTable`, 
+        with :py:meth:`~.splitTableData` or otherwise :py:meth:`~.splitTableDataLineByLine`.
+        '''
+
+        try:
+
+            with open (textFileNameAndPath, 'r') as tableFile:
+
+                tableText = tableFile.read ()
+
+        except (OSError, UnicodeDecodeError):
+
+            print ('')
+            print ('---WARNING---')
+            print (' From {}: '.format (functionName) )
+            print ('  file {} cannot be opened and / or read correctly.'.format (textFileNameAndPath))                
+
+            return None
+
+
+        if not tableText.strip ():
+
+            return None
+
+
+        # Find the line with only the  endOfHeaderString  (and blanks).
+        endOfHeaderLine = endOfHeaderString.strip ()
+        iHeaderEnd = -1
+        iMarker = tableText.find (endOfHeaderLine)
+        while iMarker >= 0:
+
+            iLineStart = tableText.rfind ('\n', 0, iMarker) + 1
+            iLineEnd = tableText.find ('\n', iMarker)
+            iLineEnd = len (tableText) if iLineEnd < 0 else iLineEnd
+            if tableText [iLineStart : iLineEnd].strip () == endOfHeaderLine:
+
+                iHeaderEnd = iLineStart
+                break
+
+
+            iMarker = tableText.find (endOfHeaderLine, iLineEnd)
+
+        
+        #---------- If file has no "C_END" marker, then assume the data start at the top.
+        if iHeaderEnd < 0:
+
+            print ('')
+            print ('---ATTENTION---')
+            print (' From {}: '.format (functionName) )
+            print('   File {} does not contain {} marker: assuming data only'.format ( textFileNameAndPath, endOfHeaderString.strip () ) )
+            print('')
+            
+            tableContentHeader = []
+            tableData = tableText
+
+        else:
+
+            # Store each line of the header in the  tableContentHeader  string list.
+            #  Do not store empty lines.
+            tableContentHeader = [ headerLine.strip ()  for headerLine in tableText [:iHeaderEnd].split ('\n')  if headerLine.strip () ]
+            tableData = tableText [iLineEnd + 1:]
+
+
+        del tableText
+
+        # The strings of each column, split in one go if possible, or otherwise line by line.
+        tableContentColumnsStrings = HandyTools.splitTableData (tableData, separatorString)
+        if tableContentColumnsStrings is None:
+
+            tableContentColumnsStrings = HandyTools.splitTableDataLineByLine (tableData, separatorString)
+
+
+        numberOfDataLines = max ( [ len (columnStrings) for columnStrings in tableContentColumnsStrings ] + [0] )
+
+        return tableContentColumnsStrings, tableContentHeader, numberOfDataLines
+
+
+
+    # Read the numbers (and strings) of the columns of a tabular text file without the messages of HandyTools.readTable, for HandyTools.readTables.
+    @staticmethod
+    def readTableContent (textFileNameAndPath, endOfHeaderString = 'C_END', separatorString = ' ', usecols = None, returnStrings = True, 
+                          functionName = 'HandyTools.readTableContent'):
+        '''
+        :param textFileNameAndPath: file name (and path) of the table (text) file to read.
+        :type textFileNameAndPath: str
+
+        :param endOfHeaderString: string at the end of the header and the start of the tabular data, default = *C_END*
+        :type endOfHeaderString: str
+
+        :param separatorString: string that separates the elements in the table at each row, default is one empty space.
+        :type separatorString: str
+
+        :param usecols: the indices of the columns to read (starting at 0), default ``None`` (all columns).
+        :type usecols: list [int]
+
+        :param returnStrings: if ``False``, then the columns are not returned as strings (an empty list is returned instead), default ``True``.
+        :type returnStrings: bool
+
+        :param functionName: the name of the function that reads the table, for the warnings.
+        :type functionName: str
+
+        :return: the same table content as :py:meth:`~.readTable` and the number of columns of the table file, or ``None`` if the file cannot be read or is empty.
+        :rtype: list [1-D NumPy array], list [ list [str] ], list [str], int
+
+
+        **Description:**
+        The table file is read as with :py:meth:`~.readTable` (without a table cache), but only warnings are printed, 
+        so that many table files can be read, for example by the worker processes of :py:meth:`~.readTables`.
+        '''
+
+        tableContent = HandyTools.readTableColumns (textFileNameAndPath, endOfHeaderString, separatorString, functionName)
+        if tableContent is None:
+
+            return None
+
+
+        tableContentColumnsStrings, tableContentHeader, numberOfDataLines = tableContent
+        iColumnsInTable = HandyTools.getColumnIndicesInTable (usecols, len (tableContentColumnsStrings), textFileNameAndPath, functionName)
+
+        tableContentDataNumbers = [ HandyTools.getNumbersFromStrings (tableContentColumnsStrings [iColumn]) for iColumn in iColumnsInTable ]
+        tableContentDataStrings = []
+        if returnStrings:
+
+            tableContentDataStrings = [ tableContentColumnsStrings [iColumn].astype (str).tolist () for iColumn in iColumnsInTable ]
+
+
+        return tableContentDataNumbers, tableContentDataStrings, tableContentHeader, len (tableContentColumnsStrings)
+
+
+
+    # Read the columns of many tabular text files with the same columns in parallel, and concatenate them.
+    @staticmethod
+    def readTables (textFileNamesAndPaths, endOfHeaderString = 'C_END', separatorString = ' ', usecols = None, returnStrings = False, 
+                    numberOfWorkers = None, useThreads = False):
+        '''
+        :param textFileNamesAndPaths: the file names (and paths) of the table (text) files to read.
+        :type textFileNamesAndPaths: list [str]
+
+        :param endOfHeaderString: string at the end of the header and the start of the tabular data, default = *C_END*
+        :type endOfHeaderString: str
+
+        :param separatorString: string that separates the elements in the table at each row, default is one empty space.
+        :type separatorString: str
+
+        :param usecols: the indices of the columns to read (starting at 0), default ``None`` (all columns).
+        :type usecols: list [int]
+
+        :param returnStrings: if ``True``, then the columns are also returned as strings, default ``False`` (an empty list is returned instead).
+        :type returnStrings: bool
+
+        :param numberOfWorkers: the number of worker processes (or threads), default ``None`` is the number of processors of the machine.
+        :type numberOfWorkers: int
+
+        :param useThreads: set to ``True`` to read the table files in threads instead of processes, default ``False``.
+        :type useThreads: bool
+
+        :return: the numbers (and strings) of each column of all the table files together, the content of the header of each table file, 
+                 and for each row the index of its table file in the ``textFileNamesAndPaths``.
+        :rtype: list [1-D NumPy array], list [ list [str] ], list [ list [str] ], 1-D NumPy array <int>
+
+        **Description:**
+        The table files are read by a pool of worker processes (see :py:meth:`~.readTableContent`), and the columns of all the table files are concatenated 
+        in the order of the ``textFileNamesAndPaths``, into arrays that are made once for the total number of rows. The data type of each column is 
+        the data type of this column in all the table files, for example float if it is int in one table file and float in another.
+        The index of the table file of each row can be used to find the rows of one table file, for example:
+
+        .. code-block:: python
+
+            tableContentDataNumbers, tableContentDataStrings, tableContentHeaders, iTableFiles = HandyTools.readTables ( 
+                HandyTools.getFilesInDirectoryTree ('/data/experiments', extension = '.txt') )
+            firstColumnOfTable3 = tableContentDataNumbers [0][iTableFiles == 3]
+
+        All the table files should have the same number of columns as the first table file that can be read, and all their (used) columns should have 
+        the same number of rows: table files that do not, or that cannot be read, are left out with a warning (and have no rows and an empty header).
+
+        Processes can read the table files at the same time, while threads mostly take turns (because the conversion of the strings holds the 
+        global interpreter lock of Python), but threads start faster and do not need to send the columns back, which can be faster for a few small table files.
+        '''
+
+        numberOfWorkers = numberOfWorkers or os.cpu_count () or 1
+        numberOfTableFiles = len (textFileNamesAndPaths)
+
+        # Give the table files to the workers in batches, so that there is not one task per small table file.
+        numberOfTableFilesPerTask = max ( 1, min ( 64, numberOfTableFiles // (4 * numberOfWorkers) ) )
+        with ( ThreadPoolExecutor if useThreads else ProcessPoolExecutor ) (numberOfWorkers) as tableExecutor:
+
+            tableContents = list ( tableExecutor.map ( HandyTools.readTableContent, textFileNamesAndPaths, itertools.repeat (endOfHeaderString), 
+                                                       itertools.repeat (separatorString), itertools.repeat (usecols), itertools.repeat (returnStrings), 
+                                                       itertools.repeat ('HandyTools.readTables'), chunksize = numberOfTableFilesPerTask ) )
+
+
+        # Check that the columns of each table file match those of the first table file that can be read.
+        numberOfColumns = None
+        numberOfRowsPerTableFile = np.zeros (numberOfTableFiles, dtype = np.int64)
+        tableFilesLeftOut = []
+        for iTableFile, tableContent in enumerate (tableContents):
+
+            # A table file with only a header has no columns, and no rows.
+            if tableContent is not None and not tableContent [3]:
+
+                continue
+
+
+            if tableContent is not None and numberOfColumns is None:
+
+                numberOfColumns = tableContent [3]
+                numberOfUsedColumns = len (tableContent [0])
+
+
+            if tableContent is None or tableContent [3] != numberOfColumns or len (tableContent [0]) != numberOfUsedColumns or \
+               len ( set ( len (columnNumbers) for columnNumbers in tableContent [0] ) ) > 1:
+
+                tableFilesLeftOut.append (textFileNamesAndPaths [iTableFile])
+                tableContents [iTableFile] = None
+                continue
+
+
+            numberOfRowsPerTableFile [iTableFile] = len (tableContent [0][0])  if tableContent [0]  else 0
+
+
+        if tableFilesLeftOut:
+
+            print ('')
+            print ('---WARNING---')
+            print (' From HandyTools.readTables: ')
+            print ( '  {} of the {} files cannot be read or do not have the same {} columns (with the same number of rows) as the first file, and are left out:'.format ( 
+                    len (tableFilesLeftOut), numberOfTableFiles, numberOfColumns ) )
+            for textFileNameAndPath in tableFilesLeftOut [:10]:
+
+                print ( '    {}'.format (textFileNameAndPath) )
+
+
+            if len (tableFilesLeftOut) > 10:
+
+                print ('    ...')
+
+
+        tableContentDataNumbers = []
+        tableContentDataStrings = []
+        tableContentHeaders = [ tableContent [2]  if tableContent is not None  else []  for tableContent in tableContents ]
+        iTableFiles = np.repeat ( np.arange (numberOfTableFiles), numberOfRowsPerTableFile )
+        if numberOfColumns is not None:
+
+            # Copy the columns of each table file into the arrays for all the table files, and let go of them as soon as they have been copied.
+            numberOfRows = int ( np.sum (numberOfRowsPerTableFile) )
+            iRowStarts = np.concatenate ( ( [0], np.cumsum (numberOfRowsPerTableFile) ) )
+            for iColumn in range (numberOfUsedColumns):
+
+                dataType = np.result_type ( *[ tableContent [0][iColumn].dtype for tableContent in tableContents if tableContent is not None and tableContent [0] ] )
+                tableContentDataNumbers.append ( np.empty (numberOfRows, dtype = dataType) )
+                tableContentDataStrings.append ([])
+
+
+            for iTableFile, tableContent in enumerate (tableContents):
+
+                if tableContent is not None:
+
+                    for iColumn, columnNumbers in enumerate (tableContent [0]):
+
+                        tableContentDataNumbers [iColumn][ iRowStarts [iTableFile] : iRowStarts [iTableFile + 1] ] = columnNumbers
+                        if returnStrings:
+
+                            tableContentDataStrings [iColumn].extend (tableContent [1][iColumn])
+
+
+                    tableContents [iTableFile] = None
+
+
+            if not returnStrings:
+
+                tableContentDataStrings = []
+
+
+        print ('')
+        print ('-------------')
+        print (' From HandyTools.readTables: ')
+        print ( '  {} files have been loaded with'.format (numberOfTableFiles - len (tableFilesLeftOut)) )
+        print ( '  {} data lines and {} columns'.format ( len (iTableFiles), numberOfColumns or 0 ) )                
+
+
+        return tableContentDataNumbers, tableContentDataStrings, tableContentHeaders, iTableFiles
+
+
+
+    # Split the data of a table in columns of strings in one go, for HandyTools.readTable.
+    @staticmethod
+    def splitTableData (tableData, separatorString = ' '):
+        '''
+        :param tableData: the data rows of the table, separated by *\\\\n*.
+        :type tableData: str
+
+        :param separatorString: string that separates the elements in the table at each row.
+        :type separatorString: str
+
+        :return: the strings of each column (as bytes if all the characters are ASCII), or ``None`` if the data cannot be split in one go.
+        :rtype: list [NumPy array <str or bytes>]
+
+
+        **Description:**
+        All the entrees are split at once with ``str.split``, which splits at any blank space (and removes the empty strings, as :py:meth:`~.readTable` does), 
+        hence this is only done if the only blank spaces in the data are the separators (after replacing a separator that is not a blank space 
+        by a blank space) and new lines. The number of entrees in each row is counted by NumPy, from the positions of the separators: 
+        if the (non-empty) rows do not all have the same number of entrees, then ``None`` is returned.
+        '''
+
+        if separatorString.isspace () and len (separatorString) == 1:
+
+            if re.search ( '[^\\S\\n' + re.escape (separatorString) + ']', tableData ):
+
+                return None
+
+
+            if separatorString != ' ':
+
+                if ' ' in tableData:
+
+                    return None
+
+
+                tableData = tableData.replace (separatorString, ' ')
+
+
+        elif separatorString:
+
+            if re.search ('[^\\S\\n]', tableData):
+
+                return None
+
+
+            tableData = tableData.replace (separatorString, ' ')
+
+        else:
+
+            return None
+
+
+        # The number of entrees on each line is the number of characters that are not a blank space or new line, and follow one (or the start of the line).
+        tableBytes = tableData.encode ()
+        tableCharacters = np.frombuffer (tableBytes, dtype = np.uint8)
+        if not len (tableCharacters):
+
+            return []
+
+
+        isSeparator = (tableCharacters == ord (' ')) | (tableCharacters == ord ('\n'))
+        isEntryStart = ~isSeparator
+        isEntryStart [1:] &= isSeparator [:-1]
+
+        iLineStarts = np.concatenate ( ( [0], np.flatnonzero (tableCharacters == ord ('\n')) + 1 ) )
+        iLineStarts = iLineStarts [iLineStarts < len (tableCharacters)]
+        numberOfEntriesPerLine = np.add.reduceat (isEntryStart, iLineStarts, dtype = np.int64)
+        numberOfEntriesPerLine = numberOfEntriesPerLine [numberOfEntriesPerLine > 0]
+
+        del tableCharacters, isSeparator, isEntryStart, iLineStarts
+
+        if not len (numberOfEntriesPerLine):
+
+            return []
+
+
+        if np.any (numberOfEntriesPerLine != numberOfEntriesPerLine [0]):
+
+            return None
+
+
+        # NumPy converts byte strings much faster to numbers than (unicode) strings, so use those if the table only has ASCII characters.
+        tableEntries = np.array ( tableBytes.split () if tableData.isascii () else tableData.split () ).reshape ( -1, int (numberOfEntriesPerLine [0]) )
+
+        return [ tableEntries [:, iColumn] for iColumn in range (tableEntries.shape [1]) ]
+
+
+
+    # Split the data of a table in columns of strings line by line, for HandyTools.readTable.
+    @staticmethod
+    def splitTableDataLineByLine (tableData, separatorString = ' '):
+        '''
+        :param tableData: the data rows of the table, separated by *\\\\n*.
+        :type tableData: str
+
+        :param separatorString: string that separates the elements in the table at each row.
+        :type separatorString: str
+
+        :return: the strings of each column.
+        :rtype: list [NumPy array <str>]
+
+
+        **Description:**
+        Each line is stripped from blank spaces at the beginning and the end and split at the ``separatorString``, and the empty strings and blank spaces 
+        around each entry are removed. The number of columns is that of the row with the most entrees: the columns of rows with fewer entrees are shorter.
+        '''
+
+        tableContentColumnsStrings = []
+        for tableLine in tableData.split ('\n'):
+
+            listOfColumnsValuesCurrentLine = [ element.strip ()  for element in tableLine.strip ().split (separatorString)  if element != '' ] 
+            for iDataValueString, dataValuesString in enumerate (listOfColumnsValuesCurrentLine):
+
+                if iDataValueString == len (tableContentColumnsStrings):
+
+                    tableContentColumnsStrings.append ([])
+
+
+                tableContentColumnsStrings [iDataValueString].append (dataValuesString)
+
+
+        return [ np.asarray (columnStrings, dtype = str) for columnStrings in tableContentColumnsStrings ]
+
+
+
+    # Convert a column of strings to numbers.
+    @staticmethod
+    def getNumbersFromStrings (columnStrings):
+        '''
+        :param columnStrings: the strings (or byte strings) of a column of a table.
+        :type columnStrings: NumPy array <str or bytes> or list [str]
+
+        :return: the numbers.
+        :rtype: NumPy array <int or float>
+
+
+        **Description:**
+        If none of the strings contains a '.' and all of them are integers, then the column is returned as integers. Otherwise the strings are returned as floats 
+        (including numbers like *1e5*, *nan* and *inf*), with NaN for the strings that are not numbers. The whole column is converted by NumPy in one go, 
+        only if this fails (because some strings are not numbers) are the (different) strings converted one by one.
+        '''
+
+        columnStrings = np.asarray (columnStrings)
+        if columnStrings.dtype.kind not in ('S', 'U'):
+
+            columnStrings = columnStrings.astype (str)
+
+
+        if not np.any ( np.char.find (columnStrings, b'.' if columnStrings.dtype.kind == 'S' else '.') >= 0 ):
+
+            try:
+
+                return columnStrings.astype (int)
+
+            except (ValueError, OverflowError):
+
+                pass
+
+
+        try:
+
+            return columnStrings.astype (float)
+
+        except ValueError:
+
+            # Convert each different string only once (columns with text usually have few different entrees).
+            uniqueStrings, iUniqueStrings = np.unique (columnStrings, return_inverse = True)
+            uniqueNumbers = np.empty (len (uniqueStrings), dtype = float)
+            for iString, uniqueString in enumerate ( uniqueStrings.tolist () ):
+
+                try:
+
+                    uniqueNumbers [iString] = float (uniqueString)
+
+                except ValueError:
+
+                    uniqueNumbers [iString] = np.nan
+
+
+            return uniqueNumbers [iUniqueStrings.ravel ()]
+
+
+
+    # Reads data from a tabular text file in chunks of rows, so that large tables can be processed without loading the whole table.
+    @staticmethod
+    def iterateTable (textFileNameAndPath, endOfHeaderString = 'C_END', separatorString = ' ', numberOfRowsPerChunk = 100000, usecols = None, 
+                      dataTypes = None, returnStrings = False):
+        '''
+        :param textFileNameAndPath: file name (and path) of the table (text) file to read.
+        :type textFileNameAndPath: str
+
+        :param endOfHeaderString: string at the end of the header and the start of the tabular data, default = *C_END*
+        :type endOfHeaderString: str
+
+        :param separatorString: string that separates the elements in the table at each row, default is one empty space.
+        :type separatorString: str
+
+        :param numberOfRowsPerChunk: the number of rows (lines) of the table in each chunk, default 100000.
+        :type numberOfRowsPerChunk: int
+
+        :param usecols: the indices of the columns to read (starting at 0), default ``None`` (all columns).
+        :type usecols: list [int]
+
+        :param dataTypes: the data type of each (used) column (float for the columns after the last one in the list), or one data type for all columns, 
+                          default ``None`` (determined from the first chunk).
+        :type dataTypes: list [NumPy dtype] or NumPy dtype
+
+        :param returnStrings: if ``True``, then the columns are also returned as strings, default ``False`` (an empty list is returned instead).
+        :type returnStrings: bool
+
+        :return: generator of the table content of each chunk for each column as numbers, as strings, and the content of the header.
+        :rtype: generator of list [1-D NumPy array], list [ list [str] ], list [str]
+
+        **Description:**
+        The content of the table is the same as with :py:meth:`~.readTable` (see there for the format of the table file), but the data rows 
+        are read and converted ``numberOfRowsPerChunk`` rows at a time. In this manner a large table can be processed chunk by chunk, 
+        for example with the out-of-core methods of DataTools, while only one chunk is held in memory:
+
+        .. code-block:: python
+
+            for tableChunkNumbers, tableChunkStrings, tableContentHeader in HandyTools.iterateTable ('table.txt', numberOfRowsPerChunk = 1000000):
+
+                columnSums += [ np.sum (columnNumbers) for columnNumbers in tableChunkNumbers ]
+
+        The data type of each column is the same in all chunks: it is the data type of the ``dataTypes`` or, if those are not given, the data type
+        that :py:meth:`~.getNumbersFromStrings` determines for the first chunk. If a column of integers in the first chunk has other numbers 
+        in a later chunk, then those are rounded down to integers (and entrees that are not numbers are set to 0), with a warning: 
+        give the ``dataTypes`` (for example ``float``) for such columns. The number of columns is also that of the first chunk.
+
+        If the table file does not have the ``endOfHeaderString``, then the file is read once to look for it, before the data are read.
+        Empty rows are skipped, so that a chunk can have fewer rows. 
+        '''
+
+        try:
+
+            tableFile = open (textFileNameAndPath, 'r')
+
+        except OSError:
+
+            print ('')
+            print ('---WARNING---')
+            print (' From HandyTools.iterateTable: ')
+            print ('  file {} cannot be opened and / or read correctly.'.format (textFileNameAndPath))                
+
+            return
+
+
+        with tableFile:
+
+            # Look for the line with only the  endOfHeaderString  (and blanks), without keeping the lines before it, since a file without it can be large.
+            iEndOfHeaderLine = next ( ( iTableLine for iTableLine, tableLine in enumerate (tableFile) if tableLine.strip () == endOfHeaderString.strip () ), None )
+            tableFile.seek (0)
+
+            #---------- If file has no "C_END" marker, then assume the data start at the top.
+            if iEndOfHeaderLine is None:
+
+                print ('')
+                print ('---ATTENTION---')
+                print (' From HandyTools.iterateTable: ')
+                print('   File {} does not contain {} marker: assuming data only'.format ( textFileNameAndPath, endOfHeaderString.strip () ) )
+                print('')
+
+                tableContentHeader = []
+
+            # Read the header, and skip the line with the  endOfHeaderString.
+            else:
+
+                tableContentHeader = [ tableLine.strip () for tableLine in itertools.islice (tableFile, iEndOfHeaderLine) if tableLine.strip () ]
+                next (tableFile)
+
+
+            numberOfDataLines = 0
+            numberOfEntriesPerLine = None
+            iColumnsInTable = None
+            dataTypesOfColumns = None
+            iColumnsRoundedDown = set ()
+            while True:
+
+                tableData = ''.join ( itertools.islice (tableFile, numberOfRowsPerChunk) )
+                if not tableData:
+
+                    break
+
+
+                # The strings of each column, split in one go if possible, or otherwise line by line.
+                tableChunkColumnsStrings = HandyTools.splitTableData (tableData, separatorString)
+                if tableChunkColumnsStrings is None:
+
+                    tableChunkColumnsStrings = HandyTools.splitTableDataLineByLine (tableData, separatorString)
+
+
+                del tableData
+
+                if not tableChunkColumnsStrings:
+
+                    continue
+
+
+                # The columns (and their data types) are determined by the first chunk with data.
+                if numberOfEntriesPerLine is None:
+
+                    numberOfEntriesPerLine = len (tableChunkColumnsStrings)
+                    iColumnsInTable = HandyTools.getColumnIndicesInTable (usecols, numberOfEntriesPerLine, textFileNameAndPath, 'HandyTools.iterateTable')
+                    if dataTypes is None:
+
+                        dataTypesOfColumns = [ HandyTools.getNumbersFromStrings (tableChunkColumnsStrings [iColumn]).dtype for iColumn in iColumnsInTable ]
+
+                    elif isinstance (dataTypes, (list, tuple)):
+
+                        dataTypesOfColumns = [ np.dtype (dataType) for dataType in dataTypes ]
+                        dataTypesOfColumns += [ np.dtype (float) ] * ( len (iColumnsInTable) - len (dataTypesOfColumns) )
+
+                    else:
+
+                        dataTypesOfColumns = [ np.dtype (dataTypes) ] * len (iColumnsInTable)
+
+
+                tableChunkNumbers = []
+                tableChunkStrings = []
+                for iColumn, dataType in zip (iColumnsInTable, dataTypesOfColumns):
+
+                    columnStrings = tableChunkColumnsStrings [iColumn]  if iColumn < len (tableChunkColumnsStrings)  else np.array ([], dtype = str)
+                    try:
+
+                        columnNumbers = columnStrings.astype (dataType)
+
+                    except (ValueError, OverflowError):
+
+                        columnNumbers = HandyTools.getNumbersFromStrings (columnStrings)
+                        if dataType.kind in ('i', 'u') and columnNumbers.dtype.kind == 'f':
+
+                            if iColumn not in iColumnsRoundedDown:
+
+                                print ('')
+                                print ('---WARNING---')
+                                print (' From HandyTools.iterateTable: ')
+                                print ( '  column {} of file {} is {}, but has values in the chunk from data line {} on that are not integers: they are rounded down.'.format ( 
+                                        iColumn, textFileNameAndPath, dataType.name, numberOfDataLines + 1 ) )
+
+                                iColumnsRoundedDown.add (iColumn)
+
+
+                            columnNumbers = np.floor ( np.nan_to_num (columnNumbers, nan = 0, posinf = 0, neginf = 0) )
+
+
+                        columnNumbers = columnNumbers.astype (dataType)
+
+
+                    tableChunkNumbers.append (columnNumbers)
+                    if returnStrings:
+
+                        tableChunkStrings.append ( columnStrings.astype (str).tolist () )
+
+
+                numberOfDataLines += max ( len (columnStrings) for columnStrings in tableChunkColumnsStrings )
+                del tableChunkColumnsStrings
+
+                yield tableChunkNumbers, tableChunkStrings, tableContentHeader
+
+
+        print ('')
+        print ('-------------')
+        print (' From HandyTools.iterateTable: ')
+        print ( '  file {} has been read with'.format (textFileNameAndPath) )
+        print ( '  {} data lines and {} columns'.format ( numberOfDataLines, numberOfEntriesPerLine or 0 ) )                
+
+
+
+    # Get the indices of the columns to read, for HandyTools.readTable and HandyTools.iterateTable.
+    @staticmethod
+    def getColumnIndicesInTable (usecols, numberOfColumns, textFileNameAndPath, functionName):
+        '''
+        :param usecols: the indices of the columns to read (starting at 0, negative indices count from the last column), or ``None`` for all columns.
+        :type usecols: list [int]
+
+        :param numberOfColumns: the number of columns of the table.
+        :type numberOfColumns: int
+
+        :param textFileNameAndPath: file name (and path) of the table, for the warning.
+        :type textFileNameAndPath: str
+
+        :param functionName: the name of the function that reads the table, for the warning.
+        :type functionName: str
+
+        :return: the (non-negative) indices of the columns to read.
+        :rtype: list [int]
+
+
+        **Description:**
+        The indices of the ``usecols`` that are not columns of the table are left out, with a warning.
+        '''
+
+        if usecols is None:
+
+            return list ( range (numberOfColumns) )
+
+
+        iColumnsInTable = [ iColumn % numberOfColumns for iColumn in usecols if -numberOfColumns <= iColumn < numberOfColumns ]
+        if len (iColumnsInTable) < len (usecols):
+
+            print ('')
+            print ('---WARNING---')
+            print (' From {}: '.format (functionName) )
+            print ( '  file {} has {} columns: columns {} are not read.'.format ( 
+                    textFileNameAndPath, numberOfColumns, [ iColumn for iColumn in usecols if not -numberOfColumns <= iColumn < numberOfColumns ] ) )
+
+
+        return iColumnsInTable
+
+
+
+    # Get the path of the table cache of a table file, for HandyTools.readTable.
+    @staticmethod
+    def getTableCachePath (textFileNameAndPath, tableCacheDirectory = ''):
+        '''
+        :param textFileNameAndPath: file name (and path) of the table (text) file.
+        :type textFileNameAndPath: str
+
+        :param tableCacheDirectory: the directory with the table caches, default '' (the table cache is next to the table file).
+        :type tableCacheDirectory: str
+
+        :return: the path of the (directory of the) table cache.
+        :rtype: str
+
+
+        **Description:**
+        The table cache of the file *table.txt* is the directory *table.txt.tablecache* next to it, or, if a ``tableCacheDirectory`` is given, 
+        a directory in the ``tableCacheDirectory`` with the file name and a hash of the absolute path of the table file.
+        '''
+
+        if not tableCacheDirectory:
+
+            return textFileNameAndPath + '.tablecache'
+
+
+        # hashlib is only imported here, so that importing HandyTools stays fast.
+        import hashlib
+
+        textFileAbsolutePath = os.path.abspath (textFileNameAndPath)
+
+        return os.path.join ( tableCacheDirectory, '{}_{}.tablecache'.format ( 
+            os.path.basename (textFileAbsolutePath), hashlib.sha1 ( textFileAbsolutePath.encode () ).hexdigest () [:16] ) )
+
+
+
+    # Read the columns of a table from its table cache, for HandyTools.readTable.
+    @staticmethod
+    def readTableCache (tableCachePath, textFileNameAndPath, tableFileStatus, endOfHeaderString = 'C_END', separatorString = ' ', usecols = None, 
+                        returnStrings = True):
+        '''
+        :param tableCachePath: the path of the table cache, see :py:meth:`~.getTableCachePath`.
+        :type tableCachePath: str
+
+        :param textFileNameAndPath: file name (and path) of the table (text) file.
+        :type textFileNameAndPath: str
+
+        :param tableFileStatus: the status of the table file (from ``os.stat``).
+        :type tableFileStatus: os.stat_result
+
+        :param endOfHeaderString: string at the end of the header and the start of the tabular data, default = *C_END*
+        :type endOfHeaderString: str
+
+        :param separatorString: string that separates the elements in the table at each row, default is one empty space.
+        :type separatorString: str
+
+        :param usecols: the indices of the columns to read (starting at 0), default ``None`` (all columns).
+        :type usecols: list [int]
+
+        :param returnStrings: if ``False``, then the columns are not returned as strings (an empty list is returned instead), default ``True``.
+        :type returnStrings: bool
+
+        :return: the same table content as :py:meth:`~.readTable`, and the number of data lines, or ``None`` if the table cache cannot be used.
+        :rtype: tuple, or None
+
+
+        **Description:**
+        The table cache is only used if it was saved by the same version of HandyTools, for the same (absolute) path of the table file, 
+        with the same size and modification time of the table file, and the same ``endOfHeaderString`` and ``separatorString``. 
+        Otherwise the table file has to be read again.
+
+        The columns of numbers are memory-mapped (read-only), so that they are only loaded from the disk when they are used.
+        The modification time of the *tableCache.json* file of the table cache is set to the current time, 
+        so that the table caches that have been used least recently can be removed first (see :py:meth:`~.removeTableCaches`).
+        '''
+
+        tableCacheMetadataFileName = os.path.join (tableCachePath, 'tableCache.json')
+        try:
+
+            with open (tableCacheMetadataFileName, 'r') as tableCacheMetadataFile:
+
+                tableCacheMetadata = json.load (tableCacheMetadataFile)
+
+
+            if tableCacheMetadata ['version'] != tableCacheVersion or tableCacheMetadata ['path'] != os.path.abspath (textFileNameAndPath) or \
+               tableCacheMetadata ['size'] != tableFileStatus.st_size or tableCacheMetadata ['modificationTime'] != tableFileStatus.st_mtime_ns or \
+               tableCacheMetadata ['endOfHeaderString'] != endOfHeaderString.strip () or tableCacheMetadata ['separatorString'] != separatorString:
+
+                return None
+
+
+            iColumnsInTable = HandyTools.getColumnIndicesInTable (usecols, tableCacheMetadata ['numberOfColumns'], textFileNameAndPath, 'HandyTools.readTable')
+            tableContentDataNumbers = []
+            tableContentDataStrings = []
+            for iColumn in iColumnsInTable:
+
+                # Columns without values cannot be memory-mapped.
+                columnNumbers = np.load ( os.path.join ( tableCachePath, 'numbers{}.npy'.format (iColumn) ), mmap_mode = 'r' )
+                tableContentDataNumbers.append (columnNumbers  if columnNumbers.size  else np.array (columnNumbers))
+                if returnStrings:
+
+                    tableContentDataStrings.append ( np.load ( os.path.join ( tableCachePath, 'strings{}.npy'.format (iColumn) ) ).astype (str).tolist () )
+
+
+            os.utime (tableCacheMetadataFileName)
+
+        except (OSError, ValueError, KeyError, TypeError):
+
+            return None
+
+
+        return tableContentDataNumbers, tableContentDataStrings, tableCacheMetadata ['header'], tableCacheMetadata ['numberOfDataLines']
+
+
+
+    # Save the columns of a table to its table cache, for HandyTools.readTable.
+    @staticmethod
+    def saveTableCache (tableCachePath, textFileNameAndPath, tableFileStatus, endOfHeaderString, separatorString, tableContentDataNumbers, 
+                        tableContentColumnsStrings, tableContentHeader, numberOfDataLines):
+        '''
+        :param tableCachePath: the path of the table cache, see :py:meth:`~.getTableCachePath`.
+        :type tableCachePath: str
+
+        :param textFileNameAndPath: file name (and path) of the table (text) file.
+        :type textFileNameAndPath: str
+
+        :param tableFileStatus: the status of the table file (from ``os.stat``), from before it was read.
+        :type tableFileStatus: os.stat_result
+
+        :param endOfHeaderString: string at the end of the header and the start of the tabular data.
+        :type endOfHeaderString: str
+
+        :param separatorString: string that separates the elements in the table at each row.
+        :type separatorString: str
+
+        :param tableContentDataNumbers: the numbers of all the columns of the table.
+        :type tableContentDataNumbers: list [1-D NumPy array]
+
+        :param tableContentColumnsStrings: the strings of all the columns of the table.
+        :type tableContentColumnsStrings: list [1-D NumPy array <str or bytes>]
+
+        :param tableContentHeader: the content of the header of the table.
+        :type tableContentHeader: list [str]
+
+        :param numberOfDataLines: the number of data lines of the table.
+        :type numberOfDataLines: int
+
+        :return: ``True`` if the table cache has been saved.
+        :rtype: bool
+
+
+        **Description:**
+        Each column of numbers and strings is saved as a *.npy* file, and the header and the size and modification time of the table file as 
+        the *tableCache.json* file. The table cache is first written to a temporary directory, which then replaces the table cache, 
+        so that a table cache is never left half-written, for example if the program is interrupted or several programs read the same table file.
+
+        If the table file had been changed less than ``scanCacheRacyNanoseconds`` (2 s) before it was read, then the table cache is not saved,
+        because a change shortly after it that is within the resolution of the modification times of the file system would not be noticed.
+        '''
+
+        if tableFileStatus.st_mtime_ns > time.time_ns () - scanCacheRacyNanoseconds:
+
+            return False
+
+
+        tableCacheTemporaryPath = '{}.{}.tmp'.format (tableCachePath, os.getpid ())
+        try:
+
+            shutil.rmtree (tableCacheTemporaryPath, ignore_errors = True)
+            os.makedirs (tableCacheTemporaryPath)
+            for iColumn, (columnNumbers, columnStrings) in enumerate ( zip (tableContentDataNumbers, tableContentColumnsStrings) ):
+
+                np.save ( os.path.join ( tableCacheTemporaryPath, 'numbers{}.npy'.format (iColumn) ), columnNumbers, allow_pickle = False )
+                np.save ( os.path.join ( tableCacheTemporaryPath, 'strings{}.npy'.format (iColumn) ), columnStrings, allow_pickle = False )
+
+
+            with open ( os.path.join (tableCacheTemporaryPath, 'tableCache.json'), 'w' ) as tableCacheMetadataFile:
+
+                json.dump ( { 'version': tableCacheVersion, 'path': os.path.abspath (textFileNameAndPath), 'size': tableFileStatus.st_size, 
+                              'modificationTime': tableFileStatus.st_mtime_ns, 'endOfHeaderString': endOfHeaderString.strip (), 
+                              'separatorString': separatorString, 'numberOfColumns': len (tableContentDataNumbers), 'numberOfDataLines': numberOfDataLines, 
+                              'header': tableContentHeader }, tableCacheMetadataFile )
+
+
+            # A directory can only replace an empty directory.
+            shutil.rmtree (tableCachePath, ignore_errors = True)
+            os.replace (tableCacheTemporaryPath, tableCachePath)
+
+            return True
+
+        except OSError:
+
+            shutil.rmtree (tableCacheTemporaryPath, ignore_errors = True)
+
+            print ('')
+            print ('---WARNING---')
+            print (' From HandyTools.saveTableCache: ')
+            print ('  table cache {} cannot be saved.'.format (tableCachePath) )
+
+            return False
+
+
+
+    # Remove the table caches in a directory that have been used least recently, so that they do not take more than a maximum space on the disk.
+    @staticmethod
+    def removeTableCaches (tableCacheDirectory, maximumTableCacheSize = 0):
+        '''
+        :param tableCacheDirectory: the directory with the table caches.
+        :type tableCacheDirectory: str
+
+        :param maximumTableCacheSize: the maximum total size (in bytes) of the table caches, default 0 (all the table caches are removed).
+        :type maximumTableCacheSize: int
+
+        :return: the number of table caches that have been removed.
+        :rtype: int
+
+
+        **Description:**
+        The table caches (see :py:meth:`~.readTable`) are removed in the order in which they have been used (read or saved), the least recently used first, 
+        until the total size of the remaining table caches is at most ``maximumTableCacheSize``. 
+        This is done by :py:meth:`~.readTable` after saving a table cache, if the ``maximumTableCacheSize`` is given.
         '''
-        :param textFileNameAndPath: file name (and path) of the table (text) file to read.
-        :type textFileNameAndPath: str
 
-        :param endOfHeaderString: string at the end of the header and the start of the tabular data, default = *C_END*
-        :type endOfHeaderString: str
+        tableCaches = []
+        try:
 
-        :param separatorString: string that separates the elements in the table at each row, default is one empty space.
-        :type separatorString: str
+            with os.scandir (tableCacheDirectory) as directoryEntries:
 
-        :return: table content for each column as numbers (int or float, or NaN), as strings, and the content of a header.
-        :rtype: list [ list [1-D NumPy array] ], one for each column in the list, list [ list [str] ], list [str]
+                for directoryEntry in directoryEntries:
 
-        **Description:**
-        With this method formatted human-readable tabular data from a text file can be loaded as a list of 1-Dimensional NumPy arrays.
+                    if directoryEntry.name.endswith ('.tablecache') and directoryEntry.is_dir (follow_symlinks = False):
 
-        If the table file has header text, then the user can indicate the ``endOfHeaderString`` that signals the end of the header and the start of the data,
-        in the example below ``C_END``, which is also the default value.
-        
-        .. code-block:: console
-        
-            header line 1
-            header line 2
-            
-            C_END
-            entry1 1 4.5 6
-            entry2 2 5.3 7
-                    
-        Alternatively there can be no header and just data. 
-        
-        .. code-block:: console
+                        try:
 
-            entry1 1 4.5 6
-            entry2 2 5.3 7
-        
-        
-        .. attention:: 
-        
-            It is assumed there are no empty rows amongst the data rows!
+                            with os.scandir (directoryEntry.path) as tableCacheEntries:
 
-                 
-        The tabular data is returned both as an array of NumPy arrays and as a list of strings. 
-        Each array (list) in the list contains the content of one of the columns from the table.
-        Note that the format of the data (int or float) can be different per column and is taken to be the format of the data entrees in the first row.
-        In this manner integers and floats can be mixed as long as they are consistent throughout each column. 
-        In the example above, the 2nd and  4th columns are int and the 3rd column a float. The first column is not numerical and is returned as a list of NaN.
-        
-        The ``HandyTools.getTextFileContent`` method is used to load the full content of the text file.
-        '''
-        
-        tableContent = HandyTools.getTextFileContent (textFileNameAndPath, stripLineFromBlanks = True)
+                                tableCacheSize = sum ( tableCacheEntry.stat ().st_size for tableCacheEntry in tableCacheEntries )
 
-        if tableContent:
-        
-            if (endOfHeaderString + "\n").strip () in tableContent:
-            
-                iHeaderEnd = tableContent.index ( (endOfHeaderString + "\n").strip () )
-            
-            
-            elif endOfHeaderString.strip () in tableContent:
-            
-                iHeaderEnd = tableContent.index ( endOfHeaderString.strip () )
-            
-            
-            #---------- If file has no "C_END" marker, then assume the data start at the top.
-            else:
 
-                print ('')
-                print ('---ATTENTION---')
-                print (' From HandyTools.readTable: ')
-                print('   File {} does not contain {} marker: assuming data only'.format ( textFileNameAndPath, endOfHeaderString.strip () ) )
-                print('')
-                
-                iHeaderEnd = -1
+                            tableCacheLastUse = os.stat ( os.path.join (directoryEntry.path, 'tableCache.json') ).st_mtime_ns
 
+                        except OSError:
 
-            # Store each line of the header in the  tableContentHeader  string list.
-            #  Do not store empty lines.
-            tableContentHeader = []
-            if iHeaderEnd >= 0:
-            
-                tableContentHeader = [ headerLine.strip ()  for headerLine in tableContent [0:iHeaderEnd]  if headerLine.strip () ]
+                            continue
 
-            
-            # Go through each data line and extract each element of the line as a string and if possible as a number.
-            numberOfLines = len (tableContent) 
-            numberOfDataLines = numberOfLines - iHeaderEnd - 1                                   
-            if numberOfDataLines:
 
-                # Depending on the structure of the table and the separator character it is possible the split function returns some empty strings.
-                # Make sure that those empty elements are not taken into account.
+                        tableCaches.append ( (tableCacheLastUse, tableCacheSize, directoryEntry.path) )
 
-                # Count the line with maximum number of elements. 
-                listOfColumnsValuesFirstLine = [ element  for element in tableContent [iHeaderEnd + 1].split (separatorString)  if element != '' ] 
-                numberOfEntriesPerLine = len (listOfColumnsValuesFirstLine)
+        except OSError:
 
-                tableContentDataNumbers = [ []  for iLine in range (numberOfEntriesPerLine) ]
-                tableContentDataStrings = [ []  for iLine in range (numberOfEntriesPerLine) ]
-                       
-                # Go through each element on the line: elements are based on the  separatorString
-                for iTableContent in range (iHeaderEnd + 1, numberOfLines):
-                               
-                    listOfColumnsValuesCurrentLine = [ element  for element in tableContent [iTableContent].split (separatorString)  if element != '' ]
+            return 0
 
-                    for iDataValueString, dataValuesString in enumerate (listOfColumnsValuesCurrentLine):
 
-                        tableContentDataStrings [iDataValueString].append ( dataValuesString.strip () )  
+        tableCaches.sort ()
+        totalTableCacheSize = sum ( tableCacheSize for tableCacheLastUse, tableCacheSize, tableCachePath in tableCaches )
+        numberOfTableCachesRemoved = 0
+        for tableCacheLastUse, tableCacheSize, tableCachePath in tableCaches:
 
-                        try:
-                            
-                            if '.' in dataValuesString:
-                            
-                                tableContentDataNumbers [iDataValueString].append ( float (dataValuesString) ) 
-                                
-                            else:
-                            
-                                tableContentDataNumbers [iDataValueString].append ( int (dataValuesString) )
+            if totalTableCacheSize <= maximumTableCacheSize:
 
-                        except:
-                        
-                            tableContentDataNumbers [iDataValueString].append (np.nan)
+                break
 
-            
-            tableContentDataNumbers =  [ np.asarray (tableContentDataNumbers [iColumn], dtype = type (tableContentDataNumbers [iColumn][0]) )  for iColumn in range (numberOfEntriesPerLine) ]                                                
-            
-            print ('')
-            print ('-------------')
-            print (' From HandyTools.readTable: ')
-            print ( '  file {} has been loaded with'.format (textFileNameAndPath) )
-            print ( '  {} data lines and {} columns'.format (numberOfDataLines, numberOfEntriesPerLine) )                
 
-            
-        else:
-        
-            print ('')
-            print ('---WARNING---')
-            print (' From HandyTools.readTable: ')
-            print ( '  file {} does not contain any readable data.'.format (textFileNameAndPath) )                
+            shutil.rmtree (tableCachePath, ignore_errors = True)
+            totalTableCacheSize -= tableCacheSize
+            numberOfTableCachesRemoved += 1
 
-            
-        return tableContentDataNumbers, tableContentDataStrings, tableContentHeader
+
+        return numberOfTableCachesRemoved
 
 
 
@@ -452,9 +2401,197 @@ class HandyTools:
     
     
                                        
+    # Write columns of data (and a header) to a tabular text file, that can be read with HandyTools.readTable.
+    @staticmethod
+    def writeTable (columns, header, textFileNameAndPath, columnFormats = None, separatorString = ' ', endOfHeaderString = 'C_END', append = False, 
+                    numberOfRowsPerChunk = 100000):
+        '''
+        :param columns: the columns of the table, all with the same number of values.
+        :type columns: list [1-D NumPy array or list]
+
+        :param header: the header of the table, as a string (for example from :py:meth:`~.getTableHeader`) or as a list of lines (for example from :py:meth:`~.readTable`),
+                       or ``None`` for no header (only the ``endOfHeaderString`` line).
+        :type header: str or list [str] or None
+
+        :param textFileNameAndPath: file name (and path) of the table (text) file to write.
+        :type textFileNameAndPath: str
+
+        :param columnFormats: the format of the values of each column, as a format string such as ``'%.3f'`` or ``'%d'`` (``None`` for the default format), 
+                              default ``None`` (the default format for all the columns).
+        :type columnFormats: list [str or None]
+
+        :param separatorString: string that separates the elements in the table at each row, default is one empty space.
+        :type separatorString: str
+
+        :param endOfHeaderString: string at the end of the header and the start of the tabular data, default = *C_END*
+        :type endOfHeaderString: str
+
+        :param append: set to ``True`` to add the rows at the end of the table file, if it exists already (without the header), default ``False``.
+        :type append: bool
+
+        :param numberOfRowsPerChunk: the number of rows that are formatted and written at a time, default 100000.
+        :type numberOfRowsPerChunk: int
+
+        :return: ``True`` if the table has been written.
+        :rtype: bool
+
+        **Description:**
+        The header is written first, followed by a line with the ``endOfHeaderString`` (unless the header has this line already, as a header from 
+        :py:meth:`~.getTableHeader` does), and then each row of the table on a separate line, with the values of the columns separated by the ``separatorString``.
+        
+        .. code-block:: python
+
+            HandyTools.writeTable ( [ np.arange (3), np.array ([0.1, 0.2, 0.3]) ], HandyTools.getTableHeader ('table.txt', headerLines = ['index value']), 'table.txt' )
+            
+        The values are formatted for a whole column (and a whole chunk of rows) at a time, and each chunk of rows is written at once. 
+        By default, integers (and booleans) are written as integers, floats in the shortest format that gives back exactly the same float, 
+        which always has a '.' (or is written in exponential notation, or is *nan* or *inf*), so that the float column is read as a float column
+        by :py:meth:`~.readTable`, and other values as strings. In this manner the table is read back with exactly the same numbers. 
+        A format of the ``columnFormats`` for a float column should also keep the '.' (for example ``'%.3f'`` or ``'%.6e'``, but not ``'%.0f'``).
+        Strings should not be empty or contain blank spaces (or the ``separatorString``), for the table to be read back correctly: a warning is given otherwise.
+
+        With ``append`` set to ``True``, rows can be added to a table file in several steps (for example while the data are being produced): 
+        the header is only written if the table file does not exist yet (or is empty).
+
+        The header and the ``columnFormats`` are checked before the table file is opened. A new table file is written to a temporary file first, 
+        which then replaces the table file, and with ``append`` the rows that have been added are removed again if an error occurs: in this manner 
+        an error never leaves a partly written table file.
+        '''
+    
+        columns = [ np.asarray (column) for column in columns ]
+        numberOfRows = len (columns [0])  if columns  else 0
+        if any ( column.ndim != 1 or len (column) != numberOfRows for column in columns ):
+
+            print ('')
+            print ('---WARNING---')
+            print (' From HandyTools.writeTable: ')
+            print ( '  the columns need to be one-dimensional with the same number of values: file {} is not written.'.format (textFileNameAndPath) )
+
+            return False
+
+
+        if columnFormats is None:
+
+            columnFormats = [None] * len (columns)
+
+
+        columnFormats = list (columnFormats) + [None] * ( len (columns) - len (columnFormats) )
+
+        # Warn about strings that cannot be read back as the same entrees.
+        for iColumn, column in enumerate (columns):
+
+            if column.dtype.kind in ('U', 'S', 'O') and columnFormats [iColumn] is None and numberOfRows:
+
+                columnStrings = column.astype (str)
+                if np.any (columnStrings == '') or any ( np.any ( np.char.find (columnStrings, characterString) >= 0 ) for characterString in set ( [' ', '\t', separatorString] ) ):
+
+                    print ('')
+                    print ('---WARNING---')
+                    print (' From HandyTools.writeTable: ')
+                    print ( '  column {} has strings that are empty or contain blank spaces: file {} cannot be read back correctly.'.format (iColumn, textFileNameAndPath) )
+
+
+        # Make the header and check the formats (on the first row) before the table file is opened, so that an error does not leave a truncated table file.
+        try:
+
+            headerLines = ( header.split ('\n')  if header  else [] )  if isinstance (header, str)  else list (header or [])
+            if not all ( isinstance (headerLine, str) for headerLine in headerLines ):
+
+                raise TypeError ('the header lines need to be strings')
+
+
+            if endOfHeaderString.strip () not in [ headerLine.strip () for headerLine in headerLines ]:
+
+                headerLines.append (endOfHeaderString)
+
+
+            for column, columnFormat in zip (columns, columnFormats):
+
+                if columnFormat is not None:
+
+                    np.char.mod ( columnFormat, column [:1] )
+
+        except (TypeError, ValueError) as error:
+
+            print ('')
+            print ('---WARNING---')
+            print (' From HandyTools.writeTable: ')
+            print ( '  the header or the column formats cannot be used ({}): file {} is not written.'.format (error, textFileNameAndPath) )
+
+            return False
+
+
+        # A new table file is written to a temporary file that replaces the table file at the end, rows are added to the table file itself.
+        writeHeader = not append or not os.path.isfile (textFileNameAndPath) or os.path.getsize (textFileNameAndPath) == 0
+        tableFileSize = 0  if writeHeader  else os.path.getsize (textFileNameAndPath)
+        temporaryTextFileNameAndPath = textFileNameAndPath  if append  else '{}.{}.tmp'.format ( textFileNameAndPath, os.getpid () )
+        try:
+
+            with open (temporaryTextFileNameAndPath, 'a' if append else 'w', buffering = 1048576) as tableFile:
+
+                if writeHeader:
+
+                    tableFile.write ( '\n'.join (headerLines) + '\n' )
+
+
+                for iRowStart in range (0, numberOfRows, numberOfRowsPerChunk):
+
+                    columnsStrings = []
+                    for column, columnFormat in zip (columns, columnFormats):
+
+                        columnChunk = column [iRowStart : iRowStart + numberOfRowsPerChunk]
+                        if columnFormat is not None:
+
+                            columnsStrings.append ( np.char.mod (columnFormat, columnChunk).tolist () )
+
+                        else:
+
+                            columnsStrings.append ( ( columnChunk.astype (int)  if columnChunk.dtype.kind == 'b'  else columnChunk ).astype (str).tolist () )
+
+                    
+                    tableFile.write ( '\n'.join ( map ( separatorString.join, zip (*columnsStrings) ) ) + '\n' )
+
+
+            if not append:
+
+                os.replace (temporaryTextFileNameAndPath, textFileNameAndPath)
+
+        except (OSError, TypeError, ValueError):
+
+            # Leave the table file as it was: remove the temporary file, or the rows that have been added to the table file.
+            try:
+
+                if not append:
+
+                    if os.path.isfile (temporaryTextFileNameAndPath):
+
+                        os.remove (temporaryTextFileNameAndPath)
+
+
+                elif os.path.isfile (textFileNameAndPath):
+
+                    os.truncate (textFileNameAndPath, tableFileSize)
+
+            except OSError:
+
+                pass
+
+
+            print ('')
+            print ('---WARNING---')
+            print (' From HandyTools.writeTable: ')
+            print ( '  file {} cannot be written correctly.'.format (textFileNameAndPath) )
+
+            return False
+
+
+        return True
+
+
+
     # Save content (list, dictionary, ...) to a numpy file with a custom extension.
     @staticmethod
-    def saveContentToNumpyWithCustomExtension (contentToSave, fileName, extensionWithoutDot, overWrite = False):
+    def saveContentToNumpyWithCustomExtension (contentToSave, fileName, extensionWithoutDot, overWrite = False, compress = False):
         '''
         :param contentToSave: any content that the user wants to save to the numpy-format file.
         :type: anything!
@@ -467,13 +2604,30 @@ class HandyTools:
         
         :param overWrite: if set to ``True``, then overwrite any file with the same file name that might already exist.
         :type overWrite: bool; default = False
+
+        :param compress: if set to ``True``, then compress the content (for example to archive it), which is slower and cannot be memory-mapped.
+        :type compress: bool; default = False
         
         :return: two booleans, the first for file saved successfully, the second for if the file already existed.
         :rtype: bool, bool
         
         **Description:**
         Save content (list, dictionary, ...) to a numpy file with a custom extension ``extensionWithoutDot``. If the file already exists, then it is overwritten only 
-        if the used set the ``overWrite`` boolean to ``True``.
+        if the used set the ``overWrite`` boolean to ``True``. The content can be loaded with :py:meth:`~.loadContentFromNumpyWithCustomExtension`.
+
+        The format of the file depends on the content:
+
+        * a NumPy array (of numbers or strings) is saved in the *.npy* format, so that it can be memory-mapped when it is loaded;
+        * a dictionary of NumPy arrays (of numbers or strings), with strings as keys, is saved in the *.npz* format, with an (uncompressed) *.npy* member 
+          for each array, so that each array can be memory-mapped (or loaded on its own) when it is loaded;
+        * any other content (for example a list, or a dictionary with other values) is saved in the *.npy* format with *pickle*, as a NumPy array 
+          (which for a dictionary contains the dictionary).
+
+        With ``compress`` set to ``True``, the arrays of a dictionary of arrays are compressed *.npz* members, and other content is saved in 
+        a *.npy* file that is compressed with *gzip*.
+        
+        The content is first written to a temporary file next to the file, which then replaces the file, so that the file is never left half-written, 
+        for example if the program is interrupted, and programs that have memory-mapped the previous file can keep on using it.
         '''
     
         fileNameWithExtension = fileName + '.' + extensionWithoutDot
@@ -484,21 +2638,51 @@ class HandyTools:
         
             fileAlreadyExists = False            
 
+            temporaryFileName = '{}.{}.tmp'.format (fileNameWithExtension, os.getpid ())
             try:
         
-                np.save (fileNameWithExtension, contentToSave)
+                if isinstance (contentToSave, dict) and contentToSave and \
+                   all ( isinstance (key, str) and isinstance (value, np.ndarray) and not value.dtype.hasobject for key, value in contentToSave.items () ):
+
+                    ( np.savez_compressed if compress else np.savez ) (temporaryFileName, **contentToSave)
+
+                    # np.savez adds the extension .npz to the file name.
+                    os.replace (temporaryFileName + '.npz', temporaryFileName)
+
+                elif compress:
+
+                    # gzip is only imported here, so that importing HandyTools stays fast.
+                    import gzip
+
+                    with gzip.open (temporaryFileName, 'wb') as contentFile:
+
+                        np.save (contentFile, contentToSave)
+
+                else:
+
+                    with open (temporaryFileName, 'wb') as contentFile:
+
+                        np.save (contentFile, contentToSave)
+
                 
-                # os.rename does not work on Windows when the destination file already exists.
-                shutil.move (fileNameWithExtension + '.npy', fileNameWithExtension)
+                # os.replace also replaces an existing file on Windows (unlike os.rename).
+                os.replace (temporaryFileName, fileNameWithExtension)
         
                 fileSaved = True
 
-            except:
+            except Exception:
+
+                for fileNameToRemove in (temporaryFileName, temporaryFileName + '.npz'):
+
+                    if os.path.isfile (fileNameToRemove):
+
+                        os.remove (fileNameToRemove)
+
         
                 print ('')
                 print ('---WARNING---')
                 print (' From HandyTools.saveContentToNumpyWithCustomExtension: ')
-                print ( '  file {} already exists, it was not overwritten!'.format (fileNameWithExtension) )                
+                print ( '  file {} cannot be saved.'.format (fileNameWithExtension) )                
  
  
         else:
@@ -510,6 +2694,138 @@ class HandyTools:
     
 
 
+    # Load content saved with HandyTools.saveContentToNumpyWithCustomExtension.
+    @staticmethod
+    def loadContentFromNumpyWithCustomExtension (fileName, extensionWithoutDot, mmap_mode = None):
+        '''
+        :param fileName: the file name of the file to be loaded.
+        :type fileName: str
+ 
+        :param extensionWithoutDot: the extension of the file name to be loaded.
+        :type extensionWithoutDot: str
+
+        :param mmap_mode: if not ``None``, then memory-map the arrays instead of loading them, with this mode (as for ``np.load``): 
+                          ``'r'`` (read-only), ``'r+'`` (changes are written to the file, only for a NumPy array) or ``'c'`` (changes are not written to the file).
+        :type mmap_mode: str; default = None
+
+        :return: the content, and a boolean for file loaded successfully.
+        :rtype: anything!, bool
+        
+        **Description:**
+        The content is returned as it was saved with :py:meth:`~.saveContentToNumpyWithCustomExtension`: a NumPy array, a dictionary of NumPy arrays, 
+        or the other content (which was saved with *pickle*, so only load files from a source you trust). 
+        
+        With a ``mmap_mode``, a NumPy array, and each array of a dictionary of arrays, is memory-mapped, so that only the parts of it that are used are read 
+        from the file, which is useful for large arrays. The arrays of a dictionary of arrays are memory-mapped at their place within the *.npz* file.
+        Compressed content, and arrays that contain other objects than numbers or strings, cannot be memory-mapped and are loaded.
+
+        Returns ``None`` (and ``False``) if the file does not exist or cannot be loaded.
+        '''
+
+        fileNameWithExtension = fileName + '.' + extensionWithoutDot
+        try:
+
+            with open (fileNameWithExtension, 'rb') as contentFile:
+
+                fileStart = contentFile.read (6)
+
+
+            # A dictionary of arrays (a zip file): changes to its arrays cannot be written to the file, because the checksums of the zip file would be wrong.
+            if fileStart.startswith (b'PK'):
+
+                if mmap_mode in ('r+', 'w+'):
+
+                    print ('')
+                    print ('---WARNING---')
+                    print (' From HandyTools.loadContentFromNumpyWithCustomExtension: ')
+                    print ( '  the arrays of file {} cannot be changed in the file: they are memory-mapped with mode c instead.'.format (fileNameWithExtension) )                
+
+                    mmap_mode = 'c'
+
+
+                contentLoaded = {}
+                with zipfile.ZipFile (fileNameWithExtension) as contentZipFile, open (fileNameWithExtension, 'rb') as contentFile:
+
+                    for zipMemberInfo in contentZipFile.infolist ():
+
+                        key = zipMemberInfo.filename [:-4]  if zipMemberInfo.filename.endswith ('.npy')  else zipMemberInfo.filename
+                        arrayLoaded = None
+                        if mmap_mode is not None and zipMemberInfo.compress_type == zipfile.ZIP_STORED:
+
+                            # The array starts after the header of the zip member (which can have another length than in the directory of the zip file) 
+                            #  and the header of the .npy member.
+                            contentFile.seek (zipMemberInfo.header_offset)
+                            zipMemberHeader = contentFile.read (30)
+                            fileNameLength, extraFieldLength = struct.unpack ( '<HH', zipMemberHeader [26:30] )
+                            contentFile.seek (zipMemberInfo.header_offset + 30 + fileNameLength + extraFieldLength)
+
+                            formatVersion = np.lib.format.read_magic (contentFile)
+                            arrayShape, fortranOrder, arrayDataType = ( np.lib.format.read_array_header_1_0  if formatVersion == (1, 0)  else 
+                                                                        np.lib.format.read_array_header_2_0 ) (contentFile)
+                            if not arrayDataType.hasobject and int ( np.prod (arrayShape) ):
+
+                                arrayLoaded = np.memmap ( fileNameWithExtension, dtype = arrayDataType, mode = mmap_mode, offset = contentFile.tell (), 
+                                                          shape = arrayShape, order = 'F' if fortranOrder else 'C' )
+
+
+                        if arrayLoaded is None:
+
+                            with contentZipFile.open (zipMemberInfo) as zipMemberFile:
+
+                                arrayLoaded = np.lib.format.read_array (zipMemberFile, allow_pickle = False)
+
+
+                        contentLoaded [key] = arrayLoaded
+
+
+            # Compressed content.
+            elif fileStart.startswith (b'\x1f\x8b'):
+
+                import gzip
+
+                with gzip.open (fileNameWithExtension, 'rb') as contentFile:
+
+                    contentLoaded = np.load (contentFile, allow_pickle = True)
+
+            else:
+
+                # Arrays with other objects (pickled) cannot be memory-mapped.
+                if mmap_mode is not None:
+
+                    with open (fileNameWithExtension, 'rb') as contentFile:
+
+                        formatVersion = np.lib.format.read_magic (contentFile)
+                        arrayShape, fortranOrder, arrayDataType = ( np.lib.format.read_array_header_1_0  if formatVersion == (1, 0)  else 
+                                                                    np.lib.format.read_array_header_2_0 ) (contentFile)
+
+
+                    if arrayDataType.hasobject:
+
+                        mmap_mode = None
+
+
+                contentLoaded = np.load ( fileNameWithExtension, mmap_mode = mmap_mode, allow_pickle = True )
+
+
+            # Other content was saved as an array with the content (unless it was a list, for example, that NumPy could convert to an array).
+            if isinstance (contentLoaded, np.ndarray) and contentLoaded.dtype.hasobject and contentLoaded.ndim == 0:
+
+                contentLoaded = contentLoaded.item ()
+
+
+            return contentLoaded, True
+
+        except Exception:
+
+            print ('')
+            print ('---WARNING---')
+            print (' From HandyTools.loadContentFromNumpyWithCustomExtension: ')
+            print ( '  file {} does not exist or cannot be loaded.'.format (fileNameWithExtension) )                
+
+            return None, False
+
+
+
     # Get the date and time now.
     @staticmethod
     def getDateAndTime ():
@@ -795,7 +3111,7 @@ class HandyTools:
             return
                     
         
-        
+        import matplotlib.pyplot as plt
         
         for iValue in range (numberOfValuesX):
                 
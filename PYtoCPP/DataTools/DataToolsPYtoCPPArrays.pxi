@@ -0,0 +1,58 @@
+# The handling of the data values and of the output arrays, shared by DataWranglingToolsPYtoCPP.pyx and FilterToolsPYtoCPP.pyx, 
+#  which include this file (it uses their  np  import).
+
+
+
+# The data values are passed to the C++ core functions without copying them whenever they already have the right data type: 
+#  any object that supports the buffer protocol is accepted (NumPy arrays, also read-only ones such as memmaps, and array.array), 
+#  with any strides (for example a column of a two-dimensional array). The stride, in number of values, is passed on to the C++ core functions.
+#  Lists, other data types and strides that are not a whole number of values are converted to a new (contiguous) array.
+cdef getDataValuesWithoutCopy (dataValues, dataType):
+
+    if isinstance (dataValues, np.ndarray):
+
+        if dataValues.dtype == dataType and dataValues.ndim == 1 and dataValues.strides [0] % dataValues.itemsize == 0:
+
+            return dataValues
+
+
+    elif not isinstance (dataValues, (list, tuple)):
+
+        try:
+
+            dataValuesBuffer = memoryview (dataValues)
+            if dataValuesBuffer.ndim == 1 and dataValuesBuffer.format == np.dtype (dataType).char and dataValuesBuffer.strides [0] % dataValuesBuffer.itemsize == 0:
+
+                return dataValues
+
+        except TypeError:
+
+            pass
+
+
+    return np.ascontiguousarray (dataValues, dtype = dataType)
+
+
+
+# Use the array given by the caller for the results, so that no new array needs to be made on every call, if it is a writable, contiguous NumPy array 
+#  of the right data type, with (at least, if not exactLength) numberOfValues values. Otherwise make a new array, with a warning if an array was given.
+cdef getOutputArray (out, Py_ssize_t numberOfValues, dataType, functionName, exactLength = True):
+
+    if out is None:
+
+        return np.zeros (numberOfValues, dtype = dataType)
+
+
+    if not isinstance (out, np.ndarray) or out.dtype != dataType or out.ndim != 1 or not out.flags ['C_CONTIGUOUS'] or not out.flags ['WRITEABLE'] or \
+       ( out.shape [0] != numberOfValues if exactLength else out.shape [0] < numberOfValues ):
+
+        print ()
+        print ('---WARNING---')
+        print (' From {}: '.format (functionName) )
+        print ('  the output array needs to be a writable, contiguous NumPy array of {}{} {} values: a new array is used instead.'.format ( 
+               '' if exactLength else 'at least ', numberOfValues, np.dtype (dataType).name ) )
+
+        return np.zeros (numberOfValues, dtype = dataType)
+
+
+    return out
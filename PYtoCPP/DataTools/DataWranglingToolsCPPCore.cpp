@@ -6,6 +6,499 @@
 
 // Custom includes.
 #include "DataWranglingToolsCPPCore.h"
+#include "SIMDDispatchCPPCore.h"
+
+
+
+// The instruction set level of the kernels is determined once, when the module is imported.
+static const int simdLevelDetectedDataWrangling = detectSIMDLevel ();
+static int simdLevelDataWrangling = simdLevelDetectedDataWrangling;
+
+
+
+// The scalar kernels also accept data values that are not stored contiguously: the data values are  dataValues [iValue * dataValuesStride] ,
+//  for example a column of a two-dimensional array, so that these do not need to be copied first. The SIMD kernels need contiguous data values.
+
+// Sum of the data values, with several independent accumulators so that the additions do not wait for each other.
+static double getSumOfValuesScalar (const double dataValues [], int numberOfValues, long long dataValuesStride = 1)
+{
+
+    double sumOfValues [4] = {0., 0., 0., 0.};
+    int iValue = 0;
+    for (; iValue + 4 <= numberOfValues; iValue += 4)
+    {
+
+        sumOfValues [0] += dataValues [iValue * dataValuesStride];
+        sumOfValues [1] += dataValues [ (iValue + 1) * dataValuesStride ];
+        sumOfValues [2] += dataValues [ (iValue + 2) * dataValuesStride ];
+        sumOfValues [3] += dataValues [ (iValue + 3) * dataValuesStride ];
+
+    }
+
+    for (; iValue < numberOfValues; iValue++)
+
+        sumOfValues [0] += dataValues [iValue * dataValuesStride];
+
+    return ( sumOfValues [0] + sumOfValues [1] ) + ( sumOfValues [2] + sumOfValues [3] );
+
+}
+
+
+// Sum of the squared deviations of the data values from the average value, with several independent accumulators.
+static double getSumOfSquaredDeviationsScalar (const double dataValues [], int numberOfValues, double averageValue, long long dataValuesStride = 1)
+{
+
+    double sumOfSquaredDeviations [4] = {0., 0., 0., 0.};
+    double deviation [4];
+    int iValue = 0;
+    for (; iValue + 4 <= numberOfValues; iValue += 4)
+    {
+
+        for (int iLane = 0; iLane < 4; iLane++)
+        {
+
+            deviation [iLane] = dataValues [ (iValue + iLane) * dataValuesStride ] - averageValue;
+            sumOfSquaredDeviations [iLane] += deviation [iLane] * deviation [iLane];
+
+        }
+
+    }
+
+    for (; iValue < numberOfValues; iValue++)
+    {
+
+        deviation [0] = dataValues [iValue * dataValuesStride] - averageValue;
+        sumOfSquaredDeviations [0] += deviation [0] * deviation [0];
+
+    }
+
+    return ( sumOfSquaredDeviations [0] + sumOfSquaredDeviations [1] ) + ( sumOfSquaredDeviations [2] + sumOfSquaredDeviations [3] );
+
+}
+
+
+// Index of the data value nearest to the value to compare, searching the whole list. When several values are equally near, the last one is chosen.
+static int getNearestValueIndexScalar (const double dataValues [], int numberOfValues, double valueToCompare, long long dataValuesStride = 1)
+{
+
+    int iSmallestDifference = 0;
+    double smallestDifferenceABS = std::fabs (dataValues [0] - valueToCompare);
+    double valueDifferenceABS;
+    for (int iValue = 1; iValue < numberOfValues; iValue++)
+    {
+
+        valueDifferenceABS = std::fabs (dataValues [iValue * dataValuesStride] - valueToCompare);
+        if ( valueDifferenceABS <= smallestDifferenceABS )
+        {
+
+            smallestDifferenceABS = valueDifferenceABS;
+            iSmallestDifference = iValue;
+
+        }
+
+    }
+
+    return iSmallestDifference;
+
+}
+
+
+
+#if SIMD_X86_KERNELS
+
+// Combine the smallest difference (and its index) found in each SIMD lane: the smallest difference wins, and for equal differences the largest index,
+//  so that the result is the same as that of the scalar search. Then continue with the remaining values of the list.
+static int getNearestValueIndexFromLanes (
+    const double smallestDifferenceLanes [], 
+    const double iSmallestDifferenceLanes [], 
+    int numberOfLanes, 
+    const double dataValues [], 
+    int iValueStart, 
+    int numberOfValues, 
+    double valueToCompare
+)
+{
+
+    double smallestDifferenceABS = smallestDifferenceLanes [0];
+    int iSmallestDifference = static_cast <int> (iSmallestDifferenceLanes [0]);
+    for (int iLane = 1; iLane < numberOfLanes; iLane++)
+    {
+
+        if ( smallestDifferenceLanes [iLane] < smallestDifferenceABS || 
+             ( smallestDifferenceLanes [iLane] == smallestDifferenceABS && iSmallestDifferenceLanes [iLane] > iSmallestDifference ) )
+        {
+
+            smallestDifferenceABS = smallestDifferenceLanes [iLane];
+            iSmallestDifference = static_cast <int> (iSmallestDifferenceLanes [iLane]);
+
+        }
+
+    }
+
+    double valueDifferenceABS;
+    for (int iValue = iValueStart; iValue < numberOfValues; iValue++)
+    {
+
+        valueDifferenceABS = std::fabs (dataValues [iValue] - valueToCompare);
+        if ( valueDifferenceABS <= smallestDifferenceABS )
+        {
+
+            smallestDifferenceABS = valueDifferenceABS;
+            iSmallestDifference = iValue;
+
+        }
+
+    }
+
+    return iSmallestDifference;
+
+}
+
+
+
+__attribute__ ((target ("sse2")))
+static double getSumOfValuesSSE2 (const double dataValues [], int numberOfValues)
+{
+
+    __m128d sumOfValues0 = _mm_setzero_pd (), sumOfValues1 = _mm_setzero_pd (), sumOfValues2 = _mm_setzero_pd (), sumOfValues3 = _mm_setzero_pd ();
+    int iValue = 0;
+    for (; iValue + 8 <= numberOfValues; iValue += 8)
+    {
+
+        sumOfValues0 = _mm_add_pd ( sumOfValues0, _mm_loadu_pd (dataValues + iValue) );
+        sumOfValues1 = _mm_add_pd ( sumOfValues1, _mm_loadu_pd (dataValues + iValue + 2) );
+        sumOfValues2 = _mm_add_pd ( sumOfValues2, _mm_loadu_pd (dataValues + iValue + 4) );
+        sumOfValues3 = _mm_add_pd ( sumOfValues3, _mm_loadu_pd (dataValues + iValue + 6) );
+
+    }
+
+    double sumOfValuesLanes [2];
+    _mm_storeu_pd ( sumOfValuesLanes, _mm_add_pd ( _mm_add_pd (sumOfValues0, sumOfValues1), _mm_add_pd (sumOfValues2, sumOfValues3) ) );
+
+    return sumOfValuesLanes [0] + sumOfValuesLanes [1] + getSumOfValuesScalar (dataValues + iValue, numberOfValues - iValue);
+
+}
+
+
+__attribute__ ((target ("sse2")))
+static double getSumOfSquaredDeviationsSSE2 (const double dataValues [], int numberOfValues, double averageValue)
+{
+
+    const __m128d average = _mm_set1_pd (averageValue);
+    __m128d sumOfSquaredDeviations0 = _mm_setzero_pd (), sumOfSquaredDeviations1 = _mm_setzero_pd ();
+    __m128d deviation0, deviation1;
+    int iValue = 0;
+    for (; iValue + 4 <= numberOfValues; iValue += 4)
+    {
+
+        deviation0 = _mm_sub_pd ( _mm_loadu_pd (dataValues + iValue), average );
+        deviation1 = _mm_sub_pd ( _mm_loadu_pd (dataValues + iValue + 2), average );
+        sumOfSquaredDeviations0 = _mm_add_pd ( sumOfSquaredDeviations0, _mm_mul_pd (deviation0, deviation0) );
+        sumOfSquaredDeviations1 = _mm_add_pd ( sumOfSquaredDeviations1, _mm_mul_pd (deviation1, deviation1) );
+
+    }
+
+    double sumOfSquaredDeviationsLanes [2];
+    _mm_storeu_pd ( sumOfSquaredDeviationsLanes, _mm_add_pd (sumOfSquaredDeviations0, sumOfSquaredDeviations1) );
+
+    return sumOfSquaredDeviationsLanes [0] + sumOfSquaredDeviationsLanes [1] + 
+           getSumOfSquaredDeviationsScalar (dataValues + iValue, numberOfValues - iValue, averageValue);
+
+}
+
+
+__attribute__ ((target ("sse2")))
+static int getNearestValueIndexSSE2 (const double dataValues [], int numberOfValues, double valueToCompare)
+{
+
+    const __m128d signBit = _mm_set1_pd (-0.);
+    const __m128d compare = _mm_set1_pd (valueToCompare);
+    const __m128d indexStep = _mm_set1_pd (2.);
+    __m128d smallestDifference = _mm_set1_pd ( std::fabs (dataValues [0] - valueToCompare) );
+    __m128d iSmallestDifference = _mm_setzero_pd ();
+    __m128d indices = _mm_set_pd (2., 1.);
+    __m128d valueDifference, isSmaller;
+
+    int iValue = 1;
+    for (; iValue + 2 <= numberOfValues; iValue += 2)
+    {
+
+        valueDifference = _mm_andnot_pd ( signBit, _mm_sub_pd (_mm_loadu_pd (dataValues + iValue), compare) );
+        isSmaller = _mm_cmple_pd (valueDifference, smallestDifference);
+
+        // SSE2 has no blend instruction: select with and / andnot / or.
+        smallestDifference = _mm_or_pd ( _mm_and_pd (isSmaller, valueDifference), _mm_andnot_pd (isSmaller, smallestDifference) );
+        iSmallestDifference = _mm_or_pd ( _mm_and_pd (isSmaller, indices), _mm_andnot_pd (isSmaller, iSmallestDifference) );
+        indices = _mm_add_pd (indices, indexStep);
+
+    }
+
+    double smallestDifferenceLanes [2], iSmallestDifferenceLanes [2];
+    _mm_storeu_pd (smallestDifferenceLanes, smallestDifference);
+    _mm_storeu_pd (iSmallestDifferenceLanes, iSmallestDifference);
+
+    return getNearestValueIndexFromLanes (smallestDifferenceLanes, iSmallestDifferenceLanes, 2, dataValues, iValue, numberOfValues, valueToCompare);
+
+}
+
+
+
+__attribute__ ((target ("avx2")))
+static double getSumOfValuesAVX2 (const double dataValues [], int numberOfValues)
+{
+
+    __m256d sumOfValues0 = _mm256_setzero_pd (), sumOfValues1 = _mm256_setzero_pd (), sumOfValues2 = _mm256_setzero_pd (), sumOfValues3 = _mm256_setzero_pd ();
+    int iValue = 0;
+    for (; iValue + 16 <= numberOfValues; iValue += 16)
+    {
+
+        sumOfValues0 = _mm256_add_pd ( sumOfValues0, _mm256_loadu_pd (dataValues + iValue) );
+        sumOfValues1 = _mm256_add_pd ( sumOfValues1, _mm256_loadu_pd (dataValues + iValue + 4) );
+        sumOfValues2 = _mm256_add_pd ( sumOfValues2, _mm256_loadu_pd (dataValues + iValue + 8) );
+        sumOfValues3 = _mm256_add_pd ( sumOfValues3, _mm256_loadu_pd (dataValues + iValue + 12) );
+
+    }
+
+    double sumOfValuesLanes [4];
+    _mm256_storeu_pd ( sumOfValuesLanes, _mm256_add_pd ( _mm256_add_pd (sumOfValues0, sumOfValues1), _mm256_add_pd (sumOfValues2, sumOfValues3) ) );
+
+    return ( sumOfValuesLanes [0] + sumOfValuesLanes [1] ) + ( sumOfValuesLanes [2] + sumOfValuesLanes [3] ) + 
+           getSumOfValuesScalar (dataValues + iValue, numberOfValues - iValue);
+
+}
+
+
+__attribute__ ((target ("avx2")))
+static double getSumOfSquaredDeviationsAVX2 (const double dataValues [], int numberOfValues, double averageValue)
+{
+
+    const __m256d average = _mm256_set1_pd (averageValue);
+    __m256d sumOfSquaredDeviations0 = _mm256_setzero_pd (), sumOfSquaredDeviations1 = _mm256_setzero_pd ();
+    __m256d sumOfSquaredDeviations2 = _mm256_setzero_pd (), sumOfSquaredDeviations3 = _mm256_setzero_pd ();
+    __m256d deviation0, deviation1, deviation2, deviation3;
+    int iValue = 0;
+    for (; iValue + 16 <= numberOfValues; iValue += 16)
+    {
+
+        deviation0 = _mm256_sub_pd ( _mm256_loadu_pd (dataValues + iValue), average );
+        deviation1 = _mm256_sub_pd ( _mm256_loadu_pd (dataValues + iValue + 4), average );
+        deviation2 = _mm256_sub_pd ( _mm256_loadu_pd (dataValues + iValue + 8), average );
+        deviation3 = _mm256_sub_pd ( _mm256_loadu_pd (dataValues + iValue + 12), average );
+        sumOfSquaredDeviations0 = _mm256_add_pd ( sumOfSquaredDeviations0, _mm256_mul_pd (deviation0, deviation0) );
+        sumOfSquaredDeviations1 = _mm256_add_pd ( sumOfSquaredDeviations1, _mm256_mul_pd (deviation1, deviation1) );
+        sumOfSquaredDeviations2 = _mm256_add_pd ( sumOfSquaredDeviations2, _mm256_mul_pd (deviation2, deviation2) );
+        sumOfSquaredDeviations3 = _mm256_add_pd ( sumOfSquaredDeviations3, _mm256_mul_pd (deviation3, deviation3) );
+
+    }
+
+    double sumOfSquaredDeviationsLanes [4];
+    _mm256_storeu_pd ( sumOfSquaredDeviationsLanes, 
+                       _mm256_add_pd ( _mm256_add_pd (sumOfSquaredDeviations0, sumOfSquaredDeviations1), _mm256_add_pd (sumOfSquaredDeviations2, sumOfSquaredDeviations3) ) );
+
+    return ( sumOfSquaredDeviationsLanes [0] + sumOfSquaredDeviationsLanes [1] ) + ( sumOfSquaredDeviationsLanes [2] + sumOfSquaredDeviationsLanes [3] ) + 
+           getSumOfSquaredDeviationsScalar (dataValues + iValue, numberOfValues - iValue, averageValue);
+
+}
+
+
+__attribute__ ((target ("avx2")))
+static int getNearestValueIndexAVX2 (const double dataValues [], int numberOfValues, double valueToCompare)
+{
+
+    const __m256d signBit = _mm256_set1_pd (-0.);
+    const __m256d compare = _mm256_set1_pd (valueToCompare);
+    const __m256d indexStep = _mm256_set1_pd (4.);
+    __m256d smallestDifference = _mm256_set1_pd ( std::fabs (dataValues [0] - valueToCompare) );
+    __m256d iSmallestDifference = _mm256_setzero_pd ();
+    __m256d indices = _mm256_set_pd (4., 3., 2., 1.);
+    __m256d valueDifference, isSmaller;
+
+    int iValue = 1;
+    for (; iValue + 4 <= numberOfValues; iValue += 4)
+    {
+
+        valueDifference = _mm256_andnot_pd ( signBit, _mm256_sub_pd (_mm256_loadu_pd (dataValues + iValue), compare) );
+        isSmaller = _mm256_cmp_pd (valueDifference, smallestDifference, _CMP_LE_OQ);
+        smallestDifference = _mm256_blendv_pd (smallestDifference, valueDifference, isSmaller);
+        iSmallestDifference = _mm256_blendv_pd (iSmallestDifference, indices, isSmaller);
+        indices = _mm256_add_pd (indices, indexStep);
+
+    }
+
+    double smallestDifferenceLanes [4], iSmallestDifferenceLanes [4];
+    _mm256_storeu_pd (smallestDifferenceLanes, smallestDifference);
+    _mm256_storeu_pd (iSmallestDifferenceLanes, iSmallestDifference);
+
+    return getNearestValueIndexFromLanes (smallestDifferenceLanes, iSmallestDifferenceLanes, 4, dataValues, iValue, numberOfValues, valueToCompare);
+
+}
+
+
+
+__attribute__ ((target ("avx512f")))
+static double getSumOfValuesAVX512 (const double dataValues [], int numberOfValues)
+{
+
+    __m512d sumOfValues0 = _mm512_setzero_pd (), sumOfValues1 = _mm512_setzero_pd (), sumOfValues2 = _mm512_setzero_pd (), sumOfValues3 = _mm512_setzero_pd ();
+    int iValue = 0;
+    for (; iValue + 32 <= numberOfValues; iValue += 32)
+    {
+
+        sumOfValues0 = _mm512_add_pd ( sumOfValues0, _mm512_loadu_pd (dataValues + iValue) );
+        sumOfValues1 = _mm512_add_pd ( sumOfValues1, _mm512_loadu_pd (dataValues + iValue + 8) );
+        sumOfValues2 = _mm512_add_pd ( sumOfValues2, _mm512_loadu_pd (dataValues + iValue + 16) );
+        sumOfValues3 = _mm512_add_pd ( sumOfValues3, _mm512_loadu_pd (dataValues + iValue + 24) );
+
+    }
+
+    double sumOfValuesLanes [8];
+    _mm512_storeu_pd ( sumOfValuesLanes, _mm512_add_pd ( _mm512_add_pd (sumOfValues0, sumOfValues1), _mm512_add_pd (sumOfValues2, sumOfValues3) ) );
+
+    return getSumOfValuesScalar (sumOfValuesLanes, 8) + getSumOfValuesScalar (dataValues + iValue, numberOfValues - iValue);
+
+}
+
+
+__attribute__ ((target ("avx512f")))
+static double getSumOfSquaredDeviationsAVX512 (const double dataValues [], int numberOfValues, double averageValue)
+{
+
+    const __m512d average = _mm512_set1_pd (averageValue);
+    __m512d sumOfSquaredDeviations0 = _mm512_setzero_pd (), sumOfSquaredDeviations1 = _mm512_setzero_pd ();
+    __m512d sumOfSquaredDeviations2 = _mm512_setzero_pd (), sumOfSquaredDeviations3 = _mm512_setzero_pd ();
+    __m512d deviation0, deviation1, deviation2, deviation3;
+    int iValue = 0;
+    for (; iValue + 32 <= numberOfValues; iValue += 32)
+    {
+
+        deviation0 = _mm512_sub_pd ( _mm512_loadu_pd (dataValues + iValue), average );
+        deviation1 = _mm512_sub_pd ( _mm512_loadu_pd (dataValues + iValue + 8), average );
+        deviation2 = _mm512_sub_pd ( _mm512_loadu_pd (dataValues + iValue + 16), average );
+        deviation3 = _mm512_sub_pd ( _mm512_loadu_pd (dataValues + iValue + 24), average );
+        sumOfSquaredDeviations0 = _mm512_add_pd ( sumOfSquaredDeviations0, _mm512_mul_pd (deviation0, deviation0) );
+        sumOfSquaredDeviations1 = _mm512_add_pd ( sumOfSquaredDeviations1, _mm512_mul_pd (deviation1, deviation1) );
+        sumOfSquaredDeviations2 = _mm512_add_pd ( sumOfSquaredDeviations2, _mm512_mul_pd (deviation2, deviation2) );
+        sumOfSquaredDeviations3 = _mm512_add_pd ( sumOfSquaredDeviations3, _mm512_mul_pd (deviation3, deviation3) );
+
+    }
+
+    double sumOfSquaredDeviationsLanes [8];
+    _mm512_storeu_pd ( sumOfSquaredDeviationsLanes, 
+                       _mm512_add_pd ( _mm512_add_pd (sumOfSquaredDeviations0, sumOfSquaredDeviations1), _mm512_add_pd (sumOfSquaredDeviations2, sumOfSquaredDeviations3) ) );
+
+    return getSumOfValuesScalar (sumOfSquaredDeviationsLanes, 8) + 
+           getSumOfSquaredDeviationsScalar (dataValues + iValue, numberOfValues - iValue, averageValue);
+
+}
+
+
+__attribute__ ((target ("avx512f")))
+static int getNearestValueIndexAVX512 (const double dataValues [], int numberOfValues, double valueToCompare)
+{
+
+    const __m512d compare = _mm512_set1_pd (valueToCompare);
+    const __m512d indexStep = _mm512_set1_pd (8.);
+    __m512d smallestDifference = _mm512_set1_pd ( std::fabs (dataValues [0] - valueToCompare) );
+    __m512d iSmallestDifference = _mm512_setzero_pd ();
+    __m512d indices = _mm512_set_pd (8., 7., 6., 5., 4., 3., 2., 1.);
+    __m512d valueDifference;
+    __mmask8 isSmaller;
+
+    int iValue = 1;
+    for (; iValue + 8 <= numberOfValues; iValue += 8)
+    {
+
+        valueDifference = _mm512_abs_pd ( _mm512_sub_pd (_mm512_loadu_pd (dataValues + iValue), compare) );
+        isSmaller = _mm512_cmp_pd_mask (valueDifference, smallestDifference, _CMP_LE_OQ);
+        smallestDifference = _mm512_mask_blend_pd (isSmaller, smallestDifference, valueDifference);
+        iSmallestDifference = _mm512_mask_blend_pd (isSmaller, iSmallestDifference, indices);
+        indices = _mm512_add_pd (indices, indexStep);
+
+    }
+
+    double smallestDifferenceLanes [8], iSmallestDifferenceLanes [8];
+    _mm512_storeu_pd (smallestDifferenceLanes, smallestDifference);
+    _mm512_storeu_pd (iSmallestDifferenceLanes, iSmallestDifference);
+
+    return getNearestValueIndexFromLanes (smallestDifferenceLanes, iSmallestDifferenceLanes, 8, dataValues, iValue, numberOfValues, valueToCompare);
+
+}
+
+#endif
+
+
+
+// Choose the kernel variant for the instruction set level of the processor, the scalar kernel if the data values are not contiguous.
+static double getSumOfValues (const double dataValues [], int numberOfValues, long long dataValuesStride)
+{
+
+#if SIMD_X86_KERNELS
+
+    if (dataValuesStride == 1 && simdLevelDataWrangling >= SIMD_AVX512)
+
+        return getSumOfValuesAVX512 (dataValues, numberOfValues);
+
+    if (dataValuesStride == 1 && simdLevelDataWrangling >= SIMD_AVX2)
+
+        return getSumOfValuesAVX2 (dataValues, numberOfValues);
+
+    if (dataValuesStride == 1 && simdLevelDataWrangling >= SIMD_SSE2)
+
+        return getSumOfValuesSSE2 (dataValues, numberOfValues);
+
+#endif
+
+    return getSumOfValuesScalar (dataValues, numberOfValues, dataValuesStride);
+
+}
+
+
+static double getSumOfSquaredDeviations (const double dataValues [], int numberOfValues, double averageValue, long long dataValuesStride)
+{
+
+#if SIMD_X86_KERNELS
+
+    if (dataValuesStride == 1 && simdLevelDataWrangling >= SIMD_AVX512)
+
+        return getSumOfSquaredDeviationsAVX512 (dataValues, numberOfValues, averageValue);
+
+    if (dataValuesStride == 1 && simdLevelDataWrangling >= SIMD_AVX2)
+
+        return getSumOfSquaredDeviationsAVX2 (dataValues, numberOfValues, averageValue);
+
+    if (dataValuesStride == 1 && simdLevelDataWrangling >= SIMD_SSE2)
+
+        return getSumOfSquaredDeviationsSSE2 (dataValues, numberOfValues, averageValue);
+
+#endif
+
+    return getSumOfSquaredDeviationsScalar (dataValues, numberOfValues, averageValue, dataValuesStride);
+
+}
+
+
+static int getNearestValueIndex (const double dataValues [], int numberOfValues, double valueToCompare, long long dataValuesStride)
+{
+
+#if SIMD_X86_KERNELS
+
+    if (dataValuesStride == 1 && simdLevelDataWrangling >= SIMD_AVX512)
+
+        return getNearestValueIndexAVX512 (dataValues, numberOfValues, valueToCompare);
+
+    if (dataValuesStride == 1 && simdLevelDataWrangling >= SIMD_AVX2)
+
+        return getNearestValueIndexAVX2 (dataValues, numberOfValues, valueToCompare);
+
+    if (dataValuesStride == 1 && simdLevelDataWrangling >= SIMD_SSE2)
+
+        return getNearestValueIndexSSE2 (dataValues, numberOfValues, valueToCompare);
+
+#endif
+
+    return getNearestValueIndexScalar (dataValues, numberOfValues, valueToCompare, dataValuesStride);
+
+}
 
 
 
@@ -16,8 +509,28 @@ DataWranglingToolsCPPCore::DataWranglingToolsCPPCore () {}
 DataWranglingToolsCPPCore::~DataWranglingToolsCPPCore () {};
 
 
+// The instruction set level of the kernels that are being used.
+int DataWranglingToolsCPPCore::getSIMDLevel ()
+{
+
+    return simdLevelDataWrangling;
+
+}
+
+
+// Select the instruction set level of the kernels (for example to compare their speed): it cannot be higher than the level supported by the processor.
+int DataWranglingToolsCPPCore::setSIMDLevel (int requestedSIMDLevel)
+{
+
+    simdLevelDataWrangling = std::max ( static_cast <int> (SIMD_SCALAR), std::min (requestedSIMDLevel, simdLevelDetectedDataWrangling) );
+
+    return simdLevelDataWrangling;
+
+}
+
+
 void DataWranglingToolsCPPCore::getSegmentSpecsFromDataValues ( 
-    float dataValues [1], //1
+    const float dataValues [1], //1
     unsigned int numberOfDataValues, //2
     unsigned int segmentStartIndices [1], //3
     unsigned int& numberOfSegments, //4
@@ -31,7 +544,8 @@ void DataWranglingToolsCPPCore::getSegmentSpecsFromDataValues (
     unsigned int segmentStartIndicesPositive [1], //12
     unsigned int& numberOfSegmentsPositive, //13
     unsigned int& iSteepestPositiveSlopeSegment, //14 
-    unsigned int& iSegmentStartIndicesSteepestPositiveSlope //15
+    unsigned int& iSegmentStartIndicesSteepestPositiveSlope, //15
+    long long dataValuesStride //16
 )                                                        
 {
 
@@ -44,7 +558,7 @@ void DataWranglingToolsCPPCore::getSegmentSpecsFromDataValues (
     numberOfSegmentsPositive = 0;
 
     // Initialise the  segmentAmplitudes  first value with the first difference in  dataValues .
-    segmentAmplitudes [numberOfSegments] = dataValues [1] - dataValues [0];
+    segmentAmplitudes [numberOfSegments] = dataValues [dataValuesStride] - dataValues [0];
         
     segmentStartIndices [numberOfSegments] = 0;
     int numberOfSamplesInSegment = 1;
@@ -63,7 +577,7 @@ void DataWranglingToolsCPPCore::getSegmentSpecsFromDataValues (
     // Go through the  dataValues  list.
     for (unsigned int iSample = 1; iSample < numberOfDataValues - 1; iSample++){
  
-        deltaValue = dataValues [iSample + 1] - dataValues [iSample];
+        deltaValue = dataValues [ (iSample + 1) * dataValuesStride ] - dataValues [iSample * dataValuesStride];
         
         // Determine the closest segment back in time that has a non-zero delta value to compare to the current delta value.
         iSegmentBefore = numberOfSegments;
@@ -194,34 +708,20 @@ void DataWranglingToolsCPPCore::getSegmentSpecsFromDataValues (
 
 
 void DataWranglingToolsCPPCore::getAverageVarAndSD (
-    double dataValues [1], //1
+    const double dataValues [1], //1
     int numberOfValues, //2
     double& averageValue, //3
     double& standardDeviation, //4
-    double& variance //5
+    double& variance, //5
+    long long dataValuesStride //6
 )
 {
     
     // Calculate the average value.
-    double sumOfDataValues = 0.;
-    for (int iValue = 0; iValue < numberOfValues; iValue++)
-      
-        sumOfDataValues += dataValues [iValue];
-    
-    averageValue = sumOfDataValues / numberOfValues;
+    averageValue = getSumOfValues (dataValues, numberOfValues, dataValuesStride) / numberOfValues;
 
     // Calculate the variance and the standard deviation.
-    sumOfDataValues = 0.;
-    double differenceSquared;
-    for (int iValue = 0; iValue < numberOfValues; iValue++)
-    {
-    
-        differenceSquared = dataValues [iValue] - averageValue;
-        sumOfDataValues += differenceSquared * differenceSquared;
-    
-    }
-            
-    variance = sumOfDataValues / numberOfValues;
+    variance = getSumOfSquaredDeviations (dataValues, numberOfValues, averageValue, dataValuesStride) / numberOfValues;
     standardDeviation = sqrt (variance);  
 
 }
@@ -229,20 +729,21 @@ void DataWranglingToolsCPPCore::getAverageVarAndSD (
 
 
 void DataWranglingToolsCPPCore::getMedianAndQuantiles (
-    double dataValues [1], //1
+    const double dataValues [1], //1
     int numberOfValues, //2
     double& medianValue, //3
     float lowerQuantile, //4
     double& lowerQuantileValue, //5
     float upperQuantile, //6
-    double& upperQuantileValue //7
+    double& upperQuantileValue, //7
+    long long dataValuesStride //8
 )
 {
  
     std::vector <double> dataValuesSorted (numberOfValues);    
     for (int iValue = 0; iValue < numberOfValues; iValue++)
     
-        dataValuesSorted [iValue] = dataValues [iValue];
+        dataValuesSorted [iValue] = dataValues [iValue * dataValuesStride];
         
 
     std::sort ( dataValuesSorted.begin (), dataValuesSorted.end () );    
@@ -262,19 +763,20 @@ void DataWranglingToolsCPPCore::getMedianAndQuantiles (
 
 
 void DataWranglingToolsCPPCore::getNearestValue (
-    double dataValues [1],
+    const double dataValues [1],
     unsigned int numberOfValues,
     double valueToCompare,
     int& iSmallestDifference,
     double& smallestDifference,
-    int monotonicList
+    int monotonicList,
+    long long dataValuesStride
 )
 {
 
     // Start at the beginning of the list of annotation markers on the electrode that needs to be compared to the valueToCompare.
     int iDAT = 0;
     iSmallestDifference = 0;
-    double smallestDifferenceABS = abs (dataValues [iDAT] - valueToCompare);
+    double smallestDifferenceABS = std::fabs (dataValues [iDAT] - valueToCompare);
     double valueDifferenceABS = 0;
         
     // If the list of dataValues is strictly monotonic, then the search can be stopped once the smallest difference has been found.
@@ -282,7 +784,7 @@ void DataWranglingToolsCPPCore::getNearestValue (
     {
 
         iDAT++;
-        valueDifferenceABS = abs (dataValues [iDAT] - valueToCompare);
+        valueDifferenceABS = std::fabs (dataValues [iDAT * dataValuesStride] - valueToCompare);
 
         // The list of values to compare has to be monotonically increasing, then as soon as the closest value has been found, stop the search.
         //  When there are two or more the same values in the monotonical list, and this value is the nearest to the value to compare, then 
@@ -300,7 +802,7 @@ void DataWranglingToolsCPPCore::getNearestValue (
               // Calculate the next difference if possible.          
               if ( iDAT < numberOfValues )
                   
-                  valueDifferenceABS = abs (dataValues [iDAT] - valueToCompare);
+                  valueDifferenceABS = std::fabs (dataValues [iDAT * dataValuesStride] - valueToCompare);
     
         }
         
@@ -310,32 +812,18 @@ void DataWranglingToolsCPPCore::getNearestValue (
     else 
     {
     
-        // The list of values to compare has to be monotonically increasing, then as soon as the closest value has been found, stop the search.
-        for ( iDAT = 1; iDAT < numberOfValues; iDAT++ )
-        {
-    
-              valueDifferenceABS = abs (dataValues [iDAT] - valueToCompare);
-              
-              // A new smallest value difference has been found.
-              if ( valueDifferenceABS <= smallestDifferenceABS )
-              {                                
-
-                  smallestDifferenceABS = valueDifferenceABS;
-                  iSmallestDifference = iDAT;
-
-              }    
-        }
+        iSmallestDifference = getNearestValueIndex (dataValues, numberOfValues, valueToCompare, dataValuesStride);
     
     };
     
     // Calculate the smallest difference in relative terms: a negative value means that the nearest value in the list is smaller than the value to compare.    
-    smallestDifference = dataValues [iSmallestDifference] - valueToCompare;
+    smallestDifference = dataValues [iSmallestDifference * dataValuesStride] - valueToCompare;
 
 }
 
 
 double DataWranglingToolsCPPCore::getQuantileValue (
-    std::vector <double> dataValuesSorted,
+    const std::vector <double>& dataValuesSorted,
     int numberOfValues,
     float quantile
 )
@@ -8,9 +8,12 @@ class DataWranglingToolsCPPCore {
     
         DataWranglingToolsCPPCore ();
         ~DataWranglingToolsCPPCore ();
+
+        int getSIMDLevel ();
+        int setSIMDLevel (int requestedSIMDLevel);
         
         void getSegmentSpecsFromDataValues ( 
-            float dataValues [1], //1
+            const float dataValues [1], //1
             unsigned int numberOfDataValues, //2                          
             unsigned int segmentStartIndices [1], //3
             unsigned int& numberOfSegments, //4
@@ -24,37 +27,41 @@ class DataWranglingToolsCPPCore {
             unsigned int segmentStartIndicesPositive [1], //12
             unsigned int& numberOfSegmentsPositive, //13
             unsigned int& iSteepestPositiveSlopeSegment, //14
-            unsigned int& iSegmentStartIndicesSteepestPositiveSlope //15
+            unsigned int& iSegmentStartIndicesSteepestPositiveSlope, //15
+            long long dataValuesStride //16
         );
 
 
         void getAverageVarAndSD (
-            double dataValues [1], //1
+            const double dataValues [1], //1
             int numberOfValues, //2
             double& averageValue, //3
             double& standardDeviation, //4
-            double& variance //5
+            double& variance, //5
+            long long dataValuesStride //6
         );
 
 
         void getMedianAndQuantiles (
-            double dataValues [1], //1
+            const double dataValues [1], //1
             int numberOfValues, //2
             double& medianValue, //3
             float lowerQuantile, //4
             double& lowerQuantileValue, //5
             float upperQuantile, //6
-            double& upperQuantileValue //7
+            double& upperQuantileValue, //7
+            long long dataValuesStride //8
         );
 
 
         void getNearestValue (
-            double dataValues [1], //1
+            const double dataValues [1], //1
             unsigned int numberOfValues, //2
             double valueToCompare, //3
             int& iSmallestDifference, //4
             double& smallestDifference, //5   
-            int monotonicList //6      
+            int monotonicList, //6      
+            long long dataValuesStride //7
         );
 
 
@@ -62,7 +69,7 @@ class DataWranglingToolsCPPCore {
     private:
 
         double getQuantileValue (
-            std::vector <double> dataValuesSorted,
+            const std::vector <double>& dataValuesSorted,
             int numberOfValues,
             float quantile
         );
@@ -8,14 +8,18 @@ cdef extern from "DataWranglingToolsCPPCore.cpp":
     pass
 
 
-cdef extern from "DataWranglingToolsCPPCore.h":
+# The C++ core functions do not touch any Python objects, so they can run without holding the GIL.
+cdef extern from "DataWranglingToolsCPPCore.h" nogil:
 
     cdef cppclass DataWranglingToolsCPPCore:
     
         DataWranglingToolsCPPCore () except+
+
+        int getSIMDLevel ()
+        int setSIMDLevel (int)
     
         void getSegmentSpecsFromDataValues ( 
-            float *, #1 short dataValues [1]
+            const float *, #1 short dataValues [1]
             unsigned int, #2 unsigned int numberOfDataValues
             unsigned int *, #3 unsigned int segmentStartIndices [1]
             unsigned int&, #4 unsigned int& numberOfSegments
@@ -29,50 +33,104 @@ cdef extern from "DataWranglingToolsCPPCore.h":
             unsigned int *, #12 unsigned int segmentStartIndicesPositive [1]
             unsigned int&, #13 unsigned int& numberOfSegmentsPositive
             unsigned int&, #14 unsigned int& iSteepestPositiveSlopeSegment
-            unsigned int& #15 unsigned int& iSegmentStartIndicesSteepestPositiveSlope
+            unsigned int&, #15 unsigned int& iSegmentStartIndicesSteepestPositiveSlope
+            long long #16 long long dataValuesStride
         )
 
         void getAverageVarAndSD (
-            double *, #1 double dataValues [1]
+            const double *, #1 double dataValues [1]
             int, #2 int numberOfValues
             double&, #3 double& averageValue
             double&, #4 double& standardDeviation
-            double& #5 double& variance
+            double&, #5 double& variance
+            long long #6 long long dataValuesStride
         )
 
 
         void getMedianAndQuantiles (
-            double *, #1 double dataValues [1]
+            const double *, #1 double dataValues [1]
             int, #2 int numberOfValues
             double&, #3 double& medianValue
             float, #4 float lowerQuantile
             double&, #5 double& lowerQuantileValue
             float, #6 float upperQuantile
-            double& #7 double& upperQuantileValue
+            double&, #7 double& upperQuantileValue
+            long long #8 long long dataValuesStride
         )
 
 
         void getNearestValue (
-            double *, #1 float dataValues [1]
+            const double *, #1 float dataValues [1]
             unsigned int, #2 unsigned int numberOfValues
             double, #3 float valueToCompare
             int&, #4 unsigned int& iSmallestDifference
             double&, #5 float& smallestDifference
-            int #6 int monotonicList
+            int, #6 int monotonicList
+            long long #7 long long dataValuesStride
             
         )
 
 
 
-cdef DataWranglingToolsCPPCore DataWranglingToolsCPPCoreObject
+# The DataWranglingToolsCPPCore class has no member variables: each wrapper creates its own (stack) object, 
+#  so that calls from different threads never share any state.
+
+
+
+# The data values and the output arrays are handled in the same way by both Python to C++ libraries.
+include "DataToolsPYtoCPPArrays.pxi"
+
 
 
-def getSegmentSpecsFromDataValuesPYtoCPP (dataValues):
+def getSIMDLevelPYtoCPP ():
+    '''
+    
+    returns:
+    
+        the instruction set level of the C++ kernels in use: 0 scalar, 1 SSE2, 2 AVX2, 3 AVX-512
+        (selected when the module is imported, from what the processor supports)
+    
+    '''
+
+    cdef DataWranglingToolsCPPCore DataWranglingToolsCPPCoreObject
+
+    return DataWranglingToolsCPPCoreObject.getSIMDLevel ()
+
+
+
+def setSIMDLevelPYtoCPP (simdLevel):
+    '''
+    
+    simdLevel:
+    
+        the instruction set level of the C++ kernels: 0 scalar, 1 SSE2, 2 AVX2, 3 AVX-512,
+        it is capped at the level supported by the processor
+    
+    returns:
+    
+        the instruction set level that is used from now on
+    
+    '''
+
+    cdef DataWranglingToolsCPPCore DataWranglingToolsCPPCoreObject
+
+    return DataWranglingToolsCPPCoreObject.setSIMDLevel (simdLevel)
+
+
+
+def getSegmentSpecsFromDataValuesPYtoCPP (dataValues, workspace = None):
     '''
     
     dataValues: 
     
-        converted to a short (np.short / int16)
+        converted to a float (np.single), only copied if it has another data type
+
+    workspace:
+
+        a dictionary with the arrays in which the results are stored, so that these can be reused for the next call, default None (new arrays):
+        'segmentStartIndices', 'segmentDurations', 'segmentStartIndicesNegative' and 'segmentStartIndicesPositive' (np.uintc), 
+        'segmentAmplitudes' and 'segmentSlopes' (np.single), each with at least as many values as the dataValues.
+        The arrays that are returned are parts of these arrays, so they are overwritten by the next call with the same workspace.
 
     
     returns tuple:
@@ -93,22 +151,12 @@ def getSegmentSpecsFromDataValuesPYtoCPP (dataValues):
     
     '''
 
-    global DataWranglingToolsCPPCoreObject
+    cdef DataWranglingToolsCPPCore DataWranglingToolsCPPCoreObject
 
-    # Make sure the dataValues list is a NumPy array.
-    if type (dataValues) == list or dataValues.dtype != 'single':
-    
-        dataValues = np.asarray (dataValues, dtype = np.single)
-
-
-    # Make sure the array is stored contiguously.
-    if not dataValues.flags ['C_CONTIGUOUS']:
-    
-        dataValues = np.ascontiguousarray (dataValues)
-    
-    
-    cdef Py_ssize_t numberOfDataValues = dataValues.shape [0]
-    cdef float [::1] dataValues_view = dataValues
+    # Get the data values without copying them, if possible.
+    cdef const float [:] dataValues_view = getDataValuesWithoutCopy (dataValues, np.single)
+    cdef Py_ssize_t numberOfDataValues = dataValues_view.shape [0]
+    cdef long long dataValuesStride = dataValues_view.strides [0] // sizeof (float)
 
 
     cdef unsigned int numberOfSegments = 0
@@ -120,48 +168,63 @@ def getSegmentSpecsFromDataValuesPYtoCPP (dataValues):
     cdef unsigned int iSegmentStartIndicesSteepestPositiveSlope = 0
     
 
-    # Initialise the arrays to the length of the the  dataValues  array.
+    # Initialise the arrays to the length of the the  dataValues  array, or use the arrays of the workspace.
+    if workspace is None:
+
+        workspace = {}
+
+    functionName = 'DataWranglingToolsPYtoCPP.getSegmentSpecsFromDataValuesPYtoCPP'
     
     # It is extremely important that the  segmentAmplitudes  array has the type np.int32 (which is int in C++)! 
     #  This is because the amplitudes are differences in the dataValues, which are of type short (-32768 - +32767), 
     #  hence the maximum difference can be + or -65535 !!!
-    segmentAmplitudes = np.ascontiguousarray ( np.zeros (numberOfDataValues, dtype = np.single) )
+    segmentAmplitudes = getOutputArray ( workspace.get ('segmentAmplitudes'), numberOfDataValues, np.single, functionName, exactLength = False )
     cdef float [::1] segmentAmplitudes_view = segmentAmplitudes
 
-    segmentSlopes = np.ascontiguousarray ( np.zeros (numberOfDataValues, dtype = np.single) )
+    segmentSlopes = getOutputArray ( workspace.get ('segmentSlopes'), numberOfDataValues, np.single, functionName, exactLength = False )
     cdef float [::1] segmentSlopes_view = segmentSlopes
 
-    segmentDurations = np.ascontiguousarray ( np.zeros (numberOfDataValues, dtype = np.uintc) )
+    segmentDurations = getOutputArray ( workspace.get ('segmentDurations'), numberOfDataValues, np.uintc, functionName, exactLength = False )
     cdef unsigned int [::1] segmentDurations_view = segmentDurations
 
-    segmentStartIndices = np.ascontiguousarray ( np.zeros (numberOfDataValues, dtype = np.uintc ) )
+    segmentStartIndices = getOutputArray ( workspace.get ('segmentStartIndices'), numberOfDataValues, np.uintc, functionName, exactLength = False )
     cdef unsigned int [::1] segmentStartIndices_view = segmentStartIndices
     
-    segmentStartIndicesNegative = np.ascontiguousarray ( np.zeros (numberOfDataValues, dtype = np.uintc ) )
+    segmentStartIndicesNegative = getOutputArray ( workspace.get ('segmentStartIndicesNegative'), numberOfDataValues, np.uintc, functionName, exactLength = False )
     cdef unsigned int [::1] segmentStartIndicesNegative_view = segmentStartIndicesNegative
     
-    segmentStartIndicesPositive = np.ascontiguousarray ( np.zeros (numberOfDataValues, dtype = np.uintc ) )
+    segmentStartIndicesPositive = getOutputArray ( workspace.get ('segmentStartIndicesPositive'), numberOfDataValues, np.uintc, functionName, exactLength = False )
     cdef unsigned int [::1] segmentStartIndicesPositive_view = segmentStartIndicesPositive
-    
-    
-    # Call the C++ core function.
-    DataWranglingToolsCPPCoreObject.getSegmentSpecsFromDataValues ( 
-        &dataValues_view [0], #1
-        numberOfDataValues, #2
-        &segmentStartIndices_view [0], #3
-        numberOfSegments, #4
-        &segmentAmplitudes_view [0], #5
-        &segmentSlopes_view [0], #6
-        &segmentDurations_view [0], #7
-        &segmentStartIndicesNegative_view [0], #8
-        numberOfSegmentsNegative, #9
-        iSteepestNegativeSlopeSegment, #10
-        iSegmentStartIndicesSteepestNegativeSlope, #11
-        &segmentStartIndicesPositive_view [0], #12
-        numberOfSegmentsPositive, #13
-        iSteepestPositiveSlopeSegment, #14
-        iSegmentStartIndicesSteepestPositiveSlope #15
-    )
+
+    # The last value of the negative and positive start indices that is returned is not always set by the C++ core function (it is then 0): 
+    #  set these to zero, in case they hold the results of a previous call.
+    if workspace:
+
+        segmentStartIndicesNegative [:numberOfDataValues] = 0
+        segmentStartIndicesPositive [:numberOfDataValues] = 0
+    
+    
+    # Call the C++ core function, without holding the GIL.
+    with nogil:
+
+        DataWranglingToolsCPPCoreObject.getSegmentSpecsFromDataValues ( 
+            &dataValues_view [0], #1
+            numberOfDataValues, #2
+            &segmentStartIndices_view [0], #3
+            numberOfSegments, #4
+            &segmentAmplitudes_view [0], #5
+            &segmentSlopes_view [0], #6
+            &segmentDurations_view [0], #7
+            &segmentStartIndicesNegative_view [0], #8
+            numberOfSegmentsNegative, #9
+            iSteepestNegativeSlopeSegment, #10
+            iSegmentStartIndicesSteepestNegativeSlope, #11
+            &segmentStartIndicesPositive_view [0], #12
+            numberOfSegmentsPositive, #13
+            iSteepestPositiveSlopeSegment, #14
+            iSegmentStartIndicesSteepestPositiveSlope, #15
+            dataValuesStride #16
+        )
 
 
     return numberOfSegments, \
@@ -186,7 +249,7 @@ def getAverageVarAndSDPYtoCPP (dataValues):
     
     dataValues: 
     
-        converted to a double
+        converted to a double, only copied if it has another data type
 
     
     returns tuple:
@@ -197,40 +260,30 @@ def getAverageVarAndSDPYtoCPP (dataValues):
     
     '''
     
-    global DataWranglingToolsCPPCoreObject
+    cdef DataWranglingToolsCPPCore DataWranglingToolsCPPCoreObject
 
     
-    # Make sure the dataValues list is a NumPy array.
-    if type (dataValues) == list:
-    
-        dataValues = np.asarray (dataValues, dtype = np.double)
-
-    else:
-    
-        dataValues = np.ascontiguousarray (dataValues, dtype = np.double)       
-
-
-#     # Make sure the array is stored contiguously.
-#     if not dataValues.flags ['C_CONTIGUOUS']:
-    
-#         dataValues = np.ascontiguousarray (dataValues)
-    
-    
-    cdef Py_ssize_t numberOfDataValues = dataValues.shape [0]
-    cdef double [::1] dataValues_view = dataValues
+    # Get the data values without copying them, if possible.
+    cdef const double [:] dataValues_view = getDataValuesWithoutCopy (dataValues, np.double)
+    cdef Py_ssize_t numberOfDataValues = dataValues_view.shape [0]
+    cdef long long dataValuesStride = dataValues_view.strides [0] // sizeof (double)
     
     cdef double averageValue = 0.
     cdef double standardDeviation = 0.
     cdef double variance = 0.
     
     
-    DataWranglingToolsCPPCoreObject.getAverageVarAndSD (
-        &dataValues_view [0], #1
-        numberOfDataValues, #2
-        averageValue, #3
-        standardDeviation, #4
-        variance #5
-    )
+    # Call the C++ core function, without holding the GIL.
+    with nogil:
+
+        DataWranglingToolsCPPCoreObject.getAverageVarAndSD (
+            &dataValues_view [0], #1
+            numberOfDataValues, #2
+            averageValue, #3
+            standardDeviation, #4
+            variance, #5
+            dataValuesStride #6
+        )
         
     return averageValue, \
            standardDeviation, \
@@ -246,7 +299,7 @@ def getMedianAndQuantilesPYtoCPP (
     
     dataValues: 
     
-        converted to a double
+        converted to a double, only copied if it has another data type
 
     
     returns tuple:
@@ -257,42 +310,35 @@ def getMedianAndQuantilesPYtoCPP (
     
     '''
     
-    global DataWranglingToolsCPPCoreObject
-
-    
-    # Make sure the dataValues list is a NumPy array.
-    if type (dataValues) == list:
-    
-        dataValues = np.asarray (dataValues, dtype = np.double)
+    cdef DataWranglingToolsCPPCore DataWranglingToolsCPPCoreObject
 
-    else:
-    
-        dataValues = np.ascontiguousarray (dataValues, dtype = np.double)       
-
-
-#     # Make sure the array is stored contiguously.
-#     if not dataValues.flags ['C_CONTIGUOUS']:
-    
-#         dataValues = np.ascontiguousarray (dataValues)
     
-    
-    cdef Py_ssize_t numberOfDataValues = dataValues.shape [0]
-    cdef double [::1] dataValues_view = dataValues
+    # Get the data values without copying them, if possible.
+    cdef const double [:] dataValues_view = getDataValuesWithoutCopy (dataValues, np.double)
+    cdef Py_ssize_t numberOfDataValues = dataValues_view.shape [0]
+    cdef long long dataValuesStride = dataValues_view.strides [0] // sizeof (double)
     
     cdef double medianValue = 0.
     cdef double lowerQuantileValue = 0.
     cdef double upperQuantileValue = 0.
     
         
-    DataWranglingToolsCPPCoreObject.getMedianAndQuantiles (
-        &dataValues_view [0], #1
-        numberOfDataValues, #2
-        medianValue, #3
-        lowerQuantile, #4
-        lowerQuantileValue, #5
-        upperQuantile, #6
-        upperQuantileValue #7
-    )
+    cdef float lowerQuantileFloat = lowerQuantile
+    cdef float upperQuantileFloat = upperQuantile
+
+    # Call the C++ core function, without holding the GIL.
+    with nogil:
+
+        DataWranglingToolsCPPCoreObject.getMedianAndQuantiles (
+            &dataValues_view [0], #1
+            numberOfDataValues, #2
+            medianValue, #3
+            lowerQuantileFloat, #4
+            lowerQuantileValue, #5
+            upperQuantileFloat, #6
+            upperQuantileValue, #7
+            dataValuesStride #8
+        )
 
         
     return medianValue, \
@@ -309,39 +355,38 @@ def getNearestValuePYtoCPP (
 
     dataValues: 
     
-        converted to a double
+        converted to a double, only copied if it has another data type
 
 
     '''
 
-    global DataWranglingToolsCPPCoreObject
+    cdef DataWranglingToolsCPPCore DataWranglingToolsCPPCoreObject
 
     cdef int iSmallestDifference = 0
     cdef double smallestDifference = 0
 
 
-    # Make sure the dataValues list is a NumPy array.
-    if type (dataValues) == list:
-    
-        dataValues = np.asarray (dataValues, dtype = np.double)
-
-    else:
-    
-        dataValues = np.ascontiguousarray (dataValues, dtype = np.double)       
-    
-    
-    cdef Py_ssize_t numberOfValues = dataValues.shape [0]
-    cdef double [::1] dataValues_view = dataValues
+    # Get the data values without copying them, if possible.
+    cdef const double [:] dataValues_view = getDataValuesWithoutCopy (dataValues, np.double)
+    cdef Py_ssize_t numberOfValues = dataValues_view.shape [0]
+    cdef long long dataValuesStride = dataValues_view.strides [0] // sizeof (double)
         
       
-    DataWranglingToolsCPPCoreObject.getNearestValue (
-        &dataValues_view [0], #1
-        numberOfValues, #2
-        valueToCompare, #3
-        iSmallestDifference, #4
-        smallestDifference, #5
-        monotonicList #6
-    )
+    cdef double valueToCompareDouble = valueToCompare
+    cdef int monotonicListInt = monotonicList
+
+    # Call the C++ core function, without holding the GIL.
+    with nogil:
+
+        DataWranglingToolsCPPCoreObject.getNearestValue (
+            &dataValues_view [0], #1
+            numberOfValues, #2
+            valueToCompareDouble, #3
+            iSmallestDifference, #4
+            smallestDifference, #5
+            monotonicListInt, #6
+            dataValuesStride #7
+        )
 
 
     return iSmallestDifference, smallestDifference
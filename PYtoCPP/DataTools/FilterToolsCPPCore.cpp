@@ -1,7 +1,131 @@
 #include <iostream>
 #include <cmath>
 #include <vector>
+#include <algorithm>
 #include "FilterToolsCPPCore.h"
+#include "SIMDDispatchCPPCore.h"
+
+
+
+// The instruction set level of the kernels is determined once, when the module is imported.
+static const int simdLevelDetectedFilter = detectSIMDLevel ();
+static int simdLevelFilter = simdLevelDetectedFilter;
+
+
+
+// The SIMD variants of the filter keep a tile of 4 vectors of filtered values in registers while the window slides over the  listOfNumbers ,
+//  the values within the window are added in the same order as in the scalar filter, so that the results are identical.
+//  Each variant returns the first element it has not filtered: the remaining elements are filtered by the scalar loop.
+#if SIMD_X86_KERNELS
+
+__attribute__ ((target ("sse2")))
+static int passAverageFilterSSE2 (const float listOfNumbers [], float listOfNumbersFiltered [], int iElementStart, int iElementEnd, int widthOfWindow)
+{
+
+    const __m128 numberOfElementsInWindow = _mm_set1_ps ( static_cast <float> (2 * widthOfWindow + 1) );
+    __m128 sumOfWindow0, sumOfWindow1, sumOfWindow2, sumOfWindow3;
+    const float * window;
+
+    int iElement = iElementStart;
+    for (; iElement + 16 <= iElementEnd; iElement += 16)
+    {
+
+        sumOfWindow0 = sumOfWindow1 = sumOfWindow2 = sumOfWindow3 = _mm_setzero_ps ();
+        for (int iWindow = -widthOfWindow; iWindow < widthOfWindow + 1; iWindow++)
+        {
+
+            window = listOfNumbers + iElement + iWindow;
+            sumOfWindow0 = _mm_add_ps ( sumOfWindow0, _mm_loadu_ps (window) );
+            sumOfWindow1 = _mm_add_ps ( sumOfWindow1, _mm_loadu_ps (window + 4) );
+            sumOfWindow2 = _mm_add_ps ( sumOfWindow2, _mm_loadu_ps (window + 8) );
+            sumOfWindow3 = _mm_add_ps ( sumOfWindow3, _mm_loadu_ps (window + 12) );
+
+        }
+
+        _mm_storeu_ps ( listOfNumbersFiltered + iElement, _mm_div_ps (sumOfWindow0, numberOfElementsInWindow) );
+        _mm_storeu_ps ( listOfNumbersFiltered + iElement + 4, _mm_div_ps (sumOfWindow1, numberOfElementsInWindow) );
+        _mm_storeu_ps ( listOfNumbersFiltered + iElement + 8, _mm_div_ps (sumOfWindow2, numberOfElementsInWindow) );
+        _mm_storeu_ps ( listOfNumbersFiltered + iElement + 12, _mm_div_ps (sumOfWindow3, numberOfElementsInWindow) );
+
+    }
+
+    return iElement;
+
+}
+
+
+__attribute__ ((target ("avx2")))
+static int passAverageFilterAVX2 (const float listOfNumbers [], float listOfNumbersFiltered [], int iElementStart, int iElementEnd, int widthOfWindow)
+{
+
+    const __m256 numberOfElementsInWindow = _mm256_set1_ps ( static_cast <float> (2 * widthOfWindow + 1) );
+    __m256 sumOfWindow0, sumOfWindow1, sumOfWindow2, sumOfWindow3;
+    const float * window;
+
+    int iElement = iElementStart;
+    for (; iElement + 32 <= iElementEnd; iElement += 32)
+    {
+
+        sumOfWindow0 = sumOfWindow1 = sumOfWindow2 = sumOfWindow3 = _mm256_setzero_ps ();
+        for (int iWindow = -widthOfWindow; iWindow < widthOfWindow + 1; iWindow++)
+        {
+
+            window = listOfNumbers + iElement + iWindow;
+            sumOfWindow0 = _mm256_add_ps ( sumOfWindow0, _mm256_loadu_ps (window) );
+            sumOfWindow1 = _mm256_add_ps ( sumOfWindow1, _mm256_loadu_ps (window + 8) );
+            sumOfWindow2 = _mm256_add_ps ( sumOfWindow2, _mm256_loadu_ps (window + 16) );
+            sumOfWindow3 = _mm256_add_ps ( sumOfWindow3, _mm256_loadu_ps (window + 24) );
+
+        }
+
+        _mm256_storeu_ps ( listOfNumbersFiltered + iElement, _mm256_div_ps (sumOfWindow0, numberOfElementsInWindow) );
+        _mm256_storeu_ps ( listOfNumbersFiltered + iElement + 8, _mm256_div_ps (sumOfWindow1, numberOfElementsInWindow) );
+        _mm256_storeu_ps ( listOfNumbersFiltered + iElement + 16, _mm256_div_ps (sumOfWindow2, numberOfElementsInWindow) );
+        _mm256_storeu_ps ( listOfNumbersFiltered + iElement + 24, _mm256_div_ps (sumOfWindow3, numberOfElementsInWindow) );
+
+    }
+
+    return iElement;
+
+}
+
+
+__attribute__ ((target ("avx512f")))
+static int passAverageFilterAVX512 (const float listOfNumbers [], float listOfNumbersFiltered [], int iElementStart, int iElementEnd, int widthOfWindow)
+{
+
+    const __m512 numberOfElementsInWindow = _mm512_set1_ps ( static_cast <float> (2 * widthOfWindow + 1) );
+    __m512 sumOfWindow0, sumOfWindow1, sumOfWindow2, sumOfWindow3;
+    const float * window;
+
+    int iElement = iElementStart;
+    for (; iElement + 64 <= iElementEnd; iElement += 64)
+    {
+
+        sumOfWindow0 = sumOfWindow1 = sumOfWindow2 = sumOfWindow3 = _mm512_setzero_ps ();
+        for (int iWindow = -widthOfWindow; iWindow < widthOfWindow + 1; iWindow++)
+        {
+
+            window = listOfNumbers + iElement + iWindow;
+            sumOfWindow0 = _mm512_add_ps ( sumOfWindow0, _mm512_loadu_ps (window) );
+            sumOfWindow1 = _mm512_add_ps ( sumOfWindow1, _mm512_loadu_ps (window + 16) );
+            sumOfWindow2 = _mm512_add_ps ( sumOfWindow2, _mm512_loadu_ps (window + 32) );
+            sumOfWindow3 = _mm512_add_ps ( sumOfWindow3, _mm512_loadu_ps (window + 48) );
+
+        }
+
+        _mm512_storeu_ps ( listOfNumbersFiltered + iElement, _mm512_div_ps (sumOfWindow0, numberOfElementsInWindow) );
+        _mm512_storeu_ps ( listOfNumbersFiltered + iElement + 16, _mm512_div_ps (sumOfWindow1, numberOfElementsInWindow) );
+        _mm512_storeu_ps ( listOfNumbersFiltered + iElement + 32, _mm512_div_ps (sumOfWindow2, numberOfElementsInWindow) );
+        _mm512_storeu_ps ( listOfNumbersFiltered + iElement + 48, _mm512_div_ps (sumOfWindow3, numberOfElementsInWindow) );
+
+    }
+
+    return iElement;
+
+}
+
+#endif
 
 
 
@@ -12,38 +136,122 @@ FilterToolsCPPCore::FilterToolsCPPCore () {};
 FilterToolsCPPCore::~FilterToolsCPPCore () {}; 
 
 
+// The instruction set level of the kernels that are being used.
+int FilterToolsCPPCore::getSIMDLevel ()
+{
+
+    return simdLevelFilter;
+
+}
+
+
+// Select the instruction set level of the kernels (for example to compare their speed): it cannot be higher than the level supported by the processor.
+int FilterToolsCPPCore::setSIMDLevel (int requestedSIMDLevel)
+{
+
+    simdLevelFilter = std::max ( static_cast <int> (SIMD_SCALAR), std::min (requestedSIMDLevel, simdLevelDetectedFilter) );
+
+    return simdLevelFilter;
+
+}
+
+
+// Filter the elements  iElementStart  to  iElementEnd  of a contiguous  listOfNumbers , whose windows lie completely within the  listOfNumbers ,
+//  as far as possible with the SIMD kernels.
+static void passAverageFilterContiguous (const float listOfNumbers [], float listOfNumbersFiltered [], int iElementStart, int iElementEnd, int widthOfWindow)
+{
+
+    int iElementScalar = iElementStart;
+
+#if SIMD_X86_KERNELS
+
+    if (simdLevelFilter >= SIMD_AVX512)
+
+        iElementScalar = passAverageFilterAVX512 (listOfNumbers, listOfNumbersFiltered, iElementStart, iElementEnd, widthOfWindow);
+
+    else if (simdLevelFilter >= SIMD_AVX2)
+
+        iElementScalar = passAverageFilterAVX2 (listOfNumbers, listOfNumbersFiltered, iElementStart, iElementEnd, widthOfWindow);
+
+    else if (simdLevelFilter >= SIMD_SSE2)
+
+        iElementScalar = passAverageFilterSSE2 (listOfNumbers, listOfNumbersFiltered, iElementStart, iElementEnd, widthOfWindow);
+
+#endif
+
+    float sumOfWindow;
+    for (int iElement = iElementScalar; iElement < iElementEnd; iElement++)
+    {
+  
+        sumOfWindow = 0;
+        for (int iWindow = -widthOfWindow; iWindow < widthOfWindow + 1; iWindow++)   
+             
+            sumOfWindow += listOfNumbers [iElement + iWindow];
+
+
+        listOfNumbersFiltered [iElement] = sumOfWindow / (2 * widthOfWindow + 1);
+
+    }
+
+}
+
+
+
 void FilterToolsCPPCore::passAverageFilter (
     // Electrogram
-    float listOfNumbers [1], //1
+    const float listOfNumbers [1], //1
     float listOfNumbersFiltered [1], //2
     int numberOfElements, //3
-    int widthOfWindow //4
+    int widthOfWindow, //4
+    long long listOfNumbersStride //5
 )
 {
 
+    // The sums of the windows are kept in  sumOfWindow , so that the  listOfNumbersFiltered  do not need to be set to zero first 
+    //  (they can be an array that is reused, see FilterToolsPYtoCPP.passAverageFilterPYtoCPP).
+    float sumOfWindow;
+
     // Filter the first  widthOfWindow  elements of the  listOfNumbers .
     for (int iElement = 0; iElement < widthOfWindow; iElement++)
     {
   
+        sumOfWindow = 0;
         for (int iWindow = 0; iWindow < iElement + widthOfWindow + 1; iWindow++)  
                   
-            listOfNumbersFiltered [iElement] += listOfNumbers [iWindow];          
+            sumOfWindow += listOfNumbers [iWindow * listOfNumbersStride];          
 
 
-        listOfNumbersFiltered [iElement] /= (iElement + widthOfWindow + 1);
+        listOfNumbersFiltered [iElement] = sumOfWindow / (iElement + widthOfWindow + 1);
  
     };
   
-    // Run the filter over all the elements.
-    for (int iElement = widthOfWindow; iElement < numberOfElements - widthOfWindow; iElement++)
+    // Run the filter over all the elements in between.
+    if (listOfNumbersStride == 1)
+
+        passAverageFilterContiguous (listOfNumbers, listOfNumbersFiltered, widthOfWindow, numberOfElements - widthOfWindow, widthOfWindow);
+
+    // If the  listOfNumbers  are not contiguous (for example a column of a two-dimensional array), then gather them tile by tile, with the windows 
+    //  around the tile, into a small contiguous buffer that stays in the cache, so that the SIMD kernels can still be used without copying the whole list.
+    else
     {
-  
-        for (int iWindow = -widthOfWindow; iWindow < widthOfWindow + 1; iWindow++)   
-             
-            listOfNumbersFiltered [iElement] += listOfNumbers [iElement + iWindow];
 
+        const int numberOfElementsPerTile = std::max (4096, 4 * widthOfWindow);
+        std::vector <float> listOfNumbersTile;
+        for (int iTileStart = widthOfWindow; iTileStart < numberOfElements - widthOfWindow; iTileStart += numberOfElementsPerTile)
+        {
+
+            int numberOfElementsInTile = std::min (numberOfElementsPerTile, numberOfElements - widthOfWindow - iTileStart);
+            listOfNumbersTile.resize (numberOfElementsInTile + 2 * widthOfWindow);
+            for (int iTileElement = 0; iTileElement < numberOfElementsInTile + 2 * widthOfWindow; iTileElement++)
+
+                listOfNumbersTile [iTileElement] = listOfNumbers [ (iTileStart - widthOfWindow + iTileElement) * listOfNumbersStride ];
 
-        listOfNumbersFiltered [iElement] /= (2 * widthOfWindow + 1);
+
+            // Element  iTileElement  of the tile is element  iTileStart - widthOfWindow + iTileElement  of the  listOfNumbers .
+            passAverageFilterContiguous ( listOfNumbersTile.data (), listOfNumbersFiltered + iTileStart - widthOfWindow, 
+                                          widthOfWindow, widthOfWindow + numberOfElementsInTile, widthOfWindow );
+
+        }
 
     }
 
@@ -52,14 +260,14 @@ void FilterToolsCPPCore::passAverageFilter (
     for (int iElement = numberOfElements - widthOfWindow; iElement < numberOfElements; iElement++)
     {
   
+        sumOfWindow = 0;
         for (int iWindow = -widthOfWindow; iWindow < numberOfElements - iElement; iWindow++)
         
-            listOfNumbersFiltered [iElement] += listOfNumbers [iElement + iWindow];          
+            sumOfWindow += listOfNumbers [ (iElement + iWindow) * listOfNumbersStride ];          
   
 
-        listOfNumbersFiltered [iElement] /= (numberOfElements - iElement + widthOfWindow);
+        listOfNumbersFiltered [iElement] = sumOfWindow / (numberOfElements - iElement + widthOfWindow);
  
     };
 
 }
-
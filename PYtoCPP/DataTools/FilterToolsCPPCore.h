@@ -8,12 +8,16 @@ class FilterToolsCPPCore {
 
         FilterToolsCPPCore ();
         ~FilterToolsCPPCore ();
+
+        int getSIMDLevel ();
+        int setSIMDLevel (int requestedSIMDLevel);
                 
         void passAverageFilter ( 
-            float listOfNumbers [1], //1
+            const float listOfNumbers [1], //1
             float listOfNumbersFiltered [1], //2
             int numberOfElements, //3
-            int widthOfWindow //4           
+            int widthOfWindow, //4
+            long long listOfNumbersStride //5
         );
 
 };
@@ -8,45 +8,113 @@ cdef extern from "FilterToolsCPPCore.cpp":
     pass
 
 
-cdef extern from "FilterToolsCPPCore.h":
+# The C++ core function does not touch any Python objects, so it can run without holding the GIL.
+cdef extern from "FilterToolsCPPCore.h" nogil:
     
     cdef cppclass FilterToolsCPPCore:
     
         FilterToolsCPPCore () except+
+
+        int getSIMDLevel ()
+        int setSIMDLevel (int)
     
         void passAverageFilter ( 
-            float *, #1
+            const float *, #1
             float *, #2
             int, #3
-            int #4
+            int, #4
+            long long #5
         )
 
 
+
+def getSIMDLevelPYtoCPP ():
+    '''
+    
+    returns:
+    
+        the instruction set level of the C++ kernels in use: 0 scalar, 1 SSE2, 2 AVX2, 3 AVX-512
+        (selected when the module is imported, from what the processor supports)
+    
+    '''
+
+    cdef FilterToolsCPPCore FilterToolsCPPCoreObject
+
+    return FilterToolsCPPCoreObject.getSIMDLevel ()
+
+
+
+def setSIMDLevelPYtoCPP (simdLevel):
+    '''
+    
+    simdLevel:
+    
+        the instruction set level of the C++ kernels: 0 scalar, 1 SSE2, 2 AVX2, 3 AVX-512,
+        it is capped at the level supported by the processor
+    
+    returns:
+    
+        the instruction set level that is used from now on
+    
+    '''
+
+    cdef FilterToolsCPPCore FilterToolsCPPCoreObject
+
+    return FilterToolsCPPCoreObject.setSIMDLevel (simdLevel)
+
+
+
+# The data values and the output arrays are handled in the same way by both Python to C++ libraries.
+include "DataToolsPYtoCPPArrays.pxi"
+
+
+
 def passAverageFilterPYtoCPP ( 
     listOfNumbers,
-    widthOfWindow ):
+    widthOfWindow,
+    out = None ):
+    '''
+
+    listOfNumbers:
+
+        converted to a float (np.single), only copied if it has another data type
+
+    out:
+
+        a float (np.single) array with the same number of values as the listOfNumbers, in which the filtered values are stored, 
+        so that it can be reused for the next call, default None (a new array)
+
+    returns:
+
+        the filtered list of numbers (out, if given)
+
+    '''
 
 
     cdef FilterToolsCPPCore FilterToolsCPPCore
 
 
-    # Make sure all arrays passed into the function from the Python code are stored contiguously and are integers.
-    listOfNumbers = np.ascontiguousarray (listOfNumbers, dtype = np.single)
-    cdef float [::1] listOfNumbers_view = listOfNumbers
-    
-    cdef int numberOfElements = len (listOfNumbers)
+    # Use the list of numbers without copying it if it is already an array (or other buffer) of floats, also if it is read-only or not contiguous 
+    #  (for example a column of a two-dimensional array): the C++ core function gets the stride, in number of values. 
+    cdef const float [:] listOfNumbers_view = getDataValuesWithoutCopy (listOfNumbers, np.single)
+    cdef int numberOfElements = listOfNumbers_view.shape [0]
+    cdef long long listOfNumbersStride = listOfNumbers_view.strides [0] // sizeof (float)
+    cdef int widthOfWindowInt = widthOfWindow
 
-    listOfNumbersFiltered = np.ascontiguousarray ( np.zeros (numberOfElements, dtype = np.single) )
+    listOfNumbersFiltered = getOutputArray (out, numberOfElements, np.single, 'FilterToolsPYtoCPP.passAverageFilterPYtoCPP')
     cdef float [::1] listOfNumbersFiltered_view = listOfNumbersFiltered
 
             
-    # Call the C++ core function.
-    FilterToolsCPPCore.passAverageFilter ( 
-        &listOfNumbers_view [0], #1
-        &listOfNumbersFiltered_view [0], #2
-        numberOfElements, #3        
-        widthOfWindow #4
-    )
+    # Call the C++ core function, without holding the GIL.
+    with nogil:
+
+        FilterToolsCPPCore.passAverageFilter ( 
+            &listOfNumbers_view [0], #1
+            &listOfNumbersFiltered_view [0], #2
+            numberOfElements, #3        
+            widthOfWindowInt, #4
+            listOfNumbersStride #5
+        )
 
 
     # Return the filter list of numbers.
@@ -0,0 +1,58 @@
+#ifndef SIMDDISPATCHCPPCORE_H
+#define SIMDDISPATCHCPPCORE_H
+
+
+// The SSE2, AVX2 and AVX-512 variants of the kernels are compiled with the GCC / Clang  target  function attribute,
+//  so that no special compiler flags are needed and the extension still loads on processors without AVX2 or AVX-512.
+//  With other compilers (MSVC) or on other architectures (ARM) only the scalar kernels are used.
+#if ( defined (__GNUC__) || defined (__clang__) ) && ( defined (__x86_64__) || defined (__i386__) )
+
+    #define SIMD_X86_KERNELS 1
+    #include <immintrin.h>
+
+#else
+
+    #define SIMD_X86_KERNELS 0
+
+#endif
+
+
+// The instruction set levels, from slowest to fastest.
+enum SIMDLevel {
+
+    SIMD_SCALAR = 0,
+    SIMD_SSE2 = 1,
+    SIMD_AVX2 = 2,
+    SIMD_AVX512 = 3
+
+};
+
+
+// Determine the best instruction set level supported by the processor (and operating system) this code runs on.
+inline int detectSIMDLevel ()
+{
+
+#if SIMD_X86_KERNELS
+
+    __builtin_cpu_init ();
+
+    if ( __builtin_cpu_supports ("avx512f") )
+
+        return SIMD_AVX512;
+
+    if ( __builtin_cpu_supports ("avx2") )
+
+        return SIMD_AVX2;
+
+    if ( __builtin_cpu_supports ("sse2") )
+
+        return SIMD_SSE2;
+
+#endif
+
+    return SIMD_SCALAR;
+
+}
+
+
+#endif
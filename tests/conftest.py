@@ -0,0 +1,16 @@
+# The tests of DataTools and HandyTools: run them from the repository with
+#
+#   python -m pytest tests
+#
+# The modules, the Python to C++ libraries and the benchmarks are found relative to this file, as in Benchmarks/DataToolsBenchmark.py.
+
+# Standard imports.
+import os
+import sys
+
+
+testsPath = os.path.dirname ( os.path.abspath (__file__) )
+sys.path.append ( os.path.join (testsPath, '..', 'DataTools') )
+sys.path.append ( os.path.join (testsPath, '..', 'HandyTools') )
+sys.path.append ( os.path.join (testsPath, '..', 'PYtoCPP', 'DataTools') )
+sys.path.append ( os.path.join (testsPath, '..', 'Benchmarks') )
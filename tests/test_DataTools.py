@@ -0,0 +1,410 @@
+# Tests of DataTools.
+
+# Standard imports.
+import os
+import json
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import DataTools as DataToolsModule
+from DataTools import DataTools, LinearFitAccumulator
+from DataToolsBenchmark import DataToolsBenchmark
+
+
+
+# The quantiles out-of-core, with small chunks and few bins so that the histograms are narrowed several times.
+@pytest.mark.parametrize ( 'dataValues', [ np.random.default_rng (0).normal ( size = 10001 ),
+                                           np.r_ [ np.arange (5000.), np.inf ],
+                                           np.r_ [ np.zeros (5000), 1e308, -1e308 ],
+                                           np.r_ [ np.random.default_rng (1).normal ( size = 2000 ) * 1e307, 1.7e308, -1.7e308 ],
+                                           np.r_ [ np.random.default_rng (2).normal ( size = 3000 ), [np.inf] * 700, [-np.inf] * 20 ],
+                                           np.r_ [ 1e-320, 2e-320, 3e-320, 5e-324 ] ] )
+def test_getMedianAndQuantilesOutOfCore (tmp_path, dataValues):
+
+    fileName = tmp_path / 'dataValues.npy'
+    np.save (fileName, dataValues)
+
+    medianValue, lowerQuantileValue, upperQuantileValue = DataTools.getMedianAndQuantilesOutOfCore (fileName, numberOfValuesPerChunk = 1000, numberOfBins = 64)
+
+    assert [medianValue, lowerQuantileValue, upperQuantileValue] == list ( np.quantile (dataValues, [0.5, 0.25, 0.75]) )
+
+
+
+# Infinite values are the smallest and largest sorted values.
+def test_getMedianAndQuantilesOutOfCoreInfiniteValues ():
+
+    assert DataTools.getMedianAndQuantilesOutOfCore ( np.r_ [ [np.inf] * 5 ] ) == (np.inf, np.inf, np.inf)
+    assert DataTools.getMedianAndQuantilesOutOfCore ( np.r_ [ [-np.inf] * 4, 1., 2., [np.inf] * 5 ] ) == (2., -np.inf, np.inf)
+    assert DataTools.getMedianAndQuantilesOutOfCore ( np.r_ [ 1., np.nan, 2., np.inf ], removeNaN = True ) == (2., 1.5, np.inf)
+
+
+
+# The accumulated linear fit is the same as the linear least square fit of all the data points, also when chunks are merged.
+def test_LinearFitAccumulator ():
+
+    randomGenerator = np.random.default_rng (0)
+    xValues = np.arange (1000.) / 10
+    yValues = 3. * xValues + 2. + randomGenerator.normal ( size = 1000 )
+    yValues [ [10, 500] ] = np.nan
+
+    linearFit = LinearFitAccumulator ()
+    for iStart in range (0, 1000, 300):
+
+        linearFit.merge ( LinearFitAccumulator ().update ( xValues [iStart : iStart + 300], yValues [iStart : iStart + 300] ) )
+
+
+    linearLeastSquareResult = DataTools.linearLeastSquare (xValues, yValues)
+    for linearFitResult in [ linearFit.result (), LinearFitAccumulator ().update (xValues, yValues).result () ]:
+
+        for value, valueExpected in zip (linearFitResult, linearLeastSquareResult):
+
+            np.testing.assert_allclose (value, valueExpected, rtol = 1e-9)
+
+
+
+
+# Too few data points give NaN values, as in DataTools.linearLeastSquare.
+def test_LinearFitAccumulatorEmpty ():
+
+    a, b, uncertaintyA, uncertaintyB, rSquared, xValuesFitLine, yValuesFitLine = LinearFitAccumulator ().result ()
+
+    assert np.isnan ( [a, b, uncertaintyA, uncertaintyB, rSquared] ).all ()
+    assert np.isnan (xValuesFitLine).all () and np.isnan (yValuesFitLine).all ()
+
+
+
+# With PYtoCPP = False the Python version is used (also when a compiled version exists), which returns the amplitudes and start indices.
+def test_getSegmentSpecsFromDataValuesPython ():
+
+    dataValues = np.array ( [0, 2, 5, 3, 1, 4], dtype = np.single )
+
+    segmentAmplitudes, segmentStartIndices = DataTools.getSegmentSpecsFromDataValues (dataValues, PYtoCPP = False)
+
+    assert segmentAmplitudes.tolist () == [5, -4, 3]
+    assert segmentStartIndices.tolist () == [0, 2, 4]
+    assert DataTools.getSegmentSpecsFromDataValuesOutOfCore (dataValues, PYtoCPP = False) is None
+
+
+
+# The C++ functions release the GIL, so that they run faster in threads on independent arrays (see DataToolsBenchmark.getThreadSpeedUps).
+def test_nativeThreadSpeedUp ():
+
+    numberOfThreads = min ( 4, os.cpu_count () or 1 )
+    if numberOfThreads < 2:
+
+        pytest.skip ('the speed-up of threads needs at least 2 processor cores')
+
+
+    with DataTools.useBackend ('native'):
+
+        if DataTools.selectBackend ('passAverageFilter') [0] != 'native':
+
+            pytest.skip ('the Python to C++ libraries are not available')
+
+
+    threadResults = DataToolsBenchmark.getThreadSpeedUps (numberOfThreads = numberOfThreads, numberOfValues = 2000000, numberOfRepeats = 5)
+
+    assert [ threadResult ['backend'] for threadResult in threadResults ] == ['native'] * len (threadResults)
+    for threadResult in threadResults:
+
+        assert threadResult ['speedUp'] > 1.3, '{} has a speed-up of {:.2f} with {} threads'.format ( threadResult ['function'], threadResult ['speedUp'], numberOfThreads )
+
+
+
+# Importing DataTools and HandyTools does not import the libraries that only some functions need (see DataToolsBenchmark.getImportTimeRegressions).
+def test_importDoesNotImportLazilyImportedModules ():
+
+    importTimes, importedModuleNames = DataToolsBenchmark.getImportTimes ( ['DataTools', 'HandyTools'], numberOfRepeats = 1 )
+
+    assert sorted (importTimes) == ['DataTools', 'HandyTools'] and np.isfinite ( list ( importTimes.values () ) ).all ()
+    assert sorted ( importedModuleNames & set (DataToolsBenchmark.lazilyImportedModuleNames) ) == []
+
+
+
+# Register an operation with a NumPy and a C++ backend for the tests, which are removed again (with the backend settings) when the test is done.
+def registerTestOperation (monkeypatch):
+
+    monkeypatch.setitem (DataToolsModule.dataToolsBackends, 'testOperation', {})
+    monkeypatch.setitem ( DataToolsModule.dataToolsBackendSettings, 'backendPreference', ['native', 'numba', 'numpy'] )
+    monkeypatch.setitem ( DataToolsModule.dataToolsBackendSettings, 'autotuneResults', {} )
+
+    DataTools.registerBackend ( 'testOperation', 'numpy', lambda dataValues: np.sum (dataValues) )
+    DataTools.registerBackend ( 'testOperation', 'native', lambda dataValues: np.sum (dataValues) )
+
+
+
+# The backend is selected by the preference of the  with  block in the current thread, then by the global preference, then in the order of registration.
+def test_selectBackend (monkeypatch):
+
+    registerTestOperation (monkeypatch)
+
+    assert DataTools.getBackends ('testOperation') == ['numpy', 'native']
+    assert DataTools.selectBackend ('testOperation') [0] == 'native'
+    assert DataTools.selectBackend ('testOperation', PYtoCPP = False) [0] == 'numpy'
+    assert DataTools.selectBackend ('missingOperation') == (None, None)
+
+    with DataTools.useBackend ('numpy'):
+
+        assert DataTools.selectBackend ('testOperation') [0] == 'numpy'
+
+        with DataTools.useBackend ( ['missing', 'native'] ):
+
+            assert DataTools.selectBackend ('testOperation') [0] == 'native'
+
+
+        assert DataTools.selectBackend ('testOperation') [0] == 'numpy'
+
+        # The preference of the  with  block does not apply to other threads.
+        with ThreadPoolExecutor (max_workers = 1) as executor:
+
+            assert executor.submit (DataTools.selectBackend, 'testOperation').result () [0] == 'native'
+
+
+
+    DataTools.setBackendPreference ('numpy')
+    assert DataTools.selectBackend ('testOperation') [0] == 'numpy'
+
+    DataTools.setBackendPreference ( ['missing'] )
+    assert DataTools.selectBackend ('testOperation') [0] == 'numpy'
+
+    # Without the C++ backend, there is no backend left with PYtoCPP = False.
+    del DataToolsModule.dataToolsBackends ['testOperation'] ['numpy']
+    assert DataTools.selectBackend ('testOperation', PYtoCPP = False) == (None, None)
+
+
+
+# A lazy backend is only registered if its library can be found, and the library is imported when the backend is selected.
+def test_registerLazyBackend (monkeypatch):
+
+    registerTestOperation (monkeypatch)
+
+    assert not DataTools.registerLazyBackend ('testOperation', 'numba', 'missingModuleForTheTest', 'missingFunction')
+    assert DataTools.registerLazyBackend ('testOperation', 'numba', 'math', 'fsum')
+    assert DataTools.getBackends ('testOperation') == ['numpy', 'native', 'numba']
+
+    with DataTools.useBackend ('numba'):
+
+        backendName, backendFunction = DataTools.selectBackend ('testOperation')
+
+
+    assert backendName == 'numba' and backendFunction ( [1., 2.] ) == 3.
+
+
+
+# With the preference 'auto', the backend measured to be the fastest for the nearest size class is selected.
+def test_selectBackendAuto (monkeypatch):
+
+    registerTestOperation (monkeypatch)
+    DataToolsModule.dataToolsBackendSettings ['autotuneResults'] = { 'testOperation': { '1': 'numpy', '5': 'native' } }
+
+    with DataTools.useBackend ('auto'):
+
+        assert [ DataTools.selectBackend ('testOperation', numberOfValues) [0] for numberOfValues in [0, 20, 200, 20000, 10 ** 7] ] == \
+               ['numpy', 'numpy', 'numpy', 'native', 'native']
+
+
+
+# The measurements are stored in the cache file and read back, and measured again when the registered backends, the size classes or the fingerprint change.
+def test_autotuneBackendsCache (tmp_path, monkeypatch, capsys):
+
+    registerTestOperation (monkeypatch)
+    cacheFileName = str ( tmp_path / 'cache' / 'backendAutotune.json' )
+
+    def autotuneBackends (sizeClasses = [1]):
+
+        fastestBackends = DataTools.autotuneBackends (sizeClasses, numberOfRepeats = 1, cacheFileName = cacheFileName)
+
+        return fastestBackends, 'Measuring the speed' in capsys.readouterr ().out
+
+
+    fastestBackends, measured = autotuneBackends ()
+    assert measured and fastestBackends ['testOperation'] ['1'] in ['numpy', 'native']
+    assert DataToolsModule.dataToolsBackendSettings ['autotuneResults'] == fastestBackends
+    assert os.listdir ( tmp_path / 'cache' ) == ['backendAutotune.json']
+
+    assert autotuneBackends () == (fastestBackends, False)
+    assert autotuneBackends ( [1, 2] ) [1]
+    assert not autotuneBackends ( [1, 2] ) [1]
+
+    DataTools.registerBackend ( 'testOperation', 'numba', lambda dataValues: np.sum (dataValues) )
+    assert autotuneBackends ( [1, 2] ) [1]
+
+    with open (cacheFileName, 'r') as cacheFile:
+
+        autotuneResults = json.load (cacheFile)
+
+
+    autotuneResults ['backendsFingerprint'] ['numpy'] = '0.0'
+    with open (cacheFileName, 'w') as cacheFile:
+
+        json.dump (autotuneResults, cacheFile)
+
+
+    assert autotuneBackends ( [1, 2] ) [1]
+    assert not autotuneBackends ( [1, 2] ) [1]
+
+
+
+# If the results cannot be stored, then the cache file stays as it was, without a temporary file left behind.
+def test_autotuneBackendsCacheWriteFails (tmp_path, monkeypatch, capsys):
+
+    registerTestOperation (monkeypatch)
+    cacheFileName = str ( tmp_path / 'backendAutotune.json' )
+    DataTools.autotuneBackends ( [1], numberOfRepeats = 1, cacheFileName = cacheFileName )
+    with open (cacheFileName, 'r') as cacheFile:
+
+        cacheContent = cacheFile.read ()
+
+
+    def replaceFails (sourceFileName, destinationFileName):
+
+        raise OSError ('the file cannot be replaced')
+
+
+    monkeypatch.setattr (os, 'replace', replaceFails)
+    capsys.readouterr ()
+    DataTools.autotuneBackends ( [1, 2], numberOfRepeats = 1, cacheFileName = cacheFileName )
+
+    assert 'could not be stored' in capsys.readouterr ().out
+    with open (cacheFileName, 'r') as cacheFile:
+
+        assert cacheFile.read () == cacheContent
+
+
+    assert os.listdir (tmp_path) == ['backendAutotune.json']
+
+
+
+# The calls made while profiling is on are recorded, with the input bytes, the predicted copies and the backend used, and the functions are restored when it is off.
+def test_profile (tmp_path, monkeypatch):
+
+    monkeypatch.setitem (DataToolsModule.dataToolsProfileSettings, 'maximumNumberOfLatencies', 2)
+    passAverageFilter = DataTools.__dict__ ['passAverageFilter'].__func__
+    DataTools.enableProfile ()
+    DataTools.resetProfile ()
+
+    try:
+
+        with DataTools.useBackend ('numpy'):
+
+            DataTools.passAverageFilter ( np.arange (100.), 5 )
+            DataTools.passAverageFilter ( np.arange (100., dtype = np.float32), 5 )
+            DataTools.passAverageFilter ( np.arange (200.) [::2], 5 )
+
+
+        DataTools.linearLeastSquare ( np.arange (10.), np.arange (10.) )
+
+        profile = DataTools.getProfile ()
+        assert sorted (profile) == ['linearLeastSquare', 'passAverageFilter']
+        assert { keyName: profile ['passAverageFilter'] [keyName] for keyName in ['numberOfCalls', 'inputBytes', 'numberOfCopies', 'bytesCopied', 'backends'] } == \
+               { 'numberOfCalls': 3, 'inputBytes': 2000, 'numberOfCopies': 1, 'bytesCopied': 800, 'backends': {'numpy': 3} }
+        assert len ( DataToolsModule.dataToolsProfile ['passAverageFilter'] ['latencies'] ) == 2
+        assert profile ['linearLeastSquare'] ['numberOfCalls'] == 1 and profile ['linearLeastSquare'] ['backends'] == {}
+
+        assert DataTools.saveProfileToJSON ( str ( tmp_path / 'profile.json' ) ) == profile
+        with open ( tmp_path / 'profile.json', 'r' ) as profileFile:
+
+            assert json.load (profileFile) == profile
+
+
+        # When profiling is off, the original functions are used again, and the profile is kept until it is reset.
+        DataTools.enableProfile (False)
+        assert DataTools.__dict__ ['passAverageFilter'].__func__ is passAverageFilter
+        DataTools.passAverageFilter ( np.arange (100.), 5 )
+        assert DataTools.getProfile () == profile
+
+        DataTools.resetProfile ()
+        assert DataTools.getProfile () == {}
+
+    finally:
+
+        DataTools.enableProfile (False)
+        DataTools.resetProfile ()
+
+
+
+# The filtered values stored in an  out  array are the same as those in a new array, for every backend.
+@pytest.mark.parametrize ( 'backendName', ['native', 'numba', 'numpy'] )
+def test_passAverageFilterOut (backendName):
+
+    with DataTools.useBackend (backendName):
+
+        if DataTools.selectBackend ('passAverageFilter') [0] != backendName:
+
+            pytest.skip ('the {} backend is not available'.format (backendName) )
+
+
+        dataValues = np.random.default_rng (0).normal ( size = 1000 )
+        out = np.full (1000, np.nan, dtype = np.single)
+
+        assert DataTools.passAverageFilter (dataValues, 11, out = out) is out
+        np.testing.assert_allclose ( out, DataTools.passAverageFilter (dataValues, 11), rtol = 1e-5, atol = 1e-6 )
+
+
+
+# An  out  array that cannot be used is replaced by a new array, with a warning.
+@pytest.mark.parametrize ( 'out', [ np.zeros (1000), np.zeros (999, dtype = np.single), np.zeros (2000, dtype = np.single) [::2], 
+                                    np.zeros ( (1000, 1), dtype = np.single ), list ( np.zeros (1000) ) ] )
+def test_passAverageFilterOutCannotBeUsed (capsys, out):
+
+    dataValues = np.random.default_rng (0).normal ( size = 1000 )
+
+    dataValuesFiltered = DataTools.passAverageFilter (dataValues, 11, out = out)
+
+    assert dataValuesFiltered is not out
+    assert 'a new array is used instead' in capsys.readouterr ().out
+    np.testing.assert_array_equal ( dataValuesFiltered, DataTools.passAverageFilter (dataValues, 11) )
+
+
+
+def test_passMedianFilterOut ():
+
+    dataValues = np.random.default_rng (0).normal ( size = 1000 )
+    out = np.empty (1000)
+
+    assert DataTools.passMedianFilter (dataValues, 7, out = out) is out
+    np.testing.assert_array_equal ( out, DataTools.passMedianFilter (dataValues, 7) )
+
+
+
+# The NaN values are removed or replaced in (the first part of) the  out  array, with the  workspace  for the marks, and the data values are not changed.
+@pytest.mark.parametrize ( 'replaceWithValue', [False, True] )
+def test_getNanFreeNumpyArrayOut (replaceWithValue):
+
+    dataValues = np.array ( [1., np.nan, 3., np.nan, 5.] )
+    out = np.zeros (10)
+    workspace = np.zeros (10, dtype = bool)
+
+    dataValuesNanFree = DataTools.getNanFreeNumpyArray (dataValues, replaceWithValue, -1., out = out, workspace = workspace)
+
+    assert np.shares_memory (dataValuesNanFree, out)
+    assert dataValuesNanFree.tolist () == ( [1., -1., 3., -1., 5.] if replaceWithValue else [1., 3., 5.] )
+    assert np.isnan (dataValues).sum () == 2
+
+
+
+# The results stored in a workspace are the same as those in new arrays, also when the workspace is reused for fewer data values, for every backend.
+@pytest.mark.parametrize ( 'backendName', ['native', 'numba'] )
+def test_getSegmentSpecsFromDataValuesWorkspace (backendName):
+
+    with DataTools.useBackend (backendName):
+
+        if DataTools.selectBackend ('getSegmentSpecsFromDataValues') [0] != backendName:
+
+            pytest.skip ('the {} backend is not available'.format (backendName) )
+
+
+        workspace = DataTools.getSegmentSpecsWorkspace (1000)
+        for numberOfValues in [1000, 300]:
+
+            dataValues = np.random.default_rng (numberOfValues).normal ( size = numberOfValues ).astype (np.single)
+
+            segmentSpecs = DataTools.getSegmentSpecsFromDataValues (dataValues, workspace = workspace)
+
+            assert np.shares_memory ( segmentSpecs [1], workspace ['segmentStartIndices'] )
+            for segmentSpec, segmentSpecExpected in zip ( segmentSpecs, DataTools.getSegmentSpecsFromDataValues (dataValues) ):
+
+                np.testing.assert_array_equal (segmentSpec, segmentSpecExpected)
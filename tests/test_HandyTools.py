@@ -0,0 +1,574 @@
+# Tests of HandyTools.
+
+# Standard imports.
+import os
+import time
+
+import numpy as np
+import pytest
+
+from HandyTools import HandyTools
+
+
+
+# Write a table file with the given content (as bytes, so that the line endings are kept as they are).
+def writeTableFile (tmp_path, fileName, content):
+
+    textFileNameAndPath = str ( tmp_path / fileName )
+    with open (textFileNameAndPath, 'wb') as tableFile:
+
+        tableFile.write ( content.encode () )
+
+    return textFileNameAndPath
+
+
+
+# The columns of numbers as (data type kind, list of values), so that they can be compared with NaN values.
+def getColumns (tableContentDataNumbers):
+
+    return [ ( column.dtype.kind, [ None if value != value else value for value in column.tolist () ] ) for column in tableContentDataNumbers ]
+
+
+
+# A search with threads that is stopped early saves the listings read so far, and the next searches with the scan cache give the same files as without it.
+def test_iterateFilesInDirectoryTreeScanCache (tmp_path):
+
+    treePath = tmp_path / 'tree'
+    for iDirectory in range (20):
+
+        directoryPath = treePath / 'directory{:02d}'.format (iDirectory) / 'subdirectory'
+        directoryPath.mkdir (parents = True)
+        for iFile in range (3):
+
+            ( directoryPath / 'file{}.txt'.format (iFile) ).write_text ('')
+            ( directoryPath.parent / 'file{}.dat'.format (iFile) ).write_text ('')
+
+
+
+    scanCacheFileName = str ( tmp_path / 'scanCache.pickle' )
+    filePaths = HandyTools.getFilesInDirectoryTree ( str (treePath) )
+
+    fileIterator = HandyTools.iterateFilesInDirectoryTree ( str (treePath), numberOfThreads = 8, scanCacheFileName = scanCacheFileName )
+    assert next (fileIterator) == filePaths [0]
+    fileIterator.close ()
+
+    assert HandyTools.readScanCache (scanCacheFileName)
+    for numberOfThreads in [8, 1]:
+
+        assert HandyTools.getFilesInDirectoryTree ( str (treePath), numberOfThreads = numberOfThreads, scanCacheFileName = scanCacheFileName ) == filePaths
+        assert len ( HandyTools.readScanCache (scanCacheFileName) ) == 41
+
+
+    assert HandyTools.getFilesInDirectoryTree ( str (treePath), '.txt', numberOfThreads = 8, scanCacheFileName = scanCacheFileName ) == \
+           [ filePath for filePath in filePaths if filePath.endswith ('.txt') ]
+
+
+
+# An analysis function that stops its worker process for the files with 'stop' in their name.
+def analyseOrStopProcess (fileName):
+
+    if 'stop' in os.path.basename (fileName):
+
+        os._exit (1)
+
+
+    return len ( os.path.basename (fileName) )
+
+
+
+# If a worker process stops, the results of the files analysed before are kept, and the files not analysed are reported: those given to the workers
+#  and those not given yet, also when the process stops while the last results are collected.
+@pytest.mark.parametrize ( 'fileNames, numberOfFilesExpected', [ ( ['file0', 'file1', 'file2stop', 'file3', 'file4'], (3, 1, 2) ),
+                                                                 ( ['file0', 'file1', 'file2', 'file3', 'file4stop'], (1, 1, 0) ) ] )
+def test_analyseFilesInDirectoryTreeBrokenProcessPool (tmp_path, capsys, fileNames, numberOfFilesExpected):
+
+    for fileName in fileNames:
+
+        ( tmp_path / fileName ).write_text ('')
+
+
+    analysisResults, analysisErrors = HandyTools.analyseFilesInDirectoryTree ( str (tmp_path), analyseOrStopProcess, numberOfProcesses = 1, 
+                                                                               maximumNumberOfPendingFiles = 1 )
+
+    iStopFile = [ iFile for iFile, fileName in enumerate (fileNames) if 'stop' in fileName ] [0]
+    assert analysisResults == { str ( tmp_path / fileName ): len (fileName) for fileName in fileNames [:iStopFile] }
+    assert analysisErrors == {}
+    assert '{} files have not been analysed ({} were being analysed, {} were not yet given to the workers)'.format (*numberOfFilesExpected) in capsys.readouterr ().out
+
+
+
+def test_readTableWithHeader (tmp_path):
+
+    textFileNameAndPath = writeTableFile (tmp_path, 'table.txt', 'header line 1\nheader line 2\n\nC_END\nentry1 1 4.5 6\nentry2 2 5.3 7\n')
+    tableContentDataNumbers, tableContentDataStrings, tableContentHeader = HandyTools.readTable (textFileNameAndPath)
+
+    assert getColumns (tableContentDataNumbers) == [ ('f', [None, None]), ('i', [1, 2]), ('f', [4.5, 5.3]), ('i', [6, 7]) ]
+    assert tableContentDataStrings == [ ['entry1', 'entry2'], ['1', '2'], ['4.5', '5.3'], ['6', '7'] ]
+    assert tableContentHeader == ['header line 1', 'header line 2']
+
+
+
+def test_readTableWithoutHeader (tmp_path):
+
+    textFileNameAndPath = writeTableFile (tmp_path, 'table.txt', 'entry1 1 4.5 6\n\nentry2 2 5.3 7\n')
+    tableContentDataNumbers, tableContentDataStrings, tableContentHeader = HandyTools.readTable (textFileNameAndPath)
+
+    assert getColumns (tableContentDataNumbers) == [ ('f', [None, None]), ('i', [1, 2]), ('f', [4.5, 5.3]), ('i', [6, 7]) ]
+    assert tableContentHeader == []
+
+
+
+# Rows with fewer entrees give shorter columns, and empty rows are skipped.
+def test_readTableRaggedRows (tmp_path):
+
+    textFileNameAndPath = writeTableFile (tmp_path, 'table.txt', 'C_END\n1 2 3\n4 5\n\n6 7 8 9\n')
+    tableContentDataNumbers, tableContentDataStrings, tableContentHeader = HandyTools.readTable (textFileNameAndPath)
+
+    assert getColumns (tableContentDataNumbers) == [ ('i', [1, 4, 6]), ('i', [2, 5, 7]), ('i', [3, 8]), ('i', [9]) ]
+    assert tableContentDataStrings == [ ['1', '4', '6'], ['2', '5', '7'], ['3', '8'], ['9'] ]
+
+
+
+def test_readTableTabs (tmp_path):
+
+    textFileNameAndPath = writeTableFile (tmp_path, 'table.txt', 'C_END\n1\t2.5\n3\t4\n')
+    tableContentDataNumbers, tableContentDataStrings, tableContentHeader = HandyTools.readTable (textFileNameAndPath, separatorString = '\t')
+
+    assert getColumns (tableContentDataNumbers) == [ ('i', [1, 3]), ('f', [2.5, 4.]) ]
+    assert tableContentDataStrings == [ ['1', '3'], ['2.5', '4'] ]
+
+
+
+def test_readTableCRLF (tmp_path):
+
+    textFileNameAndPath = writeTableFile (tmp_path, 'table.txt', 'header\r\nC_END\r\n1 2.5 a\r\n3 4 b\r\n')
+    tableContentDataNumbers, tableContentDataStrings, tableContentHeader = HandyTools.readTable (textFileNameAndPath)
+
+    assert getColumns (tableContentDataNumbers) == [ ('i', [1, 3]), ('f', [2.5, 4.]), ('f', [None, None]) ]
+    assert tableContentDataStrings == [ ['1', '3'], ['2.5', '4'], ['a', 'b'] ]
+    assert tableContentHeader == ['header']
+
+
+
+# Text entrees are NaN, also in a column that has numbers as well.
+def test_readTableTextColumns (tmp_path):
+
+    textFileNameAndPath = writeTableFile (tmp_path, 'table.txt', 'C_END\nname1 1 x\nname2 2 3\n')
+    tableContentDataNumbers, tableContentDataStrings, tableContentHeader = HandyTools.readTable (textFileNameAndPath)
+
+    assert getColumns (tableContentDataNumbers) == [ ('f', [None, None]), ('i', [1, 2]), ('f', [None, 3.]) ]
+    assert tableContentDataStrings [0] == ['name1', 'name2']
+
+
+
+def test_readTableExponentNotation (tmp_path):
+
+    textFileNameAndPath = writeTableFile (tmp_path, 'table.txt', 'C_END\n1e3 2E-2 3\n4 -5.5e+1 6\n')
+    tableContentDataNumbers, tableContentDataStrings, tableContentHeader = HandyTools.readTable (textFileNameAndPath)
+
+    assert getColumns (tableContentDataNumbers) == [ ('f', [1000., 4.]), ('f', [0.02, -55.]), ('i', [3, 6]) ]
+
+
+
+# The data type of a column is decided by all its entrees, not only by the first row: the second column is float, although it starts with an int.
+def test_readTableWholeColumnDataType (tmp_path):
+
+    textFileNameAndPath = writeTableFile (tmp_path, 'table.txt', 'C_END\n1 2\n3 4.5\n5 6\n')
+    tableContentDataNumbers, tableContentDataStrings, tableContentHeader = HandyTools.readTable (textFileNameAndPath)
+
+    assert getColumns (tableContentDataNumbers) == [ ('i', [1, 3, 5]), ('f', [2., 4.5, 6.]) ]
+
+
+
+def test_readTableUsecols (tmp_path):
+
+    textFileNameAndPath = writeTableFile (tmp_path, 'table.txt', 'C_END\na 1 2.5\nb 3 4.5\n')
+    tableContentDataNumbers, tableContentDataStrings, tableContentHeader = HandyTools.readTable (textFileNameAndPath, usecols = [2, 1], returnStrings = False)
+
+    assert getColumns (tableContentDataNumbers) == [ ('f', [2.5, 4.5]), ('i', [1, 3]) ]
+    assert tableContentDataStrings == []
+
+
+
+# The lines read lazily, as a range or one by one are the same as those of getTextFileContent, also with Windows line ends.
+@pytest.mark.parametrize ( 'content', [ 'line 1\n  line 2 \n\nline 4', 'line 1\r\nline 2\r\n', 'line 1\nline 2\n', '\n', '' ] )
+@pytest.mark.parametrize ( 'stripLineFromBlanks', [False, True] )
+def test_getTextFileContentLazy (tmp_path, content, stripLineFromBlanks):
+
+    textFileNameAndPath = writeTableFile (tmp_path, 'text.txt', content)
+    textLines = HandyTools.getTextFileContent (textFileNameAndPath, stripLineFromBlanks)
+
+    assert list ( HandyTools.getTextFileContent (textFileNameAndPath, stripLineFromBlanks, lazy = True) ) == textLines
+    assert HandyTools.getTextFileLines (textFileNameAndPath, stripLineFromBlanks = stripLineFromBlanks) == textLines
+    np.testing.assert_array_equal ( HandyTools.getTextFileLineOffsets (textFileNameAndPath, numberOfBytesPerChunk = 3), 
+                                    HandyTools.getTextFileLineOffsets (textFileNameAndPath) )
+
+    lineOffsets = HandyTools.getTextFileLineOffsets (textFileNameAndPath)
+    assert len (lineOffsets) == len (textLines)
+    for iLine in range ( -len (textLines) - 1, len (textLines) + 1 ):
+
+        assert HandyTools.getTextFileLine (textFileNameAndPath, iLine, stripLineFromBlanks, lineOffsets) == \
+               ( textLines [iLine] if -len (textLines) <= iLine < len (textLines) else None )
+        assert HandyTools.getTextFileLines (textFileNameAndPath, iLine, iLine + 2, stripLineFromBlanks, lineOffsets) == textLines [iLine : iLine + 2]
+        if iLine >= 0:
+
+            assert list ( HandyTools.iterateTextFileContent (textFileNameAndPath, stripLineFromBlanks, iLine, lineOffsets) ) == textLines [iLine:]
+
+
+
+# The line offsets are stored in the cache file and read back while the text file has not changed, and not stored for a text file that has just changed.
+def test_getTextFileLineOffsetsCache (tmp_path):
+
+    lineOffsetsCacheFileName = str ( tmp_path / 'lineOffsets.npz' )
+    textFileNameAndPath = writeOldTableFile (tmp_path, 'text.txt', 'line 1\nline 2\n')
+
+    assert HandyTools.getTextFileLineOffsets (textFileNameAndPath, lineOffsetsCacheFileName).tolist () == [0, 7]
+    assert sorted ( os.listdir (tmp_path) ) == ['lineOffsets.npz', 'text.txt']
+    with np.load (lineOffsetsCacheFileName) as lineOffsetsCache:
+
+        assert lineOffsetsCache ['lineOffsets'].tolist () == [0, 7]
+
+
+    assert HandyTools.getTextFileLine (textFileNameAndPath, 1, lineOffsetsCacheFileName = lineOffsetsCacheFileName) == 'line 2'
+
+    writeOldTableFile (tmp_path, 'text.txt', 'line\nline 2\nline 3\n', secondsAgo = 5)
+    assert HandyTools.getTextFileLineOffsets (textFileNameAndPath, lineOffsetsCacheFileName).tolist () == [0, 5, 12]
+    assert HandyTools.getTextFileLines (textFileNameAndPath, -2, lineOffsetsCacheFileName = lineOffsetsCacheFileName) == ['line 2', 'line 3']
+
+    os.remove (lineOffsetsCacheFileName)
+    writeTableFile (tmp_path, 'text.txt', 'line 1\n')
+    assert HandyTools.getTextFileLineOffsets (textFileNameAndPath, lineOffsetsCacheFileName).tolist () == [0]
+    assert not os.path.exists (lineOffsetsCacheFileName)
+
+
+
+# Write a table file that was changed some time ago, so that its table cache can be saved (see HandyTools.saveTableCache).
+def writeOldTableFile (tmp_path, fileName, content, secondsAgo = 10):
+
+    textFileNameAndPath = writeTableFile (tmp_path, fileName, content)
+    modificationTime = time.time_ns () - secondsAgo * 1000000000
+    os.utime ( textFileNameAndPath, ns = (modificationTime, modificationTime) )
+
+    return textFileNameAndPath
+
+
+
+# The table read from the table cache is the same as the table read from the table file, with memory-mapped, read-only columns of numbers.
+def test_readTableCache (tmp_path, capsys):
+
+    textFileNameAndPath = writeOldTableFile (tmp_path, 'table.txt', 'header\nC_END\na 1 2.5\nb 3 4.5\n')
+    tableContent = HandyTools.readTable (textFileNameAndPath)
+
+    for readFromTableCache in [False, True]:
+
+        capsys.readouterr ()
+        tableContentDataNumbers, tableContentDataStrings, tableContentHeader = HandyTools.readTable (textFileNameAndPath, useTableCache = True)
+
+        assert ( 'loaded from the table cache' in capsys.readouterr ().out ) == readFromTableCache
+        assert getColumns (tableContentDataNumbers) == getColumns (tableContent [0])
+        assert (tableContentDataStrings, tableContentHeader) == tableContent [1:]
+
+
+    assert os.path.isfile ( textFileNameAndPath + '.tablecache/tableCache.json' )
+    assert isinstance (tableContentDataNumbers [1], np.memmap) and not tableContentDataNumbers [1].flags ['WRITEABLE']
+
+    tableContentDataNumbers, tableContentDataStrings, tableContentHeader = HandyTools.readTable ( textFileNameAndPath, usecols = [2, 1], returnStrings = False, 
+                                                                                                  useTableCache = True )
+    assert 'loaded from the table cache' in capsys.readouterr ().out
+    assert getColumns (tableContentDataNumbers) == [ ('f', [2.5, 4.5]), ('i', [1, 3]) ] and tableContentDataStrings == []
+
+
+
+# The table cache is not used when the table file has changed, or is read with another separator, and is not saved for a table file that has just changed.
+def test_readTableCacheInvalid (tmp_path, capsys):
+
+    textFileNameAndPath = writeOldTableFile (tmp_path, 'table.txt', 'C_END\n1 2\n3 4\n')
+    HandyTools.readTable (textFileNameAndPath, useTableCache = True)
+
+    writeOldTableFile (tmp_path, 'table.txt', 'C_END\n1 2\n3 5\n', secondsAgo = 5)
+    capsys.readouterr ()
+    assert HandyTools.readTable (textFileNameAndPath, useTableCache = True) [1] == [ ['1', '3'], ['2', '5'] ]
+    assert 'loaded from the table cache' not in capsys.readouterr ().out
+
+    assert HandyTools.readTable (textFileNameAndPath, separatorString = '\t', useTableCache = True) [1] == [ ['1 2', '3 5'] ]
+    assert 'loaded from the table cache' not in capsys.readouterr ().out
+
+    textFileNameAndPath = writeTableFile (tmp_path, 'tableNew.txt', 'C_END\n1 2\n')
+    HandyTools.readTable (textFileNameAndPath, useTableCache = True)
+    assert not os.path.exists (textFileNameAndPath + '.tablecache')
+
+
+
+# The table caches in a table cache directory that have been used least recently are removed first, to stay within the maximum size.
+def test_removeTableCaches (tmp_path):
+
+    tableCacheDirectory = str ( tmp_path / 'tableCaches' )
+    textFileNamesAndPaths = [ writeOldTableFile ( tmp_path, 'table{}.txt'.format (iTableFile), 'C_END\n1 2\n3 4\n' ) for iTableFile in range (3) ]
+    for iTableFile in [0, 1, 2, 0]:
+
+        HandyTools.readTable (textFileNamesAndPaths [iTableFile], useTableCache = True, tableCacheDirectory = tableCacheDirectory)
+        time.sleep (0.01)
+
+
+    tableCachePaths = [ HandyTools.getTableCachePath (textFileNameAndPath, tableCacheDirectory) for textFileNameAndPath in textFileNamesAndPaths ]
+    assert sorted ( os.listdir (tableCacheDirectory) ) == sorted ( os.path.basename (tableCachePath) for tableCachePath in tableCachePaths )
+    tableCacheSize = sum ( tableCacheEntry.stat ().st_size for tableCacheEntry in os.scandir ( tableCachePaths [0] ) )
+
+    # The table cache of table1.txt has been used least recently.
+    assert HandyTools.removeTableCaches (tableCacheDirectory, 2 * tableCacheSize) == 1
+    assert [ os.path.isdir (tableCachePath) for tableCachePath in tableCachePaths ] == [True, False, True]
+
+    # Saving a table cache removes the others if they do not fit.
+    HandyTools.readTable ( textFileNamesAndPaths [1], useTableCache = True, tableCacheDirectory = tableCacheDirectory, maximumTableCacheSize = tableCacheSize )
+    assert [ os.path.isdir (tableCachePath) for tableCachePath in tableCachePaths ] == [False, True, False]
+
+    assert HandyTools.removeTableCaches (tableCacheDirectory) == 1
+    assert os.listdir (tableCacheDirectory) == []
+
+
+
+# The chunks of iterateTable together are the table of readTable, with and without the header.
+@pytest.mark.parametrize ( 'content', [ 'header line 1\n\nheader line 2\nC_END\n1 2.5\n3 4\n\n5 6\n7 8\n9 10\n',
+                                        '1 2.5\n3 4\n\n5 6\n7 8\n9 10\n' ] )
+def test_iterateTable (tmp_path, content):
+
+    textFileNameAndPath = writeTableFile (tmp_path, 'table.txt', content)
+    tableContentDataNumbers, tableContentDataStrings, tableContentHeader = HandyTools.readTable (textFileNameAndPath)
+
+    tableChunks = list ( HandyTools.iterateTable (textFileNameAndPath, numberOfRowsPerChunk = 2, returnStrings = True) )
+
+    assert [ len (tableChunkNumbers [0]) for tableChunkNumbers, tableChunkStrings, tableChunkHeader in tableChunks ] == [2, 1, 2]
+    for iColumn in range (2):
+
+        np.testing.assert_array_equal ( np.concatenate ( [ tableChunk [0] [iColumn] for tableChunk in tableChunks ] ), tableContentDataNumbers [iColumn] )
+        assert sum ( [ tableChunk [1] [iColumn] for tableChunk in tableChunks ], [] ) == tableContentDataStrings [iColumn]
+
+
+    assert all ( tableChunk [2] == tableContentHeader for tableChunk in tableChunks )
+    assert tableContentHeader == ( ['header line 1', 'header line 2'] if 'C_END' in content else [] )
+
+
+
+# A table written by writeTable is read back with the same numbers and column types.
+@pytest.mark.parametrize ( 'numberOfRowsPerChunk', [1, 3, 100000] )
+def test_writeTableReadTable (tmp_path, numberOfRowsPerChunk):
+
+    columns = [ np.arange (-3, 4),
+                np.array ( [0.1, -2.5e-300, 1e300, np.nan, np.inf, -np.inf, 3.] ),
+                np.array ( [True, False, True, True, False, False, True] ),
+                np.array ( ['a', 'b', 'c', 'd', 'e', 'f', 'g'] ),
+                np.arange (7, dtype = np.float32) / 3 ]
+    textFileNameAndPath = str ( tmp_path / 'table.txt' )
+
+    assert HandyTools.writeTable ( columns, ['header line'], textFileNameAndPath, numberOfRowsPerChunk = numberOfRowsPerChunk )
+
+    tableContentDataNumbers, tableContentDataStrings, tableContentHeader = HandyTools.readTable (textFileNameAndPath)
+
+    assert tableContentHeader == ['header line']
+    assert [ column.dtype.kind for column in tableContentDataNumbers ] == ['i', 'f', 'i', 'f', 'f']
+    np.testing.assert_array_equal ( tableContentDataNumbers [0], columns [0] )
+    np.testing.assert_array_equal ( tableContentDataNumbers [1], columns [1] )
+    np.testing.assert_array_equal ( tableContentDataNumbers [2], columns [2].astype (int) )
+    np.testing.assert_array_equal ( tableContentDataNumbers [4].astype (np.float32), columns [4] )
+    assert tableContentDataStrings [3] == columns [3].tolist ()
+
+
+
+def test_writeTableAppend (tmp_path):
+
+    textFileNameAndPath = str ( tmp_path / 'table.txt' )
+
+    assert HandyTools.writeTable ( [ np.arange (3) ], 'header line', textFileNameAndPath, append = True )
+    assert HandyTools.writeTable ( [ np.arange (3, 5) ], 'header line', textFileNameAndPath, append = True )
+
+    tableContentDataNumbers, tableContentDataStrings, tableContentHeader = HandyTools.readTable (textFileNameAndPath)
+
+    assert tableContentHeader == ['header line']
+    np.testing.assert_array_equal ( tableContentDataNumbers [0], np.arange (5) )
+
+
+
+# A header or formats that cannot be used, or a value that cannot be formatted, leave the table file as it was.
+@pytest.mark.parametrize ( 'append', [False, True] )
+def test_writeTableErrors (tmp_path, append):
+
+    textFileNameAndPath = str ( tmp_path / 'table.txt' )
+    assert HandyTools.writeTable ( [ np.arange (3) ], ['header line'], textFileNameAndPath )
+    with open (textFileNameAndPath, 'r') as tableFile:
+
+        tableContent = tableFile.read ()
+
+
+    assert not HandyTools.writeTable ( [ np.arange (3) ], [1, 2], textFileNameAndPath, append = append )
+    assert not HandyTools.writeTable ( [ np.arange (3) ], ['header line'], textFileNameAndPath, columnFormats = ['%q'], append = append )
+    assert not HandyTools.writeTable ( [ np.array ( [1., np.nan] ) ], ['header line'], textFileNameAndPath, columnFormats = ['%d'], append = append, 
+                                       numberOfRowsPerChunk = 1 )
+
+    with open (textFileNameAndPath, 'r') as tableFile:
+
+        assert tableFile.read () == tableContent
+
+
+    assert sorted ( path.name for path in tmp_path.iterdir () ) == ['table.txt']
+
+
+
+def test_writeTableColumnFormatsAndNoHeader (tmp_path):
+
+    textFileNameAndPath = str ( tmp_path / 'table.txt' )
+
+    assert HandyTools.writeTable ( [ np.array ( [1.23456, 2.5] ), np.array ( [True, False] ) ], None, textFileNameAndPath, columnFormats = ['%.3f', '%d'] )
+
+    with open (textFileNameAndPath, 'r') as tableFile:
+
+        assert tableFile.read () == 'C_END\n1.235 1\n2.500 0\n'
+
+
+
+# The columns of the table files are concatenated, with the data type of each column over all table files, and table files
+#  with other columns are left out.
+@pytest.mark.parametrize ( 'useThreads', [False, True] )
+def test_readTables (tmp_path, useThreads):
+
+    textFileNamesAndPaths = [ writeTableFile (tmp_path, 'table1.txt', 'header 1\nC_END\n1 2\n3 4\n'),
+                              writeTableFile (tmp_path, 'table2.txt', 'C_END\n1 2 3\n'),
+                              writeTableFile (tmp_path, 'table3.txt', 'header 3\nC_END\n5 6.5\n'),
+                              str ( tmp_path / 'missing.txt' ) ]
+
+    tableContentDataNumbers, tableContentDataStrings, tableContentHeaders, iTableFiles = HandyTools.readTables ( textFileNamesAndPaths, returnStrings = True,
+                                                                                                                 numberOfWorkers = 2, useThreads = useThreads )
+
+    assert getColumns (tableContentDataNumbers) == [ ('i', [1, 3, 5]), ('f', [2., 4., 6.5]) ]
+    assert tableContentDataStrings == [ ['1', '3', '5'], ['2', '4', '6.5'] ]
+    assert tableContentHeaders == [ ['header 1'], [], ['header 3'], [] ]
+    assert iTableFiles.tolist () == [0, 0, 2]
+
+
+
+# The concatenated columns are the same as those of readTable for each table file.
+def test_readTablesReadTable (tmp_path):
+
+    randomGenerator = np.random.default_rng (0)
+    textFileNamesAndPaths = []
+    for iTableFile in range (5):
+
+        textFileNamesAndPaths.append ( str ( tmp_path / 'table{}.txt'.format (iTableFile) ) )
+        HandyTools.writeTable ( [ randomGenerator.integers (0, 100, 20 + iTableFile), randomGenerator.normal ( size = 20 + iTableFile ) ], [], textFileNamesAndPaths [-1] )
+
+
+    tableContentDataNumbers, tableContentDataStrings, tableContentHeaders, iTableFiles = HandyTools.readTables (textFileNamesAndPaths, usecols = [1, 0])
+
+    for iTableFile, textFileNameAndPath in enumerate (textFileNamesAndPaths):
+
+        tableContentDataNumbersTable = HandyTools.readTable (textFileNameAndPath, usecols = [1, 0]) [0]
+        for column, columnTable in zip (tableContentDataNumbers, tableContentDataNumbersTable):
+
+            np.testing.assert_array_equal ( column [iTableFiles == iTableFile], columnTable )
+
+
+
+# Compare content loaded by loadContentFromNumpyWithCustomExtension with the content that was saved.
+def assertContentEqual (contentLoaded, contentSaved):
+
+    if isinstance (contentSaved, dict):
+
+        assert isinstance (contentLoaded, dict) and sorted (contentLoaded) == sorted (contentSaved)
+        for key in contentSaved:
+
+            assertContentEqual (contentLoaded [key], contentSaved [key])
+
+
+    elif isinstance (contentSaved, np.ndarray):
+
+        assert contentLoaded.dtype == contentSaved.dtype
+        np.testing.assert_array_equal (contentLoaded, contentSaved)
+
+    # A list is loaded as the NumPy array it was converted to when it was saved.
+    elif isinstance (contentSaved, list):
+
+        assert isinstance (contentLoaded, np.ndarray) and contentLoaded.tolist () == contentSaved
+
+    else:
+
+        assert contentLoaded == contentSaved
+
+
+
+# The content is loaded as it was saved, with the arrays (of a dictionary of arrays) memory-mapped if they are not compressed.
+@pytest.mark.parametrize ( 'contentToSave, isArrayContent', [ ( np.asfortranarray ( np.arange (12.).reshape (3, 4) ), True ),
+                                                              ( np.array ( ['a', 'bc', ''] ), True ),
+                                                              ( { 'numbers': np.arange (5, dtype = np.int16), 'strings': np.array ( ['a', 'b'] ), 'empty': np.zeros (0) }, True ),
+                                                              ( { 'numbers': np.arange (5), 'text': 'text' }, False ),
+                                                              ( [1, 'a', None], False ),
+                                                              ( 3.5, False ) ] )
+@pytest.mark.parametrize ( 'compress', [False, True] )
+@pytest.mark.parametrize ( 'mmap_mode', [None, 'r', 'c'] )
+def test_saveAndLoadContentFromNumpyWithCustomExtension (tmp_path, contentToSave, isArrayContent, compress, mmap_mode):
+
+    fileName = str ( tmp_path / 'content' )
+
+    assert HandyTools.saveContentToNumpyWithCustomExtension (contentToSave, fileName, 'dat', compress = compress) == (True, False)
+    assert os.listdir (tmp_path) == ['content.dat']
+
+    contentLoaded, loaded = HandyTools.loadContentFromNumpyWithCustomExtension (fileName, 'dat', mmap_mode = mmap_mode)
+
+    assert loaded
+    assertContentEqual (contentLoaded, contentToSave)
+    if isArrayContent:
+
+        arraysLoaded = list ( contentLoaded.values () ) if isinstance (contentLoaded, dict) else [contentLoaded]
+        assert [ isinstance (arrayLoaded, np.memmap) for arrayLoaded in arraysLoaded ] == \
+               [ mmap_mode is not None and not compress and arrayLoaded.size > 0 for arrayLoaded in arraysLoaded ]
+
+
+
+# An existing file is only replaced with overWrite, and a file that cannot be saved leaves the existing file as it was.
+def test_saveContentToNumpyWithCustomExtensionOverWrite (tmp_path, capsys):
+
+    fileName = str ( tmp_path / 'content' )
+    HandyTools.saveContentToNumpyWithCustomExtension (np.arange (3), fileName, 'dat')
+
+    assert HandyTools.saveContentToNumpyWithCustomExtension (np.arange (4), fileName, 'dat') == (False, True)
+    assert HandyTools.saveContentToNumpyWithCustomExtension ( [ lambda value: value ], fileName, 'dat', overWrite = True ) == (False, False)
+    assert 'cannot be saved' in capsys.readouterr ().out
+    assertContentEqual ( HandyTools.loadContentFromNumpyWithCustomExtension (fileName, 'dat') [0], np.arange (3) )
+
+    assert HandyTools.saveContentToNumpyWithCustomExtension (np.arange (4), fileName, 'dat', overWrite = True) == (True, False)
+    assertContentEqual ( HandyTools.loadContentFromNumpyWithCustomExtension (fileName, 'dat') [0], np.arange (4) )
+    assert os.listdir (tmp_path) == ['content.dat']
+
+
+
+# Changes to a memory-mapped array with mode r+ are written to the file, but not for a dictionary of arrays, which is memory-mapped with mode c instead.
+def test_loadContentFromNumpyWithCustomExtensionChanges (tmp_path, capsys):
+
+    fileName = str ( tmp_path / 'content' )
+    for contentToSave in [ np.arange (3.), { 'numbers': np.arange (3.) } ]:
+
+        HandyTools.saveContentToNumpyWithCustomExtension (contentToSave, fileName, 'dat', overWrite = True)
+        contentLoaded = HandyTools.loadContentFromNumpyWithCustomExtension (fileName, 'dat', mmap_mode = 'r+') [0]
+        arrayLoaded = contentLoaded ['numbers'] if isinstance (contentLoaded, dict) else contentLoaded
+        arrayLoaded [0] = 10.
+        arrayLoaded.flush ()
+        del contentLoaded, arrayLoaded
+
+        contentLoaded = HandyTools.loadContentFromNumpyWithCustomExtension (fileName, 'dat') [0]
+        arrayLoaded = contentLoaded ['numbers'] if isinstance (contentLoaded, dict) else contentLoaded
+        assert arrayLoaded.tolist () == ( [0., 1., 2.] if isinstance (contentToSave, dict) else [10., 1., 2.] )
+
+
+    assert 'memory-mapped with mode c instead' in capsys.readouterr ().out
+
+
+
+# Files saved before the arrays were saved as they are, and files that do not exist.
+def test_loadContentFromNumpyWithCustomExtensionOldFiles (tmp_path):
+
+    fileName = str ( tmp_path / 'content' )
+    with open (fileName + '.dat', 'wb') as contentFile:
+
+        np.save ( contentFile, np.array ( { 'numbers': np.arange (3) }, dtype = object ) )
+
+
+    assertContentEqual ( HandyTools.loadContentFromNumpyWithCustomExtension (fileName, 'dat', mmap_mode = 'r') [0], { 'numbers': np.arange (3) } )
+    assert HandyTools.loadContentFromNumpyWithCustomExtension ( str ( tmp_path / 'missing' ), 'dat' ) == (None, False)